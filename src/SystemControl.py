@@ -1,5 +1,3 @@
-import threading
-import time
 from enum import Enum
 
 from src.components.alarm.AlarmController import AlarmController
@@ -7,10 +5,18 @@ from src.components.door.DoorController import DoorController
 from src.components.light.LightController import LightController
 from src.components.sensor.SensorManager import SensorManager
 from src.emergency.EmergencyHandler import EmergencyHandler
+from src.emergency.FlightRecorder import FlightRecorder
 from src.helper.Action import Action
+from src.helper.Clock import Clock
 from src.helper.Logger import Logger, LogLevel
-from src.helper.config import MAIN_LOOP_TIMEOUT_IN_SECONDS
+from src.helper.OvenContext import OvenContext
+from src.helper.Scheduler import Scheduler
+from src.helper.Settings import Settings
+from src.helper.configuration.RuntimeConfig import RuntimeConfig, Changes
 from src.helper.exceptions import ProgramAlreadyRunningException
+from src.helper.scheduling.PeriodicRunner import PeriodicRunner
+from src.helper.scheduling.ScheduledTask import ScheduledTask
+from src.helper.scheduling.SchedulerInterface import SchedulerInterface
 from src.program.ProgramController import ProgramController
 from src.user.UserInteractionHandler import UserInteractionHandler
 
@@ -19,6 +25,8 @@ class SystemControl:
     """
     Singleton class responsible for managing the overall system state, including
     initialization, emergency handling, and main control loop.
+
+    The main loop interval is read from the runtime settings, and a changed interval is applied to the running loop.
     """
 
     class State(Enum):
@@ -31,41 +39,71 @@ class SystemControl:
 
     _instance: "SystemControl" = None
 
-    def __new__(cls, *args, **kwargs) -> "SystemControl":
+    def __new__(cls, context: OvenContext | None = None) -> "SystemControl":
         """
         Ensures only one instance of SystemControl exists (Singleton pattern).
 
-        :param args: Positional arguments.
-        :param kwargs: Keyword arguments.
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of SystemControl.
         """
+        if context is not None:
+            return super(SystemControl, cls).__new__(cls)
+
         if cls._instance is None:
             cls._instance = super(SystemControl, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initializes the SystemControl instance, setting up controllers and state.
+
+        :param context: The oven context to resolve dependencies from, or None for the singletons.
+        :type context: OvenContext | None
         """
         self.state: SystemControl.State = self.State.IDLE
+        self.context: OvenContext | None = context
 
         self.logger: Logger = Logger("SystemControl")
-        self.emergency_handler: EmergencyHandler = EmergencyHandler()
-        self.alarm_controller: AlarmController = AlarmController()
-        self.light_controller: LightController = LightController()
-        self.door_controller: DoorController = DoorController()
-        self.user_interaction_handler: UserInteractionHandler = UserInteractionHandler()
-        self.program_controller: ProgramController = ProgramController()
-        self.sensor_manager: SensorManager = SensorManager()
+        self.emergency_handler: EmergencyHandler = OvenContext.resolve(context, EmergencyHandler)
+        self.alarm_controller: AlarmController = OvenContext.resolve(context, AlarmController)
+        self.light_controller: LightController = OvenContext.resolve(context, LightController)
+        self.door_controller: DoorController = OvenContext.resolve(context, DoorController)
+        self.user_interaction_handler: UserInteractionHandler = OvenContext.resolve(context, UserInteractionHandler)
+        self.program_controller: ProgramController = OvenContext.resolve(context, ProgramController)
+        self.sensor_manager: SensorManager = OvenContext.resolve(context, SensorManager)
+        self.flight_recorder: FlightRecorder = OvenContext.resolve(context, FlightRecorder)
+        self.settings: RuntimeConfig = Settings()
+        self.runner: PeriodicRunner | ScheduledTask | None = None
+
+        self.settings.subscribe(self.apply_settings, "MAIN_LOOP_TIMEOUT_IN_SECONDS")
+
+    def apply_settings(self, changes: Changes) -> None:
+        """
+        Apply a changed main loop interval to the running loop.
+
+        :param changes: The previous and the new value of the changed settings, by name.
+        :type changes: Changes
+        :return: None
+        """
+        if self.runner is not None:
+            self.runner.period = self.settings.MAIN_LOOP_TIMEOUT_IN_SECONDS
+            self.logger.log(f"Main loop interval set to {self.runner.period}s", LogLevel.INFO)
 
     def factory_reset(self) -> None:
         """
         Performs a factory reset of the system, reinitializing all components.
 
+        Within an oven context, the components of that oven are dropped and created anew.
+
         :return: None
         """
         self.logger.log("Performing factory reset", LogLevel.INFO)
-        self.__init__()
+
+        if self.context is not None:
+            self.context.reset(self)
+
+        self.__init__(self.context)
 
     def declare_emergency(self) -> None:
         """
@@ -101,7 +139,8 @@ class SystemControl:
 
     def start(self) -> None:
         """
-        Starts the system, initializing the main loop in a separate thread.
+        Starts the system, initializing the main loop on the installed scheduler, or in a separate thread
+        if none is installed.
 
         :return: None
         """
@@ -109,7 +148,12 @@ class SystemControl:
             self.state = self.State.RUNNING
             self.light_controller.start()
 
-            threading.Thread(target=self.loop, name="SystemThread").start()
+            scheduler: SchedulerInterface | None = Scheduler()
+            if scheduler is not None:
+                interval: float = self.settings.MAIN_LOOP_TIMEOUT_IN_SECONDS
+                self.runner = scheduler.schedule(self.loop_tick, interval, interval, "System")
+            else:
+                Clock().spawn(self.loop, "SystemThread")
 
             self.logger.log("System started", LogLevel.INFO)
         else:
@@ -121,28 +165,37 @@ class SystemControl:
 
         :return: None
         """
-        while True:
-            time.sleep(MAIN_LOOP_TIMEOUT_IN_SECONDS)
+        interval: float = self.settings.MAIN_LOOP_TIMEOUT_IN_SECONDS
+        self.runner = PeriodicRunner(self.loop_tick, interval, "System", interval)
+        self.runner.run()
+
+    def loop_tick(self) -> bool:
+        """
+        Executes one iteration of the main control loop.
+
+        :return: True if the loop keeps running, False if the system became idle.
+        """
+        match self.state:
+            case self.State.IDLE:
+                self.logger.log("System is idle", LogLevel.INFO)
+                return False  # TODO build a watchdog to wake up
 
-            match self.state:
-                case self.State.IDLE:
-                    self.logger.log("System is idle", LogLevel.INFO)
-                    break  # TODO build a watchdog to wake up
+            case self.State.RUNNING:
+                self.logger.log("System is running", LogLevel.DEBUG)
 
-                case self.State.RUNNING:
-                    self.logger.log("System is running", LogLevel.DEBUG)
+                self.loop_action()
 
-                    self.loop_action()
+            case self.State.EMERGENCY:
+                self.logger.log("Emergency state!", LogLevel.WARNING)
 
-                case self.State.EMERGENCY:
-                    self.logger.log("Emergency state!", LogLevel.WARNING)
+                if self.emergency_handler.is_busy():
+                    self.emergency_handler.handle_emergency(self)
+                else:
+                    self.logger.log("No error to handle, exiting emergency state", LogLevel.INFO)
 
-                    if self.emergency_handler.is_busy():
-                        self.emergency_handler.handle_emergency(self)
-                    else:
-                        self.logger.log("No error to handle, exiting emergency state", LogLevel.INFO)
+                    self.state = self.State.RUNNING
 
-                        self.state = self.State.RUNNING
+        return True
 
     @EmergencyHandler.observe
     def loop_action(self) -> None:
@@ -188,6 +241,7 @@ class SystemControl:
 
         self.user_interaction_handler.update_display(*self.program_controller.get_state_tuple())
         self.sensor_manager.update_sensors()
+        self.flight_recorder.record()
 
     def emergency_stop_program(self) -> None:
         """
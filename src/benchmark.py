@@ -0,0 +1,67 @@
+import argparse
+import sys
+
+from src.helper.benchmark.Benchmark import Benchmark
+from src.helper.benchmark.BenchmarkComparison import BenchmarkComparison
+from src.helper.benchmark.BenchmarkReport import BenchmarkReport
+from src.helper.benchmark.BenchmarkResult import BenchmarkResult
+from src.helper.benchmark.BenchmarkRunner import BenchmarkRunner
+from src.helper.benchmark.BenchmarkSuite import BenchmarkSuite
+from src.helper.config import BENCHMARK_REGRESSION_THRESHOLD
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments of the benchmark run.
+
+    :param argv: The arguments without the program name, or None to use the command line.
+    :type argv: list[str] | None
+    :return: The parsed arguments.
+    :rtype: argparse.Namespace
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Run the benchmarks of the hot paths.")
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks whose name contains this text")
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file")
+    parser.add_argument("-b", "--baseline", help="compare the results with the JSON results in this file")
+    parser.add_argument("-t", "--threshold", type=float, default=BENCHMARK_REGRESSION_THRESHOLD,
+                        help="tolerated relative slowdown against the baseline, e.g. 0.1 for 10%%")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Entry point for the benchmarks. Runs the suite, stores the results and compares them with a baseline.
+
+    :param argv: The arguments without the program name, or None to use the command line.
+    :type argv: list[str] | None
+    :return: The exit code, 1 if a benchmark regressed against the baseline, 0 otherwise.
+    :rtype: int
+    """
+    arguments: argparse.Namespace = parse_arguments(argv)
+    benchmarks: list[Benchmark] = [benchmark for benchmark in BenchmarkSuite.benchmarks()
+                                   if arguments.filter in benchmark.name]
+
+    results: list[BenchmarkResult] = []
+    for benchmark in benchmarks:
+        result: BenchmarkResult = BenchmarkRunner.run(benchmark)
+        results.append(result)
+        print(f"{result.name:<40} {result.median() * 1e6:>12.3f} us (best {result.best() * 1e6:.3f} us, "
+              f"stdev {result.stdev() * 1e6:.3f} us)")
+
+    report: BenchmarkReport = BenchmarkReport(results)
+    if arguments.output:
+        report.save(arguments.output)
+
+    if not arguments.baseline:
+        return 0
+
+    comparisons: list[BenchmarkComparison] = report.compare(BenchmarkReport.load(arguments.baseline))
+    print(f"\nComparison with {arguments.baseline} (threshold {arguments.threshold:.0%}):")
+    for comparison in comparisons:
+        print(comparison.format(arguments.threshold))
+
+    return 1 if any(comparison.regressed(arguments.threshold) for comparison in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
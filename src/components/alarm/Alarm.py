@@ -1,3 +1,6 @@
+from src.helper.OvenContext import OvenContext
+
+
 class Alarm:
     """
     Singleton class representing an alarm system.
@@ -7,22 +10,28 @@ class Alarm:
 
     _instance: 'Alarm' = None
 
-    def __new__(cls, *args: object, **kwargs: object) -> 'Alarm':
+    def __new__(cls, context: OvenContext | None = None) -> 'Alarm':
         """
         Create or return the singleton instance of Alarm.
 
-        :param args: Positional arguments (unused).
-        :param kwargs: Keyword arguments (unused).
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of Alarm.
         """
+        if context is not None:
+            return super(Alarm, cls).__new__(cls)
+
         if cls._instance is None:
             cls._instance = super(Alarm, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initialize the Alarm instance.
 
         Sets the alarm to inactive by default.
+
+        :param context: The oven context the instance belongs to (unused).
+        :type context: OvenContext | None
         """
         self.active: bool = False
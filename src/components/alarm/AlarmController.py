@@ -1,5 +1,6 @@
 from src.components.alarm.Alarm import Alarm
 from src.helper.Logger import Logger
+from src.helper.OvenContext import OvenContext
 from src.helper.logging.LogLevel import LogLevel
 
 
@@ -12,25 +13,32 @@ class AlarmController:
 
     _instance: 'AlarmController' = None
 
-    def __new__(cls) -> 'AlarmController':
+    def __new__(cls, context: OvenContext | None = None) -> 'AlarmController':
         """
         Create or return the singleton instance of AlarmController.
 
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of AlarmController.
         :rtype: AlarmController
         """
+        if context is not None:
+            return super(AlarmController, cls).__new__(cls)
+
         if cls._instance is None:
             cls._instance = super(AlarmController, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initialize the AlarmController with a logger and an Alarm instance.
 
+        :param context: The oven context to resolve dependencies from, or None for the singletons.
+        :type context: OvenContext | None
         :return: None
         """
         self.logger: Logger = Logger("AlarmControl")
-        self.alarm: Alarm = Alarm()
+        self.alarm: Alarm = OvenContext.resolve(context, Alarm)
 
     def activate_alarm(self) -> None:
         """
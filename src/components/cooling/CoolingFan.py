@@ -1,3 +1,6 @@
+from src.helper.OvenContext import OvenContext
+
+
 class CoolingFan:
     """
     Singleton class representing a cooling fan component.
@@ -7,23 +10,31 @@ class CoolingFan:
 
     _instance: "CoolingFan" = None
 
-    def __new__(cls) -> "CoolingFan":
+    def __new__(cls, context: OvenContext | None = None) -> "CoolingFan":
         """
         Create or return the singleton instance of CoolingFan.
 
         :param cls: The class type.
         :type cls: type
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of CoolingFan.
         :rtype: CoolingFan
         """
+        if context is not None:
+            return super().__new__(cls)
+
         if not cls._instance:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initialize the CoolingFan instance.
 
         Sets the initial power_share to 0.0.
+
+        :param context: The oven context the instance belongs to (unused).
+        :type context: OvenContext | None
         """
         self.power_share: float = 0.0
@@ -1,11 +1,17 @@
 import threading
-import time
 
 from src.components.cooling.CoolingFan import CoolingFan
 from src.components.sensor.SensorManager import SensorManager
+from src.helper.Clock import Clock
 from src.helper.Logger import Logger
-from src.helper.config import COOLING_FAN_STEP_IN_PERCENT, COOLING_FAN_UPDATE_INTERVAL_IN_SECONDS
+from src.helper.OvenContext import OvenContext
+from src.helper.Scheduler import Scheduler
+from src.helper.Settings import Settings
+from src.helper.configuration.RuntimeConfig import RuntimeConfig, Changes
 from src.helper.logging.LogLevel import LogLevel
+from src.helper.scheduling.PeriodicRunner import PeriodicRunner
+from src.helper.scheduling.ScheduledTask import ScheduledTask
+from src.helper.scheduling.SchedulerInterface import SchedulerInterface
 
 
 class CoolingFanController:
@@ -13,39 +19,70 @@ class CoolingFanController:
     Singleton controller for managing the cooling fan based on sensor data.
 
     This class handles the logic for starting, stopping, and adjusting the cooling fan's power share
-    according to the temperature readings from the magnetron sensors.
+    according to the temperature readings from the magnetron sensors. The step and the update interval
+    are read from the runtime settings, and a changed update interval is applied to the running loop.
     """
 
     _instance: "CoolingFanController" = None
 
-    def __new__(cls) -> "CoolingFanController":
+    FAN_START_TEMP_IN_CELSIUS: float = 50.0
+    """float: Magnetron temperature above which the cooling fan starts."""
+
+    FAN_FULL_TEMP_IN_CELSIUS: float = 150.0
+    """float: Magnetron temperature from which the cooling fan runs at full power."""
+
+    def __new__(cls, context: OvenContext | None = None) -> "CoolingFanController":
         """
         Ensures only one instance of CoolingFanController exists.
 
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of CoolingFanController.
         :rtype: CoolingFanController
         """
+        if context is not None:
+            return super().__new__(cls)
+
         if not cls._instance:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initializes the CoolingFanController with required components and state variables.
+
+        :param context: The oven context to resolve dependencies from, or None for the singletons.
+        :type context: OvenContext | None
         """
         self.logger: Logger = Logger("CoolingControl")
-        self.cooling_fan: CoolingFan = CoolingFan()
-        self.sensors: SensorManager = SensorManager()
+        self.settings: RuntimeConfig = Settings()
+        self.cooling_fan: CoolingFan = OvenContext.resolve(context, CoolingFan)
+        self.sensors: SensorManager = OvenContext.resolve(context, SensorManager)
         self.target_power_share: float = 0.0
 
         self.cooldown: bool = False
         self.emergency: bool = False
         self.running: bool = False
-        self.thread: threading.Thread | None = None
+        self.thread: threading.Thread | ScheduledTask | None = None
+        self.runner: PeriodicRunner | ScheduledTask | None = None
+
+        self.settings.subscribe(self.apply_settings, "COOLING_FAN_UPDATE_INTERVAL_IN_SECONDS")
+
+    def apply_settings(self, changes: Changes) -> None:
+        """
+        Apply a changed update interval to the running loop.
+
+        :param changes: The previous and the new value of the changed settings, by name.
+        :type changes: Changes
+        :return: None
+        """
+        if self.runner is not None:
+            self.runner.period = self.settings.COOLING_FAN_UPDATE_INTERVAL_IN_SECONDS
+            self.logger.log(f"Cooling Fan update interval set to {self.runner.period}s", LogLevel.INFO)
 
     def start(self) -> None:
         """
-        Starts the cooling fan control loop in a separate thread.
+        Starts the cooling fan control loop on the installed scheduler, or in a separate thread if none is installed.
 
         :return: None
         """
@@ -53,8 +90,14 @@ class CoolingFanController:
             self.logger.log("Starting Cooling Fan", LogLevel.INFO)
 
             self.running = True
-            self.thread = threading.Thread(target=self.cooling_fan_loop, name="CoolingThread")
-            self.thread.start()
+
+            scheduler: SchedulerInterface | None = Scheduler()
+            if scheduler is not None:
+                interval: float = self.settings.COOLING_FAN_UPDATE_INTERVAL_IN_SECONDS
+                self.thread = scheduler.schedule(self.cooling_fan_tick, interval, name="CoolingFan")
+                self.runner = self.thread
+            else:
+                self.thread = Clock().spawn(self.cooling_fan_loop, "CoolingThread")
         else:
             self.logger.log("Cooling Fan is already running", LogLevel.WARNING)
 
@@ -82,26 +125,32 @@ class CoolingFanController:
 
             self.emergency = True
             if self.thread:
-                self.thread.join()
+                Clock().join(self.thread)
         else:
             self.logger.log("Cooling Fan is already stopped", LogLevel.WARNING)
 
-    @staticmethod
-    def magnetron_temp_to_power_share(magnetron_temp: float) -> float:
+    def magnetron_temp_to_power_share(self, magnetron_temp: float) -> float:
         """
         Converts the magnetron temperature to a power share value for the cooling fan.
 
+        The power share rises slowly to a quarter up to the middle between the start and the full temperature,
+        then steeply to full power.
+
         :param magnetron_temp: The average temperature of the magnetron in degrees Celsius.
         :type magnetron_temp: float
         :return: The calculated power share (0.0 to 1.0).
         :rtype: float
         """
-        if magnetron_temp <= 50.0:
+        start: float = self.FAN_START_TEMP_IN_CELSIUS
+        full: float = self.FAN_FULL_TEMP_IN_CELSIUS
+        middle: float = (start + full) / 2.0
+
+        if magnetron_temp <= start:
             return 0.0
-        elif magnetron_temp <= 100.0:
-            return (magnetron_temp - 50.0) / 200.0
-        elif magnetron_temp < 150.0:
-            return 0.25 + (magnetron_temp - 100.0) * 0.015
+        elif magnetron_temp <= middle:
+            return 0.25 * (magnetron_temp - start) / (middle - start)
+        elif magnetron_temp < full:
+            return 0.25 + 0.75 * (magnetron_temp - middle) / (full - middle)
         else:
             return 1.0
 
@@ -111,28 +160,41 @@ class CoolingFanController:
 
         :return: None
         """
-        self.logger.log(f"Updating Cooling Fan - currently at {self.target_power_share}%", LogLevel.DEBUG)
+        self.logger.log("Updating Cooling Fan - currently at %s%%", LogLevel.DEBUG, self.target_power_share)
+        step: float = self.settings.COOLING_FAN_STEP_IN_PERCENT
         magnetron_temp: float = (self.sensors.magnetron_temp1() + self.sensors.magnetron_temp2()) / 2.0
 
         self.target_power_share = self.magnetron_temp_to_power_share(magnetron_temp)
 
-        if (self.cooldown and self.target_power_share <= COOLING_FAN_STEP_IN_PERCENT) or self.emergency:
+        if (self.cooldown and self.target_power_share <= step) or self.emergency:
             self.running = False
             self.logger.log("Cooling Fan is stopped", LogLevel.INFO)
 
             return
 
         if self.cooling_fan.power_share != self.target_power_share:
-            if abs(self.target_power_share - self.cooling_fan.power_share) <= COOLING_FAN_STEP_IN_PERCENT:
+            if abs(self.target_power_share - self.cooling_fan.power_share) <= step:
                 self.cooling_fan.power_share = self.target_power_share
             else:
                 if self.target_power_share > self.cooling_fan.power_share:
-                    self.cooling_fan.power_share += COOLING_FAN_STEP_IN_PERCENT
+                    self.cooling_fan.power_share += step
                 else:
-                    self.cooling_fan.power_share -= COOLING_FAN_STEP_IN_PERCENT
+                    self.cooling_fan.power_share -= step
 
         self.cooling_fan.power_share = max(0.0, min(self.cooling_fan.power_share, 1.0))
 
+    def cooling_fan_tick(self) -> bool:
+        """
+        Executes one iteration of the cooling fan loop.
+
+        :return: True if the loop keeps running, False otherwise.
+        :rtype: bool
+        """
+        if self.running:
+            self.cooling_fan_cycle()
+
+        return self.running
+
     def cooling_fan_loop(self) -> None:
         """
         Main loop for controlling the cooling fan, running in a separate thread.
@@ -141,6 +203,6 @@ class CoolingFanController:
         """
         self.logger.log("Cooling Fan loop starting", LogLevel.INFO)
 
-        while self.running:
-            self.cooling_fan_cycle()
-            time.sleep(COOLING_FAN_UPDATE_INTERVAL_IN_SECONDS)
+        self.runner = PeriodicRunner(self.cooling_fan_tick, self.settings.COOLING_FAN_UPDATE_INTERVAL_IN_SECONDS,
+                                     "CoolingFan")
+        self.runner.run()
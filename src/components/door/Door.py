@@ -1,4 +1,5 @@
 from src.helper.Logger import Logger
+from src.helper.OvenContext import OvenContext
 from src.helper.logging.LogLevel import LogLevel
 
 
@@ -12,22 +13,30 @@ class Door:
 
     _instance: 'Door' = None
 
-    def __new__(cls) -> 'Door':
+    def __new__(cls, context: OvenContext | None = None) -> 'Door':
         """
         Create or return the singleton instance of Door.
 
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of Door.
         :rtype: Door
         """
+        if context is not None:
+            return super().__new__(cls)
+
         if not cls._instance:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initialize the Door instance.
 
         Sets up the logger and initializes the door state as closed.
+
+        :param context: The oven context the instance belongs to (unused).
+        :type context: OvenContext | None
         """
         self.logger: Logger = Logger("DoorControl")
         self.opened: bool = False
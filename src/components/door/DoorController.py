@@ -1,5 +1,6 @@
 from src.components.door.Door import Door
 from src.helper.Logger import Logger
+from src.helper.OvenContext import OvenContext
 from src.helper.exceptions import DoorException
 from src.helper.logging.LogLevel import LogLevel
 
@@ -11,26 +12,32 @@ class DoorController:
 
     _instance: 'DoorController' = None
 
-    def __new__(cls, *args, **kwargs) -> 'DoorController':
+    def __new__(cls, context: OvenContext | None = None) -> 'DoorController':
         """
         Ensures only one instance of DoorController exists (Singleton pattern).
 
-        :param args: Positional arguments.
-        :param kwargs: Keyword arguments.
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of DoorController.
         :rtype: DoorController
         """
+        if context is not None:
+            return super(DoorController, cls).__new__(cls)
+
         if cls._instance is None:
             cls._instance = super(DoorController, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initializes the DoorController with a logger, lock state, and a Door instance.
+
+        :param context: The oven context to resolve dependencies from, or None for the singletons.
+        :type context: OvenContext | None
         """
         self.logger: Logger = Logger("DoorControl")
         self.locked: bool = False
-        self.door: Door = Door()
+        self.door: Door = OvenContext.resolve(context, Door)
 
     def lock(self) -> None:
         """
@@ -69,7 +76,7 @@ class DoorController:
         :raises DoorException: If the door is locked and open.
         :return: None
         """
-        self.logger.log(f"Door locked: {self.locked} and opened: {self.door.opened}", LogLevel.DEBUG)
+        self.logger.log("Door locked: %s and opened: %s", LogLevel.DEBUG, self.locked, self.door.opened)
 
         if self.locked and self.door.opened:
             self.logger.log("Door is locked and was forcefully opened.", LogLevel.CRITICAL)
@@ -1,3 +1,6 @@
+from src.helper.OvenContext import OvenContext
+
+
 class Light:
     """
     Singleton class representing a light component.
@@ -7,23 +10,31 @@ class Light:
 
     _instance: 'Light' = None
 
-    def __new__(cls) -> 'Light':
+    def __new__(cls, context: OvenContext | None = None) -> 'Light':
         """
         Create or return the singleton instance of Light.
 
         :param cls: The class type.
         :type cls: type
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of Light.
         :rtype: Light
         """
+        if context is not None:
+            return super().__new__(cls)
+
         if not cls._instance:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initialize the Light instance.
 
         Sets the light state to off.
+
+        :param context: The oven context the instance belongs to (unused).
+        :type context: OvenContext | None
         """
         self.on: bool = False
@@ -1,60 +1,99 @@
 import threading
-import time
 
 from src.components.door.Door import Door
 from src.components.light.Light import Light
+from src.helper.Clock import Clock
 from src.helper.Logger import Logger
-from src.helper.config import LIGHT_UPDATE_INTERVAL_IN_SECONDS
+from src.helper.OvenContext import OvenContext
+from src.helper.Scheduler import Scheduler
+from src.helper.Settings import Settings
+from src.helper.configuration.RuntimeConfig import RuntimeConfig, Changes
 from src.helper.logging.LogLevel import LogLevel
+from src.helper.scheduling.PeriodicRunner import PeriodicRunner
+from src.helper.scheduling.ScheduledTask import ScheduledTask
+from src.helper.scheduling.SchedulerInterface import SchedulerInterface
 from src.program.ProgramController import ProgramController
 
 
 class LightController:
     """
     Singleton controller for managing the light based on door and program state.
+
+    The update interval is read from the runtime settings, and a changed interval is applied to the running loop.
     """
 
     _instance: 'LightController' = None
 
-    def __new__(cls) -> 'LightController':
+    def __new__(cls, context: OvenContext | None = None) -> 'LightController':
         """
         Create or return the singleton instance of LightController.
 
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of LightController.
         :rtype: LightController
         """
+        if context is not None:
+            return super().__new__(cls)
+
         if not cls._instance:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initialize the LightController, setting up logger, light, door, and program controller.
+
+        :param context: The oven context to resolve dependencies from, or None for the singletons.
+        :type context: OvenContext | None
         """
         self.logger: Logger = Logger("LightControl")
-        self.light: Light = Light()
-        self.door: Door = Door()
-        self.program: ProgramController = ProgramController()
+        self.light: Light = OvenContext.resolve(context, Light)
+        self.door: Door = OvenContext.resolve(context, Door)
+        self.program: ProgramController = OvenContext.resolve(context, ProgramController)
+        self.settings: RuntimeConfig = Settings()
         self.running: bool = False
-        self.thread: threading.Thread | None = None
+        self.thread: threading.Thread | ScheduledTask | None = None
+        self.runner: PeriodicRunner | ScheduledTask | None = None
+
+        self.settings.subscribe(self.apply_settings, "LIGHT_UPDATE_INTERVAL_IN_SECONDS")
+
+    def apply_settings(self, changes: Changes) -> None:
+        """
+        Apply a changed update interval to the running loop.
+
+        :param changes: The previous and the new value of the changed settings, by name.
+        :type changes: Changes
+        :return: None
+        """
+        if self.runner is not None:
+            self.runner.period = self.settings.LIGHT_UPDATE_INTERVAL_IN_SECONDS
+            self.logger.log(f"Light update interval set to {self.runner.period}s", LogLevel.INFO)
 
     def start(self) -> None:
         """
-        Start the light control loop in a separate thread if not already running.
+        Start the light control loop on the installed scheduler, or in a separate thread if none
+        is installed, if not already running.
 
         :return: None
         """
         if not self.running:
             self.logger.log("Starting light control", LogLevel.INFO)
             self.running = True
-            self.thread = threading.Thread(target=self.light_loop, name="LightThread")
-            self.thread.start()
+
+            scheduler: SchedulerInterface | None = Scheduler()
+            if scheduler is not None:
+                self.thread = scheduler.schedule(self.light_tick, self.settings.LIGHT_UPDATE_INTERVAL_IN_SECONDS,
+                                                 name="Light")
+                self.runner = self.thread
+            else:
+                self.thread = Clock().spawn(self.light_loop, "LightThread")
         else:
             self.logger.log("Light control is already running", LogLevel.WARNING)
 
     def stop(self) -> None:
         """
-        Stop the light control loop and wait for the thread to finish.
+        Stop the light control loop and wait for its thread or task to finish.
 
         :return: None
         """
@@ -62,7 +101,7 @@ class LightController:
             self.logger.log("Stopping light control", LogLevel.INFO)
             self.running = False
             if self.thread:
-                self.thread.join()
+                Clock().join(self.thread)
         else:
             self.logger.log("Light control is not running", LogLevel.WARNING)
 
@@ -84,12 +123,23 @@ class LightController:
                 self.light.on = False
                 self.logger.log("Light turned off", LogLevel.INFO)
 
+    def light_tick(self) -> bool:
+        """
+        Run one iteration of the light loop.
+
+        :return: True if the loop keeps running, False otherwise.
+        :rtype: bool
+        """
+        if self.running:
+            self.light_cycle()
+
+        return self.running
+
     def light_loop(self) -> None:
         """
         Continuously run the light cycle at a fixed interval while running.
 
         :return: None
         """
-        while self.running:
-            self.light_cycle()
-            time.sleep(LIGHT_UPDATE_INTERVAL_IN_SECONDS)
+        self.runner = PeriodicRunner(self.light_tick, self.settings.LIGHT_UPDATE_INTERVAL_IN_SECONDS, "Light")
+        self.runner.run()
@@ -1,3 +1,6 @@
+from src.helper.OvenContext import OvenContext
+
+
 class Magnetron:
     """
     Singleton class representing a Magnetron device with basic on/off functionality.
@@ -7,23 +10,29 @@ class Magnetron:
 
     _instance: "Magnetron" = None
 
-    def __new__(cls, *args, **kwargs) -> "Magnetron":
+    def __new__(cls, context: OvenContext | None = None) -> "Magnetron":
         """
         Create or return the singleton instance of Magnetron.
 
-        :param args: Positional arguments (unused).
-        :param kwargs: Keyword arguments (unused).
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of Magnetron.
         """
+        if context is not None:
+            return super(Magnetron, cls).__new__(cls)
+
         if cls._instance is None:
             cls._instance = super(Magnetron, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initialize the Magnetron instance.
 
         Sets the initial state of the device to inactive.
+
+        :param context: The oven context the instance belongs to (unused).
+        :type context: OvenContext | None
         """
         self.active: bool = False
 
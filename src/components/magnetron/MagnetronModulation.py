@@ -0,0 +1,14 @@
+from enum import Enum
+
+
+class MagnetronModulation(Enum):
+    """
+    Enumeration of how the magnetron modulator turns a target power share into on/off cycles.
+
+    RANDOM switches the magnetron on with a probability equal to the target power share, so the delivered
+    power only matches the target on average. SIGMA_DELTA accumulates the target power share and switches
+    the magnetron on whenever a full cycle is owed, so every window delivers the target share up to one cycle.
+    """
+
+    RANDOM = "RANDOM"
+    SIGMA_DELTA = "SIGMA_DELTA"
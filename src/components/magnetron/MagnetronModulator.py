@@ -1,60 +1,118 @@
-import random
 import threading
-import time
 
 from src.components.magnetron.Magnetron import Magnetron
+from src.components.magnetron.MagnetronModulation import MagnetronModulation
 from src.components.magnetron.MagnetronRingbuffer import MagnetronRingbuffer
 from src.components.sensor.SensorManager import SensorManager
+from src.helper.Clock import Clock
 from src.helper.Logger import Logger
-from src.helper.config import MAGNETRON_ON_OFF_INTERVAL_IN_SECONDS, MAGNETRON_MAX_POWER_SHARE_PER_MINUTE, \
-    MAGNETRON_MAX_TEMP_IN_CELSIUS
+from src.helper.OvenContext import OvenContext
+from src.helper.Scheduler import Scheduler
+from src.helper.Settings import Settings
+from src.helper.configuration.RuntimeConfig import RuntimeConfig, Changes
 from src.helper.logging.LogLevel import LogLevel
+from src.helper.noise.NoiseSource import NoiseSource
+from src.helper.noise.NoiseStream import NoiseStream
+from src.helper.scheduling.OverrunPolicy import OverrunPolicy
+from src.helper.scheduling.PeriodicRunner import PeriodicRunner
+from src.helper.scheduling.ScheduledTask import ScheduledTask
+from src.helper.scheduling.SchedulerInterface import SchedulerInterface
 
 
 class MagnetronModulator:
     """
     Singleton class responsible for controlling the magnetron's power modulation cycle,
     ensuring safety constraints and managing the on/off state in a separate thread.
+
+    The safety limits are read from the runtime settings on every cycle, and a changed modulation is applied
+    from the next cycle on. A changed cycle interval is applied to the running loop and resizes the power
+    history to still cover one minute, keeping the newest cycles.
     """
 
     _instance: 'MagnetronModulator' = None
 
-    def __new__(cls, *args, **kwargs) -> 'MagnetronModulator':
+    def __new__(cls, context: OvenContext | None = None) -> 'MagnetronModulator':
         """
         Ensures only one instance of MagnetronModulator exists (Singleton pattern).
 
-        :param args: Positional arguments.
-        :param kwargs: Keyword arguments.
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of MagnetronModulator.
         """
+        if context is not None:
+            return super(MagnetronModulator, cls).__new__(cls)
+
         if cls._instance is None:
             cls._instance = super(MagnetronModulator, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initializes the MagnetronModulator, setting up logging, power history,
         sensor manager, and magnetron control.
+
+        :param context: The oven context to resolve dependencies from, or None for the singletons.
+        :type context: OvenContext | None
         """
         self.logger: Logger = Logger("MagnetronControl")
-        self.power_history: MagnetronRingbuffer = MagnetronRingbuffer(60 // MAGNETRON_ON_OFF_INTERVAL_IN_SECONDS)
-        self.sensor_manager: SensorManager = SensorManager()
-        self.magnetron: Magnetron = Magnetron()
+        self.settings: RuntimeConfig = Settings()
+        self.interval: float = self.settings.MAGNETRON_ON_OFF_INTERVAL_IN_SECONDS
+        self.power_history: MagnetronRingbuffer = MagnetronRingbuffer(60 // self.interval)
+        self.sensor_manager: SensorManager = OvenContext.resolve(context, SensorManager)
+        self.magnetron: Magnetron = OvenContext.resolve(context, Magnetron)
+        self.noise: NoiseStream = OvenContext.resolve(context, NoiseSource).stream("MagnetronModulator")
+        self.modulation: MagnetronModulation = MagnetronModulation[self.settings.MAGNETRON_MODULATION]
         self.target_power_share: float = 0.0
+        self.owed_power: float = 0.0
+        self.safety_hits: int = 0
         self.running: bool = False
-        self.thread: threading.Thread | None = None
+        self.thread: threading.Thread | ScheduledTask | None = None
+        self.runner: PeriodicRunner | ScheduledTask | None = None
+
+        self.settings.subscribe(self.apply_settings, "MAGNETRON_MODULATION", "MAGNETRON_ON_OFF_INTERVAL_IN_SECONDS")
+
+    def apply_settings(self, changes: Changes) -> None:
+        """
+        Switch to a changed modulation, starting without owed power, and apply a changed cycle interval.
+
+        :param changes: The previous and the new value of the changed settings, by name.
+        :type changes: Changes
+        :return: None
+        """
+        if "MAGNETRON_MODULATION" in changes:
+            self.modulation = MagnetronModulation[self.settings.MAGNETRON_MODULATION]
+            self.owed_power = 0.0
+            self.logger.log(f"Modulation switched to {self.modulation.name}", LogLevel.INFO)
+
+        if "MAGNETRON_ON_OFF_INTERVAL_IN_SECONDS" in changes:
+            self.interval = self.settings.MAGNETRON_ON_OFF_INTERVAL_IN_SECONDS
+            power_history: MagnetronRingbuffer = MagnetronRingbuffer(60 // self.interval, self.power_history.packed)
+            for powered in self.power_history.get()[-power_history.size:]:
+                power_history.add(powered)
+            self.power_history = power_history
+
+            if self.runner is not None:
+                self.runner.period = self.interval
+            self.logger.log(f"Magnetron cycle interval set to {self.interval}s", LogLevel.INFO)
 
     def start(self) -> None:
         """
-        Starts the magnetron control loop in a separate thread if not already running.
+        Starts the magnetron control loop on the installed scheduler, or in a separate thread
+        if none is installed, if not already running.
 
         :return: None
         """
         if not self.running:
             self.logger.log("Starting Magnetron control", LogLevel.INFO)
             self.running = True
-            self.thread = threading.Thread(target=self.magnetron_loop, name="MagnetronThread")
-            self.thread.start()
+            self.owed_power = 0.0
+
+            scheduler: SchedulerInterface | None = Scheduler()
+            if scheduler is not None:
+                self.thread = scheduler.schedule(self.magnetron_tick, self.interval, name="Magnetron")
+                self.runner = self.thread
+            else:
+                self.thread = Clock().spawn(self.magnetron_loop, "MagnetronThread")
         else:
             self.logger.log("Magnetron control is already running", LogLevel.WARNING)
 
@@ -68,7 +126,7 @@ class MagnetronModulator:
             self.logger.log("Stopping Magnetron control", LogLevel.INFO)
             self.running = False
             if self.thread:
-                self.thread.join()
+                Clock().join(self.thread)
             self.magnetron.turn_off()
         else:
             self.logger.log("Magnetron control is already stopped", LogLevel.WARNING)
@@ -105,13 +163,13 @@ class MagnetronModulator:
 
         :return: True if a safety hazard is detected, False otherwise.
         """
-        if self.power_history.power_share() > MAGNETRON_MAX_POWER_SHARE_PER_MINUTE:
+        if self.power_history.power_share() > self.settings.MAGNETRON_MAX_POWER_SHARE_PER_MINUTE:
             self.logger.log("Power share limit exceeded, skipping magnetron cycle", LogLevel.WARNING)
             return True
 
         magnetron_max_temp: float = max(self.sensor_manager.magnetron_temp1(), self.sensor_manager.magnetron_temp2())
 
-        if magnetron_max_temp > MAGNETRON_MAX_TEMP_IN_CELSIUS:
+        if magnetron_max_temp > self.settings.MAGNETRON_MAX_TEMP_IN_CELSIUS:
             self.logger.log(f"Magnetron temperature {magnetron_max_temp} exceeds limit, skipping cycle",
                             LogLevel.WARNING)
             return True
@@ -124,15 +182,53 @@ class MagnetronModulator:
 
         :return: None
         """
-        self.logger.log(f"Updating Magnetron - currently at {self.target_power_share}%", LogLevel.DEBUG)
+        self.logger.log("Updating Magnetron - currently at %s%%", LogLevel.DEBUG, self.target_power_share)
 
-        if self.safety_hazard() or random.uniform(0, 1) >= self.target_power_share:
+        hazard: bool = self.safety_hazard()
+        self.safety_hits += hazard
+
+        if hazard or not self.power_cycle():
             self.power_history.add(False)
             self.magnetron.turn_off()
         else:
             self.power_history.add(True)
             self.magnetron.turn_on()
 
+    def power_cycle(self) -> bool:
+        """
+        Decides whether the next cycle powers the magnetron, according to the modulation.
+
+        With sigma-delta modulation, the target power share is added to the owed power every cycle and a cycle
+        is powered once at least one full cycle is owed. Cycles that would lift the power share of the last
+        minute above the limit are deferred instead, and at most one cycle is owed while deferring.
+
+        :return: True if the cycle powers the magnetron, False otherwise.
+        """
+        if self.modulation is MagnetronModulation.RANDOM:
+            return self.noise.uniform(0, 1) < self.target_power_share
+
+        self.owed_power += self.target_power_share
+
+        if self.owed_power < 1.0 - 1e-9:
+            return False
+        if self.power_history.power_share_after(True) > self.settings.MAGNETRON_MAX_POWER_SHARE_PER_MINUTE:
+            self.owed_power = min(self.owed_power, 1.0)
+            return False
+
+        self.owed_power -= 1.0
+        return True
+
+    def magnetron_tick(self) -> bool:
+        """
+        Executes one iteration of the magnetron loop.
+
+        :return: True if the loop keeps running, False otherwise.
+        """
+        if self.running:
+            self.magnetron_cycle()
+
+        return self.running
+
     def magnetron_loop(self) -> None:
         """
         Main loop for controlling the magnetron, running in a separate thread.
@@ -141,6 +237,5 @@ class MagnetronModulator:
         """
         self.logger.log("Magnetron loop starting", LogLevel.INFO)
 
-        while self.running:
-            self.magnetron_cycle()
-            time.sleep(MAGNETRON_ON_OFF_INTERVAL_IN_SECONDS)
+        self.runner = PeriodicRunner(self.magnetron_tick, self.interval, "Magnetron", policy=OverrunPolicy.CATCH_UP)
+        self.runner.run()
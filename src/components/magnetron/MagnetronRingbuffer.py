@@ -1,22 +1,33 @@
-from src.helper.Ringbuffer import Ringbuffer
+from array import array
 
+from src.helper.TypedRingbuffer import TypedRingbuffer
 
-class MagnetronRingbuffer(Ringbuffer):
+
+class MagnetronRingbuffer(TypedRingbuffer):
     """
     A specialized ring buffer for storing boolean values, tracking the number of filled slots,
     and providing a method to calculate the share of `True` values (power share).
+
+    The number of filled slots and of `True` values are maintained on every add, so the power share
+    and the length are available in constant time. For long windows, the values can be stored bit-packed.
     """
 
-    def __init__(self, size: int) -> None:
+    def __init__(self, size: int, packed: bool = False) -> None:
         """
         Initialize the MagnetronRingbuffer with a given size.
 
         :param size: The maximum number of items the buffer can hold.
         :type size: int
+        :param packed: Whether to store the values as bits instead of one byte each. Defaults to False.
+        :type packed: bool
         :return: None
         """
-        super().__init__(int(size))
-        self.filled: int = 0
+        super().__init__(int(size), "B")
+        self.powered: int = 0
+        self.packed: bool = packed
+
+        if packed:
+            self.buffer: array | bytearray = bytearray((self.size + 7) // 8)
 
     def add(self, item: bool) -> None:
         """
@@ -29,8 +40,63 @@ class MagnetronRingbuffer(Ringbuffer):
         """
         if not isinstance(item, bool):
             raise ValueError("Item must be a boolean value")
-        super().add(item)
-        self.filled += 1 if self.filled < self.size else 0
+
+        if self.filled == self.size:
+            self.powered -= self._read(self.index)
+        self.powered += item
+
+        if self.packed:
+            self._write(self.index, item)
+            self.index = (self.index + 1) % self.size
+            self.filled = min(self.filled + 1, self.size)
+        else:
+            super().add(item)
+
+    def _read(self, index: int) -> bool:
+        """
+        Read the value stored at the given slot.
+
+        :param index: The slot to read.
+        :type index: int
+        :return: The value of the slot.
+        :rtype: bool
+        """
+        if self.packed:
+            return bool(self.buffer[index >> 3] >> (index & 7) & 1)
+        return bool(self.buffer[index])
+
+    def _write(self, index: int, item: bool) -> None:
+        """
+        Write a value to the given slot of the bit-packed storage.
+
+        :param index: The slot to write.
+        :type index: int
+        :param item: The value to write.
+        :type item: bool
+        :return: None
+        """
+        if item:
+            self.buffer[index >> 3] |= 1 << (index & 7)
+        else:
+            self.buffer[index >> 3] &= ~(1 << (index & 7))
+
+    def segments(self, window: int | None = None) -> tuple[memoryview, memoryview]:
+        """
+        Retrieve the newest items as two segments in FIFO order.
+
+        Bit-packed storage cannot be viewed directly, so its items are unpacked into the first segment.
+
+        :param window: The number of newest items to cover, or None for all items. Defaults to None.
+        :type window: int | None
+        :return: The older and the newer segment.
+        :rtype: tuple[memoryview, memoryview]
+        """
+        if not self.packed:
+            return super().segments(window)
+
+        count: int = self.filled if window is None else max(0, min(window, self.filled))
+        start: int = self.index - count
+        return memoryview(bytes(self._read((start + offset) % self.size) for offset in range(count))), memoryview(b"")
 
     def get(self) -> list:
         """
@@ -39,7 +105,7 @@ class MagnetronRingbuffer(Ringbuffer):
         :return: A list containing the buffer's items.
         :rtype: list
         """
-        return super().get()
+        return [bool(item) for item in super().get()]
 
     def power_share(self) -> float:
         """
@@ -50,13 +116,17 @@ class MagnetronRingbuffer(Ringbuffer):
         """
         if self.filled == 0:
             return 0
-        return sum(self.get()) / self.filled
+        return self.powered / self.filled
 
-    def __len__(self) -> int:
+    def power_share_after(self, item: bool) -> float:
         """
-        Get the number of items currently in the buffer.
+        Calculate the share of `True` values the buffer would have after adding an item.
 
-        :return: The number of items in the buffer.
-        :rtype: int
+        :param item: The boolean value that would be added.
+        :type item: bool
+        :return: The ratio of `True` values to the number of filled slots after adding the item.
+        :rtype: float
         """
-        return super().__len__()
+        if self.filled == self.size:
+            return (self.powered - self._read(self.index) + item) / self.size
+        return (self.powered + item) / (self.filled + 1)
@@ -1,3 +1,6 @@
+from src.helper.OvenContext import OvenContext
+
+
 class Reflector:
     """
     Singleton class representing a reflector with an adjustable angle.
@@ -8,23 +11,30 @@ class Reflector:
 
     _instance: 'Reflector' = None
 
-    def __new__(cls) -> 'Reflector':
+    def __new__(cls, context: OvenContext | None = None) -> 'Reflector':
         """
         Create or return the singleton instance of Reflector.
 
         :param cls: The class type.
         :type cls: type
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of Reflector.
         :rtype: Reflector
         """
+        if context is not None:
+            return super().__new__(cls)
+
         if not cls._instance:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initialize the Reflector instance with a default angle of 0.
 
+        :param context: The oven context the instance belongs to (unused).
+        :type context: OvenContext | None
         :return: None
         """
         self.angle: int = 0
@@ -1,6 +1,8 @@
 from src.components.reflector.Reflector import Reflector
 from src.helper.Logger import Logger
-from src.helper.config import REFLECTOR_STEP_IN_DEGREES, REFLECTOR_MIN_ANGLE_IN_DEGREES, REFLECTOR_MAX_ANGLE_IN_DEGREES
+from src.helper.OvenContext import OvenContext
+from src.helper.Settings import Settings
+from src.helper.configuration.RuntimeConfig import RuntimeConfig
 from src.helper.logging.LogLevel import LogLevel
 
 
@@ -10,30 +12,38 @@ class ReflectorController:
 
     This class provides methods to update the reflector's angle, set a target angle,
     stop the reflector, and perform an emergency stop. It ensures the angle remains
-    within defined bounds and logs all actions.
+    within the bounds of the runtime settings, which are read on every call, and logs all actions.
     """
 
     _instance: "ReflectorController" = None
 
-    def __new__(cls) -> "ReflectorController":
+    def __new__(cls, context: OvenContext | None = None) -> "ReflectorController":
         """
         Create or return the singleton instance of ReflectorController.
 
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of ReflectorController.
         :rtype: ReflectorController
         """
+        if context is not None:
+            return super().__new__(cls)
+
         if not cls._instance:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initialize the ReflectorController with a logger, reflector, and default target angle.
 
+        :param context: The oven context to resolve dependencies from, or None for the singletons.
+        :type context: OvenContext | None
         :return: None
         """
         self.logger: Logger = Logger("ReflectorControl")
-        self.reflector: Reflector = Reflector()
+        self.settings: RuntimeConfig = Settings()
+        self.reflector: Reflector = OvenContext.resolve(context, Reflector)
         self.target_angle: float = 0.0
 
     def update(self) -> None:
@@ -46,19 +56,20 @@ class ReflectorController:
         :return: None
         """
         self.logger.log("Updating Reflector", LogLevel.DEBUG)
+        step: float = self.settings.REFLECTOR_STEP_IN_DEGREES
 
         if self.reflector.angle != self.target_angle:
-            if abs(self.target_angle - self.reflector.angle) <= REFLECTOR_STEP_IN_DEGREES:
+            if abs(self.target_angle - self.reflector.angle) <= step:
                 self.reflector.angle = self.target_angle
             else:
                 if self.target_angle > self.reflector.angle:
-                    self.reflector.angle += REFLECTOR_STEP_IN_DEGREES
+                    self.reflector.angle += step
                 else:
-                    self.reflector.angle -= REFLECTOR_STEP_IN_DEGREES
+                    self.reflector.angle -= step
 
         self.reflector.angle = max(
-            REFLECTOR_MIN_ANGLE_IN_DEGREES,
-            min(REFLECTOR_MAX_ANGLE_IN_DEGREES, self.reflector.angle)
+            self.settings.REFLECTOR_MIN_ANGLE_IN_DEGREES,
+            min(self.settings.REFLECTOR_MAX_ANGLE_IN_DEGREES, self.reflector.angle)
         )
 
     def set_angle(self, angle: float) -> None:
@@ -70,16 +81,16 @@ class ReflectorController:
         :raises ValueError: If the angle is outside the allowed range.
         :return: None
         """
-        if angle < REFLECTOR_MIN_ANGLE_IN_DEGREES or angle > REFLECTOR_MAX_ANGLE_IN_DEGREES:
-            raise ValueError(
-                f"Angle must be between {REFLECTOR_MIN_ANGLE_IN_DEGREES} and {REFLECTOR_MAX_ANGLE_IN_DEGREES} degrees."
-            )
+        minimum: float = self.settings.REFLECTOR_MIN_ANGLE_IN_DEGREES
+        maximum: float = self.settings.REFLECTOR_MAX_ANGLE_IN_DEGREES
+        if angle < minimum or angle > maximum:
+            raise ValueError(f"Angle must be between {minimum} and {maximum} degrees.")
 
         if angle == self.target_angle:
             return
 
         self.target_angle = angle
-        self.logger.info(f"Changing the reflector target_angle to {angle}.", LogLevel.INFO)
+        self.logger.log(f"Changing the reflector target_angle to {angle}.", LogLevel.INFO)
 
     def stop(self) -> None:
         """
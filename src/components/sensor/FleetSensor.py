@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.components.sensor.SimulationSensor import SimulationSensor
+
+if TYPE_CHECKING:
+    from src.components.sensor.FleetSensorEngine import FleetSensorEngine
+
+
+class FleetSensor(SimulationSensor):
+    """
+    Sensor reading one oven's value from the arrays of a FleetSensorEngine.
+
+    The engine advances all ovens in one batched step, so updating a single fleet sensor does nothing.
+
+    :ivar engine: The engine holding the sensor values.
+    :ivar field: The name of the engine array this sensor reads.
+    :ivar slot: The index of the oven within the engine arrays.
+    """
+
+    def __init__(self, engine: FleetSensorEngine, field: str, slot: int) -> None:
+        """
+        Initialize the FleetSensor for one slot of an engine array.
+
+        :param engine: The engine holding the sensor values.
+        :type engine: FleetSensorEngine
+        :param field: The name of the engine array this sensor reads.
+        :type field: str
+        :param slot: The index of the oven within the engine arrays.
+        :type slot: int
+        :return: None
+        """
+        self.engine: FleetSensorEngine = engine
+        self.field: str = field
+        self.slot: int = slot
+
+    def get(self) -> float:
+        """
+        Get the current value of this oven from the engine array.
+
+        :return: The current sensor value.
+        :rtype: float
+        """
+        return float(getattr(self.engine, self.field)[self.slot])
+
+    def update(self) -> None:
+        """
+        Do nothing, as the engine updates all ovens in one batched step.
+
+        :return: None
+        """
+
+    def reset(self) -> None:
+        """
+        Reset the value of this oven to its initial value.
+
+        :return: None
+        """
+        self.engine.reset(self.slot, self.field)
@@ -0,0 +1,192 @@
+import numpy as np
+
+from src.components.cooling.CoolingFan import CoolingFan
+from src.components.door.Door import Door
+from src.components.magnetron.Magnetron import Magnetron
+from src.components.sensor.FleetSensor import FleetSensor
+from src.components.sensor.SimulationSensorHumidity import SimulationSensorHumidity
+from src.components.sensor.SimulationSensorMagnetronTemp1 import SimulationSensorMagnetronTemp1
+from src.components.sensor.SimulationSensorMagnetronTemp2 import SimulationSensorMagnetronTemp2
+from src.components.sensor.SimulationSensorTemp1 import SimulationSensorTemp1
+from src.components.sensor.SimulationSensorTemp2 import SimulationSensorTemp2
+from src.components.sensor.SimulationSensorWeight import SimulationSensorWeight
+from src.helper.OvenContext import OvenContext
+from src.helper.config import AMBIENT_TEMPERATURE_IN_CELSIUS, AMBIENT_HUMIDITY_IN_PERCENT, TURNTABLE_WEIGHT_IN_GRAMS
+
+
+class FleetSensorEngine:
+    """
+    Struct-of-arrays simulation backend for the sensors of many ovens.
+
+    Every sensor value and every actuator input is stored in one contiguous array with one slot per oven,
+    and all ovens are advanced in a single vectorized step following the same rules as the simulation
+    sensors. Attaching an oven context registers FleetSensor instances reading its slot, so the SensorManager
+    of that oven reads from the arrays without further changes.
+
+    :ivar size: The number of attached ovens.
+    :ivar rng: The random generator used for the sensor noise.
+    """
+
+    FIELDS: dict[str, tuple[type, float]] = {
+        "temp1": (SimulationSensorTemp1, AMBIENT_TEMPERATURE_IN_CELSIUS),
+        "temp2": (SimulationSensorTemp2, AMBIENT_TEMPERATURE_IN_CELSIUS),
+        "humidity": (SimulationSensorHumidity, AMBIENT_HUMIDITY_IN_PERCENT),
+        "weight": (SimulationSensorWeight, float(TURNTABLE_WEIGHT_IN_GRAMS)),
+        "magnetron_temp1": (SimulationSensorMagnetronTemp1, AMBIENT_TEMPERATURE_IN_CELSIUS),
+        "magnetron_temp2": (SimulationSensorMagnetronTemp2, AMBIENT_TEMPERATURE_IN_CELSIUS),
+    }
+    """dict[str, tuple[type, float]]: The sensor arrays with the sensor type they replace and their initial value."""
+
+    def __init__(self, capacity: int = 1024, seed: int | None = None) -> None:
+        """
+        Initialize the engine with empty arrays.
+
+        :param capacity: The number of slots allocated up front. The arrays grow when exceeded. Defaults to 1024.
+        :type capacity: int
+        :param seed: The seed of the noise generator, or None for a random seed. Defaults to None.
+        :type seed: int | None
+        :return: None
+        :raises ValueError: If the capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError(f"Capacity must be positive, got {capacity}")
+
+        self.size: int = 0
+        self.rng: np.random.Generator = np.random.default_rng(seed)
+
+        self.temp1: np.ndarray = np.empty(0)
+        self.temp2: np.ndarray = np.empty(0)
+        self.humidity: np.ndarray = np.empty(0)
+        self.weight: np.ndarray = np.empty(0)
+        self.magnetron_temp1: np.ndarray = np.empty(0)
+        self.magnetron_temp2: np.ndarray = np.empty(0)
+
+        self.magnetron_active: np.ndarray = np.empty(0, dtype=bool)
+        self.door_opened: np.ndarray = np.empty(0, dtype=bool)
+        self.last_door_opened: np.ndarray = np.empty(0, dtype=bool)
+        self.cooling_fan_power: np.ndarray = np.empty(0)
+
+        self.magnetrons: list[Magnetron] = []
+        self.doors: list[Door] = []
+        self.cooling_fans: list[CoolingFan] = []
+
+        self._grow(capacity)
+
+    def _grow(self, capacity: int) -> None:
+        """
+        Reallocate all arrays with the given capacity, keeping the values of the attached ovens.
+
+        :param capacity: The new number of slots.
+        :type capacity: int
+        :return: None
+        """
+        for field, (_, initial) in self.FIELDS.items():
+            array: np.ndarray = np.full(capacity, initial)
+            array[:self.size] = getattr(self, field)[:self.size]
+            setattr(self, field, array)
+
+        for field, dtype in (("magnetron_active", bool), ("door_opened", bool), ("last_door_opened", bool),
+                             ("cooling_fan_power", float)):
+            array = np.zeros(capacity, dtype=dtype)
+            array[:self.size] = getattr(self, field)[:self.size]
+            setattr(self, field, array)
+
+    def attach(self, context: OvenContext) -> int:
+        """
+        Allocate a slot for the oven of the given context and register its fleet sensors in that context.
+
+        Must be called before the SensorManager of the context is created.
+
+        :param context: The context of the oven.
+        :type context: OvenContext
+        :return: The slot of the oven.
+        :rtype: int
+        """
+        if self.size == len(self.temp1):
+            self._grow(2 * self.size)
+
+        slot: int = self.size
+        self.size += 1
+
+        self.magnetrons.append(context.get(Magnetron))
+        self.doors.append(context.get(Door))
+        self.cooling_fans.append(context.get(CoolingFan))
+
+        for field, (sensor_type, _) in self.FIELDS.items():
+            context.register(sensor_type, FleetSensor(self, field, slot))
+
+        return slot
+
+    def gather_inputs(self) -> None:
+        """
+        Copy the magnetron, door and cooling fan states of all attached ovens into the input arrays.
+
+        :return: None
+        """
+        size: int = self.size
+        self.magnetron_active[:size] = [magnetron.active for magnetron in self.magnetrons]
+        self.door_opened[:size] = [door.opened for door in self.doors]
+        self.cooling_fan_power[:size] = [cooling_fan.power_share for cooling_fan in self.cooling_fans]
+
+    def step(self) -> None:
+        """
+        Advance the sensors of all attached ovens by one simulation step.
+
+        Applies the rules of the simulation sensors to all slots at once.
+
+        :return: None
+        """
+        self.gather_inputs()
+
+        size: int = self.size
+        active: np.ndarray = self.magnetron_active[:size]
+        opened: np.ndarray = self.door_opened[:size]
+        noise: np.ndarray = self.rng.uniform(-0.01, 0.01, (5, size))
+
+        inner_delta: np.ndarray = np.where(active, 0.1, -0.02) - 0.1 * opened
+        for index, (values, ambient) in enumerate(((self.temp1, AMBIENT_TEMPERATURE_IN_CELSIUS),
+                                                   (self.temp2, AMBIENT_TEMPERATURE_IN_CELSIUS),
+                                                   (self.humidity, AMBIENT_HUMIDITY_IN_PERCENT))):
+            self._advance(values[:size], inner_delta, ambient, noise[index])
+
+        magnetron_delta: np.ndarray = np.where(active, 0.3, -0.05) - 0.4 * self.cooling_fan_power[:size]
+        for index, values in enumerate((self.magnetron_temp1, self.magnetron_temp2), start=3):
+            self._advance(values[:size], magnetron_delta, AMBIENT_TEMPERATURE_IN_CELSIUS, noise[index])
+
+        weight: np.ndarray = self.weight[:size]
+        weight += 530 * (opened & ~self.last_door_opened[:size])
+        weight += self.rng.uniform(-0.1, 0.1, size)
+        self.last_door_opened[:size] = opened
+
+    @staticmethod
+    def _advance(values: np.ndarray, delta: np.ndarray, minimum: float, noise: np.ndarray) -> None:
+        """
+        Apply a step to the given values in place, clamp them to the minimum and add the noise.
+
+        :param values: The values to advance.
+        :type values: np.ndarray
+        :param delta: The change of the values.
+        :type delta: np.ndarray
+        :param minimum: The lower bound before the noise is added.
+        :type minimum: float
+        :param noise: The noise added after clamping.
+        :type noise: np.ndarray
+        :return: None
+        """
+        values += delta
+        np.maximum(values, minimum, out=values)
+        values += noise
+
+    def reset(self, slot: int, field: str | None = None) -> None:
+        """
+        Reset the sensor values of one oven to their initial values.
+
+        :param slot: The slot of the oven.
+        :type slot: int
+        :param field: The sensor array to reset, or None for all of them. Defaults to None.
+        :type field: str | None
+        :return: None
+        """
+        for name, (_, initial) in self.FIELDS.items():
+            if field is None or field == name:
+                getattr(self, name)[slot] = initial
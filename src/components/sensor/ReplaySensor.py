@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.components.sensor.SimulationSensor import SimulationSensor
+
+if TYPE_CHECKING:
+    from src.helper.replay.ReplayEngine import ReplayEngine
+
+
+class ReplaySensor(SimulationSensor):
+    """
+    Sensor returning the values of one column of a recorded session.
+
+    The replay engine moves to the next row after every sensor update of the oven, so updating a single
+    replay sensor does nothing.
+
+    :ivar engine: The engine replaying the session.
+    :ivar column: The name of the recorded column this sensor reads.
+    """
+
+    def __init__(self, engine: ReplayEngine, column: str) -> None:
+        """
+        Initialize the ReplaySensor for one recorded column.
+
+        :param engine: The engine replaying the session.
+        :type engine: ReplayEngine
+        :param column: The name of the recorded column this sensor reads.
+        :type column: str
+        :return: None
+        """
+        self.engine: ReplayEngine = engine
+        self.column: str = column
+
+    def get(self) -> float:
+        """
+        Get the recorded value of the current row.
+
+        :return: The recorded sensor value.
+        :rtype: float
+        """
+        return float(self.engine.trace[self.column][self.engine.cursor])
+
+    def update(self) -> None:
+        """
+        Do nothing, as the engine moves all sensors to the next row at once.
+
+        :return: None
+        """
+
+    def reset(self) -> None:
+        """
+        Do nothing, as recorded values cannot be reset.
+
+        :return: None
+        """
@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from src.components.sensor.SimulationSensor import SimulationSensor
 from src.components.sensor.SimulationSensorHumidity import SimulationSensorHumidity
 from src.components.sensor.SimulationSensorMagnetronTemp1 import SimulationSensorMagnetronTemp1
@@ -6,8 +10,12 @@ from src.components.sensor.SimulationSensorTemp1 import SimulationSensorTemp1
 from src.components.sensor.SimulationSensorTemp2 import SimulationSensorTemp2
 from src.components.sensor.SimulationSensorWeight import SimulationSensorWeight
 from src.helper.Logger import Logger
+from src.helper.OvenContext import OvenContext
 from src.helper.logging.LogLevel import LogLevel
 
+if TYPE_CHECKING:
+    from src.helper.telemetry.TelemetryRecorder import TelemetryRecorder
+
 
 class SensorManager:
     """
@@ -17,30 +25,42 @@ class SensorManager:
 
     _instance: 'SensorManager' = None
 
-    def __new__(cls) -> 'SensorManager':
+    def __new__(cls, context: OvenContext | None = None) -> 'SensorManager':
         """
         Ensures only one instance of SensorManager exists (Singleton pattern).
 
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of SensorManager.
         :rtype: SensorManager
         """
+        if context is not None:
+            return super().__new__(cls)
+
         if not cls._instance:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
-        Initializes all simulation sensors and the logger.
+        Initializes all simulation sensors and the logger. An attached recorder stays attached.
+
+        :param context: The oven context to resolve dependencies from, or None for the singletons.
+        :type context: OvenContext | None
         """
         self.logger: Logger = Logger("Sensors")
 
-        self.temp1_sensor: SimulationSensorTemp1 = SimulationSensorTemp1()
-        self.temp2_sensor: SimulationSensorTemp2 = SimulationSensorTemp2()
-        self.humidity_sensor: SimulationSensorHumidity = SimulationSensorHumidity()
-        self.weight_sensor: SimulationSensorWeight = SimulationSensorWeight()
+        self.temp1_sensor: SimulationSensorTemp1 = OvenContext.resolve(context, SimulationSensorTemp1)
+        self.temp2_sensor: SimulationSensorTemp2 = OvenContext.resolve(context, SimulationSensorTemp2)
+        self.humidity_sensor: SimulationSensorHumidity = OvenContext.resolve(context, SimulationSensorHumidity)
+        self.weight_sensor: SimulationSensorWeight = OvenContext.resolve(context, SimulationSensorWeight)
 
-        self.magnetron_temp1_sensor: SimulationSensorMagnetronTemp1 = SimulationSensorMagnetronTemp1()
-        self.magnetron_temp2_sensor: SimulationSensorMagnetronTemp2 = SimulationSensorMagnetronTemp2()
+        self.magnetron_temp1_sensor: SimulationSensorMagnetronTemp1 = OvenContext.resolve(
+            context, SimulationSensorMagnetronTemp1
+        )
+        self.magnetron_temp2_sensor: SimulationSensorMagnetronTemp2 = OvenContext.resolve(
+            context, SimulationSensorMagnetronTemp2
+        )
 
         self.sensors: list[SimulationSensor] = [
             self.temp1_sensor,
@@ -51,9 +71,12 @@ class SensorManager:
             self.magnetron_temp2_sensor
         ]
 
+        # Keep a recorder attached to the singleton when it is retrieved again
+        self.recorder: TelemetryRecorder | None = getattr(self, "recorder", None)
+
     def update_sensors(self) -> None:
         """
-        Updates all sensors and logs their current values.
+        Updates all sensors, records them if a recorder is attached and logs their current values.
 
         :return: None
         """
@@ -61,12 +84,15 @@ class SensorManager:
         for sensor in self.sensors:
             sensor.update()
 
-        self.logger.log(f"Magnetron Temp 1: {self.magnetron_temp1()}", LogLevel.DEBUG)
-        self.logger.log(f"Magnetron Temp 2: {self.magnetron_temp2()}", LogLevel.DEBUG)
-        self.logger.log(f"Inner Temp 1: {self.inner_temp1()}", LogLevel.DEBUG)
-        self.logger.log(f"Inner Temp 2: {self.inner_temp2()}", LogLevel.DEBUG)
-        self.logger.log(f"Inner Weight: {self.inner_weight()}", LogLevel.DEBUG)
-        self.logger.log(f"Inner humidity: {self.inner_humidity()}", LogLevel.DEBUG)
+        if self.recorder is not None:
+            self.recorder.record()
+
+        self.logger.log("Magnetron Temp 1: %s", LogLevel.DEBUG, self.magnetron_temp1())
+        self.logger.log("Magnetron Temp 2: %s", LogLevel.DEBUG, self.magnetron_temp2())
+        self.logger.log("Inner Temp 1: %s", LogLevel.DEBUG, self.inner_temp1())
+        self.logger.log("Inner Temp 2: %s", LogLevel.DEBUG, self.inner_temp2())
+        self.logger.log("Inner Weight: %s", LogLevel.DEBUG, self.inner_weight())
+        self.logger.log("Inner humidity: %s", LogLevel.DEBUG, self.inner_humidity())
 
     def reset(self) -> None:
         """
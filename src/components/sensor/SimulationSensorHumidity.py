@@ -1,9 +1,10 @@
-import random
-
 from src.components.door.Door import Door
 from src.components.magnetron.Magnetron import Magnetron
 from src.components.sensor.SimulationSensor import SimulationSensor
+from src.helper.OvenContext import OvenContext
 from src.helper.config import AMBIENT_HUMIDITY_IN_PERCENT
+from src.helper.noise.NoiseSource import NoiseSource
+from src.helper.noise.NoiseStream import NoiseStream
 
 
 class SimulationSensorHumidity(SimulationSensor):
@@ -16,25 +17,34 @@ class SimulationSensorHumidity(SimulationSensor):
 
     _instance: "SimulationSensorHumidity" = None
 
-    def __new__(cls) -> "SimulationSensorHumidity":
+    def __new__(cls, context: OvenContext | None = None) -> "SimulationSensorHumidity":
         """
         Create or return the singleton instance of SimulationSensorHumidity.
 
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of SimulationSensorHumidity.
         :rtype: SimulationSensorHumidity
         """
+        if context is not None:
+            return super().__new__(cls)
+
         if not cls._instance:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initialize the SimulationSensorHumidity instance.
 
         Sets up the magnetron, door, and initial humidity value.
+
+        :param context: The oven context to resolve dependencies from, or None for the singletons.
+        :type context: OvenContext | None
         """
-        self.magnetron: Magnetron = Magnetron()
-        self.door: Door = Door()
+        self.magnetron: Magnetron = OvenContext.resolve(context, Magnetron)
+        self.door: Door = OvenContext.resolve(context, Door)
+        self.noise: NoiseStream = OvenContext.resolve(context, NoiseSource).stream("SimulationSensorHumidity")
         self.humidity: float = AMBIENT_HUMIDITY_IN_PERCENT
 
     def get(self) -> float:
@@ -66,7 +76,7 @@ class SimulationSensorHumidity(SimulationSensor):
             self.humidity -= 0.1
 
         self.humidity = max(AMBIENT_HUMIDITY_IN_PERCENT, self.humidity)
-        self.humidity += random.uniform(-0.01, 0.01)
+        self.humidity += self.noise.uniform(-0.01, 0.01)
 
     def reset(self) -> None:
         """
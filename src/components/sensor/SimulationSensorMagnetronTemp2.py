@@ -1,9 +1,10 @@
-import random
-
 from src.components.cooling.CoolingFan import CoolingFan
 from src.components.magnetron.Magnetron import Magnetron
 from src.components.sensor.SimulationSensor import SimulationSensor
+from src.helper.OvenContext import OvenContext
 from src.helper.config import AMBIENT_TEMPERATURE_IN_CELSIUS
+from src.helper.noise.NoiseSource import NoiseSource
+from src.helper.noise.NoiseStream import NoiseStream
 
 
 class SimulationSensorMagnetronTemp2(SimulationSensor):
@@ -19,23 +20,32 @@ class SimulationSensorMagnetronTemp2(SimulationSensor):
     """
     _instance: 'SimulationSensorMagnetronTemp2' = None
 
-    def __new__(cls) -> 'SimulationSensorMagnetronTemp2':
+    def __new__(cls, context: OvenContext | None = None) -> 'SimulationSensorMagnetronTemp2':
         """
         Create or return the singleton instance of the class.
 
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of SimulationSensorMagnetronTemp2.
         :rtype: SimulationSensorMagnetronTemp2
         """
+        if context is not None:
+            return super().__new__(cls)
+
         if not cls._instance:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initialize the simulation sensor with default values.
+
+        :param context: The oven context to resolve dependencies from, or None for the singletons.
+        :type context: OvenContext | None
         """
-        self.magnetron: Magnetron = Magnetron()
-        self.cooling_fan: CoolingFan = CoolingFan()
+        self.magnetron: Magnetron = OvenContext.resolve(context, Magnetron)
+        self.cooling_fan: CoolingFan = OvenContext.resolve(context, CoolingFan)
+        self.noise: NoiseStream = OvenContext.resolve(context, NoiseSource).stream("SimulationSensorMagnetronTemp2")
         self.temperature: float = AMBIENT_TEMPERATURE_IN_CELSIUS
 
     def get(self) -> float:
@@ -59,7 +69,7 @@ class SimulationSensorMagnetronTemp2(SimulationSensor):
 
         self.temperature -= 0.4 * self.cooling_fan.power_share
         self.temperature = max(AMBIENT_TEMPERATURE_IN_CELSIUS, self.temperature)
-        self.temperature += random.uniform(-0.01, 0.01)
+        self.temperature += self.noise.uniform(-0.01, 0.01)
 
     def reset(self) -> None:
         """
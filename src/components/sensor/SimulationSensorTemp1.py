@@ -1,9 +1,10 @@
-import random
-
 from src.components.door.Door import Door
 from src.components.magnetron.Magnetron import Magnetron
 from src.components.sensor.SimulationSensor import SimulationSensor
+from src.helper.OvenContext import OvenContext
 from src.helper.config import AMBIENT_TEMPERATURE_IN_CELSIUS
+from src.helper.noise.NoiseSource import NoiseSource
+from src.helper.noise.NoiseStream import NoiseStream
 
 
 class SimulationSensorTemp1(SimulationSensor):
@@ -15,25 +16,33 @@ class SimulationSensorTemp1(SimulationSensor):
 
     _instance: "SimulationSensorTemp1" = None
 
-    def __new__(cls) -> "SimulationSensorTemp1":
+    def __new__(cls, context: OvenContext | None = None) -> "SimulationSensorTemp1":
         """
         Create or return the singleton instance of SimulationSensorTemp1.
 
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of SimulationSensorTemp1.
         :rtype: SimulationSensorTemp1
         """
+        if context is not None:
+            return super().__new__(cls)
+
         if not cls._instance:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initialize the SimulationSensorTemp1 instance.
 
+        :param context: The oven context to resolve dependencies from, or None for the singletons.
+        :type context: OvenContext | None
         :return: None
         """
-        self.magnetron: Magnetron = Magnetron()
-        self.door: Door = Door()
+        self.magnetron: Magnetron = OvenContext.resolve(context, Magnetron)
+        self.door: Door = OvenContext.resolve(context, Door)
+        self.noise: NoiseStream = OvenContext.resolve(context, NoiseSource).stream("SimulationSensorTemp1")
         self.temperature: float = AMBIENT_TEMPERATURE_IN_CELSIUS
 
     def get(self) -> float:
@@ -60,7 +69,7 @@ class SimulationSensorTemp1(SimulationSensor):
             self.temperature -= 0.1
 
         self.temperature = max(AMBIENT_TEMPERATURE_IN_CELSIUS, self.temperature)
-        self.temperature += random.uniform(-0.01, 0.01)
+        self.temperature += self.noise.uniform(-0.01, 0.01)
 
     def reset(self) -> None:
         """
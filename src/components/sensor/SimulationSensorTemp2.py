@@ -1,9 +1,10 @@
-import random
-
 from src.components.door.Door import Door
 from src.components.magnetron.Magnetron import Magnetron
 from src.components.sensor.SimulationSensor import SimulationSensor
+from src.helper.OvenContext import OvenContext
 from src.helper.config import AMBIENT_TEMPERATURE_IN_CELSIUS
+from src.helper.noise.NoiseSource import NoiseSource
+from src.helper.noise.NoiseStream import NoiseStream
 
 
 class SimulationSensorTemp2(SimulationSensor):
@@ -23,23 +24,32 @@ class SimulationSensorTemp2(SimulationSensor):
 
     _instance: 'SimulationSensorTemp2' = None
 
-    def __new__(cls) -> 'SimulationSensorTemp2':
+    def __new__(cls, context: OvenContext | None = None) -> 'SimulationSensorTemp2':
         """
         Ensures only one instance of SimulationSensorTemp2 exists.
 
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of SimulationSensorTemp2.
         :rtype: SimulationSensorTemp2
         """
+        if context is not None:
+            return super().__new__(cls)
+
         if not cls._instance:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initializes the SimulationSensorTemp2 instance with default values.
+
+        :param context: The oven context to resolve dependencies from, or None for the singletons.
+        :type context: OvenContext | None
         """
-        self.magnetron: Magnetron = Magnetron()
-        self.door: Door = Door()
+        self.magnetron: Magnetron = OvenContext.resolve(context, Magnetron)
+        self.door: Door = OvenContext.resolve(context, Door)
+        self.noise: NoiseStream = OvenContext.resolve(context, NoiseSource).stream("SimulationSensorTemp2")
         self.temperature: float = AMBIENT_TEMPERATURE_IN_CELSIUS
 
     def get(self) -> float:
@@ -67,7 +77,7 @@ class SimulationSensorTemp2(SimulationSensor):
             self.temperature -= 0.1
 
         self.temperature = max(AMBIENT_TEMPERATURE_IN_CELSIUS, self.temperature)
-        self.temperature += random.uniform(-0.01, 0.01)
+        self.temperature += self.noise.uniform(-0.01, 0.01)
 
     def reset(self) -> None:
         """
@@ -1,8 +1,9 @@
-import random
-
 from src.components.door.Door import Door
 from src.components.sensor.SimulationSensor import SimulationSensor
+from src.helper.OvenContext import OvenContext
 from src.helper.config import TURNTABLE_WEIGHT_IN_GRAMS
+from src.helper.noise.NoiseSource import NoiseSource
+from src.helper.noise.NoiseStream import NoiseStream
 
 
 class SimulationSensorWeight(SimulationSensor):
@@ -14,24 +15,33 @@ class SimulationSensorWeight(SimulationSensor):
 
     _instance: 'SimulationSensorWeight' = None
 
-    def __new__(cls) -> 'SimulationSensorWeight':
+    def __new__(cls, context: OvenContext | None = None) -> 'SimulationSensorWeight':
         """
         Create or return the singleton instance of SimulationSensorWeight.
 
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of SimulationSensorWeight.
         :rtype: SimulationSensorWeight
         """
+        if context is not None:
+            return super().__new__(cls)
+
         if not cls._instance:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initialize the SimulationSensorWeight instance.
 
         Sets up the door sensor, last door state, and initial weight.
+
+        :param context: The oven context to resolve dependencies from, or None for the singletons.
+        :type context: OvenContext | None
         """
-        self.door: Door = Door()
+        self.door: Door = OvenContext.resolve(context, Door)
+        self.noise: NoiseStream = OvenContext.resolve(context, NoiseSource).stream("SimulationSensorWeight")
         self.last_door_opened: bool = False
         self.weight: float = TURNTABLE_WEIGHT_IN_GRAMS
 
@@ -54,7 +64,7 @@ class SimulationSensorWeight(SimulationSensor):
             self.weight += 530
 
         self.last_door_opened = self.door.opened
-        self.weight += random.uniform(-0.1, 0.1)
+        self.weight += self.noise.uniform(-0.1, 0.1)
 
     def reset(self) -> None:
         """
@@ -1,3 +1,6 @@
+from src.helper.OvenContext import OvenContext
+
+
 class Turntable:
     """
     Singleton class representing a turntable with adjustable rotations per minute (RPM).
@@ -7,23 +10,31 @@ class Turntable:
 
     _instance: 'Turntable' = None
 
-    def __new__(cls) -> 'Turntable':
+    def __new__(cls, context: OvenContext | None = None) -> 'Turntable':
         """
         Create or return the singleton instance of Turntable.
 
         :param cls: The class type.
         :type cls: type
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of Turntable.
         :rtype: Turntable
         """
+        if context is not None:
+            return super().__new__(cls)
+
         if not cls._instance:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initialize the Turntable instance.
 
         Sets the rotations per minute (RPM) to 0.0.
+
+        :param context: The oven context the instance belongs to (unused).
+        :type context: OvenContext | None
         """
         self.rotations_per_minute: float = 0.0
@@ -1,7 +1,8 @@
 from src.components.turntable.Turntable import Turntable
 from src.helper.Logger import Logger
-from src.helper.config import TURNTABLE_STEP_IN_ROTATIONS_PER_MINUTE, TURNTABLE_MIN_ROTATIONS_PER_MINUTE, \
-    TURNTABLE_MAX_ROTATIONS_PER_MINUTE
+from src.helper.OvenContext import OvenContext
+from src.helper.Settings import Settings
+from src.helper.configuration.RuntimeConfig import RuntimeConfig
 from src.helper.logging.LogLevel import LogLevel
 
 
@@ -11,29 +12,39 @@ class TurntableController:
 
     This class provides methods to update the turntable's speed, set a target speed,
     stop the turntable, and perform an emergency stop. It ensures that only one instance
-    of the controller exists throughout the application.
+    of the controller exists throughout the application. The speed limits and the step are read from
+    the runtime settings on every call.
     """
     _instance: 'TurntableController' = None
 
-    def __new__(cls) -> 'TurntableController':
+    def __new__(cls, context: OvenContext | None = None) -> 'TurntableController':
         """
         Create or return the singleton instance of TurntableController.
 
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of TurntableController.
         :rtype: TurntableController
         """
+        if context is not None:
+            return super().__new__(cls)
+
         if not cls._instance:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initialize the TurntableController instance.
 
         Sets up the logger, the turntable object, and initializes the target speed.
+
+        :param context: The oven context to resolve dependencies from, or None for the singletons.
+        :type context: OvenContext | None
         """
         self.logger: Logger = Logger("TurntableControl")
-        self.turntable: Turntable = Turntable()
+        self.settings: RuntimeConfig = Settings()
+        self.turntable: Turntable = OvenContext.resolve(context, Turntable)
         self.target_rotations_per_minute: float = 0.0
 
     def update(self) -> None:
@@ -43,16 +54,16 @@ class TurntableController:
         Gradually adjusts the turntable's speed in steps until it matches the target speed.
         """
         self.logger.log("Updating Turntable", LogLevel.DEBUG)
+        step: float = self.settings.TURNTABLE_STEP_IN_ROTATIONS_PER_MINUTE
 
         if self.turntable.rotations_per_minute != self.target_rotations_per_minute:
-            if (abs(self.target_rotations_per_minute - self.turntable.rotations_per_minute)
-                    <= TURNTABLE_STEP_IN_ROTATIONS_PER_MINUTE):
+            if abs(self.target_rotations_per_minute - self.turntable.rotations_per_minute) <= step:
                 self.turntable.rotations_per_minute = self.target_rotations_per_minute
             else:
                 if self.target_rotations_per_minute > self.turntable.rotations_per_minute:
-                    self.turntable.rotations_per_minute += TURNTABLE_STEP_IN_ROTATIONS_PER_MINUTE
+                    self.turntable.rotations_per_minute += step
                 else:
-                    self.turntable.rotations_per_minute -= TURNTABLE_STEP_IN_ROTATIONS_PER_MINUTE
+                    self.turntable.rotations_per_minute -= step
 
     def set_speed(self, rotations_per_minute: float) -> None:
         """
@@ -63,9 +74,10 @@ class TurntableController:
         :raises ValueError: If the speed is outside the allowed range.
         :return: None
         """
-        if (rotations_per_minute < TURNTABLE_MIN_ROTATIONS_PER_MINUTE
-                or rotations_per_minute > TURNTABLE_MAX_ROTATIONS_PER_MINUTE):
-            raise ValueError("Rotations per minute must be between -5 and 5.")
+        minimum: float = self.settings.TURNTABLE_MIN_ROTATIONS_PER_MINUTE
+        maximum: float = self.settings.TURNTABLE_MAX_ROTATIONS_PER_MINUTE
+        if rotations_per_minute < minimum or rotations_per_minute > maximum:
+            raise ValueError(f"Rotations per minute must be between {minimum} and {maximum}.")
 
         if rotations_per_minute == self.target_rotations_per_minute:
             return
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import weakref
 from typing import TYPE_CHECKING, Callable, Any
 
 from src.helper.Logger import Logger, LogLevel
+from src.helper.OvenContext import OvenContext
 from src.helper.exceptions import CustomException, MockException, DoorException, ProgramAlreadyRunningException
 
 if TYPE_CHECKING:
     from src.SystemControl import SystemControl
+    from src.emergency.FlightRecorder import FlightRecorder
 
 
 class EmergencyHandler:
@@ -16,30 +19,67 @@ class EmergencyHandler:
     Attributes
     ----------
     error : CustomException | None
-        Stores the current error that triggered the emergency state.
+        Stores the current error that triggered the emergency state of this handler's oven.
+    emergencies : int
+        Number of emergencies declared for this handler's oven. The count is kept per oven outside the handler,
+        so it survives a factory reset, which creates the handler anew.
     logger : Logger
         Logger instance for logging emergency events.
     _instance : EmergencyHandler | None
         Singleton instance of the EmergencyHandler.
     """
 
-    error: CustomException | None = None
     logger: Logger = Logger("EmergencyHandler")
     _instance: EmergencyHandler | None = None
+    _emergencies: weakref.WeakKeyDictionary[object, int] = weakref.WeakKeyDictionary()
 
-    def __new__(cls, *args: Any, **kwargs: Any) -> EmergencyHandler:
+    def __new__(cls, context: OvenContext | None = None) -> EmergencyHandler:
         """
         Ensures only one instance of EmergencyHandler exists (Singleton pattern).
 
-        :param args: Positional arguments.
-        :param kwargs: Keyword arguments.
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: Singleton instance of EmergencyHandler.
         :rtype: EmergencyHandler
         """
+        if context is not None:
+            return super(EmergencyHandler, cls).__new__(cls)
+
         if cls._instance is None:
             cls._instance = super(EmergencyHandler, cls).__new__(cls)
         return cls._instance
 
+    def __init__(self, context: OvenContext | None = None) -> None:
+        """
+        Initializes the EmergencyHandler without a pending error, keeping the emergencies recorded for its oven.
+
+        :param context: The oven context the instance belongs to, or None for the singleton.
+        :type context: OvenContext | None
+        """
+        self.error: CustomException | None = None
+        self.oven: object = context if context is not None else EmergencyHandler
+
+    @property
+    def emergencies(self) -> int:
+        """
+        Get the number of emergencies declared for the oven of this handler.
+
+        :return: The number of emergencies, including those before a factory reset.
+        :rtype: int
+        """
+        return self._emergencies.get(self.oven, 0)
+
+    @emergencies.setter
+    def emergencies(self, emergencies: int) -> None:
+        """
+        Set the number of emergencies declared for the oven of this handler.
+
+        :param emergencies: The number of emergencies.
+        :type emergencies: int
+        :return: None
+        """
+        self._emergencies[self.oven] = emergencies
+
     @classmethod
     def observe(cls, func: Callable[..., Any]) -> Callable[..., Any]:
         """
@@ -66,23 +106,43 @@ class EmergencyHandler:
             except CustomException as e:
                 cls.logger.log("Internal error occurred, entering emergency state.", LogLevel.ERROR)
                 self.declare_emergency()
-                cls.error = e
+                handler: EmergencyHandler = getattr(self, "emergency_handler", None) or cls()
+                handler.error = e
+                handler.emergencies += 1
+                cls.dump_flight_record(self, type(e).__name__)
+                Logger.flush()
 
             except Exception as e:
                 cls.logger.log(f"Major error ({e}) occurred, shutting down.", LogLevel.CRITICAL)
+                cls.dump_flight_record(self, type(e).__name__)
+                Logger.flush()
                 raise e
 
         return wrapper
 
-    @classmethod
-    def is_busy(cls) -> bool:
+    @staticmethod
+    def dump_flight_record(owner: Any, reason: str) -> None:
+        """
+        Dump the flight recorder of the given object, if it has one.
+
+        :param owner: The object whose `flight_recorder` is dumped, usually the system control.
+        :type owner: Any
+        :param reason: The cause of the dump.
+        :type reason: str
+        :return: None
+        """
+        flight_recorder: FlightRecorder | None = getattr(owner, "flight_recorder", None)
+        if flight_recorder is not None:
+            flight_recorder.dump(reason)
+
+    def is_busy(self) -> bool:
         """
         Checks if the EmergencyHandler is currently handling an error.
 
         :return: True if an error is being handled, False otherwise.
         :rtype: bool
         """
-        return cls.error is not None
+        return self.error is not None
 
     def handle_emergency(self, system_control: "SystemControl") -> None:
         """
@@ -96,21 +156,22 @@ class EmergencyHandler:
 
         if isinstance(self.error, MockException):
             self.logger.log("Mock exception occurred, simulating emergency handling.", LogLevel.ERROR)
-            EmergencyHandler.error = None
+            self.error = None
             return
 
         if isinstance(self.error, DoorException):
             self.logger.log("Door exception occurred, stopping the running program.", LogLevel.ERROR)
             system_control.emergency_stop_program()
-            EmergencyHandler.error = None
+            self.error = None
             return
 
         if isinstance(self.error, ProgramAlreadyRunningException):
             self.logger.log("A Program is already running.", LogLevel.ERROR)
-            EmergencyHandler.error = None
+            self.error = None
             return
 
         self.logger.log("Resetting system.", LogLevel.ERROR)
+        self.dump_flight_record(system_control, "FactoryReset")
         system_control.stop()
         system_control.factory_reset()
 
@@ -0,0 +1,166 @@
+import os
+import re
+import time
+
+import numpy as np
+
+from src.helper.Clock import Clock
+from src.helper.Logger import Logger
+from src.helper.OvenContext import OvenContext
+from src.helper.Settings import Settings
+from src.helper.config import FLIGHT_RECORDER_DIRECTORY
+from src.helper.configuration.RuntimeConfig import RuntimeConfig, Changes
+from src.helper.logging.FlightLog import FlightLog
+from src.helper.logging.LogLevel import LogLevel
+from src.helper.logging.LoggerFacade import LoggerFacade
+from src.helper.telemetry.TelemetrySampler import TelemetrySampler
+
+
+class FlightRecorder:
+    """
+    Singleton class keeping the recent samples of one oven in memory and writing them out on emergencies.
+
+    One row of sensor values, actuator states and user actions is kept per main loop cycle in a preallocated
+    circular array covering FLIGHT_RECORDER_DURATION_IN_SECONDS. A dump writes these rows together with the
+    log messages of the same time span kept by the installed FlightLog, if any. The rows are resized when the
+    main loop timeout changes at runtime, keeping the newest samples.
+
+    :ivar settings: The runtime settings the duration and main loop timeout are read from.
+    :ivar name: The name of the oven, used in the names of the dump files.
+    :ivar duration: The time span in seconds covered by the rows.
+    :ivar rows: The number of rows kept.
+    :ivar samples: The preallocated rows.
+    :ivar index: The row the next sample is written to.
+    :ivar filled: The number of rows holding samples.
+    :ivar directory: The directory dumps are written to.
+    :ivar dumps: The number of dumps written.
+    """
+
+    _instance: 'FlightRecorder' = None
+
+    def __new__(cls, context: OvenContext | None = None) -> 'FlightRecorder':
+        """
+        Ensures only one instance of FlightRecorder exists (Singleton pattern).
+
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
+        :return: The singleton instance of FlightRecorder.
+        :rtype: FlightRecorder
+        """
+        if context is not None:
+            return super().__new__(cls)
+
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, context: OvenContext | None = None) -> None:
+        """
+        Initializes the FlightRecorder with empty preallocated rows.
+
+        :param context: The oven context to sample, or None for the singletons.
+        :type context: OvenContext | None
+        """
+        self.logger: Logger = Logger("FlightRecorder")
+        self.name: str = context.name if context is not None else "Oven"
+        self.sampler: TelemetrySampler = TelemetrySampler(context)
+        self.settings: RuntimeConfig = Settings()
+
+        self.duration: float = self.settings.FLIGHT_RECORDER_DURATION_IN_SECONDS
+        self.rows: int = self.rows_for(self.settings.MAIN_LOOP_TIMEOUT_IN_SECONDS)
+        self.samples: np.ndarray = np.zeros((self.rows, len(TelemetrySampler.COLUMNS)))
+        self.index: int = 0
+        self.filled: int = 0
+
+        self.directory: str = FLIGHT_RECORDER_DIRECTORY
+        self.dumps: int = 0
+
+        self.settings.subscribe(self.apply_settings, "MAIN_LOOP_TIMEOUT_IN_SECONDS")
+
+    def rows_for(self, main_loop_timeout: float) -> int:
+        """
+        Calculate the number of rows covering the duration with one sample per main loop cycle.
+
+        :param main_loop_timeout: The time between two main loop cycles in seconds.
+        :type main_loop_timeout: float
+        :return: The number of rows, at least one.
+        :rtype: int
+        """
+        return max(1, round(self.duration / main_loop_timeout))
+
+    def apply_settings(self, changes: Changes) -> None:
+        """
+        Resize the rows to a changed main loop timeout, keeping the newest samples.
+
+        :param changes: The previous and the new value of the changed settings, by name.
+        :type changes: Changes
+        :return: None
+        """
+        window: np.ndarray = self.window()
+        self.rows = self.rows_for(self.settings.MAIN_LOOP_TIMEOUT_IN_SECONDS)
+        self.samples = np.zeros((self.rows, len(TelemetrySampler.COLUMNS)))
+
+        kept: np.ndarray = window[len(window) - min(len(window), self.rows):]
+        self.samples[:len(kept)] = kept
+        self.filled = len(kept)
+        self.index = self.filled % self.rows
+
+    def record(self) -> None:
+        """
+        Keep one sample of the oven, overwriting the oldest one if all rows are filled.
+
+        :return: None
+        """
+        self.samples[self.index] = self.sampler.sample()
+        self.index = (self.index + 1) % self.rows
+        self.filled = min(self.filled + 1, self.rows)
+
+    def window(self) -> np.ndarray:
+        """
+        Retrieve the kept samples in the order they were recorded.
+
+        :return: The kept rows, oldest first.
+        :rtype: np.ndarray
+        """
+        if self.filled < self.rows:
+            return self.samples[:self.filled].copy()
+        return np.concatenate((self.samples[self.index:], self.samples[:self.index]))
+
+    def dump(self, reason: str) -> str | None:
+        """
+        Write the kept samples and log messages to the dump directory.
+
+        The state of the oven at the time of the dump is kept as the last sample first, so the samples show the
+        state that caused it, e.g. the door opened while locked.
+        Two files sharing one base name are written: `<base>.csv` with the samples and `<base>.log` with the
+        log messages of the covered time span. Failing to write is logged, but never raised, so a dump cannot
+        interfere with handling the emergency.
+
+        :param reason: The cause of the dump, used in the file names.
+        :type reason: str
+        :return: The base path of the written files, or None if writing failed.
+        :rtype: str | None
+        """
+        self.record()
+        self.dumps += 1
+        label: str = re.sub(r"[^A-Za-z0-9_.-]+", "_", f"{self.name}-{reason}")
+        base: str = os.path.join(self.directory, f"{time.strftime('%Y%m%d-%H%M%S')}-{self.dumps}-{label}")
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+
+            header: str = ",".join(name for name, _ in TelemetrySampler.COLUMNS)
+            np.savetxt(base + ".csv", self.window(), delimiter=",", header=header, comments="", fmt="%.6g")
+
+            flight_log: FlightLog | None = LoggerFacade.flight_log
+            since: float = Clock().monotonic() - self.duration
+            with open(base + ".log", "w") as file:
+                if flight_log is not None:
+                    for entry in flight_log.snapshot(since):
+                        file.write(FlightLog.format(entry) + "\n")
+        except OSError as e:
+            self.logger.log(f"Could not write flight record {base}: {e}", LogLevel.ERROR)
+            return None
+
+        self.logger.log(f"Flight record written to {base} ({reason})", LogLevel.WARNING)
+        return base
@@ -0,0 +1,49 @@
+import argparse
+import sys
+
+from src.program.estimate.DefrostEstimateTable import DefrostEstimateTable
+from src.program.estimate.DefrostEstimator import DefrostEstimator
+from src.program.estimate.DefrostSweep import DefrostSweep
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments of the estimate sweep.
+
+    :param argv: The arguments without the program name, or None to use the command line.
+    :type argv: list[str] | None
+    :return: The parsed arguments.
+    :rtype: argparse.Namespace
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Precompute the defrost estimate tables by simulating the defrosting program.")
+    parser.add_argument("-o", "--output", default=DefrostEstimator.BUILTIN_TABLE_PATH,
+                        help="write the tables as JSON to this file, defaults to the shipped tables")
+    parser.add_argument("-w", "--weights", type=float, nargs="+", help="measured weights in grams to simulate")
+    parser.add_argument("-t", "--temperatures", type=float, nargs="+",
+                        help="starting inner temperatures in degrees Celsius to simulate")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Entry point for the estimate sweep. Simulates every grid point and writes the lookup tables.
+
+    :param argv: The arguments without the program name, or None to use the command line.
+    :type argv: list[str] | None
+    :return: The exit code, always 0.
+    :rtype: int
+    """
+    arguments: argparse.Namespace = parse_arguments(argv)
+
+    table: DefrostEstimateTable = DefrostSweep().run(arguments.weights, arguments.temperatures)
+    table.save(arguments.output)
+
+    for weight, durations in zip(table.weights, table.durations):
+        print(f"{weight:>8.0f} g " + " ".join(f"{duration:>7.1f}" for duration in durations))
+    print(f"Wrote {len(table.weights)} x {len(table.temperatures)} estimates to {arguments.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""
+Clock module providing the process-wide clock.
+
+This module defines the Clock class, which hands out the clock implementation that all periodic
+loops use to measure and wait for time. The wall clock is used unless another clock is installed,
+e.g. a VirtualClock to run simulations faster than real time.
+"""
+
+from src.helper.clock.ClockInterface import ClockInterface
+from src.helper.clock.SystemClock import SystemClock
+
+
+class Clock:
+    """
+    Accessor for the clock currently used by the system.
+
+    Calling `Clock()` returns the installed ClockInterface implementation instead of a Clock instance.
+    """
+
+    _instance: ClockInterface = SystemClock()
+
+    def __new__(cls) -> ClockInterface:
+        """
+        Retrieve the currently installed clock.
+
+        :return: The installed clock implementation.
+        :rtype: ClockInterface
+        """
+        return cls._instance
+
+    @classmethod
+    def use(cls, clock: ClockInterface) -> None:
+        """
+        Install a clock implementation for the whole process.
+
+        Install the clock before starting the system, as switching clocks while loops are running mixes time bases.
+
+        :param clock: The clock implementation to install.
+        :type clock: ClockInterface
+        :return: None
+        """
+        cls._instance = clock
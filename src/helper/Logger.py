@@ -2,10 +2,15 @@
 Logger module providing a singleton logger per service.
 
 This module defines the Logger class, which ensures that only one logger instance
-exists per service name. It uses the LoggerFacade to handle logging operations.
+exists per service name. It uses the LoggerFacade to handle logging operations and
+can move the output to a background writer thread.
 """
 
+import logging
+
 from src.helper.config import DEFAULT_LOG_LEVEL
+from src.helper.logging.AsyncLogHandler import AsyncLogHandler
+from src.helper.logging.FlightLog import FlightLog
 from src.helper.logging.LogLevel import LogLevel
 from src.helper.logging.LoggerFacade import LoggerFacade
 from src.helper.logging.LoggerInterface import LoggerInterface
@@ -34,3 +39,47 @@ class Logger(LoggerInterface):
         if service not in cls._instances:
             cls._instances[service] = LoggerFacade(level, service)
         return cls._instances[service]
+
+    @staticmethod
+    def use_async() -> list[AsyncLogHandler]:
+        """
+        Move the output of all loggers to background writer threads, so logging never blocks the caller.
+
+        Every output handler is wrapped in an AsyncLogHandler. Calling this again keeps the existing wrappers.
+
+        :return: The asynchronous handlers now in use.
+        :rtype: list[AsyncLogHandler]
+        """
+        root: logging.Logger = logging.getLogger()
+        handlers: list[logging.Handler] = list(root.handlers) or [LoggerFacade.create_stream_handler()]
+
+        async_handlers: list[AsyncLogHandler] = []
+        for handler in handlers:
+            if not isinstance(handler, AsyncLogHandler):
+                root.removeHandler(handler)
+                handler = AsyncLogHandler(handler)
+                root.addHandler(handler)
+            async_handlers.append(handler)
+
+        return async_handlers
+
+    @staticmethod
+    def use_flight_log(flight_log: FlightLog | None) -> None:
+        """
+        Keep every message of all loggers in the given flight log, whatever its level, or stop with None.
+
+        :param flight_log: The flight log to keep the messages in, or None.
+        :type flight_log: FlightLog | None
+        :return: None
+        """
+        LoggerFacade.flight_log = flight_log
+
+    @staticmethod
+    def flush() -> None:
+        """
+        Write all pending log records of every output handler before returning.
+
+        :return: None
+        """
+        for handler in logging.getLogger().handlers:
+            handler.flush()
@@ -0,0 +1,136 @@
+"""
+OvenContext module providing instance-scoped wiring of components.
+
+This module defines the OvenContext class, a container that holds one independent set of
+components. Components created without a context keep using the process-wide singletons.
+"""
+
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class OvenContext:
+    """
+    Container holding the components of one oven.
+
+    Components constructed with a context resolve their dependencies from it instead of using the
+    process-wide singletons, so a single process can host many independent ovens. Every component
+    type exists at most once per context and is created on first access.
+
+    :ivar name: The name of the oven.
+    """
+
+    def __init__(self, name: str = "Oven") -> None:
+        """
+        Initialize an empty OvenContext.
+
+        :param name: The name of the oven. Defaults to "Oven".
+        :type name: str
+        :return: None
+        """
+        self.name: str = name
+        self._components: dict[type, object] = {}
+
+    def get(self, component_type: type[T]) -> T:
+        """
+        Retrieve the component of the given type, creating it for this context on first access.
+
+        :param component_type: The class of the component.
+        :type component_type: type[T]
+        :return: The component instance of this context.
+        :rtype: T
+        """
+        component: object | None = self._components.get(component_type)
+
+        if component is None:
+            component = component_type(context=self)
+            self._components[component_type] = component
+
+        return component
+
+    def register(self, component_type: type[T], component: T) -> None:
+        """
+        Register an existing component for the given type, e.g. to substitute a simulation component.
+
+        :param component_type: The class the component is resolved by.
+        :type component_type: type[T]
+        :param component: The component instance.
+        :type component: T
+        :return: None
+        """
+        self._components[component_type] = component
+
+    def components(self) -> dict[type, object]:
+        """
+        Retrieve all components created or registered so far, e.g. to capture their state.
+
+        :return: The components by the type they are resolved by, in the order they were added.
+        :rtype: dict[type, object]
+        """
+        return dict(self._components)
+
+    def reset(self, *keep: object) -> None:
+        """
+        Drop all components so they are created anew on next access, except the given ones.
+
+        :param keep: Components that stay registered.
+        :type keep: object
+        :return: None
+        """
+        self._components = {
+            component_type: component for component_type, component in self._components.items()
+            if any(component is kept for kept in keep)
+        }
+
+    @staticmethod
+    def resolve(context: "OvenContext | None", component_type: type[T]) -> T:
+        """
+        Retrieve a component from the given context, or the process-wide singleton if no context is given.
+
+        :param context: The context to resolve from, or None for the process-wide singleton.
+        :type context: OvenContext | None
+        :param component_type: The class of the component.
+        :type component_type: type[T]
+        :return: The component instance.
+        :rtype: T
+        """
+        if context is None:
+            return component_type()
+
+        return context.get(component_type)
+
+    @staticmethod
+    def peek(context: "OvenContext | None", component_type: type[T]) -> T | None:
+        """
+        Retrieve an existing component without creating it or initializing the singleton again, e.g. to observe it.
+
+        :param context: The context to look in, or None for the process-wide singleton.
+        :type context: OvenContext | None
+        :param component_type: The class of the component.
+        :type component_type: type[T]
+        :return: The component instance, or None if it has not been created yet.
+        :rtype: T | None
+        """
+        if context is None:
+            return getattr(component_type, "_instance", None)
+        return context._components.get(component_type)
+
+    @staticmethod
+    def observe(context: "OvenContext | None", component_type: type[T]) -> T:
+        """
+        Retrieve a component to observe it, creating it only if it does not exist yet.
+
+        Unlike resolve, an existing singleton is not initialized again, so its state is kept.
+
+        :param context: The context to resolve from, or None for the process-wide singleton.
+        :type context: OvenContext | None
+        :param component_type: The class of the component.
+        :type component_type: type[T]
+        :return: The component instance.
+        :rtype: T
+        """
+        component: T | None = OvenContext.peek(context, component_type)
+        if component is None:
+            return OvenContext.resolve(context, component_type)
+        return component
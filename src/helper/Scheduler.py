@@ -0,0 +1,42 @@
+"""
+Scheduler module providing the process-wide cooperative scheduler.
+
+This module defines the Scheduler class, which hands out the scheduler that drives the periodic
+loops of all controllers. If no scheduler is installed, every controller runs its loop in a
+dedicated thread.
+"""
+
+from src.helper.scheduling.SchedulerInterface import SchedulerInterface
+
+
+class Scheduler:
+    """
+    Accessor for the scheduler currently used by the system.
+
+    Calling `Scheduler()` returns the installed SchedulerInterface implementation, or None if the
+    controllers should use their own threads.
+    """
+
+    _instance: SchedulerInterface | None = None
+
+    def __new__(cls) -> SchedulerInterface | None:
+        """
+        Retrieve the currently installed scheduler.
+
+        :return: The installed scheduler, or None if threads are used.
+        :rtype: SchedulerInterface | None
+        """
+        return cls._instance
+
+    @classmethod
+    def use(cls, scheduler: SchedulerInterface | None) -> None:
+        """
+        Install a scheduler for the whole process, or None to go back to one thread per loop.
+
+        Install the scheduler before starting the system, as running loops are not migrated.
+
+        :param scheduler: The scheduler to install.
+        :type scheduler: SchedulerInterface | None
+        :return: None
+        """
+        cls._instance = scheduler
@@ -0,0 +1,41 @@
+"""
+Settings module providing the process-wide runtime settings.
+
+This module defines the Settings class, which hands out the runtime settings that controllers read and
+subscribe to. Unlike the constants of the configuration module, the runtime settings can be changed while
+the system is running, e.g. by editing the watched settings file.
+"""
+
+from src.helper.configuration.RuntimeConfig import RuntimeConfig
+
+
+class Settings:
+    """
+    Accessor for the runtime settings currently used by the system.
+
+    Calling `Settings()` returns the installed RuntimeConfig instead of a Settings instance.
+    """
+
+    _instance: RuntimeConfig = RuntimeConfig()
+
+    def __new__(cls) -> RuntimeConfig:
+        """
+        Retrieve the currently installed runtime settings.
+
+        :return: The installed runtime settings.
+        :rtype: RuntimeConfig
+        """
+        return cls._instance
+
+    @classmethod
+    def use(cls, settings: RuntimeConfig) -> None:
+        """
+        Install runtime settings for the whole process.
+
+        Install the settings before creating the controllers, as controllers keep the settings they were created with.
+
+        :param settings: The runtime settings to install.
+        :type settings: RuntimeConfig
+        :return: None
+        """
+        cls._instance = settings
@@ -0,0 +1,157 @@
+from array import array
+from typing import Iterator
+
+
+class TypedRingbuffer:
+    """
+    A fixed-size ring buffer for numeric values backed by a typed array.
+
+    Unlike the generic Ringbuffer, values are stored unboxed, the number of stored items is tracked explicitly
+    and reading the buffer does not copy it: the items are exposed as two memoryview segments in FIFO order,
+    on which windowed aggregates are computed without materializing a list.
+
+    :param size: The maximum number of items the buffer can hold.
+    :type size: int
+    :param typecode: The array typecode of the stored values. Defaults to "d" (float).
+    :type typecode: str
+    :raises ValueError: If the provided size is not a positive integer.
+    """
+
+    def __init__(self, size: int, typecode: str = "d") -> None:
+        """
+        Initialize the ring buffer with a given size and value type.
+
+        :param size: The maximum number of items the buffer can hold.
+        :type size: int
+        :param typecode: The array typecode of the stored values. Defaults to "d" (float).
+        :type typecode: str
+        :raises ValueError: If size is not a positive integer.
+        """
+        if size <= 0:
+            raise ValueError("Size must be a positive integer")
+
+        self.size: int = size
+        self.typecode: str = typecode
+        self.buffer: array = array(typecode, bytes(array(typecode).itemsize * size))
+        self.index: int = 0
+        self.filled: int = 0
+
+    def add(self, item: float) -> None:
+        """
+        Add an item at the current index. Overwrites the oldest item if the buffer is full.
+
+        :param item: The value to add to the buffer.
+        :type item: float
+        :return: None
+        """
+        self.buffer[self.index] = item
+        self.index = (self.index + 1) % self.size
+
+        if self.filled < self.size:
+            self.filled += 1
+
+    def segments(self, window: int | None = None) -> tuple[memoryview, memoryview]:
+        """
+        Retrieve the newest items as two zero-copy segments in FIFO order.
+
+        :param window: The number of newest items to cover, or None for all items. Defaults to None.
+        :type window: int | None
+        :return: The older and the newer segment. The second segment is empty if the items do not wrap around.
+        :rtype: tuple[memoryview, memoryview]
+        """
+        count: int = self.filled if window is None else max(0, min(window, self.filled))
+        start: int = (self.index - count) % self.size
+        view: memoryview = memoryview(self.buffer)
+
+        if start + count <= self.size:
+            return view[start:start + count], view[0:0]
+        return view[start:], view[:self.index]
+
+    def get(self) -> list:
+        """
+        Retrieve the items in the buffer in FIFO order as a list.
+
+        :return: A list of items currently in the buffer.
+        :rtype: list
+        """
+        return list(self)
+
+    def sum(self, window: int | None = None) -> float:
+        """
+        Calculate the sum of the newest items.
+
+        :param window: The number of newest items to cover, or None for all items. Defaults to None.
+        :type window: int | None
+        :return: The sum of the items, or 0 if the buffer is empty.
+        :rtype: float
+        """
+        older, newer = self.segments(window)
+        return sum(older) + sum(newer)
+
+    def mean(self, window: int | None = None) -> float:
+        """
+        Calculate the mean of the newest items.
+
+        :param window: The number of newest items to cover, or None for all items. Defaults to None.
+        :type window: int | None
+        :return: The mean of the items.
+        :rtype: float
+        :raises ValueError: If the buffer is empty.
+        """
+        older, newer = self.segments(window)
+        count: int = len(older) + len(newer)
+
+        if count == 0:
+            raise ValueError("Buffer is empty")
+        return (sum(older) + sum(newer)) / count
+
+    def min(self, window: int | None = None) -> float:
+        """
+        Find the minimum of the newest items.
+
+        :param window: The number of newest items to cover, or None for all items. Defaults to None.
+        :type window: int | None
+        :return: The minimum of the items.
+        :rtype: float
+        :raises ValueError: If the buffer is empty.
+        """
+        segments: list[memoryview] = [segment for segment in self.segments(window) if len(segment) > 0]
+
+        if not segments:
+            raise ValueError("Buffer is empty")
+        return min(min(segment) for segment in segments)
+
+    def max(self, window: int | None = None) -> float:
+        """
+        Find the maximum of the newest items.
+
+        :param window: The number of newest items to cover, or None for all items. Defaults to None.
+        :type window: int | None
+        :return: The maximum of the items.
+        :rtype: float
+        :raises ValueError: If the buffer is empty.
+        """
+        segments: list[memoryview] = [segment for segment in self.segments(window) if len(segment) > 0]
+
+        if not segments:
+            raise ValueError("Buffer is empty")
+        return max(max(segment) for segment in segments)
+
+    def __iter__(self) -> Iterator[float]:
+        """
+        Iterate over the items in FIFO order without copying the buffer.
+
+        :return: An iterator over the items.
+        :rtype: Iterator[float]
+        """
+        for segment in self.segments():
+            yield from segment
+
+    def __len__(self) -> int:
+        """
+        Get the number of items currently stored in the buffer.
+
+        :return: The number of items in the buffer.
+        :rtype: int
+        """
+        return self.filled
@@ -0,0 +1,39 @@
+from typing import Callable
+
+
+class Benchmark:
+    """
+    Definition of one benchmark: the code to time and how often to run it.
+
+    The setup is called once per repetition, outside the timed section, and returns the function to time. That
+    way every repetition starts from the same state, e.g. a fresh oven for a whole program run.
+
+    :ivar name: The unique name of the benchmark.
+    :ivar setup: Creates the state of one repetition and returns the function to time.
+    :ivar number: The number of calls of the function per repetition.
+    :ivar repeat: The number of repetitions.
+    """
+
+    def __init__(self, name: str, setup: Callable[[], Callable[[], object]], number: int = 1000,
+                 repeat: int = 5) -> None:
+        """
+        Initialize the Benchmark.
+
+        :param name: The unique name of the benchmark.
+        :type name: str
+        :param setup: Creates the state of one repetition and returns the function to time.
+        :type setup: Callable[[], Callable[[], object]]
+        :param number: The number of calls of the function per repetition. Defaults to 1000.
+        :type number: int
+        :param repeat: The number of repetitions. Defaults to 5.
+        :type repeat: int
+        :return: None
+        :raises ValueError: If the number of calls or repetitions is not positive.
+        """
+        if number <= 0 or repeat <= 0:
+            raise ValueError(f"Number and repeat must be positive, got {number} and {repeat}")
+
+        self.name: str = name
+        self.setup: Callable[[], Callable[[], object]] = setup
+        self.number: int = number
+        self.repeat: int = repeat
@@ -0,0 +1,59 @@
+class BenchmarkComparison:
+    """
+    Comparison of one benchmark against its baseline.
+
+    :ivar name: The name of the benchmark.
+    :ivar baseline: The median time of one call in the baseline in seconds.
+    :ivar current: The median time of one call in the current run in seconds.
+    """
+
+    def __init__(self, name: str, baseline: float, current: float) -> None:
+        """
+        Initialize the BenchmarkComparison.
+
+        :param name: The name of the benchmark.
+        :type name: str
+        :param baseline: The median time of one call in the baseline in seconds.
+        :type baseline: float
+        :param current: The median time of one call in the current run in seconds.
+        :type current: float
+        :return: None
+        """
+        self.name: str = name
+        self.baseline: float = baseline
+        self.current: float = current
+
+    def ratio(self) -> float:
+        """
+        Get the current time relative to the baseline, e.g. 1.2 for a run 20% slower than the baseline.
+
+        :return: The ratio of the current to the baseline time.
+        :rtype: float
+        """
+        if self.baseline <= 0:
+            return 1.0 if self.current <= 0 else float("inf")
+        return self.current / self.baseline
+
+    def regressed(self, threshold: float) -> bool:
+        """
+        Check whether the benchmark got slower than the baseline by more than the threshold.
+
+        :param threshold: The tolerated relative slowdown, e.g. 0.1 for 10%.
+        :type threshold: float
+        :return: True if the benchmark regressed, False otherwise.
+        :rtype: bool
+        """
+        return self.ratio() > 1.0 + threshold
+
+    def format(self, threshold: float) -> str:
+        """
+        Format the comparison as one line of a report.
+
+        :param threshold: The tolerated relative slowdown, used to mark regressions.
+        :type threshold: float
+        :return: The name, both times in microseconds, the relative change and the verdict.
+        :rtype: str
+        """
+        verdict: str = "REGRESSION" if self.regressed(threshold) else "ok"
+        return (f"{self.name:<40} {self.baseline * 1e6:>12.3f} us {self.current * 1e6:>12.3f} us "
+                f"{(self.ratio() - 1.0) * 100:>+8.1f}% {verdict}")
@@ -0,0 +1,107 @@
+import json
+import os
+import platform
+import sys
+from datetime import datetime, timezone
+
+import numpy as np
+
+from src.helper.benchmark.BenchmarkComparison import BenchmarkComparison
+from src.helper.benchmark.BenchmarkResult import BenchmarkResult
+
+
+class BenchmarkReport:
+    """
+    Results of a benchmark run together with the environment they were measured in.
+
+    Reports are stored as JSON, so a report of a reference run can be kept as the baseline later runs are
+    compared with. Timings are only comparable between runs in the same environment, which is why it is stored
+    alongside the results.
+
+    :ivar results: The results by benchmark name.
+    :ivar environment: The description of the machine and interpreter the results were measured with.
+    """
+
+    def __init__(self, results: list[BenchmarkResult], environment: dict[str, object] | None = None) -> None:
+        """
+        Initialize the BenchmarkReport.
+
+        :param results: The results of the run.
+        :type results: list[BenchmarkResult]
+        :param environment: The environment of the run, or None to describe the current one. Defaults to None.
+        :type environment: dict[str, object] | None
+        :return: None
+        """
+        self.results: dict[str, BenchmarkResult] = {result.name: result for result in results}
+        self.environment: dict[str, object] = environment if environment is not None else self.describe()
+
+    @staticmethod
+    def describe() -> dict[str, object]:
+        """
+        Describe the current machine and interpreter.
+
+        :return: The metadata of the environment.
+        :rtype: dict[str, object]
+        """
+        return {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+            "numpy": np.__version__,
+        }
+
+    def compare(self, baseline: "BenchmarkReport") -> list[BenchmarkComparison]:
+        """
+        Compare the results with a baseline, for all benchmarks contained in both reports.
+
+        :param baseline: The report to compare with.
+        :type baseline: BenchmarkReport
+        :return: The comparisons in the order of the results of this report.
+        :rtype: list[BenchmarkComparison]
+        """
+        return [
+            BenchmarkComparison(name, baseline.results[name].median(), result.median())
+            for name, result in self.results.items() if name in baseline.results
+        ]
+
+    def to_dict(self) -> dict[str, object]:
+        """
+        Convert the report to a JSON-compatible dict.
+
+        :return: The environment and the results.
+        :rtype: dict[str, object]
+        """
+        return {
+            "environment": self.environment,
+            "results": [result.to_dict() for result in self.results.values()],
+        }
+
+    def save(self, path: str) -> None:
+        """
+        Write the report to a JSON file.
+
+        :param path: The path of the file.
+        :type path: str
+        :return: None
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> "BenchmarkReport":
+        """
+        Read a report written by `save`.
+
+        :param path: The path of the file.
+        :type path: str
+        :return: The report.
+        :rtype: BenchmarkReport
+        """
+        with open(path, encoding="utf-8") as file:
+            data: dict[str, object] = json.load(file)
+
+        return cls([BenchmarkResult.from_dict(result) for result in data["results"]], dict(data["environment"]))
@@ -0,0 +1,86 @@
+import statistics
+
+
+class BenchmarkResult:
+    """
+    Timings of one benchmark.
+
+    :ivar name: The name of the benchmark.
+    :ivar number: The number of calls per repetition.
+    :ivar times: The mean time of one call in seconds, per repetition.
+    """
+
+    def __init__(self, name: str, number: int, times: list[float]) -> None:
+        """
+        Initialize the BenchmarkResult.
+
+        :param name: The name of the benchmark.
+        :type name: str
+        :param number: The number of calls per repetition.
+        :type number: int
+        :param times: The mean time of one call in seconds, per repetition.
+        :type times: list[float]
+        :return: None
+        :raises ValueError: If no times are given.
+        """
+        if not times:
+            raise ValueError(f"Benchmark {name} has no timings")
+
+        self.name: str = name
+        self.number: int = number
+        self.times: list[float] = times
+
+    def best(self) -> float:
+        """
+        Get the time of one call in the fastest repetition.
+
+        :return: The time in seconds.
+        :rtype: float
+        """
+        return min(self.times)
+
+    def median(self) -> float:
+        """
+        Get the median time of one call over all repetitions, the value compared against a baseline.
+
+        :return: The time in seconds.
+        :rtype: float
+        """
+        return statistics.median(self.times)
+
+    def stdev(self) -> float:
+        """
+        Get the standard deviation of the time of one call over all repetitions.
+
+        :return: The standard deviation in seconds, 0.0 for a single repetition.
+        :rtype: float
+        """
+        return statistics.stdev(self.times) if len(self.times) > 1 else 0.0
+
+    def to_dict(self) -> dict[str, object]:
+        """
+        Convert the result to a JSON-compatible dict.
+
+        :return: The timings and their summary.
+        :rtype: dict[str, object]
+        """
+        return {
+            "name": self.name,
+            "number": self.number,
+            "times": self.times,
+            "best": self.best(),
+            "median": self.median(),
+            "stdev": self.stdev(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, object]) -> "BenchmarkResult":
+        """
+        Create a result from a dict written by `to_dict`.
+
+        :param data: The stored result.
+        :type data: dict[str, object]
+        :return: The result.
+        :rtype: BenchmarkResult
+        """
+        return cls(str(data["name"]), int(data["number"]), [float(time) for time in data["times"]])
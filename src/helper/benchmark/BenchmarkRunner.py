@@ -0,0 +1,46 @@
+import gc
+import itertools
+import time
+
+from src.helper.benchmark.Benchmark import Benchmark
+from src.helper.benchmark.BenchmarkResult import BenchmarkResult
+
+
+class BenchmarkRunner:
+    """
+    Times benchmarks on the wall clock.
+
+    Time is taken with `time.perf_counter` rather than the installed Clock, so benchmarks that install a
+    virtual clock themselves are still measured in real time. The garbage collector is disabled while timing,
+    as `timeit` does, to keep collections of earlier repetitions out of the measurement.
+    """
+
+    @staticmethod
+    def run(benchmark: Benchmark) -> BenchmarkResult:
+        """
+        Run all repetitions of a benchmark.
+
+        :param benchmark: The benchmark to run.
+        :type benchmark: Benchmark
+        :return: The mean time of one call per repetition.
+        :rtype: BenchmarkResult
+        """
+        times: list[float] = []
+
+        for _ in range(benchmark.repeat):
+            function = benchmark.setup()
+            gc_enabled: bool = gc.isenabled()
+            gc.disable()
+
+            try:
+                start: float = time.perf_counter()
+                for _ in itertools.repeat(None, benchmark.number):
+                    function()
+                end: float = time.perf_counter()
+            finally:
+                if gc_enabled:
+                    gc.enable()
+
+            times.append((end - start) / benchmark.number)
+
+        return BenchmarkResult(benchmark.name, benchmark.number, times)
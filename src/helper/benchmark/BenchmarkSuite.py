@@ -0,0 +1,284 @@
+from typing import Callable
+
+from src.SystemControl import SystemControl
+from src.components.cooling.CoolingFanController import CoolingFanController
+from src.components.magnetron.MagnetronModulator import MagnetronModulator
+from src.components.magnetron.MagnetronRingbuffer import MagnetronRingbuffer
+from src.components.sensor.SensorManager import SensorManager
+from src.helper.Action import Action
+from src.helper.Clock import Clock
+from src.helper.Logger import Logger
+from src.helper.OvenContext import OvenContext
+from src.helper.Scheduler import Scheduler
+from src.helper.Settings import Settings
+from src.helper.benchmark.Benchmark import Benchmark
+from src.helper.checkpoint.Checkpoint import Checkpoint
+from src.helper.clock.VirtualClock import VirtualClock
+from src.helper.config import AMBIENT_TEMPERATURE_IN_CELSIUS, MAGNETRON_ON_OFF_INTERVAL_IN_SECONDS, \
+    MAIN_LOOP_TIMEOUT_IN_SECONDS
+from src.helper.configuration.RuntimeConfig import RuntimeConfig
+from src.helper.logging.LogLevel import LogLevel
+from src.helper.noise.NoiseSource import NoiseSource
+from src.helper.scheduling.TickScheduler import TickScheduler
+from src.program.ProgramController import ProgramController
+from src.user.InputDetector import InputDetector
+from src.user.ScriptedInputDetector import ScriptedInputDetector
+
+
+class BenchmarkSuite:
+    """
+    The benchmarks of the hot paths of the system.
+
+    Micro benchmarks time single calls of the code running in every tick of a control loop on an oven of its
+    own. The macro benchmarks time a complete defrosting program in simulated time, from the start and resumed
+    from a warm checkpoint. All ovens use a seeded noise source and scripted user input, so every run executes
+    the same code paths.
+    """
+
+    SEED: int = 0
+    """int: The seed of the noise source of every benchmarked oven."""
+
+    DEFROSTING_TIMEOUT_IN_SECONDS: float = 3600.0
+    """float: The simulated time after which the defrosting benchmark is aborted."""
+
+    _warm_checkpoint: Checkpoint | None = None
+
+    @classmethod
+    def benchmarks(cls) -> list[Benchmark]:
+        """
+        Get all benchmarks of the suite.
+
+        :return: The benchmarks, micro benchmarks first.
+        :rtype: list[Benchmark]
+        """
+        return [
+            Benchmark("SystemControl.loop_action", cls.loop_action),
+            Benchmark("SensorManager.update_sensors", cls.update_sensors),
+            Benchmark("MagnetronModulator.magnetron_cycle", cls.magnetron_cycle),
+            Benchmark("MagnetronModulator.safety_hazard", cls.safety_hazard),
+            Benchmark("MagnetronRingbuffer.power_share", cls.power_share),
+            Benchmark("CoolingFanController.cooling_fan_cycle", cls.cooling_fan_cycle),
+            Benchmark("LoggerFacade.log.filtered_string", cls.log_filtered_string, number=10000),
+            Benchmark("LoggerFacade.log.filtered_args", cls.log_filtered_args, number=10000),
+            Benchmark("LoggerFacade.log.filtered_callable", cls.log_filtered_callable, number=10000),
+            Benchmark("DefrostingProgram.run", cls.defrosting_program, number=1, repeat=3),
+            Benchmark("DefrostingProgram.resume", cls.resumed_defrosting_program, number=1, repeat=3),
+        ]
+
+    @classmethod
+    def oven(cls, actions: dict[int, Action] | None = None) -> OvenContext:
+        """
+        Create an oven with seeded noise and scripted user input.
+
+        :param actions: The scripted user actions by system loop tick. Defaults to no actions.
+        :type actions: dict[int, Action] | None
+        :return: The context of the oven.
+        :rtype: OvenContext
+        """
+        context: OvenContext = OvenContext("Benchmark")
+        context.register(InputDetector, ScriptedInputDetector(actions))
+        context.get(NoiseSource).seed(cls.SEED)
+        return context
+
+    @classmethod
+    def loop_action(cls) -> Callable[[], object]:
+        """
+        Time one iteration of the system loop of a running oven without a program.
+
+        :return: The function to time.
+        :rtype: Callable[[], object]
+        """
+        return cls.oven().get(SystemControl).loop_action
+
+    @classmethod
+    def update_sensors(cls) -> Callable[[], object]:
+        """
+        Time one update of all simulation sensors.
+
+        :return: The function to time.
+        :rtype: Callable[[], object]
+        """
+        return cls.oven().get(SensorManager).update_sensors
+
+    @classmethod
+    def magnetron_cycle(cls) -> Callable[[], object]:
+        """
+        Time one on/off decision of the magnetron at half power.
+
+        :return: The function to time.
+        :rtype: Callable[[], object]
+        """
+        modulator: MagnetronModulator = cls.oven().get(MagnetronModulator)
+        modulator.set_target_power_share(0.5)
+        return modulator.magnetron_cycle
+
+    @classmethod
+    def safety_hazard(cls) -> Callable[[], object]:
+        """
+        Time one safety check of the magnetron with a full power history.
+
+        :return: The function to time.
+        :rtype: Callable[[], object]
+        """
+        modulator: MagnetronModulator = cls.oven().get(MagnetronModulator)
+        for index in range(modulator.power_history.size):
+            modulator.power_history.add(index % 2 == 0)
+        return modulator.safety_hazard
+
+    @staticmethod
+    def power_share() -> Callable[[], object]:
+        """
+        Time the power share computation over a full one-minute power history.
+
+        :return: The function to time.
+        :rtype: Callable[[], object]
+        """
+        power_history: MagnetronRingbuffer = MagnetronRingbuffer(int(60 // MAGNETRON_ON_OFF_INTERVAL_IN_SECONDS))
+        for index in range(power_history.size):
+            power_history.add(index % 3 == 0)
+        return power_history.power_share
+
+    @classmethod
+    def cooling_fan_cycle(cls) -> Callable[[], object]:
+        """
+        Time one control cycle of the cooling fan while the magnetron is hot.
+
+        :return: The function to time.
+        :rtype: Callable[[], object]
+        """
+        context: OvenContext = cls.oven()
+        sensors: SensorManager = context.get(SensorManager)
+        sensors.magnetron_temp1_sensor.temperature = 120.0
+        sensors.magnetron_temp2_sensor.temperature = 120.0
+        return context.get(CoolingFanController).cooling_fan_cycle
+
+    @staticmethod
+    def log_filtered_string() -> Callable[[], object]:
+        """
+        Time logging a plain message below the enabled level.
+
+        :return: The function to time.
+        :rtype: Callable[[], object]
+        """
+        logger = Logger("Benchmark")
+        return lambda: logger.log("Updating all sensors", LogLevel.DEBUG)
+
+    @staticmethod
+    def log_filtered_args() -> Callable[[], object]:
+        """
+        Time logging a message with arguments below the enabled level.
+
+        :return: The function to time.
+        :rtype: Callable[[], object]
+        """
+        logger = Logger("Benchmark")
+        return lambda: logger.log("Inner Temp 1: %s", LogLevel.DEBUG, 22.0)
+
+    @staticmethod
+    def log_filtered_callable() -> Callable[[], object]:
+        """
+        Time logging a deferred message below the enabled level.
+
+        :return: The function to time.
+        :rtype: Callable[[], object]
+        """
+        logger = Logger("Benchmark")
+        return lambda: logger.log(lambda: f"Inner Temp 1: {22.0}", LogLevel.DEBUG)
+
+    @classmethod
+    def defrosting_program(cls) -> Callable[[], object]:
+        """
+        Time a complete defrosting program, started by the user in the first tick, in simulated time.
+
+        The process-wide clock and scheduler are replaced while the program runs and restored afterwards.
+
+        :return: The function to time.
+        :rtype: Callable[[], object]
+        """
+        context: OvenContext = cls.oven({0: Action.START})
+        return lambda: cls.simulate(context, lambda: context.get(SystemControl).start())
+
+    @classmethod
+    def resumed_defrosting_program(cls) -> Callable[[], object]:
+        """
+        Time the rest of a defrosting program, resumed from the warm checkpoint, in simulated time.
+
+        :return: The function to time.
+        :rtype: Callable[[], object]
+        """
+        checkpoint: Checkpoint = cls.warm_checkpoint()
+        context: OvenContext = cls.oven()
+        return lambda: cls.simulate(context, lambda: checkpoint.restore(context), checkpoint.time)
+
+    @classmethod
+    def warm_checkpoint(cls) -> Checkpoint:
+        """
+        Get the checkpoint of a defrosting program halfway through warming up its load, simulated once per process.
+
+        :return: The checkpoint, taken when the mean inner temperature first reaches the middle between the
+            ambient and the target temperature.
+        :rtype: Checkpoint
+        """
+        if cls._warm_checkpoint is None:
+            context: OvenContext = cls.oven({0: Action.START})
+            sensors: SensorManager = context.get(SensorManager)
+            settings: RuntimeConfig = Settings()
+            warm: float = (AMBIENT_TEMPERATURE_IN_CELSIUS + settings.PROGRAM_DEFROSTING_TARGET_TEMP) / 2
+
+            def capture() -> bool:
+                if (sensors.inner_temp1() + sensors.inner_temp2()) / 2 < warm:
+                    return True
+
+                cls._warm_checkpoint = Checkpoint.capture(context)
+                Scheduler().stop()
+                return False
+
+            def start() -> None:
+                Scheduler().schedule(capture, MAIN_LOOP_TIMEOUT_IN_SECONDS, name="BenchmarkCheckpoint")
+                context.get(SystemControl).start()
+
+            cls.simulate(context, start)
+
+        return cls._warm_checkpoint
+
+    @classmethod
+    def simulate(cls, context: OvenContext, start: Callable[[], object], time: float = 0.0) -> None:
+        """
+        Run an oven in simulated time until its program finishes or the scheduler is stopped.
+
+        The process-wide clock and scheduler are replaced while the oven runs and restored afterwards.
+
+        :param context: The context of the oven.
+        :type context: OvenContext
+        :param start: The function starting the oven, called once the simulated clock and scheduler are installed.
+        :type start: Callable[[], object]
+        :param time: The simulated time to start at. Defaults to 0.0.
+        :type time: float
+        :raises TimeoutError: If the program does not finish within `DEFROSTING_TIMEOUT_IN_SECONDS`.
+        :return: None
+        """
+        program_controller: ProgramController = context.get(ProgramController)
+
+        def watch() -> bool:
+            if program_controller.program is not None and program_controller.is_finished():
+                Scheduler().stop()
+                return False
+            return True
+
+        def timeout() -> bool:
+            Scheduler().stop()
+            raise TimeoutError(f"Defrosting did not finish within {cls.DEFROSTING_TIMEOUT_IN_SECONDS} s")
+
+        clock, scheduler = Clock(), Scheduler()
+        Clock.use(VirtualClock(time))
+        Scheduler.use(TickScheduler())
+
+        try:
+            Scheduler().schedule(watch, MAIN_LOOP_TIMEOUT_IN_SECONDS, name="BenchmarkWatch")
+            Scheduler().schedule(timeout, cls.DEFROSTING_TIMEOUT_IN_SECONDS, cls.DEFROSTING_TIMEOUT_IN_SECONDS,
+                                 "BenchmarkTimeout")
+            start()
+            Scheduler().run()
+        finally:
+            Clock.use(clock)
+            Scheduler.use(scheduler)
@@ -0,0 +1,353 @@
+"""
+Checkpoint module capturing the complete state of an oven.
+
+This module defines the Checkpoint class, which captures the state of every component of an oven and of its
+running program, stores it in a compact binary form and restores it into a running oven, e.g. to start a
+benchmark or regression scenario from a warm state without simulating the warm-up.
+"""
+
+import struct
+import zlib
+from enum import Enum
+
+import numpy as np
+
+from src.SystemControl import SystemControl
+from src.helper.Clock import Clock
+from src.helper.OvenContext import OvenContext
+from src.helper.TypedRingbuffer import TypedRingbuffer
+from src.helper.checkpoint.CheckpointCodec import CheckpointCodec
+from src.helper.exceptions import CustomException
+from src.program.Program import Program
+from src.program.ProgramController import ProgramController
+from src.program.ProgramRegistry import ProgramRegistry
+
+Section = dict[str, object]
+
+
+class Checkpoint:
+    """
+    The state of one oven at a point in (simulated) time.
+
+    Every component of the oven is captured as a section holding its class and the values of its public
+    attributes that are plain values: numbers, texts, enum members, application exceptions and NumPy arrays, and
+    lists and tuples of those. Ring buffers are captured with their contents, and components providing `snapshot`
+    and `restore`, like the noise source, are captured by those, which also cover the stateful helpers they own.
+    References to other components, loggers, threads and tasks are not captured, since they are wired up again
+    when the oven is built.
+
+    The running program is captured the same way, together with the key it was created by.
+
+    :ivar name: The name of the oven.
+    :ivar time: The time of the clock when the checkpoint was captured.
+    :ivar components: The sections of the components, by the class they are resolved by.
+    :ivar program: The section of the program, or None if the oven had no program.
+    """
+
+    MAGIC: bytes = b"MWCP"
+    """bytes: The first bytes of every encoded checkpoint."""
+
+    VERSION: int = 1
+    """int: The version of the encoding written by `to_bytes`."""
+
+    HEADER: struct.Struct = struct.Struct("<4sH")
+    """struct.Struct: The magic bytes and the version preceding the compressed sections."""
+
+    VALUE_TYPES: tuple[type, ...] = (type(None), bool, int, float, str, Enum, CustomException, np.ndarray)
+    """tuple[type, ...]: The types of the attributes captured as they are."""
+
+    def __init__(self, name: str, time: float, components: dict[str, Section], program: Section | None) -> None:
+        """
+        Initialize the Checkpoint.
+
+        :param name: The name of the oven.
+        :type name: str
+        :param time: The time of the clock when the checkpoint was captured.
+        :type time: float
+        :param components: The sections of the components, by the class they are resolved by.
+        :type components: dict[str, Section]
+        :param program: The section of the program, or None if the oven had no program.
+        :type program: Section | None
+        :return: None
+        """
+        self.name: str = name
+        self.time: float = time
+        self.components: dict[str, Section] = components
+        self.program: Section | None = program
+
+    @classmethod
+    def capture(cls, context: OvenContext) -> "Checkpoint":
+        """
+        Capture the state of an oven.
+
+        Capture the state between two ticks of its loops, e.g. from a scheduled task or while the scheduler is
+        stopped, so that no component is changed while it is captured.
+
+        :param context: The context of the oven.
+        :type context: OvenContext
+        :return: The checkpoint.
+        :rtype: Checkpoint
+        """
+        components: dict[str, Section] = {
+            CheckpointCodec.path(component_type): cls.section(component)
+            for component_type, component in context.components().items()
+        }
+
+        program: Section | None = None
+        program_controller: ProgramController | None = OvenContext.peek(context, ProgramController)
+        if program_controller is not None and program_controller.program is not None:
+            program = cls.section(program_controller.program)
+            program["key"] = program_controller.program.key
+
+        return cls(context.name, Clock().monotonic(), components, program)
+
+    def restore(self, context: OvenContext | None = None) -> OvenContext:
+        """
+        Restore the state into an oven and resume its loops and program where they were captured.
+
+        The oven is built from its system control. Substitute components, e.g. scripted input, have to be
+        registered before; components of another class than the captured one are not restored. The clock should
+        be set to the captured time before, e.g. with a `VirtualClock` starting at `time`, and a scheduler should
+        be installed to run the resumed loops in simulated time.
+
+        :param context: The context to restore into, which must not run yet, or None for a new one.
+        :type context: OvenContext | None
+        :raises ValueError: If the program of the checkpoint cannot be created.
+        :return: The context of the restored oven.
+        :rtype: OvenContext
+        """
+        context = context if context is not None else OvenContext(self.name)
+        system_control: SystemControl = context.get(SystemControl)
+        program_controller: ProgramController = context.get(ProgramController)
+
+        self._apply_components(context, resume=True)
+        if self.program is not None:
+            program_controller.program = self._create_program(context)
+            self.apply(program_controller.program, self.program, resume=True)
+            self._apply_components(context, resume=True)
+
+        system: Section | None = self.components.get(CheckpointCodec.path(SystemControl))
+        if system is not None and system["fields"].get("state", SystemControl.State.IDLE) != SystemControl.State.IDLE:
+            system_control.state = SystemControl.State.IDLE
+            system_control.start()
+
+        if self.program is not None and self.program["fields"].get("running") and \
+                not self.program["fields"].get("finished"):
+            program_controller.start(program_controller.program)
+            if self.program["fields"].get("paused"):
+                program_controller.pause()
+
+        for component_type, component in context.components().items():
+            section: Section | None = self.components.get(CheckpointCodec.path(component_type))
+            if section is not None and section["fields"].get("running") and not getattr(component, "running") \
+                    and callable(getattr(component, "start", None)):
+                component.start()
+
+        self._apply_components(context)
+        if self.program is not None:
+            self.apply(program_controller.program, self.program)
+
+        return context
+
+    def _apply_components(self, context: OvenContext, resume: bool = False) -> None:
+        """
+        Apply the captured sections to the components of an oven that have the captured class.
+
+        :param context: The context of the oven.
+        :type context: OvenContext
+        :param resume: Whether to leave the running state untouched, so the loops can be started afterwards.
+        :type resume: bool
+        :return: None
+        """
+        for component_type, component in context.components().items():
+            section: Section | None = self.components.get(CheckpointCodec.path(component_type))
+
+            if section is not None and section["class"] == CheckpointCodec.path(type(component)):
+                self.apply(component, section, resume)
+
+    def _create_program(self, context: OvenContext) -> Program:
+        """
+        Create the captured program in an oven, by the key it was created by, or else by its class.
+
+        :param context: The context of the oven.
+        :type context: OvenContext
+        :raises ValueError: If the program is unknown.
+        :return: The new program.
+        :rtype: Program
+        """
+        key: str | None = self.program.get("key")
+        if key is not None:
+            return ProgramRegistry.create(key, context)
+        return CheckpointCodec.load(self.program["class"], Program)(context)
+
+    @classmethod
+    def section(cls, component: object) -> Section:
+        """
+        Capture the state of a single component.
+
+        :param component: The component.
+        :type component: object
+        :return: The class of the component, its plain attributes, its ring buffers and its snapshot, if any.
+        :rtype: Section
+        """
+        snapshot = getattr(component, "snapshot", None)
+
+        return {
+            "class": CheckpointCodec.path(type(component)),
+            "fields": cls.fields(component),
+            "buffers": {name: {"fields": cls.fields(value), "data": bytes(value.buffer)}
+                        for name, value in vars(component).items()
+                        if not name.startswith("_") and isinstance(value, TypedRingbuffer)},
+            "snapshot": snapshot() if callable(snapshot) else None,
+        }
+
+    @classmethod
+    def fields(cls, component: object) -> dict[str, object]:
+        """
+        Capture the public attributes of an object that are plain values.
+
+        :param component: The object.
+        :type component: object
+        :return: The values by attribute name. Arrays and lists are copied.
+        :rtype: dict[str, object]
+        """
+        return {name: cls.copy(value) for name, value in vars(component).items()
+                if not name.startswith("_") and cls.is_plain(value)}
+
+    @classmethod
+    def is_plain(cls, value: object) -> bool:
+        """
+        Check whether a value is captured as it is.
+
+        :param value: The value.
+        :type value: object
+        :return: True for plain values and for lists and tuples of plain values, False otherwise.
+        :rtype: bool
+        """
+        if isinstance(value, (list, tuple)):
+            return all(isinstance(item, cls.VALUE_TYPES) for item in value)
+        return isinstance(value, cls.VALUE_TYPES)
+
+    @staticmethod
+    def copy(value: object, like: object = None) -> object:
+        """
+        Copy a captured value, so the component and the checkpoint never share a mutable value.
+
+        :param value: The value.
+        :type value: object
+        :param like: The value it replaces, whose type a list is converted back to if it is a tuple. Defaults to None.
+        :type like: object
+        :return: The copy of an array or a list, a tuple for a list replacing a tuple, or else the value itself.
+        :rtype: object
+        """
+        if isinstance(value, np.ndarray):
+            return value.copy()
+        if isinstance(value, (list, tuple)):
+            items: list[object] = [item.copy() if isinstance(item, np.ndarray) else item for item in value]
+            return tuple(items) if isinstance(value, tuple) or isinstance(like, tuple) else items
+        return value
+
+    @classmethod
+    def apply(cls, component: object, section: Section, resume: bool = False) -> None:
+        """
+        Apply a captured section to a component. Ring buffers are filled in place.
+
+        :param component: The component.
+        :type component: object
+        :param section: The captured state of the component.
+        :type section: Section
+        :param resume: Whether to leave the running state untouched. Defaults to False.
+        :type resume: bool
+        :raises ValueError: If a ring buffer has another size than the captured one.
+        :return: None
+        """
+        for name, value in section["fields"].items():
+            if not (resume and name == "running"):
+                setattr(component, name, cls.copy(value, getattr(component, name, None)))
+
+        for name, captured in section["buffers"].items():
+            buffer: TypedRingbuffer | None = getattr(component, name, None)
+            if buffer is None:
+                continue
+
+            view: memoryview = memoryview(buffer.buffer).cast("B")
+            if view.nbytes != len(captured["data"]):
+                raise ValueError(f"Ring buffer {name} holds {view.nbytes} bytes, but {len(captured['data'])} "
+                                 f"were captured")
+
+            view[:] = captured["data"]
+            for field, value in captured["fields"].items():
+                setattr(buffer, field, value)
+
+        if section["snapshot"] is not None:
+            component.restore(section["snapshot"])
+
+    def to_bytes(self) -> bytes:
+        """
+        Encode the checkpoint in its compact binary form.
+
+        :return: The header followed by the compressed sections.
+        :rtype: bytes
+        """
+        payload: bytes = CheckpointCodec.encode({"name": self.name, "time": self.time,
+                                                 "components": self.components, "program": self.program})
+        return self.HEADER.pack(self.MAGIC, self.VERSION) + zlib.compress(payload)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Checkpoint":
+        """
+        Decode a checkpoint encoded by `to_bytes`.
+
+        :param data: The encoded checkpoint.
+        :type data: bytes
+        :raises ValueError: If the data is not a checkpoint of a supported version or misses one of its values.
+        :return: The checkpoint.
+        :rtype: Checkpoint
+        """
+        if len(data) < cls.HEADER.size:
+            raise ValueError("Not a checkpoint: data is too short")
+
+        magic, version = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC:
+            raise ValueError("Not a checkpoint: magic bytes do not match")
+        if version != cls.VERSION:
+            raise ValueError(f"Unsupported checkpoint version {version}")
+
+        try:
+            payload: bytes = zlib.decompress(data[cls.HEADER.size:])
+        except zlib.error as exception:
+            raise ValueError(f"Corrupt checkpoint: {exception}") from exception
+
+        values: object = CheckpointCodec.decode(payload)
+        if not isinstance(values, dict):
+            raise ValueError("Corrupt checkpoint: payload is not a dict")
+
+        missing: list[str] = [key for key in ("name", "time", "components", "program") if key not in values]
+        if missing:
+            raise ValueError(f"Corrupt checkpoint: missing {', '.join(missing)}")
+        return cls(values["name"], values["time"], values["components"], values["program"])
+
+    def save(self, path: str) -> None:
+        """
+        Write the checkpoint to a file.
+
+        :param path: The path of the file.
+        :type path: str
+        :return: None
+        """
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "Checkpoint":
+        """
+        Read a checkpoint from a file written by `save`.
+
+        :param path: The path of the file.
+        :type path: str
+        :raises ValueError: If the file is not a checkpoint of a supported version.
+        :return: The checkpoint.
+        :rtype: Checkpoint
+        """
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
@@ -0,0 +1,291 @@
+import importlib
+import struct
+from enum import Enum
+
+import numpy as np
+
+from src.helper.exceptions import CustomException
+
+
+class CheckpointCodec:
+    """
+    Compact binary encoding of the values held in a checkpoint.
+
+    Every value starts with a one-byte tag, followed by its payload: nothing for None and booleans, the byte
+    length (uint8) and the little endian two's complement bytes for integers of any size, a float64 for floats,
+    the byte length (uint32) and the bytes for texts (UTF-8) and bytes, the item count (uint32) and the items for
+    lists and tuples, the entry count (uint32) and alternating keys and values for dicts. Enum members are stored
+    as the text of their class and name, application exceptions as the text of their class and message, and NumPy
+    arrays as the text of their dtype, the list of their dimensions and their bytes.
+
+    Enum and exception classes are imported by name when decoding, which is restricted to Enum subclasses and
+    application exceptions, so decoding a checkpoint never creates other objects. Only modules of the application
+    package are imported, so a checkpoint cannot cause other modules to be imported.
+    """
+
+    NONE: bytes = b"N"
+    TRUE: bytes = b"T"
+    FALSE: bytes = b"F"
+    INT: bytes = b"i"
+    FLOAT: bytes = b"d"
+    TEXT: bytes = b"s"
+    BYTES: bytes = b"b"
+    LIST: bytes = b"l"
+    DICT: bytes = b"m"
+    ENUM: bytes = b"e"
+    ERROR: bytes = b"x"
+    ARRAY: bytes = b"a"
+
+    LENGTH: struct.Struct = struct.Struct("<I")
+    """struct.Struct: Encoding of lengths and counts."""
+
+    DOUBLE: struct.Struct = struct.Struct("<d")
+    """struct.Struct: Encoding of floats."""
+
+    PACKAGE: str = "src"
+    """str: The package classes are imported from when loading."""
+
+    @classmethod
+    def encode(cls, value: object) -> bytes:
+        """
+        Encode a value.
+
+        :param value: The value, made of None, booleans, integers, floats, texts, bytes, lists, tuples, dicts, enum
+            members, application exceptions and NumPy arrays.
+        :type value: object
+        :raises TypeError: If the value contains an object of another type.
+        :return: The encoded value.
+        :rtype: bytes
+        """
+        parts: list[bytes] = []
+        cls._encode(value, parts)
+        return b"".join(parts)
+
+    @classmethod
+    def decode(cls, data: bytes) -> object:
+        """
+        Decode a value encoded by `encode`.
+
+        :param data: The encoded value.
+        :type data: bytes
+        :raises ValueError: If the data is not a valid encoded value.
+        :return: The value. Tuples are decoded as lists.
+        :rtype: object
+        """
+        view: memoryview = memoryview(data)
+        try:
+            value, offset = cls._decode(view, 0)
+        except (IndexError, struct.error, UnicodeDecodeError) as exception:
+            raise ValueError(f"Truncated or corrupt checkpoint data: {exception}") from exception
+
+        if offset != len(view):
+            raise ValueError(f"Unexpected {len(view) - offset} bytes after checkpoint data")
+        return value
+
+    @classmethod
+    def _encode(cls, value: object, parts: list[bytes]) -> None:
+        """
+        Append the encoding of a value to a list of parts.
+
+        :param value: The value.
+        :type value: object
+        :param parts: The encoded parts so far.
+        :type parts: list[bytes]
+        :raises TypeError: If the value contains an object of an unsupported type.
+        :return: None
+        """
+        if value is None:
+            parts.append(cls.NONE)
+        elif isinstance(value, Enum):
+            parts.append(cls.ENUM)
+            cls._encode_text(cls.path(type(value)), parts)
+            cls._encode_text(value.name, parts)
+        elif isinstance(value, bool):
+            parts.append(cls.TRUE if value else cls.FALSE)
+        elif isinstance(value, int):
+            raw: bytes = value.to_bytes((value.bit_length() + 8) // 8, "little", signed=True)
+            parts += [cls.INT, bytes((len(raw),)), raw]
+        elif isinstance(value, float):
+            parts += [cls.FLOAT, cls.DOUBLE.pack(value)]
+        elif isinstance(value, str):
+            parts.append(cls.TEXT)
+            cls._encode_text(value, parts)
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            parts += [cls.BYTES, cls.LENGTH.pack(len(value)), bytes(value)]
+        elif isinstance(value, (list, tuple)):
+            parts += [cls.LIST, cls.LENGTH.pack(len(value))]
+            for item in value:
+                cls._encode(item, parts)
+        elif isinstance(value, dict):
+            parts += [cls.DICT, cls.LENGTH.pack(len(value))]
+            for key, item in value.items():
+                cls._encode(key, parts)
+                cls._encode(item, parts)
+        elif isinstance(value, CustomException):
+            parts.append(cls.ERROR)
+            cls._encode_text(cls.path(type(value)), parts)
+            cls._encode_text(str(value), parts)
+        elif isinstance(value, np.ndarray):
+            parts.append(cls.ARRAY)
+            cls._encode_text(value.dtype.str, parts)
+            cls._encode(list(value.shape), parts)
+            data: bytes = np.ascontiguousarray(value).tobytes()
+            parts += [cls.LENGTH.pack(len(data)), data]
+        else:
+            raise TypeError(f"Cannot encode {type(value).__name__} in a checkpoint")
+
+    @classmethod
+    def _encode_text(cls, text: str, parts: list[bytes]) -> None:
+        """
+        Append the length and the UTF-8 bytes of a text to a list of parts.
+
+        :param text: The text.
+        :type text: str
+        :param parts: The encoded parts so far.
+        :type parts: list[bytes]
+        :return: None
+        """
+        raw: bytes = text.encode()
+        parts += [cls.LENGTH.pack(len(raw)), raw]
+
+    @classmethod
+    def _decode(cls, view: memoryview, offset: int) -> tuple[object, int]:
+        """
+        Decode the value at an offset.
+
+        :param view: The encoded data.
+        :type view: memoryview
+        :param offset: The offset of the tag of the value.
+        :type offset: int
+        :raises ValueError: If the tag is unknown or a class is not allowed.
+        :return: The value and the offset following it.
+        :rtype: tuple[object, int]
+        """
+        tag: bytes = bytes(view[offset:offset + 1])
+        offset += 1
+
+        match tag:
+            case cls.NONE:
+                return None, offset
+            case cls.TRUE:
+                return True, offset
+            case cls.FALSE:
+                return False, offset
+            case cls.INT:
+                length: int = view[offset]
+                return int.from_bytes(view[offset + 1:offset + 1 + length], "little", signed=True), offset + 1 + length
+            case cls.FLOAT:
+                return cls.DOUBLE.unpack_from(view, offset)[0], offset + cls.DOUBLE.size
+            case cls.TEXT:
+                return cls._decode_text(view, offset)
+            case cls.BYTES:
+                return cls._decode_bytes(view, offset)
+            case cls.LIST:
+                count: int = cls.LENGTH.unpack_from(view, offset)[0]
+                offset += cls.LENGTH.size
+                items: list[object] = []
+                for _ in range(count):
+                    item, offset = cls._decode(view, offset)
+                    items.append(item)
+                return items, offset
+            case cls.DICT:
+                count = cls.LENGTH.unpack_from(view, offset)[0]
+                offset += cls.LENGTH.size
+                entries: dict[object, object] = {}
+                for _ in range(count):
+                    key, offset = cls._decode(view, offset)
+                    entries[key], offset = cls._decode(view, offset)
+                return entries, offset
+            case cls.ENUM:
+                path, offset = cls._decode_text(view, offset)
+                name, offset = cls._decode_text(view, offset)
+                return cls.load(path, Enum)[name], offset
+            case cls.ERROR:
+                path, offset = cls._decode_text(view, offset)
+                message, offset = cls._decode_text(view, offset)
+                error_type: type = cls.load(path, CustomException)
+                error: CustomException = error_type.__new__(error_type)
+                error.args = (message,)
+                return error, offset
+            case cls.ARRAY:
+                dtype, offset = cls._decode_text(view, offset)
+                shape, offset = cls._decode(view, offset)
+                data, offset = cls._decode_bytes(view, offset)
+                return np.frombuffer(data, dtype=np.dtype(dtype)).reshape(shape).copy(), offset
+            case _:
+                raise ValueError(f"Unknown checkpoint value tag {tag!r} at offset {offset - 1}")
+
+    @classmethod
+    def _decode_text(cls, view: memoryview, offset: int) -> tuple[str, int]:
+        """
+        Decode the text at an offset.
+
+        :param view: The encoded data.
+        :type view: memoryview
+        :param offset: The offset of the length of the text.
+        :type offset: int
+        :return: The text and the offset following it.
+        :rtype: tuple[str, int]
+        """
+        raw, offset = cls._decode_bytes(view, offset)
+        return raw.decode(), offset
+
+    @classmethod
+    def _decode_bytes(cls, view: memoryview, offset: int) -> tuple[bytes, int]:
+        """
+        Decode the bytes at an offset.
+
+        :param view: The encoded data.
+        :type view: memoryview
+        :param offset: The offset of the length of the bytes.
+        :type offset: int
+        :raises ValueError: If the data ends before the bytes.
+        :return: The bytes and the offset following them.
+        :rtype: tuple[bytes, int]
+        """
+        length: int = cls.LENGTH.unpack_from(view, offset)[0]
+        start: int = offset + cls.LENGTH.size
+        if start + length > len(view):
+            raise ValueError("Truncated checkpoint data")
+        return bytes(view[start:start + length]), start + length
+
+    @staticmethod
+    def path(value_type: type) -> str:
+        """
+        Get the name a class is stored and imported by.
+
+        :param value_type: The class.
+        :type value_type: type
+        :return: The module and the qualified name of the class, as "module:Class".
+        :rtype: str
+        """
+        return f"{value_type.__module__}:{value_type.__qualname__}"
+
+    @staticmethod
+    def load(path: str, base: type) -> type:
+        """
+        Import a class by the name `path` returns for it.
+
+        :param path: The module and the qualified name of the class, as "module:Class".
+        :type path: str
+        :param base: The class the imported class must be a subclass of.
+        :type base: type
+        :raises ValueError: If the module is outside the application package, or the class does not exist or is not
+            a subclass of the base.
+        :return: The class.
+        :rtype: type
+        """
+        module_name, _, name = path.partition(":")
+        if module_name != CheckpointCodec.PACKAGE and not module_name.startswith(CheckpointCodec.PACKAGE + "."):
+            raise ValueError(f"Class {path} in checkpoint is outside the {CheckpointCodec.PACKAGE} package")
+
+        try:
+            value: object = importlib.import_module(module_name)
+            for part in name.split("."):
+                value = getattr(value, part)
+        except (ImportError, AttributeError) as exception:
+            raise ValueError(f"Unknown class {path} in checkpoint: {exception}") from exception
+
+        if not isinstance(value, type) or not issubclass(value, base):
+            raise ValueError(f"Class {path} in checkpoint is not a {base.__name__}")
+        return value
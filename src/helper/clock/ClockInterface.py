@@ -0,0 +1,85 @@
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable
+
+
+class ClockInterface(ABC):
+    """
+    Abstract base class for clock implementations.
+
+    Every periodic loop of the system measures and waits for time exclusively through this interface,
+    so the same control code can run against wall-clock time or against a simulated time base.
+    Blocking calls on threads and conditions are routed through the clock as well, which allows
+    simulated clocks to know when all participating threads are idle.
+    """
+
+    @abstractmethod
+    def monotonic(self) -> float:
+        """
+        Get the current time of the clock in seconds.
+
+        :return: The current monotonic time in seconds.
+        :rtype: float
+        """
+        pass
+
+    @abstractmethod
+    def sleep(self, seconds: float) -> None:
+        """
+        Block the calling thread for the given amount of clock time.
+
+        :param seconds: The time to sleep in seconds.
+        :type seconds: float
+        :return: None
+        """
+        pass
+
+    @abstractmethod
+    def spawn(self, target: Callable[[], None], name: str) -> threading.Thread:
+        """
+        Start a new thread that takes part in the clock's time base.
+
+        :param target: The function executed by the thread.
+        :type target: Callable[[], None]
+        :param name: The name of the thread.
+        :type name: str
+        :return: The started thread.
+        :rtype: threading.Thread
+        """
+        pass
+
+    @abstractmethod
+    def join(self, thread: threading.Thread) -> None:
+        """
+        Block the calling thread until the given thread has finished.
+
+        :param thread: The thread to wait for.
+        :type thread: threading.Thread
+        :return: None
+        """
+        pass
+
+    @abstractmethod
+    def wait_for(self, condition: threading.Condition, predicate: Callable[[], bool]) -> bool:
+        """
+        Wait on an already acquired condition until the predicate becomes true.
+
+        :param condition: The condition to wait on. The caller must hold its lock.
+        :type condition: threading.Condition
+        :param predicate: The predicate that ends the wait.
+        :type predicate: Callable[[], bool]
+        :return: The last value of the predicate.
+        :rtype: bool
+        """
+        pass
+
+    @abstractmethod
+    def notify_all(self, condition: threading.Condition) -> None:
+        """
+        Wake all threads waiting on an already acquired condition.
+
+        :param condition: The condition to notify. The caller must hold its lock.
+        :type condition: threading.Condition
+        :return: None
+        """
+        pass
@@ -0,0 +1,81 @@
+import threading
+import time
+from typing import Callable
+
+from src.helper.clock.ClockInterface import ClockInterface
+
+
+class SystemClock(ClockInterface):
+    """
+    Clock implementation backed by the real wall-clock time of the host.
+
+    This is the default clock of the system and behaves exactly like calling the `time` and
+    `threading` modules directly.
+    """
+
+    def monotonic(self) -> float:
+        """
+        Get the current monotonic time of the host.
+
+        :return: The current monotonic time in seconds.
+        :rtype: float
+        """
+        return time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Block the calling thread for the given amount of real time.
+
+        :param seconds: The time to sleep in seconds.
+        :type seconds: float
+        :return: None
+        """
+        time.sleep(seconds)
+
+    def spawn(self, target: Callable[[], None], name: str) -> threading.Thread:
+        """
+        Start a new thread executing the given target.
+
+        :param target: The function executed by the thread.
+        :type target: Callable[[], None]
+        :param name: The name of the thread.
+        :type name: str
+        :return: The started thread.
+        :rtype: threading.Thread
+        """
+        thread: threading.Thread = threading.Thread(target=target, name=name)
+        thread.start()
+        return thread
+
+    def join(self, thread: threading.Thread) -> None:
+        """
+        Block the calling thread until the given thread has finished.
+
+        :param thread: The thread to wait for.
+        :type thread: threading.Thread
+        :return: None
+        """
+        thread.join()
+
+    def wait_for(self, condition: threading.Condition, predicate: Callable[[], bool]) -> bool:
+        """
+        Wait on an already acquired condition until the predicate becomes true.
+
+        :param condition: The condition to wait on. The caller must hold its lock.
+        :type condition: threading.Condition
+        :param predicate: The predicate that ends the wait.
+        :type predicate: Callable[[], bool]
+        :return: The last value of the predicate.
+        :rtype: bool
+        """
+        return condition.wait_for(predicate)
+
+    def notify_all(self, condition: threading.Condition) -> None:
+        """
+        Wake all threads waiting on an already acquired condition.
+
+        :param condition: The condition to notify. The caller must hold its lock.
+        :type condition: threading.Condition
+        :return: None
+        """
+        condition.notify_all()
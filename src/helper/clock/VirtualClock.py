@@ -0,0 +1,225 @@
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Iterator
+
+from src.helper.clock.ClockInterface import ClockInterface
+
+
+class VirtualClock(ClockInterface):
+    """
+    Discrete-event clock that simulates time instead of waiting for it.
+
+    Every sleep registers a wake-up event. Threads that use the clock are participants of the
+    simulation: as soon as all of them are parked (sleeping, joining or waiting through the clock),
+    the clock jumps to the earliest pending event and wakes exactly that thread. Whole sessions
+    therefore run as fast as the CPU allows, while all loops keep their configured intervals
+    relative to each other.
+
+    Participants must block exclusively through the clock, otherwise the simulation stalls until
+    they do. Participants that died without leaving the simulation are pruned while waiting.
+
+    :ivar speed: Optional speed-up factor. If set, every jump is paced in real time, so a factor
+        of 10 simulates ten seconds per real second. None runs as fast as possible.
+    """
+
+    PRUNE_INTERVAL_IN_SECONDS: float = 0.1
+
+    def __init__(self, start: float = 0.0, speed: float | None = None) -> None:
+        """
+        Initialize the VirtualClock.
+
+        :param start: The initial simulated time in seconds. Defaults to 0.0.
+        :type start: float
+        :param speed: Optional speed-up factor relative to real time. Defaults to None (unpaced).
+        :type speed: float | None
+        :raises ValueError: If the speed is not a positive number.
+        :return: None
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("Speed must be a positive number")
+
+        self.speed: float | None = speed
+        self._now: float = start
+        self._condition: threading.Condition = threading.Condition()
+        self._sequence: Iterator[int] = itertools.count()
+        self._events: list[tuple[float, int, threading.Thread]] = []
+        self._participants: set[threading.Thread] = set()
+        self._blocked: dict[threading.Thread, object] = {}
+        self._released: set[threading.Thread] = set()
+        self._pacing: bool = False
+
+    def monotonic(self) -> float:
+        """
+        Get the current simulated time.
+
+        :return: The simulated time in seconds.
+        :rtype: float
+        """
+        return self._now
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Block the calling thread until the simulated time has advanced by the given amount.
+
+        :param seconds: The simulated time to sleep in seconds.
+        :type seconds: float
+        :return: None
+        """
+        thread: threading.Thread = threading.current_thread()
+
+        with self._condition:
+            self._participants.add(thread)
+            heapq.heappush(self._events, (self._now + max(0.0, seconds), next(self._sequence), thread))
+            self._dispatch()
+
+            while thread not in self._released:
+                if not self._condition.wait(self.PRUNE_INTERVAL_IN_SECONDS):
+                    self._dispatch()
+            self._released.discard(thread)
+
+    def spawn(self, target: Callable[[], None], name: str) -> threading.Thread:
+        """
+        Start a new thread that participates in the simulation until its target returns.
+
+        :param target: The function executed by the thread.
+        :type target: Callable[[], None]
+        :param name: The name of the thread.
+        :type name: str
+        :return: The started thread.
+        :rtype: threading.Thread
+        """
+
+        def run() -> None:
+            try:
+                target()
+            finally:
+                with self._condition:
+                    self._participants.discard(threading.current_thread())
+                    self._wake(threading.current_thread())
+                    self._dispatch()
+
+        thread: threading.Thread = threading.Thread(target=run, name=name)
+
+        with self._condition:
+            self._participants.add(threading.current_thread())
+            self._participants.add(thread)
+        thread.start()
+
+        return thread
+
+    def join(self, thread: threading.Thread) -> None:
+        """
+        Block the calling thread until the given thread has finished, letting simulated time advance meanwhile.
+
+        :param thread: The thread to wait for.
+        :type thread: threading.Thread
+        :return: None
+        """
+        while thread.is_alive():
+            self._park(thread)
+            thread.join()
+            self._unpark()
+
+    def wait_for(self, condition: threading.Condition, predicate: Callable[[], bool]) -> bool:
+        """
+        Wait on an already acquired condition, letting simulated time advance meanwhile.
+
+        :param condition: The condition to wait on. The caller must hold its lock.
+        :type condition: threading.Condition
+        :param predicate: The predicate that ends the wait.
+        :type predicate: Callable[[], bool]
+        :return: The last value of the predicate.
+        :rtype: bool
+        """
+        result: bool = predicate()
+
+        while not result:
+            self._park(condition)
+            condition.wait()
+            self._unpark()
+            result = predicate()
+
+        return result
+
+    def notify_all(self, condition: threading.Condition) -> None:
+        """
+        Wake all threads waiting on an already acquired condition and count them as runnable again.
+
+        :param condition: The condition to notify. The caller must hold its lock.
+        :type condition: threading.Condition
+        :return: None
+        """
+        with self._condition:
+            self._wake(condition)
+        condition.notify_all()
+
+    def _park(self, reason: object) -> None:
+        """
+        Mark the calling thread as blocked outside the clock, e.g. on a thread or a condition.
+
+        :param reason: The thread or condition the calling thread is about to wait for.
+        :type reason: object
+        :return: None
+        """
+        with self._condition:
+            self._participants.add(threading.current_thread())
+            self._blocked[threading.current_thread()] = reason
+            self._dispatch()
+
+    def _unpark(self) -> None:
+        """
+        Mark the calling thread as runnable again.
+
+        :return: None
+        """
+        with self._condition:
+            self._blocked.pop(threading.current_thread(), None)
+
+    def _wake(self, reason: object) -> None:
+        """
+        Count all threads blocked on the given reason as runnable, before they actually wake up.
+
+        Must be called while holding the clock's condition.
+
+        :param reason: The thread or condition that is released.
+        :type reason: object
+        :return: None
+        """
+        for thread in [thread for thread, blocked_on in self._blocked.items() if blocked_on is reason]:
+            del self._blocked[thread]
+
+    def _dispatch(self) -> None:
+        """
+        Advance to the earliest pending event and wake its thread, if every participant is parked.
+
+        Must be called while holding the clock's condition.
+
+        :return: None
+        """
+        if self._released or self._pacing or not self._events:
+            return
+
+        self._participants = {
+            participant for participant in self._participants
+            if participant.is_alive() or participant.ident is None
+        }
+
+        sleeping: set[threading.Thread] = {thread for _, _, thread in self._events}
+        for participant in self._participants:
+            if participant not in sleeping and participant not in self._blocked:
+                return
+
+        deadline, _, thread = heapq.heappop(self._events)
+
+        if self.speed is not None and deadline > self._now:
+            self._pacing = True
+            wake_up: float = time.monotonic() + (deadline - self._now) / self.speed
+            while (remaining := wake_up - time.monotonic()) > 0:
+                self._condition.wait(remaining)
+            self._pacing = False
+
+        self._now = max(self._now, deadline)
+        self._released.add(thread)
+        self._condition.notify_all()
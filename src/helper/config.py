@@ -8,6 +8,42 @@ logging, environment parameters, hardware timing, and operational limits.
 DEFAULT_LOG_LEVEL: str = "INFO"
 """str: The default logging level for the application."""
 
+LOG_QUEUE_CAPACITY: int = 10000
+"""int: Number of queued log records above which asynchronous logging starts dropping records."""
+
+LOG_FLUSH_INTERVAL_IN_SECONDS: float = 0.05
+"""float: Longest time in seconds a log record waits in the queue before being written."""
+
+FLIGHT_RECORDER_DURATION_IN_SECONDS: float = 30.0
+"""float: Time span in seconds of log records and samples kept in memory for emergency dumps."""
+
+FLIGHT_RECORDER_LOG_CAPACITY: int = 20000
+"""int: Maximum number of log records kept in memory for emergency dumps."""
+
+FLIGHT_RECORDER_DIRECTORY: str = "flight_records"
+"""str: Directory the flight recorder writes its emergency dumps to."""
+
+LOOP_REPORT_INTERVAL_IN_SECONDS: float = 60.0
+"""float: Interval in seconds for logging the timing statistics of all periodic loops."""
+
+METRICS_ENABLED: bool = False
+"""bool: Whether the metrics server is started with the application."""
+
+METRICS_HOST: str = "127.0.0.1"
+"""str: The address the metrics server listens on."""
+
+METRICS_PORT: int = 9464
+"""int: The port the metrics server listens on."""
+
+BENCHMARK_REGRESSION_THRESHOLD: float = 0.1
+"""float: Relative slowdown of a benchmark against its baseline reported as a regression."""
+
+NOISE_SEED: int | None = None
+"""int | None: Seed of the simulation noise, or None for a different noise on every run."""
+
+NOISE_BLOCK_SIZE: int = 4096
+"""int: Number of noise values generated at once per simulated sensor or modulator."""
+
 AMBIENT_TEMPERATURE_IN_CELSIUS: float = 22.0
 """float: The default ambient temperature in degrees Celsius."""
 
@@ -26,6 +62,12 @@ MAGNETRON_MAX_POWER_SHARE_PER_MINUTE: float = 0.8
 MAGNETRON_MAX_TEMP_IN_CELSIUS: float = 200.0
 """float: Maximum allowed temperature for the magnetron in degrees Celsius."""
 
+MAGNETRON_MODULATION: str = "SIGMA_DELTA"
+"""str: Name of the MagnetronModulation turning the target power share into on/off cycles."""
+
+MAGNETRON_POWER_IN_WATTS: float = 800.0
+"""float: Microwave power the magnetron delivers while switched on, in watts."""
+
 COOLING_FAN_STEP_IN_PERCENT: float = 0.1
 """float: Step size for adjusting the cooling fan speed as a percentage."""
 
@@ -61,3 +103,30 @@ PROGRAM_UPDATE_INTERVAL_IN_SECONDS: float = 0.01
 
 PROGRAM_DEFROSTING_TARGET_TEMP: int = 60
 """int: Target temperature in degrees Celsius for the defrosting program."""
+
+PROGRAM_DEFAULT: str = "defrosting"
+"""str: Key of the program started when the user has not selected another one."""
+
+PROGRAM_RECIPE_DIRECTORY: str = "recipes"
+"""str: Directory recipe files (.json or .toml) are loaded from in addition to the built-in recipes."""
+
+PROGRAM_METADATA_CACHE_PATH: str = "program_metadata.json"
+"""str: File the metadata of installed program plugins is cached in, so listing them needs no import."""
+
+PROGRAM_PREDICTIVE_HORIZON_IN_SECONDS: float = 5.0
+"""float: Time the predictive defrosting program looks ahead when planning the magnetron power."""
+
+PROGRAM_PREDICTIVE_POWER_LEVELS: int = 20
+"""int: Number of steps the magnetron power share range is divided into by the predictive defrosting program."""
+
+PROGRAM_PREDICTIVE_TEMP_MARGIN_IN_CELSIUS: float = 10.0
+"""float: Distance to the magnetron temperature limit the predictive defrosting program keeps when planning."""
+
+TELEMETRY_CHUNK_ROWS: int = 6000
+"""int: Number of rows preallocated at once in telemetry files, one minute of main loop ticks."""
+
+CONFIG_PATH: str = "microwave.toml"
+"""str: File of the runtime settings overriding these defaults, in TOML or JSON, watched for changes."""
+
+CONFIG_WATCH_INTERVAL_IN_SECONDS: float = 1.0
+"""float: Interval in seconds for checking the file of the runtime settings for changes."""
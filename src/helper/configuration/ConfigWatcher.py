@@ -0,0 +1,149 @@
+import os
+import threading
+
+from src.helper.Clock import Clock
+from src.helper.Logger import Logger
+from src.helper.Scheduler import Scheduler
+from src.helper.Settings import Settings
+from src.helper.configuration.RuntimeConfig import RuntimeConfig, Changes
+from src.helper.logging.LogLevel import LogLevel
+from src.helper.scheduling.PeriodicRunner import PeriodicRunner
+from src.helper.scheduling.ScheduledTask import ScheduledTask
+from src.helper.scheduling.SchedulerInterface import SchedulerInterface
+
+
+class ConfigWatcher:
+    """
+    Watches the settings file and applies it to the runtime settings whenever it changes.
+
+    The file is checked periodically for a changed modification time or size. A file that cannot be read or holds
+    invalid settings is logged and ignored, so the settings stay as they were until the file is fixed. A deleted
+    file also leaves the settings as they were. A changed watch interval is applied to the running loop.
+
+    :ivar path: The path of the settings file.
+    :ivar settings: The runtime settings the file is applied to.
+    :ivar signature: The modification time and size of the file when it was last checked, or None if it was missing.
+    :ivar reloads: The number of times the file was applied.
+    :ivar runner: The task or runner of the watch loop, or None if it was not started.
+    """
+
+    def __init__(self, path: str, settings: RuntimeConfig | None = None) -> None:
+        """
+        Initialize the ConfigWatcher.
+
+        :param path: The path of the settings file, ending in .json or .toml.
+        :type path: str
+        :param settings: The runtime settings to apply the file to, or None for the installed ones.
+        :type settings: RuntimeConfig | None
+        :return: None
+        """
+        self.logger: Logger = Logger("Configuration")
+        self.path: str = path
+        self.settings: RuntimeConfig = settings if settings is not None else Settings()
+        self.signature: tuple[int, int] | None = None
+        self.reloads: int = 0
+        self.running: bool = False
+        self.thread: threading.Thread | ScheduledTask | None = None
+        self.runner: PeriodicRunner | ScheduledTask | None = None
+
+        self.settings.subscribe(self.apply_settings, "CONFIG_WATCH_INTERVAL_IN_SECONDS")
+
+    def apply_settings(self, changes: Changes) -> None:
+        """
+        Apply a changed watch interval to the running loop.
+
+        :param changes: The previous and the new value of the changed settings, by name.
+        :type changes: Changes
+        :return: None
+        """
+        if self.runner is not None:
+            self.runner.period = self.settings.CONFIG_WATCH_INTERVAL_IN_SECONDS
+            self.logger.log(f"Settings file watch interval set to {self.runner.period}s", LogLevel.INFO)
+
+    def start(self) -> None:
+        """
+        Apply the settings file, then watch it on the installed scheduler, or in a separate thread if none is
+        installed, if not already running.
+
+        :return: None
+        """
+        if not self.running:
+            self.logger.log(f"Watching settings file {self.path}", LogLevel.INFO)
+            self.running = True
+            self.check()
+
+            scheduler: SchedulerInterface | None = Scheduler()
+            if scheduler is not None:
+                interval: float = self.settings.CONFIG_WATCH_INTERVAL_IN_SECONDS
+                self.thread = scheduler.schedule(self.watch_tick, interval, interval, "ConfigWatch")
+                self.runner = self.thread
+            else:
+                self.thread = Clock().spawn(self.watch_loop, "ConfigWatchThread")
+        else:
+            self.logger.log("Settings file is already watched", LogLevel.WARNING)
+
+    def stop(self) -> None:
+        """
+        Stop watching the settings file and wait for its thread or task to finish.
+
+        :return: None
+        """
+        if self.running:
+            self.logger.log(f"Stopping to watch settings file {self.path}", LogLevel.INFO)
+            self.running = False
+            if self.thread:
+                Clock().join(self.thread)
+        else:
+            self.logger.log("Settings file is not watched", LogLevel.WARNING)
+
+    def check(self) -> bool:
+        """
+        Apply the settings file if it changed since the last check.
+
+        :return: True if the file changed and was applied, False otherwise.
+        :rtype: bool
+        """
+        try:
+            status: os.stat_result = os.stat(self.path)
+            signature: tuple[int, int] | None = (status.st_mtime_ns, status.st_size)
+        except FileNotFoundError:
+            signature = None
+
+        if signature == self.signature:
+            return False
+
+        self.signature = signature
+        if signature is None:
+            self.logger.log(f"Settings file {self.path} was removed, keeping the current settings", LogLevel.WARNING)
+            return False
+
+        try:
+            self.settings.load(self.path)
+        except (OSError, ValueError) as exception:
+            self.logger.log(f"Ignoring settings file {self.path}: {exception}", LogLevel.WARNING)
+            return False
+
+        self.reloads += 1
+        return True
+
+    def watch_tick(self) -> bool:
+        """
+        Run one iteration of the watch loop.
+
+        :return: True if the loop keeps running, False otherwise.
+        :rtype: bool
+        """
+        if self.running:
+            self.check()
+
+        return self.running
+
+    def watch_loop(self) -> None:
+        """
+        Continuously check the settings file at a fixed interval while running.
+
+        :return: None
+        """
+        interval: float = self.settings.CONFIG_WATCH_INTERVAL_IN_SECONDS
+        self.runner = PeriodicRunner(self.watch_tick, interval, "ConfigWatch", interval)
+        self.runner.run()
@@ -0,0 +1,401 @@
+import inspect
+import json
+import os
+import threading
+import tomllib
+import weakref
+from types import ModuleType, NoneType
+from typing import Callable, Mapping, get_args
+
+from src.components.magnetron.MagnetronModulation import MagnetronModulation
+from src.helper import config
+from src.helper.Logger import Logger
+from src.helper.logging.LogLevel import LogLevel
+
+Changes = dict[str, tuple[object, object]]
+"""The previous and the new value by setting."""
+
+
+class RuntimeConfig:
+    """
+    Typed settings of the microwave control system that can be changed while it is running.
+
+    Every annotated constant of the configuration module is a setting, with the constant as its default and the
+    annotation as its type. The settings are plain attributes, so reading them costs no more than any other
+    attribute access. The reloadable settings are overridden by a settings file and by environment variables, the
+    latter taking precedence; the other settings are read once when the modules using them are loaded, so they are
+    ignored with a warning there and rejected by `update`. Every change is validated as a whole before it is applied,
+    so an invalid change leaves all settings as they were. Subscribers are notified of the settings that changed
+    after they were applied.
+
+    Bound methods are subscribed weakly, so a controller that is no longer used does not have to unsubscribe.
+
+    :ivar types: The type of every setting, by name.
+    :ivar defaults: The default of every setting, by name.
+    :ivar file_values: The settings read from the settings file, by name.
+    :ivar environment_values: The settings read from the environment, by name.
+    """
+
+    ENVIRONMENT_PREFIX: str = "MICROWAVE_"
+    """str: Prefix of the environment variables overriding a setting, followed by the name of the setting."""
+
+    TRUE_VALUES: tuple[str, ...] = ("1", "true", "yes", "on")
+    """tuple[str, ...]: Texts read as True for a boolean setting."""
+
+    FALSE_VALUES: tuple[str, ...] = ("0", "false", "no", "off")
+    """tuple[str, ...]: Texts read as False for a boolean setting."""
+
+    CONSTRAINTS: dict[str, tuple[Callable[[object], bool], str]] = {
+        "DEFAULT_LOG_LEVEL": (lambda value: value.upper() in LogLevel.__members__, "a log level"),
+        "LOG_QUEUE_CAPACITY": (lambda value: value > 0, "positive"),
+        "LOG_FLUSH_INTERVAL_IN_SECONDS": (lambda value: value > 0, "positive"),
+        "FLIGHT_RECORDER_DURATION_IN_SECONDS": (lambda value: value > 0, "positive"),
+        "FLIGHT_RECORDER_LOG_CAPACITY": (lambda value: value > 0, "positive"),
+        "LOOP_REPORT_INTERVAL_IN_SECONDS": (lambda value: value > 0, "positive"),
+        "METRICS_PORT": (lambda value: 0 <= value <= 65535, "a port number"),
+        "BENCHMARK_REGRESSION_THRESHOLD": (lambda value: value >= 0, "non-negative"),
+        "NOISE_BLOCK_SIZE": (lambda value: value > 0, "positive"),
+        "AMBIENT_HUMIDITY_IN_PERCENT": (lambda value: 0 <= value <= 100, "between 0 and 100"),
+        "MAIN_LOOP_TIMEOUT_IN_SECONDS": (lambda value: value > 0, "positive"),
+        "MAGNETRON_ON_OFF_INTERVAL_IN_SECONDS": (lambda value: value > 0, "positive"),
+        "MAGNETRON_MAX_POWER_SHARE_PER_MINUTE": (lambda value: 0 <= value <= 1, "between 0 and 1"),
+        "MAGNETRON_MAX_TEMP_IN_CELSIUS": (lambda value: value > 0, "positive"),
+        "MAGNETRON_MODULATION": (lambda value: value in MagnetronModulation.__members__, "a modulation"),
+        "MAGNETRON_POWER_IN_WATTS": (lambda value: value > 0, "positive"),
+        "COOLING_FAN_STEP_IN_PERCENT": (lambda value: 0 < value <= 1, "between 0 (exclusive) and 1"),
+        "COOLING_FAN_UPDATE_INTERVAL_IN_SECONDS": (lambda value: value > 0, "positive"),
+        "TURNTABLE_WEIGHT_IN_GRAMS": (lambda value: value >= 0, "non-negative"),
+        "TURNTABLE_STEP_IN_ROTATIONS_PER_MINUTE": (lambda value: value > 0, "positive"),
+        "REFLECTOR_STEP_IN_DEGREES": (lambda value: value > 0, "positive"),
+        "LIGHT_UPDATE_INTERVAL_IN_SECONDS": (lambda value: value > 0, "positive"),
+        "PROGRAM_UPDATE_INTERVAL_IN_SECONDS": (lambda value: value > 0, "positive"),
+        "PROGRAM_PREDICTIVE_HORIZON_IN_SECONDS": (lambda value: value > 0, "positive"),
+        "PROGRAM_PREDICTIVE_POWER_LEVELS": (lambda value: value > 0, "positive"),
+        "PROGRAM_PREDICTIVE_TEMP_MARGIN_IN_CELSIUS": (lambda value: value >= 0, "non-negative"),
+        "TELEMETRY_CHUNK_ROWS": (lambda value: value > 0, "positive"),
+        "CONFIG_WATCH_INTERVAL_IN_SECONDS": (lambda value: value > 0, "positive"),
+    }
+    """dict[str, tuple[Callable[[object], bool], str]]: Check and description of the valid values, by setting."""
+
+    RELOADABLE: frozenset[str] = frozenset({
+        "MAIN_LOOP_TIMEOUT_IN_SECONDS",
+        "MAGNETRON_ON_OFF_INTERVAL_IN_SECONDS",
+        "MAGNETRON_MAX_POWER_SHARE_PER_MINUTE",
+        "MAGNETRON_MAX_TEMP_IN_CELSIUS",
+        "MAGNETRON_MODULATION",
+        "COOLING_FAN_STEP_IN_PERCENT",
+        "COOLING_FAN_UPDATE_INTERVAL_IN_SECONDS",
+        "TURNTABLE_MIN_ROTATIONS_PER_MINUTE",
+        "TURNTABLE_MAX_ROTATIONS_PER_MINUTE",
+        "TURNTABLE_STEP_IN_ROTATIONS_PER_MINUTE",
+        "REFLECTOR_MIN_ANGLE_IN_DEGREES",
+        "REFLECTOR_MAX_ANGLE_IN_DEGREES",
+        "REFLECTOR_STEP_IN_DEGREES",
+        "LIGHT_UPDATE_INTERVAL_IN_SECONDS",
+        "PROGRAM_DEFROSTING_TARGET_TEMP",
+        "CONFIG_WATCH_INTERVAL_IN_SECONDS",
+    })
+    """frozenset[str]: The settings the controllers read or subscribe to while running, which can be changed."""
+
+    ORDERED: tuple[tuple[str, str], ...] = (
+        ("TURNTABLE_MIN_ROTATIONS_PER_MINUTE", "TURNTABLE_MAX_ROTATIONS_PER_MINUTE"),
+        ("REFLECTOR_MIN_ANGLE_IN_DEGREES", "REFLECTOR_MAX_ANGLE_IN_DEGREES"),
+    )
+    """tuple[tuple[str, str], ...]: Pairs of settings the first of which must not exceed the second."""
+
+    def __init__(self, defaults: ModuleType = config) -> None:
+        """
+        Initialize the RuntimeConfig with the defaults.
+
+        :param defaults: The module whose annotated constants are the settings. Defaults to the configuration module.
+        :type defaults: ModuleType
+        :return: None
+        """
+        self.logger: Logger = Logger("Configuration")
+        self.types: dict[str, object] = dict(defaults.__annotations__)
+        self.defaults: dict[str, object] = {name: getattr(defaults, name) for name in self.types}
+        self.file_values: dict[str, object] = {}
+        self.environment_values: dict[str, object] = {}
+
+        self._lock: threading.RLock = threading.RLock()
+        self._subscribers: list[tuple[Callable[[], Callable[[Changes], None] | None], frozenset[str]]] = []
+
+        for name, value in self.defaults.items():
+            setattr(self, name, value)
+
+    def convert(self, name: str, value: object) -> object:
+        """
+        Convert a value to the type of a setting and check it against the constraints of the setting.
+
+        Texts, e.g. from environment variables, are parsed. Integers are accepted for float settings, but no other
+        conversion between types is made.
+
+        :param name: The name of the setting.
+        :type name: str
+        :param value: The value.
+        :type value: object
+        :raises ValueError: If the setting does not exist or the value is not valid for it.
+        :return: The converted value.
+        :rtype: object
+        """
+        if name not in self.types:
+            raise ValueError(f"Unknown setting {name}")
+
+        kinds: tuple[object, ...] = get_args(self.types[name]) or (self.types[name],)
+
+        if NoneType in kinds and (value is None or isinstance(value, str) and value.strip().lower() in ("", "none")):
+            return None
+
+        for kind in kinds:
+            try:
+                converted: object = self._coerce(value, kind)
+                break
+            except (TypeError, ValueError):
+                continue
+        else:
+            raise ValueError(f"{name} must be of type {self.types[name]}, got {value!r}")
+
+        check, description = self.CONSTRAINTS.get(name, (None, ""))
+        if check is not None and not check(converted):
+            raise ValueError(f"{name} must be {description}, got {converted!r}")
+
+        return converted
+
+    def _coerce(self, value: object, kind: object) -> object:
+        """
+        Convert a value to a type.
+
+        :param value: The value.
+        :type value: object
+        :param kind: The type.
+        :type kind: object
+        :raises TypeError: If the value cannot be converted to the type.
+        :raises ValueError: If the value is a text that cannot be parsed as the type.
+        :return: The converted value.
+        :rtype: object
+        """
+        if kind is bool:
+            if isinstance(value, bool):
+                return value
+            if isinstance(value, str) and value.strip().lower() in self.TRUE_VALUES + self.FALSE_VALUES:
+                return value.strip().lower() in self.TRUE_VALUES
+        elif kind is int:
+            if isinstance(value, int) and not isinstance(value, bool):
+                return value
+            if isinstance(value, str):
+                return int(value)
+        elif kind is float:
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return float(value)
+            if isinstance(value, str):
+                return float(value)
+        elif kind is str:
+            if isinstance(value, str):
+                return value
+
+        raise TypeError(f"Cannot convert {value!r} to {kind}")
+
+    def validate(self, values: Mapping[str, object]) -> dict[str, object]:
+        """
+        Convert and check changed settings, also against the settings they are not changed with.
+
+        :param values: The changed settings, by name.
+        :type values: Mapping[str, object]
+        :raises ValueError: If a setting does not exist or a value is not valid.
+        :return: The converted settings, by name.
+        :rtype: dict[str, object]
+        """
+        converted: dict[str, object] = {name: self.convert(name, value) for name, value in values.items()}
+
+        for lower, upper in self.ORDERED:
+            if lower in converted or upper in converted:
+                low: object = converted.get(lower, getattr(self, lower))
+                high: object = converted.get(upper, getattr(self, upper))
+                if low > high:
+                    raise ValueError(f"{lower} must not exceed {upper}, got {low!r} > {high!r}")
+
+        return converted
+
+    def update(self, values: Mapping[str, object]) -> Changes:
+        """
+        Validate and apply changed settings, then notify the subscribers of the settings that changed.
+
+        Settings changed this way are replaced again when the settings file or the environment is reloaded.
+
+        :param values: The changed settings, by name.
+        :type values: Mapping[str, object]
+        :raises ValueError: If a setting does not exist, is not reloadable or a value is not valid. No setting is
+            changed then.
+        :return: The previous and the new value of every setting that changed, by name.
+        :rtype: Changes
+        """
+        fixed: list[str] = sorted(name for name in values if name in self.types and name not in self.RELOADABLE)
+        if fixed:
+            raise ValueError(f"Settings {', '.join(fixed)} are only read at startup and cannot be changed")
+
+        with self._lock:
+            converted: dict[str, object] = self.validate(values)
+            changes: Changes = {name: (getattr(self, name), value) for name, value in converted.items()
+                                if getattr(self, name) != value}
+
+            for name, (_, value) in changes.items():
+                setattr(self, name, value)
+
+        if changes:
+            self.logger.log(f"Settings changed: {', '.join(sorted(changes))}", LogLevel.INFO)
+            self.notify(changes)
+
+        return changes
+
+    def reload(self) -> Changes:
+        """
+        Apply the defaults overridden by the settings file and the environment.
+
+        :raises ValueError: If a value is not valid. No setting is changed then.
+        :return: The previous and the new value of every setting that changed, by name.
+        :rtype: Changes
+        """
+        return self.update(self.reloadable(self.defaults) | self.file_values | self.environment_values)
+
+    def reloadable(self, values: Mapping[str, object], source: str | None = None) -> dict[str, object]:
+        """
+        Keep the reloadable settings and the unknown ones, which are rejected when applied.
+
+        :param values: The settings, by name.
+        :type values: Mapping[str, object]
+        :param source: The source of the settings, to warn about the dropped ones, or None to drop them silently.
+        :type source: str | None
+        :return: The settings without the ones that are only read at startup, by name.
+        :rtype: dict[str, object]
+        """
+        fixed: list[str] = sorted(name for name in values if name in self.types and name not in self.RELOADABLE)
+        if fixed and source is not None:
+            self.logger.log(f"Ignoring {', '.join(fixed)} from {source}: only read at startup", LogLevel.WARNING)
+
+        return {name: value for name, value in values.items() if name not in fixed}
+
+    def load(self, path: str) -> Changes:
+        """
+        Read the settings file, a flat table of setting names and values in JSON or TOML, and apply it.
+
+        Settings missing from the file go back to their default, unless they are set in the environment. Settings
+        that are not reloadable are ignored with a warning.
+
+        :param path: The path of the file, ending in .json or .toml.
+        :type path: str
+        :raises ValueError: If the file type is not supported or the content is not valid. No setting is changed then.
+        :raises OSError: If the file cannot be read.
+        :return: The previous and the new value of every setting that changed, by name.
+        :rtype: Changes
+        """
+        match os.path.splitext(path)[1].lower():
+            case ".json":
+                with open(path, encoding="utf-8") as file:
+                    data: object = json.load(file)
+            case ".toml":
+                with open(path, "rb") as file:
+                    data = tomllib.load(file)
+            case _:
+                raise ValueError(f"Unsupported settings file type: {path}")
+
+        if not isinstance(data, dict):
+            raise ValueError(f"Settings file {path} does not contain a table")
+
+        values: dict[str, object] = self.reloadable({str(name).upper(): value for name, value in data.items()}, path)
+        changes: Changes = self.update(self.reloadable(self.defaults) | values | self.environment_values)
+        self.file_values = values
+        return changes
+
+    def load_environment(self, environment: Mapping[str, str] | None = None) -> Changes:
+        """
+        Read the settings from the environment variables named after them with the prefix and apply them.
+
+        Settings that are not reloadable are ignored with a warning.
+
+        :param environment: The environment variables, or None for the ones of the process.
+        :type environment: Mapping[str, str] | None
+        :raises ValueError: If a value is not valid. No setting is changed then.
+        :return: The previous and the new value of every setting that changed, by name.
+        :rtype: Changes
+        """
+        environment = os.environ if environment is None else environment
+        values: dict[str, object] = self.reloadable({name: environment[self.ENVIRONMENT_PREFIX + name]
+                                                     for name in self.types
+                                                     if self.ENVIRONMENT_PREFIX + name in environment},
+                                                    "the environment")
+        changes: Changes = self.update(self.reloadable(self.defaults) | self.file_values | values)
+        self.environment_values = values
+        return changes
+
+    def subscribe(self, callback: Callable[[Changes], None], *names: str) -> None:
+        """
+        Notify a callback of changed settings after they were applied.
+
+        The callback is called with the changes of the named settings only, and only if one of them changed. It is
+        called in the thread applying the change, e.g. the thread of the settings watcher. Subscribing a callback
+        again for the same settings has no effect, so singletons can subscribe in their initializer, which runs
+        again whenever they are retrieved.
+
+        :param callback: The function called with the previous and the new value of the changed settings, by name.
+        :type callback: Callable[[Changes], None]
+        :param names: The settings to notify of. Defaults to all settings.
+        :type names: str
+        :raises ValueError: If a setting does not exist or is not reloadable.
+        :return: None
+        """
+        unknown: list[str] = [name for name in names if name not in self.types]
+        if unknown:
+            raise ValueError(f"Unknown settings {', '.join(unknown)}")
+
+        fixed: list[str] = [name for name in names if name not in self.RELOADABLE]
+        if fixed:
+            raise ValueError(f"Settings {', '.join(fixed)} are only read at startup and never change")
+
+        reference: Callable[[], Callable[[Changes], None] | None] = \
+            weakref.WeakMethod(callback) if inspect.ismethod(callback) else lambda: callback
+
+        with self._lock:
+            if any(subscribed() == callback and subscribed_names == frozenset(names)
+                   for subscribed, subscribed_names in self._subscribers):
+                return
+            self._subscribers.append((reference, frozenset(names)))
+
+    def unsubscribe(self, callback: Callable[[Changes], None]) -> None:
+        """
+        Stop notifying a callback of changed settings.
+
+        :param callback: The subscribed function.
+        :type callback: Callable[[Changes], None]
+        :return: None
+        """
+        with self._lock:
+            self._subscribers = [(reference, names) for reference, names in self._subscribers
+                                 if reference() not in (None, callback)]
+
+    def notify(self, changes: Changes) -> None:
+        """
+        Call every subscriber interested in one of the changed settings.
+
+        A failing subscriber is logged and does not keep the others from being notified.
+
+        :param changes: The previous and the new value of the changed settings, by name.
+        :type changes: Changes
+        :return: None
+        """
+        with self._lock:
+            self._subscribers = [(reference, names) for reference, names in self._subscribers
+                                 if reference() is not None]
+            subscribers: list[tuple[Callable[[], Callable[[Changes], None] | None], frozenset[str]]] = \
+                list(self._subscribers)
+
+        for reference, names in subscribers:
+            callback: Callable[[Changes], None] | None = reference()
+            relevant: Changes = {name: change for name, change in changes.items() if not names or name in names}
+
+            if callback is None or not relevant:
+                continue
+
+            try:
+                callback(relevant)
+            except Exception as exception:
+                self.logger.log(f"Settings subscriber {callback} failed: {exception}", LogLevel.ERROR)
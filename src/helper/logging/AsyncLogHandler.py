@@ -0,0 +1,205 @@
+import itertools
+import logging
+import sys
+import threading
+import traceback
+from collections import deque
+
+from src.helper.config import LOG_QUEUE_CAPACITY, LOG_FLUSH_INTERVAL_IN_SECONDS
+from src.helper.logging.LogLevel import LogLevel
+
+
+class AsyncLogHandler(logging.Handler):
+    """
+    Logging handler that decouples producers from a slow output handler.
+
+    Producers only append records to bounded per-level queues without taking a lock; the queues are thread-safe
+    deques, and a producer making room may pop from them while they are drained. A dedicated writer thread
+    drains the queues in batches, restores the original record order, passes the records to the target handler
+    and flushes it. If the queues are full, records of the droppable levels are discarded lowest level first;
+    CRITICAL records are never dropped.
+
+    :ivar target: The handler the records are written to.
+    :ivar capacity: The number of queued records above which records are dropped.
+    :ivar droppable: The levels that may be dropped on overflow, in the order they are dropped.
+    :ivar dropped: The number of dropped records per level since the last report.
+    """
+
+    def __init__(self, target: logging.Handler, capacity: int = LOG_QUEUE_CAPACITY,
+                 droppable: tuple[LogLevel, ...] = (LogLevel.DEBUG, LogLevel.INFO, LogLevel.WARNING, LogLevel.ERROR),
+                 flush_interval: float = LOG_FLUSH_INTERVAL_IN_SECONDS) -> None:
+        """
+        Initialize the handler and start its writer thread.
+
+        :param target: The handler the records are written to.
+        :type target: logging.Handler
+        :param capacity: The number of queued records above which records are dropped. Defaults to LOG_QUEUE_CAPACITY.
+        :type capacity: int
+        :param droppable: The levels that may be dropped on overflow, in the order they are dropped.
+            Defaults to every level except CRITICAL, DEBUG first.
+        :type droppable: tuple[LogLevel, ...]
+        :param flush_interval: The longest time in seconds a record waits before being written.
+            Defaults to LOG_FLUSH_INTERVAL_IN_SECONDS.
+        :type flush_interval: float
+        :raises ValueError: If the capacity is not positive or CRITICAL is droppable.
+        :return: None
+        """
+        if capacity <= 0:
+            raise ValueError(f"Capacity must be positive, got {capacity}")
+        if LogLevel.CRITICAL in droppable:
+            raise ValueError("CRITICAL records must never be dropped")
+
+        super().__init__()
+        self.target: logging.Handler = target
+        self.capacity: int = capacity
+        self.droppable: tuple[LogLevel, ...] = droppable
+        self.flush_interval: float = flush_interval
+        self.dropped: dict[LogLevel, int] = {level: 0 for level in LogLevel}
+
+        self._queues: dict[LogLevel, deque[tuple[int, logging.LogRecord]]] = {level: deque() for level in LogLevel}
+        self._sequence: itertools.count = itertools.count()
+        self._write_lock: threading.Lock = threading.Lock()
+        self._wakeup: threading.Event = threading.Event()
+        self._running: bool = True
+        self._thread: threading.Thread = threading.Thread(target=self._write_loop, name="LogWriterThread",
+                                                          daemon=True)
+        self._thread.start()
+
+    def __len__(self) -> int:
+        """
+        Get the number of queued records.
+
+        :return: The number of records waiting to be written.
+        :rtype: int
+        """
+        return sum(len(queue) for queue in self._queues.values())
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Queue a record for the writer thread, dropping a record if the queues are full.
+
+        :param record: The record to queue.
+        :type record: logging.LogRecord
+        :return: None
+        """
+        level: LogLevel = self._level_of(record)
+
+        if len(self) >= self.capacity and not self._make_room(level):
+            self.dropped[level] += 1
+            return
+
+        self._queues[level].append((next(self._sequence), record))
+
+        if level >= LogLevel.ERROR:
+            self._wakeup.set()
+
+    def _make_room(self, level: LogLevel) -> bool:
+        """
+        Drop the oldest queued record of the lowest droppable level not above the given level.
+
+        :param level: The level of the record that needs room.
+        :type level: LogLevel
+        :return: True if the record may be queued, False if it has to be dropped.
+        :rtype: bool
+        """
+        for droppable in self.droppable:
+            if droppable > level:
+                continue
+
+            try:
+                self._queues[droppable].popleft()
+            except IndexError:
+                continue
+
+            self.dropped[droppable] += 1
+            return True
+
+        return level not in self.droppable
+
+    @staticmethod
+    def _level_of(record: logging.LogRecord) -> LogLevel:
+        """
+        Map a record to the queue of its level, rounding custom levels down.
+
+        :param record: The record to classify.
+        :type record: logging.LogRecord
+        :return: The level of the queue for the record.
+        :rtype: LogLevel
+        """
+        for level in reversed(LogLevel):
+            if record.levelno >= level:
+                return level
+        return LogLevel.DEBUG
+
+    def _write_loop(self) -> None:
+        """
+        Write the queued records until the handler is closed.
+
+        A failing write is reported on stderr, as logging does for failing handlers, and does not stop the thread.
+
+        :return: None
+        """
+        while self._running:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                traceback.print_exc(file=sys.stderr)
+
+    def flush(self) -> None:
+        """
+        Write all queued records to the target handler and flush it, on the calling thread.
+
+        :return: None
+        """
+        with self._write_lock:
+            batch: list[tuple[int, logging.LogRecord]] = []
+            for queue in self._queues.values():
+                for _ in range(len(queue)):
+                    # Producers making room may pop records meanwhile, leaving fewer than counted
+                    try:
+                        batch.append(queue.popleft())
+                    except IndexError:
+                        break
+
+            batch.sort(key=lambda entry: entry[0])
+            self._report_dropped()
+
+            for _, record in batch:
+                self.target.handle(record)
+            self.target.flush()
+
+    def _report_dropped(self) -> None:
+        """
+        Write a warning to the target handler if records were dropped since the last report.
+
+        :return: None
+        """
+        counts: dict[LogLevel, int] = {level: count for level, count in self.dropped.items() if count > 0}
+        if not counts:
+            return
+
+        for level in counts:
+            self.dropped[level] -= counts[level]
+
+        summary: str = ", ".join(f"{count} {level.name}" for level, count in counts.items())
+        self.target.handle(logging.makeLogRecord({
+            "levelno": LogLevel.WARNING, "levelname": LogLevel.WARNING.name, "threadName": self._thread.name,
+            "msg": f"AsyncLogHandler -> Log queue overflow, dropped {summary} records",
+        }))
+
+    def close(self) -> None:
+        """
+        Stop the writer thread, write the remaining records and close the target handler.
+
+        :return: None
+        """
+        self._running = False
+        self._wakeup.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+        self.flush()
+        self.target.close()
+        super().close()
@@ -0,0 +1,86 @@
+import itertools
+from typing import Iterator
+
+from src.helper.Clock import Clock
+from src.helper.config import FLIGHT_RECORDER_LOG_CAPACITY
+from src.helper.logging.LogLevel import LogLevel
+
+
+class FlightLog:
+    """
+    Preallocated circular store of the most recent log messages of all levels.
+
+    Messages are kept unformatted, including DEBUG messages the logger does not emit, so they can be written
+    out after an incident without writing DEBUG output during normal operation. Adding a message only stores
+    a tuple in a preallocated slot; once full, the oldest message is overwritten.
+
+    :ivar capacity: The maximum number of kept messages.
+    """
+
+    Entry = tuple[int, float, LogLevel, str, str, tuple]
+    """type: The sequence number, time, level, service, message and message arguments of a log message."""
+
+    def __init__(self, capacity: int = FLIGHT_RECORDER_LOG_CAPACITY) -> None:
+        """
+        Initialize an empty FlightLog.
+
+        :param capacity: The maximum number of kept messages. Defaults to FLIGHT_RECORDER_LOG_CAPACITY.
+        :type capacity: int
+        :raises ValueError: If the capacity is not a positive integer.
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be a positive integer")
+
+        self.capacity: int = capacity
+        self.entries: list[FlightLog.Entry | None] = [None] * capacity
+        self._sequence: Iterator[int] = itertools.count()
+
+    def add(self, level: LogLevel, service: str, message: str, args: tuple = ()) -> None:
+        """
+        Store a log message, overwriting the oldest one if the store is full.
+
+        :param level: The level of the message.
+        :type level: LogLevel
+        :param service: The service that logged the message.
+        :type service: str
+        :param message: The message, or a format string for the arguments.
+        :type message: str
+        :param args: Arguments merged into the message with %-formatting when it is written. Defaults to ().
+        :type args: tuple
+        :return: None
+        """
+        sequence: int = next(self._sequence)
+        self.entries[sequence % self.capacity] = (sequence, Clock().monotonic(), level, service, message, args)
+
+    def snapshot(self, since: float | None = None) -> list["FlightLog.Entry"]:
+        """
+        Retrieve the stored messages in the order they were logged.
+
+        :param since: The earliest time of a returned message, or None for all messages. Defaults to None.
+        :type since: float | None
+        :return: The stored messages, oldest first.
+        :rtype: list[FlightLog.Entry]
+        """
+        entries: list[FlightLog.Entry] = sorted(entry for entry in list(self.entries) if entry is not None)
+        if since is None:
+            return entries
+        return [entry for entry in entries if entry[1] >= since]
+
+    @staticmethod
+    def format(entry: "FlightLog.Entry") -> str:
+        """
+        Format a stored message as a log line.
+
+        :param entry: The stored message.
+        :type entry: FlightLog.Entry
+        :return: The log line with the time, level, service and message.
+        :rtype: str
+        """
+        _, created, level, service, message, args = entry
+        if args:
+            try:
+                message = message % args
+            except (TypeError, ValueError):
+                message = f"{message} {args!r}"
+
+        return f"[{created:.3f}] {LogLevel(level).name}: {service} -> {message}"
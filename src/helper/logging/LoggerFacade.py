@@ -1,5 +1,7 @@
 import logging
+from typing import Callable
 
+from src.helper.logging.FlightLog import FlightLog
 from src.helper.logging.LogLevel import LogLevel
 from src.helper.logging.LoggerInterface import LoggerInterface
 
@@ -14,6 +16,9 @@ class LoggerFacade(LoggerInterface):
     :type service: str
     """
 
+    flight_log: FlightLog | None = None
+    """FlightLog | None: The store every message is kept in regardless of the level, or None."""
+
     def __init__(self, level: LogLevel = LogLevel.INFO, service: str = "DefaultService") -> None:
         """
         Initialize the LoggerFacade with a specified log level and service name.
@@ -28,27 +33,68 @@ class LoggerFacade(LoggerInterface):
         self._service: str = service
 
         if not self._logger.handlers:
-            handler: logging.StreamHandler = logging.StreamHandler()
-            formatter: logging.Formatter = logging.Formatter(
-                '[%(asctime)s] [%(threadName)s] %(levelname)s: %(message)s', datefmt='%H:%M:%S'
-            )
-            handler.setFormatter(formatter)
-            self._logger.addHandler(handler)
+            self._logger.addHandler(self.create_stream_handler())
 
         self._logger.setLevel(level)
 
-    def log(self, message: str, level: LogLevel = LogLevel.INFO) -> None:
+    @staticmethod
+    def create_stream_handler() -> logging.StreamHandler:
+        """
+        Create the stream handler writing formatted records to stderr.
+
+        :return: The configured stream handler.
+        :rtype: logging.StreamHandler
+        """
+        handler: logging.StreamHandler = logging.StreamHandler()
+        formatter: logging.Formatter = logging.Formatter(
+            '[%(asctime)s] [%(threadName)s] %(levelname)s: %(message)s', datefmt='%H:%M:%S'
+        )
+        handler.setFormatter(formatter)
+        return handler
+
+    def log(self, message: str | Callable[[], str], level: LogLevel = LogLevel.INFO, *args: object) -> None:
         """
         Log a message with the specified log level.
 
-        :param message: The message to log.
-        :type message: str
+        Deferred messages, given as a callable or with arguments, are dropped before being built if the level is
+        disabled. Arguments are merged by the logging module only when the record is emitted. If a flight log is
+        installed, every message except disabled callables is also kept there, whatever its level.
+
+        :param message: The message to log, a format string for the arguments, or a callable returning the message.
+        :type message: str | Callable[[], str]
         :param level: The logging level to use. Defaults to LogLevel.INFO.
         :type level: LogLevel
+        :param args: Arguments merged into the message with %-formatting when the message is emitted.
+        :type args: object
         :return: None
         """
+        flight_log: FlightLog | None = LoggerFacade.flight_log
+
+        if callable(message) or args:
+            if not self._logger.isEnabledFor(level):
+                if flight_log is not None and not callable(message):
+                    flight_log.add(level, self._service, message, args)
+                return
+
+            if callable(message):
+                message = message()
+
+        if flight_log is not None:
+            flight_log.add(level, self._service, message, args)
+
         if len(message) > 0:
-            self._logger.log(level, f"{self._service} -> {message}")
+            self._logger.log(level, f"{self._service} -> {message}", *args)
+
+    def is_enabled(self, level: LogLevel) -> bool:
+        """
+        Check whether messages of the given level are emitted.
+
+        :param level: The log level to check.
+        :type level: LogLevel
+        :return: True if messages of the level are emitted, False otherwise.
+        :rtype: bool
+        """
+        return self._logger.isEnabledFor(level)
 
     def set_level(self, level: LogLevel) -> None:
         """
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Callable
 
 from src.helper.logging.LogLevel import LogLevel
 
@@ -11,18 +12,36 @@ class LoggerInterface(ABC):
     """
 
     @abstractmethod
-    def log(self, message: str, level: LogLevel = LogLevel.INFO) -> None:
+    def log(self, message: str | Callable[[], str], level: LogLevel = LogLevel.INFO, *args: object) -> None:
         """
         Log a message with the specified log level.
 
-        :param message: The message to log.
-        :type message: str
+        The message may be deferred, either as a %-style format string with arguments or as a callable
+        returning the message. Deferred messages are only built if the level is enabled.
+
+        :param message: The message to log, a format string for the arguments, or a callable returning the message.
+        :type message: str | Callable[[], str]
         :param level: The log level for the message. Defaults to LogLevel.INFO.
         :type level: LogLevel
+        :param args: Arguments merged into the message with %-formatting when the message is emitted.
+        :type args: object
         :return: None
         """
         pass
 
+    def is_enabled(self, level: LogLevel) -> bool:
+        """
+        Check whether messages of the given level are emitted, to skip building messages that would be dropped.
+
+        Implementations that can filter cheaply should override this. The default emits every level.
+
+        :param level: The log level to check.
+        :type level: LogLevel
+        :return: True if messages of the level are emitted, False otherwise.
+        :rtype: bool
+        """
+        return True
+
     @abstractmethod
     def set_level(self, level: LogLevel) -> None:
         """
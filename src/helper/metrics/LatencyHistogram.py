@@ -0,0 +1,169 @@
+from array import array
+
+
+class LatencyHistogram:
+    """
+    A fixed-size histogram of durations with logarithmic buckets of constant relative precision.
+
+    Durations are counted in whole microseconds. Values below the sub-bucket count get a bucket of their own,
+    larger values share buckets whose width doubles with every power of two, in the manner of an HDR
+    histogram. Recording a value is a constant-time index calculation and one increment of a typed array,
+    so it can be done on every cycle of a control loop without allocating.
+
+    :ivar significant_bits: The number of bits of a value kept exactly, which determines the precision.
+    :ivar highest_bits: The bit length of the largest trackable value in microseconds. Larger values are
+        counted in the last bucket.
+    :ivar count: The number of recorded values.
+    :ivar total: The sum of the recorded values in microseconds.
+    :ivar minimum: The smallest recorded value in microseconds.
+    :ivar maximum: The largest recorded value in microseconds.
+    """
+
+    UNIT: float = 1e-6
+    """float: The duration of one histogram unit in seconds."""
+
+    def __init__(self, significant_bits: int = 5, highest_bits: int = 32) -> None:
+        """
+        Initialize an empty histogram.
+
+        :param significant_bits: The number of bits of a value kept exactly. Defaults to 5, i.e. about 3%
+            relative precision.
+        :type significant_bits: int
+        :param highest_bits: The bit length of the largest trackable value in microseconds. Defaults to 32,
+            i.e. a bit more than an hour.
+        :type highest_bits: int
+        :raises ValueError: If significant_bits is below 1 or highest_bits is below significant_bits.
+        """
+        if significant_bits < 1:
+            raise ValueError("Significant bits must be a positive integer")
+        if highest_bits < significant_bits:
+            raise ValueError("Highest bits must not be lower than the significant bits")
+
+        self.significant_bits: int = significant_bits
+        self.highest_bits: int = highest_bits
+        self._half: int = 1 << (significant_bits - 1)
+        self.counts: array = array("Q", bytes(8 * self._index((1 << highest_bits) - 1) + 8))
+
+        self.count: int = 0
+        self.total: int = 0
+        self.minimum: int = 0
+        self.maximum: int = 0
+
+    def _index(self, value: int) -> int:
+        """
+        Calculate the bucket of a value.
+
+        :param value: The value in microseconds.
+        :type value: int
+        :return: The index of the bucket.
+        :rtype: int
+        """
+        shift: int = value.bit_length() - self.significant_bits
+        if shift <= 0:
+            return value
+        return (shift + 1) * self._half + (value >> shift) - self._half
+
+    def _highest_value(self, index: int) -> int:
+        """
+        Calculate the largest value counted in a bucket.
+
+        :param index: The index of the bucket.
+        :type index: int
+        :return: The largest value of the bucket in microseconds.
+        :rtype: int
+        """
+        if index < 2 * self._half:
+            return index
+        shift: int = index // self._half - 1
+        sub_bucket: int = index % self._half + self._half
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        """
+        Record a duration.
+
+        :param seconds: The duration in seconds. Negative durations are recorded as zero.
+        :type seconds: float
+        :return: None
+        """
+        value: int = max(0, round(seconds / self.UNIT))
+        index: int = min(self._index(value), len(self.counts) - 1)
+        self.counts[index] += 1
+
+        if self.count == 0 or value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        self.count += 1
+        self.total += value
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Get the duration below or at which the given percentage of recorded durations lies.
+
+        The result is the upper bound of the bucket the percentile falls into, capped at the maximum.
+
+        :param percentile: The percentile between 0 and 100.
+        :type percentile: float
+        :raises ValueError: If the histogram is empty or the percentile is out of range.
+        :return: The duration in seconds.
+        :rtype: float
+        """
+        if self.count == 0:
+            raise ValueError("Histogram is empty")
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100, got {percentile}")
+
+        target: int = max(1, -(-self.count * percentile // 100))
+        seen: int = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self._highest_value(index), self.maximum) * self.UNIT
+        return self.maximum * self.UNIT
+
+    def mean(self) -> float:
+        """
+        Get the mean of the recorded durations.
+
+        :raises ValueError: If the histogram is empty.
+        :return: The mean duration in seconds.
+        :rtype: float
+        """
+        if self.count == 0:
+            raise ValueError("Histogram is empty")
+        return self.total / self.count * self.UNIT
+
+    def summary(self) -> dict[str, float]:
+        """
+        Summarize the recorded durations.
+
+        :return: The count and, if not empty, the minimum, mean, 50th, 90th, 99th and 99.9th percentile and
+            maximum in seconds.
+        :rtype: dict[str, float]
+        """
+        if self.count == 0:
+            return {"count": 0}
+
+        return {
+            "count": self.count,
+            "min": self.minimum * self.UNIT,
+            "mean": self.mean(),
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "p999": self.percentile(99.9),
+            "max": self.maximum * self.UNIT,
+        }
+
+    def reset(self) -> None:
+        """
+        Remove all recorded durations.
+
+        :return: None
+        """
+        self.counts = array("Q", bytes(8 * len(self.counts)))
+        self.count = 0
+        self.total = 0
+        self.minimum = 0
+        self.maximum = 0
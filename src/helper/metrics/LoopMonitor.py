@@ -0,0 +1,64 @@
+"""
+LoopMonitor module providing the timing statistics of all periodic loops.
+
+This module defines the LoopMonitor class, which keeps one LoopStatistics instance per loop
+name, so the loop drivers can record into it and monitoring can read it.
+"""
+
+from src.helper.metrics.LoopStatistics import LoopStatistics
+
+
+class LoopMonitor:
+    """
+    Registry of the timing statistics of all periodic loops in the process, by loop name.
+
+    Calling `LoopMonitor(name, period)` returns the statistics of the named loop, creating them on first use.
+    """
+
+    _loops: dict[str, LoopStatistics] = {}
+
+    def __new__(cls, name: str, period: float) -> LoopStatistics:
+        """
+        Create or retrieve the statistics of the named loop.
+
+        :param name: The name of the loop.
+        :type name: str
+        :param period: The configured period of the loop in seconds, used when the statistics are created.
+        :type period: float
+        :return: The statistics of the loop.
+        :rtype: LoopStatistics
+        """
+        statistics: LoopStatistics | None = cls._loops.get(name)
+        if statistics is None:
+            statistics = cls._loops.setdefault(name, LoopStatistics(name, period))
+        return statistics
+
+    @classmethod
+    def loops(cls) -> list[LoopStatistics]:
+        """
+        Retrieve the statistics of all loops.
+
+        :return: The statistics of every loop recorded so far.
+        :rtype: list[LoopStatistics]
+        """
+        return list(cls._loops.values())
+
+    @classmethod
+    def snapshot(cls) -> dict[str, dict[str, object]]:
+        """
+        Summarize the statistics of all loops.
+
+        :return: The summary of every loop by loop name.
+        :rtype: dict[str, dict[str, object]]
+        """
+        return {statistics.name: statistics.snapshot() for statistics in cls.loops()}
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Remove all recorded cycles of every loop.
+
+        :return: None
+        """
+        for statistics in cls.loops():
+            statistics.reset()
@@ -0,0 +1,138 @@
+import threading
+
+from src.helper.Clock import Clock
+from src.helper.Logger import Logger
+from src.helper.Scheduler import Scheduler
+from src.helper.config import LOOP_REPORT_INTERVAL_IN_SECONDS
+from src.helper.logging.LogLevel import LogLevel
+from src.helper.metrics.LatencyHistogram import LatencyHistogram
+from src.helper.metrics.LoopMonitor import LoopMonitor
+from src.helper.metrics.LoopStatistics import LoopStatistics
+from src.helper.scheduling.PeriodicRunner import PeriodicRunner
+from src.helper.scheduling.ScheduledTask import ScheduledTask
+from src.helper.scheduling.SchedulerInterface import SchedulerInterface
+
+
+class LoopReporter:
+    """
+    Singleton that periodically logs a summary of the timing statistics of all periodic loops.
+    """
+
+    _instance: 'LoopReporter' = None
+
+    def __new__(cls) -> 'LoopReporter':
+        """
+        Create or return the singleton instance of LoopReporter.
+
+        :return: The singleton instance of LoopReporter.
+        :rtype: LoopReporter
+        """
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self) -> None:
+        """
+        Initialize the LoopReporter.
+        """
+        self.logger: Logger = Logger("LoopMonitor")
+        self.running: bool = False
+        self.thread: threading.Thread | ScheduledTask | None = None
+
+    def start(self) -> None:
+        """
+        Start reporting on the installed scheduler, or in a separate thread if none is installed,
+        if not already running.
+
+        :return: None
+        """
+        if not self.running:
+            self.logger.log("Starting loop reports", LogLevel.INFO)
+            self.running = True
+
+            scheduler: SchedulerInterface | None = Scheduler()
+            if scheduler is not None:
+                self.thread = scheduler.schedule(self.report_tick, LOOP_REPORT_INTERVAL_IN_SECONDS,
+                                                 LOOP_REPORT_INTERVAL_IN_SECONDS, "LoopReport")
+            else:
+                self.thread = Clock().spawn(self.report_loop, "LoopReportThread")
+        else:
+            self.logger.log("Loop reports are already running", LogLevel.WARNING)
+
+    def stop(self) -> None:
+        """
+        Stop reporting and wait for its thread or task to finish.
+
+        :return: None
+        """
+        if self.running:
+            self.logger.log("Stopping loop reports", LogLevel.INFO)
+            self.running = False
+            if self.thread:
+                Clock().join(self.thread)
+        else:
+            self.logger.log("Loop reports are not running", LogLevel.WARNING)
+
+    def report(self) -> None:
+        """
+        Log one line per loop with its cycle and deadline miss counts and its timing percentiles.
+
+        :return: None
+        """
+        if not self.logger.is_enabled(LogLevel.INFO):
+            return
+
+        for statistics in LoopMonitor.loops():
+            self.logger.log(self.format(statistics), LogLevel.INFO)
+
+    @staticmethod
+    def format(statistics: LoopStatistics) -> str:
+        """
+        Format the statistics of one loop as a report line.
+
+        :param statistics: The statistics of the loop.
+        :type statistics: LoopStatistics
+        :return: The report line.
+        :rtype: str
+        """
+        return (f"{statistics.name} (period {statistics.period * 1000:.1f}ms): {statistics.cycles} cycles, "
+                f"{statistics.deadline_misses} deadline misses, "
+                f"execution {LoopReporter._format_histogram(statistics.execution)}, "
+                f"period {LoopReporter._format_histogram(statistics.interval)}")
+
+    @staticmethod
+    def _format_histogram(histogram: LatencyHistogram) -> str:
+        """
+        Format the percentiles of a histogram in milliseconds.
+
+        :param histogram: The histogram.
+        :type histogram: LatencyHistogram
+        :return: The formatted percentiles, or "n/a" if the histogram is empty.
+        :rtype: str
+        """
+        if histogram.count == 0:
+            return "n/a"
+
+        return (f"p50 {histogram.percentile(50) * 1000:.2f}ms p99 {histogram.percentile(99) * 1000:.2f}ms "
+                f"max {histogram.maximum * histogram.UNIT * 1000:.2f}ms")
+
+    def report_tick(self) -> bool:
+        """
+        Run one iteration of the report loop.
+
+        :return: True if the loop keeps running, False otherwise.
+        :rtype: bool
+        """
+        if self.running:
+            self.report()
+
+        return self.running
+
+    def report_loop(self) -> None:
+        """
+        Continuously report at a fixed interval while running.
+
+        :return: None
+        """
+        PeriodicRunner(self.report_tick, LOOP_REPORT_INTERVAL_IN_SECONDS, "LoopReport",
+                       LOOP_REPORT_INTERVAL_IN_SECONDS).run()
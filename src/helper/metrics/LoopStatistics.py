@@ -0,0 +1,86 @@
+from src.helper.metrics.LatencyHistogram import LatencyHistogram
+
+
+class LoopStatistics:
+    """
+    Timing statistics of one periodic loop.
+
+    Every cycle records how long the callback executed, the time since the previous cycle started and
+    whether the cycle finished after its deadline, i.e. after the start of the next period on the time grid.
+
+    Loops of the same name, e.g. the system loops of several ovens, share one instance. Recording takes no
+    lock, so control loops never wait for each other or for a reader; in the rare case of two loops of the
+    same name recording at the very same time, one count may get lost.
+
+    :ivar name: The name of the loop.
+    :ivar period: The configured period of the loop in seconds.
+    :ivar execution: The histogram of the execution times.
+    :ivar interval: The histogram of the actual periods between consecutive cycle starts.
+    :ivar cycles: The number of recorded cycles.
+    :ivar deadline_misses: The number of cycles that finished after their deadline.
+    """
+
+    def __init__(self, name: str, period: float) -> None:
+        """
+        Initialize empty statistics for a loop.
+
+        :param name: The name of the loop.
+        :type name: str
+        :param period: The configured period of the loop in seconds.
+        :type period: float
+        """
+        self.name: str = name
+        self.period: float = period
+        self.execution: LatencyHistogram = LatencyHistogram()
+        self.interval: LatencyHistogram = LatencyHistogram()
+        self.cycles: int = 0
+        self.deadline_misses: int = 0
+
+    def record(self, start: float, end: float, deadline: float, previous_start: float | None = None) -> None:
+        """
+        Record one cycle of the loop.
+
+        :param start: The time the cycle started in seconds.
+        :type start: float
+        :param end: The time the cycle finished in seconds.
+        :type end: float
+        :param deadline: The time the cycle had to finish by in seconds.
+        :type deadline: float
+        :param previous_start: The time the previous cycle of the same loop started in seconds, or None for
+            the first cycle. Defaults to None.
+        :type previous_start: float | None
+        :return: None
+        """
+        self.execution.record(end - start)
+        if previous_start is not None:
+            self.interval.record(start - previous_start)
+
+        self.cycles += 1
+        if end > deadline:
+            self.deadline_misses += 1
+
+    def snapshot(self) -> dict[str, object]:
+        """
+        Summarize the statistics of the loop.
+
+        :return: The period, cycle and deadline miss counts and the summaries of both histograms.
+        :rtype: dict[str, object]
+        """
+        return {
+            "period": self.period,
+            "cycles": self.cycles,
+            "deadline_misses": self.deadline_misses,
+            "execution": self.execution.summary(),
+            "interval": self.interval.summary(),
+        }
+
+    def reset(self) -> None:
+        """
+        Remove all recorded cycles.
+
+        :return: None
+        """
+        self.execution.reset()
+        self.interval.reset()
+        self.cycles = 0
+        self.deadline_misses = 0
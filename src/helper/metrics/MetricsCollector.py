@@ -0,0 +1,217 @@
+from src.components.magnetron.Magnetron import Magnetron
+from src.components.magnetron.MagnetronModulator import MagnetronModulator
+from src.components.sensor.SensorManager import SensorManager
+from src.emergency.EmergencyHandler import EmergencyHandler
+from src.helper.OvenContext import OvenContext
+from src.helper.metrics.LatencyHistogram import LatencyHistogram
+from src.helper.metrics.LoopMonitor import LoopMonitor
+from src.helper.metrics.LoopStatistics import LoopStatistics
+from src.program.ProgramController import ProgramController
+
+
+class MetricsCollector:
+    """
+    Collects the metrics of the loops and ovens of the process in the Prometheus text exposition format.
+
+    All values are read when the metrics are collected. The control loops neither publish values nor take
+    any lock for it, and reading does not lock either, so collecting never stalls a control loop. Components
+    are only observed: components that have not been created yet are left out instead of being created.
+
+    :ivar contexts: The contexts of the observed ovens. None stands for the oven of the singletons.
+    """
+
+    QUANTILES: tuple[float, ...] = (0.5, 0.9, 0.99, 0.999)
+    """tuple[float, ...]: The quantiles exported for loop timings."""
+
+    OVEN_METRICS: tuple[tuple[str, str, str], ...] = (
+        ("microwave_inner_temperature_celsius", "gauge", "Temperature inside the oven."),
+        ("microwave_inner_humidity_percent", "gauge", "Humidity inside the oven."),
+        ("microwave_inner_weight_grams", "gauge", "Weight on the turntable."),
+        ("microwave_magnetron_temperature_celsius", "gauge", "Temperature of the magnetron."),
+        ("microwave_magnetron_active", "gauge", "Whether the magnetron is switched on."),
+        ("microwave_magnetron_power_share", "gauge", "Share of the last minute the magnetron was switched on."),
+        ("microwave_emergencies_total", "counter", "Emergencies declared for the oven."),
+        ("microwave_emergency_active", "gauge", "Whether an emergency is being handled."),
+        ("microwave_program_running", "gauge", "Whether the program is running."),
+        ("microwave_program_finished", "gauge", "Whether the program has finished."),
+        ("microwave_program_paused", "gauge", "Whether the program is paused."),
+        ("microwave_program_eta_seconds", "gauge", "Estimated remaining time of the program."),
+    )
+    """tuple[tuple[str, str, str], ...]: The name, type and help text of every oven metric."""
+
+    def __init__(self, contexts: list[OvenContext | None] | None = None) -> None:
+        """
+        Initialize the MetricsCollector.
+
+        :param contexts: The contexts of the observed ovens, None for the oven of the singletons.
+            Defaults to None.
+        :type contexts: list[OvenContext | None] | None
+        """
+        self.contexts: list[OvenContext | None] = contexts if contexts is not None else [None]
+
+    def collect(self) -> str:
+        """
+        Collect all metrics.
+
+        :return: The metrics in the Prometheus text exposition format.
+        :rtype: str
+        """
+        lines: list[str] = []
+        self._collect_loops(lines)
+        self._collect_ovens(lines)
+        return "\n".join(lines) + "\n"
+
+    def _collect_loops(self, lines: list[str]) -> None:
+        """
+        Add the timing metrics of all periodic loops.
+
+        :param lines: The lines to add the metrics to.
+        :type lines: list[str]
+        :return: None
+        """
+        loops: list[LoopStatistics] = LoopMonitor.loops()
+
+        self._family(lines, "microwave_loop_period_target_seconds", "gauge", "Configured period of the loop.")
+        for statistics in loops:
+            self._sample(lines, "microwave_loop_period_target_seconds", {"loop": statistics.name}, statistics.period)
+
+        self._family(lines, "microwave_loop_cycles_total", "counter", "Executed cycles of the loop.")
+        for statistics in loops:
+            self._sample(lines, "microwave_loop_cycles_total", {"loop": statistics.name}, statistics.cycles)
+
+        self._family(lines, "microwave_loop_deadline_misses_total", "counter",
+                     "Cycles of the loop that finished after their deadline.")
+        for statistics in loops:
+            self._sample(lines, "microwave_loop_deadline_misses_total", {"loop": statistics.name},
+                         statistics.deadline_misses)
+
+        self._family(lines, "microwave_loop_execution_seconds", "summary", "Execution time of a loop cycle.")
+        for statistics in loops:
+            self._summary(lines, "microwave_loop_execution_seconds", statistics.name, statistics.execution)
+
+        self._family(lines, "microwave_loop_interval_seconds", "summary", "Time between two cycle starts.")
+        for statistics in loops:
+            self._summary(lines, "microwave_loop_interval_seconds", statistics.name, statistics.interval)
+
+    def _collect_ovens(self, lines: list[str]) -> None:
+        """
+        Add the sensor, magnetron, emergency and program metrics of every observed oven.
+
+        :param lines: The lines to add the metrics to.
+        :type lines: list[str]
+        :return: None
+        """
+        samples: dict[str, list[tuple[dict[str, str], float]]] = {name: [] for name, _, _ in self.OVEN_METRICS}
+
+        for context in self.contexts:
+            oven: dict[str, str] = {"oven": context.name if context is not None else "Oven"}
+
+            sensors: SensorManager | None = OvenContext.peek(context, SensorManager)
+            if sensors is not None:
+                samples["microwave_inner_temperature_celsius"] += [
+                    ({**oven, "sensor": "1"}, sensors.inner_temp1()), ({**oven, "sensor": "2"}, sensors.inner_temp2())
+                ]
+                samples["microwave_inner_humidity_percent"].append((oven, sensors.inner_humidity()))
+                samples["microwave_inner_weight_grams"].append((oven, sensors.inner_weight()))
+                samples["microwave_magnetron_temperature_celsius"] += [
+                    ({**oven, "sensor": "1"}, sensors.magnetron_temp1()),
+                    ({**oven, "sensor": "2"}, sensors.magnetron_temp2()),
+                ]
+
+            magnetron: Magnetron | None = OvenContext.peek(context, Magnetron)
+            if magnetron is not None:
+                samples["microwave_magnetron_active"].append((oven, magnetron.active))
+
+            modulator: MagnetronModulator | None = OvenContext.peek(context, MagnetronModulator)
+            if modulator is not None:
+                samples["microwave_magnetron_power_share"].append((oven, modulator.power_history.power_share()))
+
+            emergency_handler: EmergencyHandler | None = OvenContext.peek(context, EmergencyHandler)
+            if emergency_handler is not None:
+                samples["microwave_emergencies_total"].append((oven, emergency_handler.emergencies))
+                samples["microwave_emergency_active"].append((oven, emergency_handler.is_busy()))
+
+            program_controller: ProgramController | None = OvenContext.peek(context, ProgramController)
+            if program_controller is not None:
+                name, running, finished, paused, eta = program_controller.get_state_tuple()
+                program: dict[str, str] = {**oven, "program": name}
+                samples["microwave_program_running"].append((program, running))
+                samples["microwave_program_finished"].append((program, finished))
+                samples["microwave_program_paused"].append((program, paused))
+                if eta is not None:
+                    samples["microwave_program_eta_seconds"].append((program, eta))
+
+        for name, kind, description in self.OVEN_METRICS:
+            self._family(lines, name, kind, description)
+            for labels, value in samples[name]:
+                self._sample(lines, name, labels, value)
+
+    def _summary(self, lines: list[str], name: str, loop: str, histogram: LatencyHistogram) -> None:
+        """
+        Add the quantiles, sum and count of a loop timing histogram.
+
+        :param lines: The lines to add the samples to.
+        :type lines: list[str]
+        :param name: The name of the metric.
+        :type name: str
+        :param loop: The name of the loop.
+        :type loop: str
+        :param histogram: The histogram of the loop timing.
+        :type histogram: LatencyHistogram
+        :return: None
+        """
+        count: int = histogram.count
+        if count > 0:
+            for quantile in self.QUANTILES:
+                self._sample(lines, name, {"loop": loop, "quantile": str(quantile)},
+                             histogram.percentile(quantile * 100))
+        self._sample(lines, name + "_sum", {"loop": loop}, histogram.total * histogram.UNIT)
+        self._sample(lines, name + "_count", {"loop": loop}, count)
+
+    @staticmethod
+    def _family(lines: list[str], name: str, kind: str, description: str) -> None:
+        """
+        Add the help and type lines of a metric.
+
+        :param lines: The lines to add to.
+        :type lines: list[str]
+        :param name: The name of the metric.
+        :type name: str
+        :param kind: The type of the metric, e.g. "gauge".
+        :type kind: str
+        :param description: The help text of the metric.
+        :type description: str
+        :return: None
+        """
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    @staticmethod
+    def _sample(lines: list[str], name: str, labels: dict[str, str], value: float) -> None:
+        """
+        Add one sample of a metric.
+
+        :param lines: The lines to add to.
+        :type lines: list[str]
+        :param name: The name of the metric.
+        :type name: str
+        :param labels: The labels of the sample.
+        :type labels: dict[str, str]
+        :param value: The value of the sample. Booleans are exported as 0 or 1.
+        :type value: float
+        :return: None
+        """
+        formatted: str = ",".join(f'{key}="{MetricsCollector._escape(label)}"' for key, label in labels.items())
+        lines.append(f"{name}{{{formatted}}} {float(value)!r}")
+
+    @staticmethod
+    def _escape(label: str) -> str:
+        """
+        Escape a label value for the exposition format.
+
+        :param label: The label value.
+        :type label: str
+        :return: The label value with backslashes, double quotes and line feeds escaped.
+        :rtype: str
+        """
+        return label.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,116 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.helper.Logger import Logger
+from src.helper.OvenContext import OvenContext
+from src.helper.config import METRICS_HOST, METRICS_PORT
+from src.helper.logging.LogLevel import LogLevel
+from src.helper.metrics.MetricsCollector import MetricsCollector
+
+
+class MetricsExporter:
+    """
+    HTTP server exposing the metrics of the process in the Prometheus text format on `/metrics`.
+
+    The server runs in a daemon thread of its own and every scrape is answered in a separate thread, so
+    the control loops are never involved in serving a scrape.
+
+    :ivar collector: The collector building the metrics.
+    :ivar host: The address the server listens on.
+    :ivar port: The port the server listens on. After starting, the actually bound port.
+    :ivar server: The running HTTP server, or None if not started.
+    :ivar thread: The thread serving requests, or None if not started.
+    """
+
+    CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+    """str: The content type of the Prometheus text exposition format."""
+
+    class RequestHandler(BaseHTTPRequestHandler):
+        """
+        Handler answering scrapes of `/metrics` with the collected metrics.
+        """
+
+        server: "ThreadingHTTPServer"
+
+        def do_GET(self) -> None:
+            """
+            Answer a GET request with the metrics, or with 404 for any other path.
+
+            :return: None
+            """
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+
+            body: bytes = self.server.collector.collect().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", MetricsExporter.CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            """
+            Log requests through the application logger instead of stderr.
+
+            :param format: The format string of the message.
+            :type format: str
+            :param args: The arguments of the format string.
+            :type args: object
+            :return: None
+            """
+            Logger("Metrics").log(format, LogLevel.DEBUG, *args)
+
+    def __init__(self, contexts: list[OvenContext | None] | None = None, host: str = METRICS_HOST,
+                 port: int = METRICS_PORT) -> None:
+        """
+        Initialize the MetricsExporter without starting the server.
+
+        :param contexts: The contexts of the observed ovens, None for the oven of the singletons.
+            Defaults to None.
+        :type contexts: list[OvenContext | None] | None
+        :param host: The address to listen on. Defaults to METRICS_HOST.
+        :type host: str
+        :param port: The port to listen on, 0 for any free port. Defaults to METRICS_PORT.
+        :type port: int
+        """
+        self.logger: Logger = Logger("Metrics")
+        self.collector: MetricsCollector = MetricsCollector(contexts)
+        self.host: str = host
+        self.port: int = port
+        self.server: ThreadingHTTPServer | None = None
+        self.thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """
+        Start serving the metrics in a separate thread, if not already running.
+
+        :return: None
+        """
+        if self.server is None:
+            self.server = ThreadingHTTPServer((self.host, self.port), self.RequestHandler)
+            self.server.daemon_threads = True
+            self.server.collector = self.collector
+            self.port = self.server.server_address[1]
+
+            self.thread = threading.Thread(target=self.server.serve_forever, name="MetricsThread", daemon=True)
+            self.thread.start()
+            self.logger.log(f"Serving metrics on http://{self.host}:{self.port}/metrics", LogLevel.INFO)
+        else:
+            self.logger.log("Metrics server is already running", LogLevel.WARNING)
+
+    def stop(self) -> None:
+        """
+        Stop serving the metrics and close the server.
+
+        :return: None
+        """
+        if self.server is not None:
+            self.logger.log("Stopping metrics server", LogLevel.INFO)
+            self.server.shutdown()
+            self.server.server_close()
+            self.thread.join()
+            self.server = None
+            self.thread = None
+        else:
+            self.logger.log("Metrics server is not running", LogLevel.WARNING)
@@ -0,0 +1,128 @@
+import zlib
+
+import numpy as np
+
+from src.helper.OvenContext import OvenContext
+from src.helper.config import NOISE_SEED, NOISE_BLOCK_SIZE
+from src.helper.noise.NoiseStream import NoiseStream
+
+
+class NoiseSource:
+    """
+    Singleton source of the simulation noise of one oven.
+
+    Every consumer, e.g. a simulation sensor or the magnetron modulator, draws from a NoiseStream of its own.
+    The streams are derived from the seed, the name of the oven and the name of the consumer, so a seeded
+    simulation produces the same values on every run, regardless of the order the consumers are created or
+    updated in, while different ovens and consumers never share a sequence.
+
+    :ivar key: The part of the seed derived from the name of the oven.
+    :ivar block_size: The number of values each stream generates at once.
+    :ivar seed_sequence: The seed sequence all streams are derived from.
+    :ivar streams: The streams handed out, by consumer name.
+    """
+
+    _instance: "NoiseSource" = None
+
+    def __new__(cls, context: OvenContext | None = None) -> "NoiseSource":
+        """
+        Create or return the singleton instance of NoiseSource.
+
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
+        :return: The singleton instance of NoiseSource.
+        :rtype: NoiseSource
+        """
+        if context is not None:
+            return super().__new__(cls)
+
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, context: OvenContext | None = None) -> None:
+        """
+        Initialize the NoiseSource with the configured seed.
+
+        The singleton is initialized once, so retrieving it again keeps its seed and the streams handed out.
+
+        :param context: The oven context the noise is generated for, or None for the singleton.
+        :type context: OvenContext | None
+        :return: None
+        """
+        if context is None and hasattr(self, "seed_sequence"):
+            return
+
+        self.key: int = zlib.crc32(context.name.encode()) if context is not None else 0
+        self.block_size: int = NOISE_BLOCK_SIZE
+        self.seed_sequence: np.random.SeedSequence = np.random.SeedSequence(NOISE_SEED, spawn_key=(self.key,))
+        self.streams: dict[str, NoiseStream] = {}
+
+    def seed(self, seed: int | None) -> None:
+        """
+        Restart all streams from the given seed.
+
+        Streams already handed out keep their identity and continue with the values of the new seed.
+
+        :param seed: The seed to derive the streams from, or None for a random seed.
+        :type seed: int | None
+        :return: None
+        """
+        self.seed_sequence = np.random.SeedSequence(seed, spawn_key=(self.key,))
+        for name, stream in self.streams.items():
+            stream.restart(self._generator(name))
+
+    def stream(self, name: str) -> NoiseStream:
+        """
+        Retrieve the stream of a consumer, creating it on first access.
+
+        :param name: The name of the consumer.
+        :type name: str
+        :return: The stream of the consumer.
+        :rtype: NoiseStream
+        """
+        stream: NoiseStream | None = self.streams.get(name)
+
+        if stream is None:
+            stream = NoiseStream(name, self._generator(name), self.block_size)
+            self.streams[name] = stream
+
+        return stream
+
+    def snapshot(self) -> dict[str, object]:
+        """
+        Capture the seed and the position of every stream, e.g. for a checkpoint.
+
+        :return: The entropy of the seed and the state of every stream, by consumer name.
+        :rtype: dict[str, object]
+        """
+        return {"entropy": self.seed_sequence.entropy,
+                "streams": {name: stream.snapshot() for name, stream in self.streams.items()}}
+
+    def restore(self, snapshot: dict[str, object]) -> None:
+        """
+        Continue from a seed and stream positions captured by `snapshot`.
+
+        Streams not handed out yet are created, so their consumers continue with the captured values once they
+        draw from them.
+
+        :param snapshot: The entropy of the seed and the state of every stream, by consumer name.
+        :type snapshot: dict[str, object]
+        :return: None
+        """
+        self.seed(snapshot["entropy"])
+        for name, state in snapshot["streams"].items():
+            self.stream(name).restore(state)
+
+    def _generator(self, name: str) -> np.random.Generator:
+        """
+        Create the generator of a consumer from the current seed sequence.
+
+        :param name: The name of the consumer.
+        :type name: str
+        :return: A generator whose sequence depends only on the seed, the oven and the consumer name.
+        :rtype: np.random.Generator
+        """
+        entropy: int | list[int] = self.seed_sequence.entropy
+        spawn_key: tuple[int, ...] = tuple(self.seed_sequence.spawn_key) + (zlib.crc32(name.encode()),)
+        return np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=spawn_key))
@@ -0,0 +1,94 @@
+from typing import Callable
+
+import numpy as np
+
+
+class NoiseStream:
+    """
+    Buffered stream of uniformly distributed random numbers drawn from one seeded generator.
+
+    The generator fills a whole block of numbers at once and the stream hands them out one by one, so drawing
+    a value costs an iterator step instead of a call into the generator. A stream is meant to be used by a single
+    consumer, i.e. a single thread, which keeps the drawn sequence independent of the thread interleaving.
+
+    :ivar name: The name of the consumer the stream belongs to.
+    :ivar block_size: The number of values generated at once.
+    :ivar generator: The generator the values are drawn from.
+    """
+
+    def __init__(self, name: str, generator: np.random.Generator, block_size: int) -> None:
+        """
+        Initialize a stream without any buffered values.
+
+        :param name: The name of the consumer the stream belongs to.
+        :type name: str
+        :param generator: The generator the values are drawn from.
+        :type generator: np.random.Generator
+        :param block_size: The number of values generated at once.
+        :type block_size: int
+        :return: None
+        :raises ValueError: If the block size is not positive.
+        """
+        if block_size <= 0:
+            raise ValueError(f"Block size must be positive, got {block_size}")
+
+        self.name: str = name
+        self.block_size: int = block_size
+        self.generator: np.random.Generator = generator
+        self._next: Callable[[], float] = iter(()).__next__
+
+    def restart(self, generator: np.random.Generator) -> None:
+        """
+        Discard the buffered values and continue with the values of another generator.
+
+        :param generator: The generator the values are drawn from from now on.
+        :type generator: np.random.Generator
+        :return: None
+        """
+        self.generator = generator
+        self._next = iter(()).__next__
+
+    def snapshot(self) -> dict[str, object]:
+        """
+        Capture the position of the stream, e.g. for a checkpoint.
+
+        The buffered values are discarded and the generator is moved back by their number, so the stream continues
+        with the same values as before, and the position is fully described by the state of the generator.
+
+        :return: The state of the generator.
+        :rtype: dict[str, object]
+        """
+        remaining: int = sum(1 for _ in self._next.__self__)
+        self.generator.bit_generator.advance(-remaining)
+        self._next = iter(()).__next__
+        return self.generator.bit_generator.state
+
+    def restore(self, state: dict[str, object]) -> None:
+        """
+        Continue the stream from a position captured by `snapshot`.
+
+        :param state: The state of the generator.
+        :type state: dict[str, object]
+        :return: None
+        """
+        self.generator.bit_generator.state = state
+        self._next = iter(()).__next__
+
+    def uniform(self, low: float, high: float) -> float:
+        """
+        Draw the next value, uniformly distributed in the half-open interval [low, high).
+
+        :param low: The lower bound of the interval.
+        :type low: float
+        :param high: The upper bound of the interval.
+        :type high: float
+        :return: The drawn value.
+        :rtype: float
+        """
+        try:
+            value: float = self._next()
+        except StopIteration:
+            self._next = iter(self.generator.random(self.block_size).tolist()).__next__
+            value = self._next()
+
+        return low + (high - low) * value
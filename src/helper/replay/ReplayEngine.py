@@ -0,0 +1,211 @@
+import numpy as np
+
+from src.SystemControl import SystemControl
+from src.components.cooling.CoolingFan import CoolingFan
+from src.components.magnetron.Magnetron import Magnetron
+from src.components.reflector.Reflector import Reflector
+from src.components.sensor.ReplaySensor import ReplaySensor
+from src.components.sensor.SensorManager import SensorManager
+from src.components.sensor.SimulationSensor import SimulationSensor
+from src.components.sensor.SimulationSensorHumidity import SimulationSensorHumidity
+from src.components.sensor.SimulationSensorMagnetronTemp1 import SimulationSensorMagnetronTemp1
+from src.components.sensor.SimulationSensorMagnetronTemp2 import SimulationSensorMagnetronTemp2
+from src.components.sensor.SimulationSensorTemp1 import SimulationSensorTemp1
+from src.components.sensor.SimulationSensorTemp2 import SimulationSensorTemp2
+from src.components.sensor.SimulationSensorWeight import SimulationSensorWeight
+from src.components.turntable.Turntable import Turntable
+from src.helper.Action import Action
+from src.helper.Clock import Clock
+from src.helper.Logger import Logger
+from src.helper.OvenContext import OvenContext
+from src.helper.Scheduler import Scheduler
+from src.helper.clock.VirtualClock import VirtualClock
+from src.helper.config import MAIN_LOOP_TIMEOUT_IN_SECONDS
+from src.helper.logging.LogLevel import LogLevel
+from src.helper.noise.NoiseSource import NoiseSource
+from src.helper.replay.ReplayResult import ReplayResult
+from src.helper.scheduling.TickScheduler import TickScheduler
+from src.helper.telemetry.TelemetryFormat import TelemetryFormat
+from src.helper.telemetry.TelemetryReader import TelemetryReader
+from src.user.InputDetector import InputDetector
+from src.user.ReplayInputDetector import ReplayInputDetector
+
+
+class ReplayEngine:
+    """
+    Replays a recorded telemetry session through a fresh oven and compares its actuator outputs.
+
+    The recorded sensor values and user actions are fed into an OvenContext of its own, whose system loop,
+    program and controllers are driven tick by tick by a TickScheduler in simulated time, so a session
+    replays as fast as it can be computed. The noise source of the oven is seeded, so every replay of a
+    session produces the same outputs.
+
+    The engine takes the place of a telemetry recorder: after every sensor update of the replayed oven it
+    stores the actuator values and moves on to the next recorded row.
+
+    :ivar path: The path of the telemetry file.
+    :ivar trace: The recorded values by column name.
+    :ivar rows: The number of recorded rows.
+    :ivar seed: The seed of the simulation noise.
+    :ivar tolerance: The largest absolute difference of an actuator value still considered a match.
+    :ivar cursor: The index of the row the replay sensors currently return.
+    :ivar tick: The number of rows replayed so far.
+    """
+
+    SENSORS: dict[str, type[SimulationSensor]] = {
+        "inner_temp1": SimulationSensorTemp1,
+        "inner_temp2": SimulationSensorTemp2,
+        "inner_humidity": SimulationSensorHumidity,
+        "inner_weight": SimulationSensorWeight,
+        "magnetron_temp1": SimulationSensorMagnetronTemp1,
+        "magnetron_temp2": SimulationSensorMagnetronTemp2,
+    }
+    """dict[str, type[SimulationSensor]]: The sensor type replaced by every recorded sensor column."""
+
+    ACTUATORS: dict[str, tuple[type, str]] = {
+        "magnetron_active": (Magnetron, "active"),
+        "cooling_fan_power_share": (CoolingFan, "power_share"),
+        "turntable_rotations_per_minute": (Turntable, "rotations_per_minute"),
+        "reflector_angle": (Reflector, "angle"),
+    }
+    """dict[str, tuple[type, str]]: The component type and attribute compared with every recorded actuator column."""
+
+    def __init__(self, path: str, seed: int = 0, tolerance: float = 1e-9) -> None:
+        """
+        Load a recorded session.
+
+        :param path: The path of the telemetry file.
+        :type path: str
+        :param seed: The seed of the simulation noise. Defaults to 0.
+        :type seed: int
+        :param tolerance: The largest absolute difference still considered a match. Defaults to 1e-9.
+        :type tolerance: float
+        :raises ValueError: If the file is not a telemetry file of a supported version.
+        :return: None
+        """
+        self.logger: Logger = Logger("Replay")
+        self.path: str = path
+
+        reader: TelemetryReader = TelemetryReader(path)
+        self.trace: dict[str, np.ndarray] = reader.read_all()
+        self.rows: int = reader.rows
+
+        self.seed: int = seed
+        self.tolerance: float = tolerance
+        self.cursor: int = 0
+        self.tick: int = 0
+
+        self._actions: list[Action | None] = [TelemetryFormat.decode_action(code) for code in self.trace["action"]]
+        self._outputs: dict[str, np.ndarray] = {}
+        self._actuators: dict[str, object] = {}
+
+    def create_context(self) -> OvenContext:
+        """
+        Create an oven context whose sensors and input detector return the recorded session.
+
+        :return: The context of the replayed oven.
+        :rtype: OvenContext
+        """
+        context: OvenContext = OvenContext("Replay")
+        for column, sensor_type in self.SENSORS.items():
+            context.register(sensor_type, ReplaySensor(self, column))
+        context.register(InputDetector, ReplayInputDetector(self))
+        context.get(NoiseSource).seed(self.seed)
+        return context
+
+    def run(self) -> ReplayResult:
+        """
+        Replay the session in simulated time and compare the actuator outputs with the recording.
+
+        The process-wide clock and scheduler are replaced during the replay and restored
+        afterwards, so replays in one process must run one after another.
+
+        :return: The outcome of the replay.
+        :rtype: ReplayResult
+        """
+        clock, scheduler = Clock(), Scheduler()
+        Clock.use(VirtualClock())
+        Scheduler.use(TickScheduler())
+
+        try:
+            self.cursor = 0
+            self.tick = 0
+
+            context: OvenContext = self.create_context()
+            context.get(SensorManager).recorder = self
+            self._actuators = {column: context.get(component_type)
+                               for column, (component_type, _) in self.ACTUATORS.items()}
+            self._outputs = {column: np.zeros(self.rows, dtype=self.trace[column].dtype) for column in self.ACTUATORS}
+
+            if self.rows > 0:
+                duration: float = float(self.trace["time"][-1] - self.trace["time"][0])
+                limit: float = 2 * (duration + MAIN_LOOP_TIMEOUT_IN_SECONDS)
+                Scheduler().schedule(self._timeout, limit, limit, "ReplayTimeout")
+
+                context.get(SystemControl).start()
+                Scheduler().run()
+        finally:
+            Clock.use(clock)
+            Scheduler.use(scheduler)
+
+        return self._compare()
+
+    def action(self) -> Action | None:
+        """
+        Get the user action recorded for the current row.
+
+        :return: The recorded Action, or None if there was none or the recording has ended.
+        :rtype: Action | None
+        """
+        return self._actions[self.tick] if self.tick < self.rows else None
+
+    def record(self) -> None:
+        """
+        Store the actuator values of the current row and move the replay sensors on to it.
+
+        Called by the sensor manager of the replayed oven after every sensor update. Stops the replay once
+        all recorded rows are reached.
+
+        :return: None
+        """
+        if self.tick >= self.rows:
+            return
+
+        for column, (_, attribute) in self.ACTUATORS.items():
+            self._outputs[column][self.tick] = getattr(self._actuators[column], attribute)
+
+        self.cursor = self.tick
+        self.tick += 1
+
+        if self.tick == self.rows:
+            Scheduler().stop()
+
+    def _timeout(self) -> bool:
+        """
+        Stop a replay that ran far longer than the recorded session without reaching its end.
+
+        :return: False, as the timeout fires once.
+        :rtype: bool
+        """
+        self.logger.log(lambda: f"Replay of {self.path} timed out after {self.tick} of {self.rows} rows",
+                        LogLevel.WARNING)
+        Scheduler().stop()
+        return False
+
+    def _compare(self) -> ReplayResult:
+        """
+        Compare the replayed actuator values with the recording.
+
+        :return: The outcome of the replay.
+        :rtype: ReplayResult
+        """
+        replayed: int = self.tick
+        outputs: dict[str, np.ndarray] = {column: values[:replayed] for column, values in self._outputs.items()}
+        mismatches: dict[str, np.ndarray] = {}
+
+        for column, values in outputs.items():
+            recorded: np.ndarray = self.trace[column][:replayed].astype(np.float64)
+            difference: np.ndarray = np.abs(values.astype(np.float64) - recorded)
+            mismatches[column] = np.flatnonzero(difference > self.tolerance)
+
+        return ReplayResult(self.rows, replayed, outputs, mismatches)
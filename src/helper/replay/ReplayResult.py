@@ -0,0 +1,51 @@
+import numpy as np
+
+
+class ReplayResult:
+    """
+    Outcome of replaying a recorded session.
+
+    :ivar rows: The number of recorded rows.
+    :ivar replayed: The number of rows the replay reached.
+    :ivar outputs: The actuator values of the replay per row, by column name.
+    :ivar mismatches: The rows whose replayed actuator value differs from the recording, by column name.
+    """
+
+    def __init__(self, rows: int, replayed: int, outputs: dict[str, np.ndarray],
+                 mismatches: dict[str, np.ndarray]) -> None:
+        """
+        Initialize the ReplayResult.
+
+        :param rows: The number of recorded rows.
+        :type rows: int
+        :param replayed: The number of rows the replay reached.
+        :type replayed: int
+        :param outputs: The actuator values of the replay per row, by column name.
+        :type outputs: dict[str, np.ndarray]
+        :param mismatches: The indices of the differing rows, by column name.
+        :type mismatches: dict[str, np.ndarray]
+        :return: None
+        """
+        self.rows: int = rows
+        self.replayed: int = replayed
+        self.outputs: dict[str, np.ndarray] = outputs
+        self.mismatches: dict[str, np.ndarray] = mismatches
+
+    def matches(self) -> bool:
+        """
+        Check whether the replay reached every recorded row without any differing actuator value.
+
+        :return: True if the replay reproduced the recording, False otherwise.
+        :rtype: bool
+        """
+        return self.replayed == self.rows and not any(len(rows) for rows in self.mismatches.values())
+
+    def first_mismatch(self) -> int | None:
+        """
+        Get the first row in which any actuator value differs from the recording.
+
+        :return: The index of the row, or None if all replayed rows match.
+        :rtype: int | None
+        """
+        rows: list[int] = [int(indices[0]) for indices in self.mismatches.values() if len(indices)]
+        return min(rows) if rows else None
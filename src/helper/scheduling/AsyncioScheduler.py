@@ -0,0 +1,164 @@
+import asyncio
+import threading
+from typing import Callable
+
+from src.helper.Logger import Logger
+from src.helper.logging.LogLevel import LogLevel
+from src.helper.scheduling.PeriodicRunner import PeriodicRunner
+from src.helper.scheduling.ScheduledTask import ScheduledTask
+from src.helper.scheduling.SchedulerInterface import SchedulerInterface
+
+
+class AsyncioScheduler(SchedulerInterface):
+    """
+    Scheduler that drives every periodic task as a coroutine on an asyncio event loop.
+
+    Each task is awaited on the loop instead of occupying an OS thread, so many controllers and
+    their I/O can share one event loop. Suspended tasks await an `asyncio.Event` until they are
+    resumed. Periods and phases are measured with the event loop's clock.
+
+    :ivar loop: The event loop the tasks run on. Bound to the running loop on first use if not given.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        """
+        Initialize the AsyncioScheduler.
+
+        :param loop: The event loop to run the tasks on. Defaults to the loop running when the first task is scheduled.
+        :type loop: asyncio.AbstractEventLoop | None
+        :return: None
+        """
+        self.logger: Logger = Logger("Scheduler")
+        self.loop: asyncio.AbstractEventLoop | None = loop
+
+        self._lock: threading.RLock = threading.RLock()
+        self._resumed: dict[ScheduledTask, asyncio.Event] = {}
+        self._drivers: set[asyncio.Task] = set()
+
+    def schedule(self, callback: Callable[[], bool], period: float, phase: float = 0.0,
+                 name: str = "Task") -> ScheduledTask:
+        """
+        Schedule a periodic task as a coroutine on the event loop.
+
+        May be called from the event loop or from any other thread.
+
+        :param callback: The function executed once per period. Returning False ends the task.
+        :type callback: Callable[[], bool]
+        :param period: The period of the task in seconds.
+        :type period: float
+        :param phase: The offset of the first execution in seconds. Defaults to 0.0.
+        :type phase: float
+        :param name: The name of the task. Defaults to "Task".
+        :type name: str
+        :raises ValueError: If the period is not positive or the phase is negative.
+        :raises RuntimeError: If no event loop is given and none is running.
+        :return: The handle of the scheduled task.
+        :rtype: ScheduledTask
+        """
+        if period <= 0:
+            raise ValueError("Period must be a positive number")
+        if phase < 0:
+            raise ValueError("Phase must not be negative")
+
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+
+        task: ScheduledTask = ScheduledTask(self, callback, period, name, self._lock)
+        self._resumed[task] = asyncio.Event()
+
+        self.logger.log(f"Scheduling {name} every {period}s", LogLevel.INFO)
+        self._call_on_loop(self._spawn, task, phase)
+
+        return task
+
+    def reschedule(self, task: ScheduledTask) -> None:
+        """
+        Wake the coroutine of a previously suspended task.
+
+        :param task: The task to resume.
+        :type task: ScheduledTask
+        :return: None
+        """
+        event: asyncio.Event | None = self._resumed.get(task)
+
+        if event is not None:
+            self._call_on_loop(event.set)
+
+    async def join(self) -> None:
+        """
+        Wait until all scheduled tasks, including tasks scheduled meanwhile, have ended.
+
+        :return: None
+        """
+        while self._drivers:
+            await asyncio.gather(*self._drivers)
+
+    def _spawn(self, task: ScheduledTask, phase: float) -> None:
+        """
+        Create the coroutine driving a task. Must be called on the event loop.
+
+        :param task: The task to drive.
+        :type task: ScheduledTask
+        :param phase: The offset of the first execution in seconds.
+        :type phase: float
+        :return: None
+        """
+        driver: asyncio.Task = self.loop.create_task(self._drive(task, phase), name=task.name)
+        self._drivers.add(driver)
+        driver.add_done_callback(self._drivers.discard)
+
+    async def _drive(self, task: ScheduledTask, phase: float) -> None:
+        """
+        Execute a task once per period until it ends, waiting while it is suspended.
+
+        Missed executions are skipped so the task stays on its original time grid.
+
+        :param task: The task to drive.
+        :type task: ScheduledTask
+        :param phase: The offset of the first execution in seconds.
+        :type phase: float
+        :return: None
+        """
+        resumed: asyncio.Event = self._resumed[task]
+        next_run: float = self.loop.time() + phase
+
+        try:
+            while not task.done:
+                await asyncio.sleep(max(0.0, next_run - self.loop.time()))
+
+                if task.suspended:
+                    while task.suspended and not task.done:
+                        await resumed.wait()
+                        resumed.clear()
+                    next_run = self.loop.time()
+                    continue
+
+                start: float = self.loop.time()
+                alive: bool = task.run()
+                task.measure(start, self.loop.time(), next_run + task.period)
+
+                if not alive:
+                    break
+
+                next_run, _ = PeriodicRunner.next_deadline(next_run, self.loop.time(), task.period)
+        finally:
+            self._resumed.pop(task, None)
+
+    def _call_on_loop(self, function: Callable[..., None], *args: object) -> None:
+        """
+        Call a function on the event loop, directly if already on it, thread-safe otherwise.
+
+        :param function: The function to call.
+        :type function: Callable[..., None]
+        :param args: Positional arguments for the function.
+        :return: None
+        """
+        try:
+            running: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is self.loop:
+            function(*args)
+        else:
+            self.loop.call_soon_threadsafe(function, *args)
@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class OverrunPolicy(Enum):
+    """
+    Enumeration of how a periodic task handles deadlines it missed because an execution overran.
+
+    SKIP drops the missed executions and continues on the original time grid. CATCH_UP executes
+    every missed deadline back to back until the task is on time again.
+    """
+
+    SKIP = "SKIP"
+    CATCH_UP = "CATCH_UP"
@@ -0,0 +1,143 @@
+import math
+from typing import Callable
+
+from src.helper.Clock import Clock
+from src.helper.Logger import Logger
+from src.helper.logging.LogLevel import LogLevel
+from src.helper.metrics.LoopMonitor import LoopMonitor
+from src.helper.metrics.LoopStatistics import LoopStatistics
+from src.helper.scheduling.OverrunPolicy import OverrunPolicy
+
+
+class PeriodicRunner:
+    """
+    Runs a callback at a fixed rate in the calling thread.
+
+    Executions are scheduled against absolute deadlines on a fixed time grid instead of sleeping for the
+    period after each execution, so the time spent in the callback does not accumulate as drift. If an
+    execution finishes after the next deadline, the overrun is reported and the missed deadlines are handled
+    according to the overrun policy. The timing of every execution is recorded in the statistics of the loop.
+
+    :ivar name: The name of the task, used in overrun reports.
+    :ivar period: The period in seconds.
+    :ivar phase: The delay of the first execution in seconds.
+    :ivar policy: How missed deadlines are handled.
+    :ivar overruns: The number of executions that finished after the next deadline.
+    :ivar missed: The number of deadlines skipped.
+    :ivar max_lateness: The largest time in seconds an execution finished after the next deadline.
+    :ivar statistics: The timing statistics of the loop, shared by all loops of the same name.
+    """
+
+    def __init__(self, callback: Callable[[], bool], period: float, name: str = "Task", phase: float = 0.0,
+                 policy: OverrunPolicy = OverrunPolicy.SKIP) -> None:
+        """
+        Initialize the PeriodicRunner.
+
+        :param callback: The function executed once per period. Returning False ends the run.
+        :type callback: Callable[[], bool]
+        :param period: The period in seconds.
+        :type period: float
+        :param name: The name of the task, used in overrun reports. Defaults to "Task".
+        :type name: str
+        :param phase: The delay of the first execution in seconds. Defaults to 0.0.
+        :type phase: float
+        :param policy: How missed deadlines are handled. Defaults to OverrunPolicy.SKIP.
+        :type policy: OverrunPolicy
+        :raises ValueError: If the period is not positive or the phase is negative.
+        :return: None
+        """
+        if period <= 0:
+            raise ValueError(f"Period must be positive, got {period}")
+        if phase < 0:
+            raise ValueError(f"Phase must not be negative, got {phase}")
+
+        self.logger: Logger = Logger("Scheduler")
+        self.name: str = name
+        self.period: float = period
+        self.phase: float = phase
+        self.policy: OverrunPolicy = policy
+
+        self.overruns: int = 0
+        self.missed: int = 0
+        self.max_lateness: float = 0.0
+        self.statistics: LoopStatistics = LoopMonitor(name, period)
+
+        self._callback: Callable[[], bool] = callback
+        self._behind: bool = False
+
+    def run(self) -> None:
+        """
+        Execute the callback once per period until it returns False.
+
+        :return: None
+        """
+        deadline: float = Clock().monotonic() + self.phase
+        previous_start: float | None = None
+
+        while True:
+            delay: float = deadline - Clock().monotonic()
+            if delay > 0:
+                Clock().sleep(delay)
+
+            start: float = Clock().monotonic()
+            alive: bool = self._callback()
+            end: float = Clock().monotonic()
+
+            self.statistics.record(start, end, deadline + self.period, previous_start)
+            previous_start = start
+
+            if not alive:
+                break
+
+            deadline = self.advance(deadline, end)
+
+    def advance(self, deadline: float, now: float) -> float:
+        """
+        Determine the deadline following an execution and report it if the execution overran.
+
+        While catching up on missed deadlines, the late executions are not reported again.
+
+        :param deadline: The deadline of the finished execution.
+        :type deadline: float
+        :param now: The time the execution finished.
+        :type now: float
+        :return: The deadline of the next execution.
+        :rtype: float
+        """
+        next_deadline, missed = self.next_deadline(deadline, now, self.period, self.policy)
+        lateness: float = now - (deadline + self.period)
+
+        if lateness > 0 and not self._behind:
+            self.overruns += 1
+            self.missed += missed
+            self.max_lateness = max(self.max_lateness, lateness)
+            self.logger.log("%s overran its period of %ss by %.4fs, %d deadlines skipped", LogLevel.WARNING,
+                            self.name, self.period, lateness, missed)
+
+        self._behind = next_deadline < now
+        return next_deadline
+
+    @staticmethod
+    def next_deadline(deadline: float, now: float, period: float,
+                      policy: OverrunPolicy = OverrunPolicy.SKIP) -> tuple[float, int]:
+        """
+        Calculate the deadline following the given one on the fixed time grid.
+
+        :param deadline: The deadline of the finished execution.
+        :type deadline: float
+        :param now: The current time.
+        :type now: float
+        :param period: The period in seconds.
+        :type period: float
+        :param policy: How missed deadlines are handled. Defaults to OverrunPolicy.SKIP.
+        :type policy: OverrunPolicy
+        :return: The next deadline and the number of deadlines skipped to reach it.
+        :rtype: tuple[float, int]
+        """
+        next_deadline: float = deadline + period
+
+        if next_deadline > now or policy is OverrunPolicy.CATCH_UP:
+            return next_deadline, 0
+
+        missed: int = math.ceil((now - next_deadline) / period)
+        return next_deadline + missed * period, missed
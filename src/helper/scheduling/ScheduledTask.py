@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Callable
+
+from src.helper.metrics.LoopMonitor import LoopMonitor
+from src.helper.metrics.LoopStatistics import LoopStatistics
+
+if TYPE_CHECKING:
+    from src.helper.scheduling.SchedulerInterface import SchedulerInterface
+
+
+class ScheduledTask:
+    """
+    Handle of a periodic task driven by a scheduler.
+
+    The handle mirrors the parts of `threading.Thread` used by the controllers (`name`, `is_alive`
+    and `join`), so a controller can store and stop it like the thread of its loop.
+
+    :ivar name: The name of the task.
+    :ivar period: The period of the task in seconds.
+    :ivar next_run: The scheduler time of the next execution in seconds.
+    :ivar done: Indicates if the task has ended.
+    :ivar suspended: Indicates if the task is currently not scheduled.
+    :ivar statistics: The timing statistics of the task, shared by all loops of the same name.
+    :ivar last_start: The scheduler time the latest execution started in seconds, or None before the first
+        execution after scheduling or resuming.
+    """
+
+    def __init__(self, scheduler: SchedulerInterface, callback: Callable[[], bool], period: float, name: str,
+                 lock: threading.RLock) -> None:
+        """
+        Initialize the ScheduledTask.
+
+        :param scheduler: The scheduler driving the task.
+        :type scheduler: SchedulerInterface
+        :param callback: The function executed once per period. Returning False ends the task.
+        :type callback: Callable[[], bool]
+        :param period: The period of the task in seconds.
+        :type period: float
+        :param name: The name of the task.
+        :type name: str
+        :param lock: The lock the scheduler holds while executing tasks.
+        :type lock: threading.RLock
+        :return: None
+        """
+        self.name: str = name
+        self.period: float = period
+        self.next_run: float = 0.0
+        self.done: bool = False
+        self.suspended: bool = False
+        self.statistics: LoopStatistics = LoopMonitor(name, period)
+        self.last_start: float | None = None
+
+        self._scheduler: SchedulerInterface = scheduler
+        self._callback: Callable[[], bool] = callback
+        self._lock: threading.RLock = lock
+
+    def run(self) -> bool:
+        """
+        Execute one iteration of the task.
+
+        :return: True if the task keeps running, False if it has ended.
+        :rtype: bool
+        """
+        with self._lock:
+            if not self.done and not self._callback():
+                self.done = True
+
+            return not self.done
+
+    def measure(self, start: float, end: float, deadline: float) -> None:
+        """
+        Record the timing of an execution driven by the scheduler.
+
+        :param start: The scheduler time the execution started in seconds.
+        :type start: float
+        :param end: The scheduler time the execution finished in seconds.
+        :type end: float
+        :param deadline: The scheduler time the execution had to finish by in seconds.
+        :type deadline: float
+        :return: None
+        """
+        self.statistics.record(start, end, deadline, self.last_start)
+        self.last_start = start
+
+    def is_alive(self) -> bool:
+        """
+        Check if the task has not ended yet.
+
+        :return: True if the task is still running, False otherwise.
+        :rtype: bool
+        """
+        return not self.done
+
+    def join(self) -> None:
+        """
+        Run the task inline until it ends.
+
+        Mirrors `threading.Thread.join`: the owner signals its loop to end before joining, so the
+        remaining iterations (usually exactly one) run without waiting for the next period.
+
+        :return: None
+        """
+        with self._lock:
+            while not self.done:
+                self.run()
+
+        self._release()
+
+    def cancel(self) -> None:
+        """
+        End the task without executing it again.
+
+        :return: None
+        """
+        self.done = True
+        self._release()
+
+    def suspend(self) -> None:
+        """
+        Stop scheduling the task until it is resumed.
+
+        :return: None
+        """
+        self.suspended = True
+
+    def resume(self) -> None:
+        """
+        Schedule a suspended task again.
+
+        :return: None
+        """
+        if self.suspended and not self.done:
+            self.suspended = False
+            self.last_start = None
+            self._scheduler.reschedule(self)
+
+    def _release(self) -> None:
+        """
+        Hand an ended task that is still suspended back to its scheduler, so the scheduler can drop it.
+
+        :return: None
+        """
+        if self.suspended:
+            self.suspended = False
+            self._scheduler.reschedule(self)
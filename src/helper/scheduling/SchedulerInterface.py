@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from src.helper.scheduling.ScheduledTask import ScheduledTask
+
+
+class SchedulerInterface(ABC):
+    """
+    Abstract base class for schedulers that drive periodic tasks cooperatively.
+
+    A task is a callback that executes one iteration of a control loop and returns whether the loop
+    should keep running. Schedulers call the task once per period instead of dedicating a thread to it.
+    """
+
+    @abstractmethod
+    def schedule(self, callback: Callable[[], bool], period: float, phase: float = 0.0,
+                 name: str = "Task") -> ScheduledTask:
+        """
+        Schedule a periodic task.
+
+        :param callback: The function executed once per period. Returning False ends the task.
+        :type callback: Callable[[], bool]
+        :param period: The period of the task in seconds.
+        :type period: float
+        :param phase: The offset of the first execution in seconds. Defaults to 0.0.
+        :type phase: float
+        :param name: The name of the task. Defaults to "Task".
+        :type name: str
+        :return: The handle of the scheduled task.
+        :rtype: ScheduledTask
+        """
+        pass
+
+    @abstractmethod
+    def reschedule(self, task: ScheduledTask) -> None:
+        """
+        Schedule a previously suspended task again.
+
+        :param task: The task to resume.
+        :type task: ScheduledTask
+        :return: None
+        """
+        pass
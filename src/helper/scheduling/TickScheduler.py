@@ -0,0 +1,169 @@
+import heapq
+import itertools
+import threading
+from typing import Callable, Iterator
+
+from src.helper.Clock import Clock
+from src.helper.Logger import Logger
+from src.helper.logging.LogLevel import LogLevel
+from src.helper.scheduling.PeriodicRunner import PeriodicRunner
+from src.helper.scheduling.ScheduledTask import ScheduledTask
+from src.helper.scheduling.SchedulerInterface import SchedulerInterface
+
+
+class TickScheduler(SchedulerInterface):
+    """
+    Cooperative scheduler that drives all periodic tasks from a single thread.
+
+    Tasks keep their own period and phase offset. If a task falls behind, missed executions are
+    skipped so the task stays on its original time grid. The scheduler measures and waits for time
+    through the installed Clock, so it also runs in simulated time.
+
+    :ivar running: Indicates if the scheduler loop is running.
+    :ivar thread: The thread running the scheduler loop, if started through `start`.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the TickScheduler without any tasks.
+
+        :return: None
+        """
+        self.logger: Logger = Logger("Scheduler")
+        self.running: bool = False
+        self.thread: threading.Thread | None = None
+
+        self._lock: threading.RLock = threading.RLock()
+        self._sequence: Iterator[int] = itertools.count()
+        self._queue: list[tuple[float, int, ScheduledTask]] = []
+
+    def schedule(self, callback: Callable[[], bool], period: float, phase: float = 0.0,
+                 name: str = "Task") -> ScheduledTask:
+        """
+        Schedule a periodic task.
+
+        :param callback: The function executed once per period. Returning False ends the task.
+        :type callback: Callable[[], bool]
+        :param period: The period of the task in seconds.
+        :type period: float
+        :param phase: The offset of the first execution in seconds. Defaults to 0.0.
+        :type phase: float
+        :param name: The name of the task. Defaults to "Task".
+        :type name: str
+        :raises ValueError: If the period is not positive or the phase is negative.
+        :return: The handle of the scheduled task.
+        :rtype: ScheduledTask
+        """
+        if period <= 0:
+            raise ValueError("Period must be a positive number")
+        if phase < 0:
+            raise ValueError("Phase must not be negative")
+
+        task: ScheduledTask = ScheduledTask(self, callback, period, name, self._lock)
+        task.next_run = Clock().monotonic() + phase
+
+        self.logger.log(f"Scheduling {name} every {period}s", LogLevel.INFO)
+        self._push(task)
+
+        return task
+
+    def reschedule(self, task: ScheduledTask) -> None:
+        """
+        Schedule a previously suspended task again, starting with the next tick.
+
+        :param task: The task to resume.
+        :type task: ScheduledTask
+        :return: None
+        """
+        task.next_run = Clock().monotonic()
+        self._push(task)
+
+    def tick(self) -> float | None:
+        """
+        Execute all tasks that are due.
+
+        :return: The time of the next due task, or None if no tasks are left.
+        :rtype: float | None
+        """
+        with self._lock:
+            now: float = Clock().monotonic()
+
+            while self._queue:
+                next_run, _, task = self._queue[0]
+
+                if task.done or task.suspended:
+                    heapq.heappop(self._queue)
+                    continue
+
+                if next_run > now:
+                    return next_run
+
+                heapq.heappop(self._queue)
+
+                start: float = now
+                alive: bool = task.run()
+                now = Clock().monotonic()
+                task.measure(start, now, next_run + task.period)
+
+                if alive:
+                    task.next_run, _ = PeriodicRunner.next_deadline(next_run, now, task.period)
+                    self._push(task)
+
+            return None
+
+    def run(self) -> None:
+        """
+        Run the scheduler loop in the calling thread until it is stopped or no tasks are left.
+
+        :return: None
+        """
+        self.logger.log("Scheduler loop starting", LogLevel.INFO)
+        self.running = True
+
+        while self.running:
+            next_run: float | None = self.tick()
+
+            if next_run is None:
+                self.logger.log("No tasks left, scheduler loop ends", LogLevel.INFO)
+                break
+
+            Clock().sleep(max(0.0, next_run - Clock().monotonic()))
+
+        self.running = False
+
+    def start(self) -> None:
+        """
+        Start the scheduler loop in a separate thread.
+
+        :return: None
+        """
+        if not self.running:
+            self.running = True
+            self.thread = Clock().spawn(self.run, "SchedulerThread")
+        else:
+            self.logger.log("Scheduler is already running", LogLevel.WARNING)
+
+    def stop(self) -> None:
+        """
+        Stop the scheduler loop and wait for its thread to finish.
+
+        :return: None
+        """
+        if self.running:
+            self.logger.log("Stopping scheduler", LogLevel.INFO)
+            self.running = False
+            if self.thread:
+                Clock().join(self.thread)
+        else:
+            self.logger.log("Scheduler is not running", LogLevel.WARNING)
+
+    def _push(self, task: ScheduledTask) -> None:
+        """
+        Insert a task into the queue according to its next execution time.
+
+        :param task: The task to insert.
+        :type task: ScheduledTask
+        :return: None
+        """
+        with self._lock:
+            heapq.heappush(self._queue, (task.next_run, next(self._sequence), task))
@@ -0,0 +1,109 @@
+import struct
+
+from src.helper.Action import Action
+
+
+class TelemetryFormat:
+    """
+    Binary layout of telemetry files.
+
+    A telemetry file starts with a fixed-size header followed by chunks of a fixed number of rows. Within a
+    chunk, every column is stored contiguously, so each column of a chunk can be read as one typed array.
+
+    The header consists of the magic bytes, the version (uint16), the column count (uint16), the rows per
+    chunk (uint32) and the row count (uint64), followed by one descriptor per column holding the NUL-padded
+    name (32 bytes) and the struct format character (1 byte). All values are little endian.
+    """
+
+    MAGIC: bytes = b"MWTL"
+    """bytes: Marker identifying telemetry files."""
+
+    VERSION: int = 1
+    """int: Version of the layout."""
+
+    HEADER: struct.Struct = struct.Struct("<4sHHIQ")
+    """struct.Struct: Fixed part of the header."""
+
+    ROWS_OFFSET: int = 12
+    """int: Byte offset of the row count within the header."""
+
+    ROWS: struct.Struct = struct.Struct("<Q")
+    """struct.Struct: Encoding of the row count."""
+
+    COLUMN: struct.Struct = struct.Struct("<32sc")
+    """struct.Struct: Descriptor of one column."""
+
+    ALIGNMENT: int = 64
+    """int: Alignment of chunks and columns in bytes."""
+
+    ACTIONS: tuple[Action, ...] = tuple(Action)
+    """tuple[Action, ...]: Actions in the order of their codes, starting at 1. Code 0 stands for no action."""
+
+    @classmethod
+    def encode_action(cls, action: Action | None) -> int:
+        """
+        Encode a user action as a column value.
+
+        :param action: The action, or None if there was no action.
+        :type action: Action | None
+        :return: The code of the action.
+        :rtype: int
+        """
+        return 0 if action is None else cls.ACTIONS.index(action) + 1
+
+    @classmethod
+    def decode_action(cls, code: int) -> Action | None:
+        """
+        Decode a column value into a user action.
+
+        :param code: The code of the action.
+        :type code: int
+        :return: The action, or None if the code stands for no action.
+        :rtype: Action | None
+        """
+        return None if code == 0 else cls.ACTIONS[code - 1]
+
+    @classmethod
+    def header_size(cls, columns: int) -> int:
+        """
+        Calculate the size of the header including the padding up to the first chunk.
+
+        :param columns: The number of columns.
+        :type columns: int
+        :return: The byte offset of the first chunk.
+        :rtype: int
+        """
+        return cls._align(cls.HEADER.size + columns * cls.COLUMN.size)
+
+    @classmethod
+    def chunk_layout(cls, formats: list[str], chunk_rows: int) -> tuple[list[int], int]:
+        """
+        Calculate the byte offset of every column within a chunk and the size of a chunk.
+
+        :param formats: The struct format characters of the columns.
+        :type formats: list[str]
+        :param chunk_rows: The number of rows per chunk.
+        :type chunk_rows: int
+        :return: The byte offsets of the columns within a chunk and the size of a chunk in bytes.
+        :rtype: tuple[list[int], int]
+        """
+        offsets: list[int] = []
+        offset: int = 0
+
+        for column_format in formats:
+            offsets.append(offset)
+            offset = cls._align(offset + struct.calcsize("<" + column_format) * chunk_rows)
+
+        return offsets, offset
+
+    @classmethod
+    def _align(cls, size: int) -> int:
+        """
+        Round a size up to the alignment.
+
+        :param size: The size in bytes.
+        :type size: int
+        :return: The aligned size in bytes.
+        :rtype: int
+        """
+        return -(-size // cls.ALIGNMENT) * cls.ALIGNMENT
@@ -0,0 +1,72 @@
+import numpy as np
+
+from src.helper.telemetry.TelemetryFormat import TelemetryFormat
+
+
+class TelemetryReader:
+    """
+    Reads the columns of a telemetry file as NumPy arrays.
+
+    The file is memory-mapped and every column is exposed as a strided view over its chunks, so no values
+    are parsed. Columns of a file with a single chunk are returned without copying.
+
+    :ivar path: The path of the telemetry file.
+    :ivar rows: The number of recorded rows.
+    :ivar chunk_rows: The number of rows per chunk.
+    :ivar columns: The names of the columns in file order.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Map the telemetry file and read its header.
+
+        :param path: The path of the telemetry file.
+        :type path: str
+        :raises ValueError: If the file is not a telemetry file of a supported version.
+        :return: None
+        """
+        self.path: str = path
+        self._data: np.ndarray = np.memmap(path, dtype=np.uint8, mode="r")
+
+        magic, version, column_count, self.chunk_rows, self.rows = TelemetryFormat.HEADER.unpack_from(self._data)
+        if magic != TelemetryFormat.MAGIC or version != TelemetryFormat.VERSION:
+            raise ValueError(f"{path} is not a telemetry file of version {TelemetryFormat.VERSION}")
+
+        self._formats: dict[str, str] = {}
+        for index in range(column_count):
+            name, column_format = TelemetryFormat.COLUMN.unpack_from(
+                self._data, TelemetryFormat.HEADER.size + index * TelemetryFormat.COLUMN.size
+            )
+            self._formats[name.rstrip(b"\0").decode()] = column_format.decode()
+
+        self.columns: list[str] = list(self._formats)
+        offsets, self._chunk_size = TelemetryFormat.chunk_layout(list(self._formats.values()), self.chunk_rows)
+        self._offsets: dict[str, int] = dict(zip(self.columns, offsets))
+        self._header_size: int = TelemetryFormat.header_size(column_count)
+        self._chunks: int = (len(self._data) - self._header_size) // self._chunk_size
+
+    def read(self, column: str) -> np.ndarray:
+        """
+        Get the recorded values of one column.
+
+        :param column: The name of the column.
+        :type column: str
+        :return: The values of all recorded rows.
+        :rtype: np.ndarray
+        :raises KeyError: If the file has no such column.
+        """
+        dtype: np.dtype = np.dtype("<" + self._formats[column])
+        chunks: np.ndarray = np.ndarray(
+            shape=(self._chunks, self.chunk_rows), dtype=dtype, buffer=self._data,
+            offset=self._header_size + self._offsets[column], strides=(self._chunk_size, dtype.itemsize)
+        )
+        return chunks.reshape(-1)[:self.rows]
+
+    def read_all(self) -> dict[str, np.ndarray]:
+        """
+        Get the recorded values of every column.
+
+        :return: The values of all recorded rows by column name.
+        :rtype: dict[str, np.ndarray]
+        """
+        return {column: self.read(column) for column in self.columns}
@@ -0,0 +1,136 @@
+import mmap
+import struct
+
+from src.components.sensor.SensorManager import SensorManager
+from src.helper.OvenContext import OvenContext
+from src.helper.config import TELEMETRY_CHUNK_ROWS
+from src.helper.telemetry.TelemetryFormat import TelemetryFormat
+from src.helper.telemetry.TelemetrySampler import TelemetrySampler
+
+
+class TelemetryRecorder:
+    """
+    Records one row of sensor values, actuator states and user actions per sensor update into a binary columnar file.
+
+    Rows are fixed-width and written directly into a memory-mapped file, which is extended by preallocated
+    chunks whenever it is full. Once attached, the SensorManager records a row after every update.
+
+    :ivar path: The path of the telemetry file.
+    :ivar rows: The number of recorded rows.
+    :ivar chunk_rows: The number of rows per chunk.
+    """
+
+    COLUMNS: tuple[tuple[str, str], ...] = TelemetrySampler.COLUMNS
+    """tuple[tuple[str, str], ...]: The name and struct format character of every column."""
+
+    def __init__(self, path: str, context: OvenContext | None = None, chunk_rows: int = TELEMETRY_CHUNK_ROWS) -> None:
+        """
+        Create the telemetry file with its header and first chunk.
+
+        :param path: The path of the telemetry file. An existing file is overwritten.
+        :type path: str
+        :param context: The oven context to record, or None for the singletons. Defaults to None.
+        :type context: OvenContext | None
+        :param chunk_rows: The number of rows per chunk. Defaults to TELEMETRY_CHUNK_ROWS.
+        :type chunk_rows: int
+        :raises ValueError: If the number of rows per chunk is not positive.
+        :return: None
+        """
+        if chunk_rows <= 0:
+            raise ValueError(f"Rows per chunk must be positive, got {chunk_rows}")
+
+        self.path: str = path
+        self.rows: int = 0
+        self.chunk_rows: int = chunk_rows
+
+        self.sampler: TelemetrySampler = TelemetrySampler(context)
+        self.sensor_manager: SensorManager = self.sampler.sensor_manager
+
+        formats: list[str] = [column_format for _, column_format in self.COLUMNS]
+        offsets, self.chunk_size = TelemetryFormat.chunk_layout(formats, chunk_rows)
+        self.header_size: int = TelemetryFormat.header_size(len(self.COLUMNS))
+        self.chunks: int = 0
+        self._layout: list[tuple[struct.Struct, int]] = [
+            (struct.Struct("<" + column_format), offset) for column_format, offset in zip(formats, offsets)
+        ]
+
+        self._file = open(path, "w+b")
+        self._map: mmap.mmap | None = None
+        self._grow()
+        self._write_header()
+
+    def _write_header(self) -> None:
+        """
+        Write the header describing the columns.
+
+        :return: None
+        """
+        TelemetryFormat.HEADER.pack_into(self._map, 0, TelemetryFormat.MAGIC, TelemetryFormat.VERSION,
+                                         len(self.COLUMNS), self.chunk_rows, self.rows)
+
+        for index, (name, column_format) in enumerate(self.COLUMNS):
+            offset: int = TelemetryFormat.HEADER.size + index * TelemetryFormat.COLUMN.size
+            TelemetryFormat.COLUMN.pack_into(self._map, offset, name.encode(), column_format.encode())
+
+    def _grow(self) -> None:
+        """
+        Extend the file by one preallocated chunk and map it again.
+
+        :return: None
+        """
+        if self._map is not None:
+            self._map.close()
+
+        self.chunks += 1
+        self._file.truncate(self.header_size + self.chunks * self.chunk_size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+    def attach(self) -> None:
+        """
+        Record a row after every update of the sensor manager.
+
+        :return: None
+        """
+        self.sensor_manager.recorder = self
+
+    def record(self) -> None:
+        """
+        Sample the sensors, actuators and the latest user action and append them as one row.
+
+        :return: None
+        """
+        self.append(self.sampler.sample())
+
+    def append(self, row: tuple) -> None:
+        """
+        Append one row with a value for every column.
+
+        :param row: The values in column order.
+        :type row: tuple
+        :return: None
+        """
+        chunk, index = divmod(self.rows, self.chunk_rows)
+        if chunk == self.chunks:
+            self._grow()
+
+        base: int = self.header_size + chunk * self.chunk_size
+        for (column, offset), value in zip(self._layout, row):
+            column.pack_into(self._map, base + offset + index * column.size, value)
+
+        self.rows += 1
+        TelemetryFormat.ROWS.pack_into(self._map, TelemetryFormat.ROWS_OFFSET, self.rows)
+
+    def close(self) -> None:
+        """
+        Detach from the sensor manager, flush the recorded rows and close the file.
+
+        :return: None
+        """
+        if getattr(self.sensor_manager, "recorder", None) is self:
+            self.sensor_manager.recorder = None
+
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+            self._map = None
+        self._file.close()
@@ -0,0 +1,77 @@
+from src.components.cooling.CoolingFan import CoolingFan
+from src.components.door.Door import Door
+from src.components.door.DoorController import DoorController
+from src.components.magnetron.Magnetron import Magnetron
+from src.components.reflector.Reflector import Reflector
+from src.components.sensor.SensorManager import SensorManager
+from src.components.turntable.Turntable import Turntable
+from src.helper.Clock import Clock
+from src.helper.OvenContext import OvenContext
+from src.helper.telemetry.TelemetryFormat import TelemetryFormat
+from src.user.UserInteractionHandler import UserInteractionHandler
+
+
+class TelemetrySampler:
+    """
+    Samples the sensor values, actuator states, the latest user action and the door state of one oven as a row.
+    """
+
+    COLUMNS: tuple[tuple[str, str], ...] = (
+        ("time", "d"),
+        ("inner_temp1", "d"),
+        ("inner_temp2", "d"),
+        ("inner_humidity", "d"),
+        ("inner_weight", "d"),
+        ("magnetron_temp1", "d"),
+        ("magnetron_temp2", "d"),
+        ("magnetron_active", "?"),
+        ("cooling_fan_power_share", "d"),
+        ("turntable_rotations_per_minute", "d"),
+        ("reflector_angle", "d"),
+        ("action", "B"),
+        ("door_opened", "?"),
+        ("door_locked", "?"),
+    )
+    """tuple[tuple[str, str], ...]: The name and struct format character of every column."""
+
+    def __init__(self, context: OvenContext | None = None) -> None:
+        """
+        Initialize the TelemetrySampler. Components that already exist are sampled as they are, without being
+        initialized again.
+
+        :param context: The oven context to sample, or None for the singletons. Defaults to None.
+        :type context: OvenContext | None
+        """
+        self.sensor_manager: SensorManager = OvenContext.observe(context, SensorManager)
+        self.magnetron: Magnetron = OvenContext.observe(context, Magnetron)
+        self.cooling_fan: CoolingFan = OvenContext.observe(context, CoolingFan)
+        self.turntable: Turntable = OvenContext.observe(context, Turntable)
+        self.reflector: Reflector = OvenContext.observe(context, Reflector)
+        self.user_interaction_handler: UserInteractionHandler = OvenContext.observe(context, UserInteractionHandler)
+        self.door: Door = OvenContext.observe(context, Door)
+        self.door_controller: DoorController = OvenContext.observe(context, DoorController)
+
+    def sample(self) -> tuple:
+        """
+        Sample the sensors, actuators, the latest user action and the door.
+
+        :return: The values in column order.
+        :rtype: tuple
+        """
+        sensors: SensorManager = self.sensor_manager
+        return (
+            Clock().monotonic(),
+            sensors.inner_temp1(),
+            sensors.inner_temp2(),
+            sensors.inner_humidity(),
+            sensors.inner_weight(),
+            sensors.magnetron_temp1(),
+            sensors.magnetron_temp2(),
+            self.magnetron.active,
+            self.cooling_fan.power_share,
+            self.turntable.rotations_per_minute,
+            self.reflector.angle,
+            TelemetryFormat.encode_action(self.user_interaction_handler.last_action),
+            self.door.opened,
+            self.door_controller.locked,
+        )
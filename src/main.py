@@ -1,6 +1,12 @@
-import time
-
 from src.SystemControl import SystemControl
+from src.helper.Clock import Clock
+from src.helper.Logger import Logger
+from src.helper.Settings import Settings
+from src.helper.config import METRICS_ENABLED, CONFIG_PATH
+from src.helper.configuration.ConfigWatcher import ConfigWatcher
+from src.helper.logging.FlightLog import FlightLog
+from src.helper.metrics.LoopReporter import LoopReporter
+from src.helper.metrics.MetricsExporter import MetricsExporter
 
 
 def main() -> None:
@@ -9,9 +15,16 @@ def main() -> None:
 
     :return: None
     """
+    Logger.use_async()
+    Logger.use_flight_log(FlightLog())
+    Settings().load_environment()
+    ConfigWatcher(CONFIG_PATH).start()
+    LoopReporter().start()
+    if METRICS_ENABLED:
+        MetricsExporter().start()
     system_control: SystemControl = SystemControl()
     system_control.start()
-    time.sleep(1)
+    Clock().sleep(1)
 
 
 if __name__ == "__main__":
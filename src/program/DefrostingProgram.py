@@ -1,4 +1,5 @@
-from src.helper.config import TURNTABLE_WEIGHT_IN_GRAMS, PROGRAM_DEFROSTING_TARGET_TEMP, AMBIENT_TEMPERATURE_IN_CELSIUS
+from src.helper.OvenContext import OvenContext
+from src.helper.config import TURNTABLE_WEIGHT_IN_GRAMS, AMBIENT_TEMPERATURE_IN_CELSIUS
 from src.helper.logging.LogLevel import LogLevel
 from src.program.Program import Program
 
@@ -17,24 +18,66 @@ class DefrostingProgram(Program):
     :ivar cycles: Number of remaining defrosting cycles.
     """
 
-    def __init__(self) -> None:
+    display_name: str = "Defrosting Program"
+
+    RESTING_MARGIN_IN_CELSIUS: float = 5.0
+    """float: Distance to the ambient temperature the load cools down to between two cycles."""
+
+    BASE_POWER_SHARE: float = 0.1
+    """float: Magnetron power share while heating, before adding the share per remaining cycle."""
+
+    POWER_SHARE_PER_CYCLE: float = 0.1
+    """float: Magnetron power share added per remaining cycle while heating."""
+
+    MAX_POWER_SHARE: float = 0.4
+    """float: Highest magnetron power share while heating."""
+
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initialize the DefrostingProgram.
 
         Sets up the program name, state flags, and calculates the number of cycles based on the inner weight.
 
+        :param context: The oven context to resolve dependencies from, or None for the singletons.
+        :type context: OvenContext | None
         :return: None
         """
-        super().__init__()
+        super().__init__(context)
 
-        self.name: str = "Defrosting Program"
+        self.name: str = self.display_name
         self.running: bool = False
         self.paused: bool = False
         self.just_updated: bool = False
 
-        self.cycles: int = max(1, (self.sensors.inner_weight() - TURNTABLE_WEIGHT_IN_GRAMS) // 100)
+        self.cycles: int = self.cycles_for_weight(self.sensors.inner_weight())
         self.logger.log(f"Defrosting will take {self.cycles} cycles")
 
+    @staticmethod
+    def cycles_for_weight(weight: float) -> int:
+        """
+        Calculate the number of defrosting cycles for a measured weight, one per 100 g of load.
+
+        :param weight: The measured weight including the turntable in grams.
+        :type weight: float
+        :return: The number of cycles, at least 1.
+        :rtype: int
+        """
+        return max(1, int((weight - TURNTABLE_WEIGHT_IN_GRAMS) // 100))
+
+    @staticmethod
+    def weight_for_cycles(cycles: int) -> float:
+        """
+        Calculate a measured weight the program runs the given number of cycles for.
+
+        The weight lies in the middle of the range of weights with that number of cycles.
+
+        :param cycles: The number of cycles, at least 1.
+        :type cycles: int
+        :return: The measured weight including the turntable in grams.
+        :rtype: float
+        """
+        return TURNTABLE_WEIGHT_IN_GRAMS + 100 * cycles + 50
+
     def control_components(self) -> None:
         """
         Control the components (magnetron, turntable) during the defrosting process.
@@ -45,22 +88,35 @@ class DefrostingProgram(Program):
         """
         inner_temp: float = (self.sensors.inner_temp1() + self.sensors.inner_temp2()) / 2
 
-        if inner_temp > PROGRAM_DEFROSTING_TARGET_TEMP and not self.just_updated:
+        if inner_temp > self.settings.PROGRAM_DEFROSTING_TARGET_TEMP and not self.just_updated:
             self.magnetron.set_target_power_share(0.0)
             self.cycles -= 1
             self.just_updated = True
 
             self.logger.log(f"Defrosting cycle finished: {self.cycles} left", LogLevel.INFO)
         elif self.just_updated:
-            if inner_temp < AMBIENT_TEMPERATURE_IN_CELSIUS + 5:
+            if inner_temp < AMBIENT_TEMPERATURE_IN_CELSIUS + self.RESTING_MARGIN_IN_CELSIUS:
                 self.just_updated = False
         else:
-            self.magnetron.set_target_power_share(min(0.4, 0.1 + self.cycles * 0.1))
+            self.magnetron.set_target_power_share(self.heating_power_share(inner_temp))
 
         if self.cycles <= 0:
             self.logger.log(f"Finished {self.name}", LogLevel.INFO)
             self.finished = True
 
+    def heating_power_share(self, inner_temp: float) -> float:
+        """
+        Determine the magnetron power share while heating towards the target temperature.
+
+        The power share is reduced as fewer cycles remain, so the last cycles heat more gently.
+
+        :param inner_temp: The mean inner temperature.
+        :type inner_temp: float
+        :return: The power share to apply.
+        :rtype: float
+        """
+        return min(self.MAX_POWER_SHARE, self.BASE_POWER_SHARE + self.cycles * self.POWER_SHARE_PER_CYCLE)
+
     def start(self) -> None:
         """
         Start the defrosting program.
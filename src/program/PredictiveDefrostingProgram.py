@@ -0,0 +1,94 @@
+from src.helper.Clock import Clock
+from src.helper.OvenContext import OvenContext
+from src.program.DefrostingProgram import DefrostingProgram
+from src.program.control.ModelPredictiveController import ModelPredictiveController
+
+
+class PredictiveDefrostingProgram(DefrostingProgram):
+    """
+    Defrosting program planning the magnetron power with a model-predictive controller.
+
+    Runs the same heating and resting cycles as the DefrostingProgram, but heats with the highest power share
+    the controller predicts to stay within the limits of the magnetron, instead of a fixed share per cycle.
+    The thermal models of the controller are fitted to the sensor readings on every tick.
+
+    :ivar controller: The controller planning the power share.
+    :ivar planned_power_share: The power share of the last plan.
+    :ivar planned_at: The monotonic time of the last plan, or None before the first one.
+    """
+
+    display_name: str = "Predictive Defrosting Program"
+
+    def __init__(self, context: OvenContext | None = None) -> None:
+        """
+        Initialize the PredictiveDefrostingProgram.
+
+        :param context: The oven context to resolve dependencies from, or None for the singletons.
+        :type context: OvenContext | None
+        :return: None
+        """
+        super().__init__(context)
+
+        self.controller: ModelPredictiveController = ModelPredictiveController()
+        self.planned_power_share: float = 0.0
+        self.planned_at: float | None = None
+
+    def snapshot(self) -> dict[str, object]:
+        """
+        Capture the state of the controller, e.g. for a checkpoint.
+
+        :return: The state of the controller.
+        :rtype: dict[str, object]
+        """
+        return {"controller": self.controller.snapshot()}
+
+    def restore(self, state: dict[str, object]) -> None:
+        """
+        Continue with the controller state captured by `snapshot`.
+
+        :param state: The state of the controller.
+        :type state: dict[str, object]
+        :return: None
+        """
+        self.controller.restore(state["controller"])
+
+    def magnetron_temp(self) -> float:
+        """
+        Read the higher of the magnetron temperatures.
+
+        :return: The magnetron temperature.
+        :rtype: float
+        """
+        return max(self.sensors.magnetron_temp1(), self.sensors.magnetron_temp2())
+
+    def control_components(self) -> None:
+        """
+        Fit the thermal models to the current readings, then control the components like the DefrostingProgram.
+
+        :return: None
+        """
+        inner_temp: float = (self.sensors.inner_temp1() + self.sensors.inner_temp2()) / 2
+        self.controller.observe(Clock().monotonic(), inner_temp, self.magnetron_temp(),
+                                self.magnetron.magnetron.active, self.cooling_fan.cooling_fan.power_share)
+
+        super().control_components()
+
+    def heating_power_share(self, inner_temp: float) -> float:
+        """
+        Determine the magnetron power share while heating, replanning once per magnetron cycle.
+
+        :param inner_temp: The mean inner temperature.
+        :type inner_temp: float
+        :return: The power share to apply.
+        :rtype: float
+        """
+        now: float = Clock().monotonic()
+
+        if self.planned_at is None or now - self.planned_at >= self.settings.MAGNETRON_ON_OFF_INTERVAL_IN_SECONDS:
+            self.planned_power_share = self.controller.plan(inner_temp, self.settings.PROGRAM_DEFROSTING_TARGET_TEMP,
+                                                            self.magnetron_temp(),
+                                                            self.cooling_fan.cooling_fan.power_share,
+                                                            self.magnetron.power_history)
+            self.planned_at = now
+
+        return self.planned_power_share
@@ -1,5 +1,4 @@
 import threading
-import time
 from abc import ABC, abstractmethod
 
 from src.components.cooling.CoolingFanController import CoolingFanController
@@ -8,9 +7,17 @@ from src.components.magnetron.MagnetronModulator import MagnetronModulator
 from src.components.reflector.ReflectorController import ReflectorController
 from src.components.sensor.SensorManager import SensorManager
 from src.components.turntable.TurntableController import TurntableController
+from src.helper.Clock import Clock
 from src.helper.Logger import Logger
+from src.helper.OvenContext import OvenContext
+from src.helper.Scheduler import Scheduler
+from src.helper.Settings import Settings
 from src.helper.config import PROGRAM_UPDATE_INTERVAL_IN_SECONDS
+from src.helper.configuration.RuntimeConfig import RuntimeConfig
 from src.helper.logging.LogLevel import LogLevel
+from src.helper.scheduling.PeriodicRunner import PeriodicRunner
+from src.helper.scheduling.ScheduledTask import ScheduledTask
+from src.helper.scheduling.SchedulerInterface import SchedulerInterface
 
 
 class Program(ABC):
@@ -22,6 +29,13 @@ class Program(ABC):
     and component interactions.
     """
 
+    display_name: str = "Program"
+    """str: The name of the program shown in a program menu, read without creating an instance."""
+    parameters: dict[str, object] = {}
+    """dict[str, object]: The adjustable parameters of the program with their default values."""
+    expected_duration_in_seconds: float | None = None
+    """float | None: The typical run time of the program, or None if unknown."""
+
     pause_condition: threading.Condition = threading.Condition()
     logger: Logger = Logger("ProgramControl")
     sensors: SensorManager = SensorManager()
@@ -32,14 +46,32 @@ class Program(ABC):
     reflector: ReflectorController = ReflectorController()
     components: list = [magnetron, cooling_fan, turntable, reflector]
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initializes the Program instance with default state variables.
+
+        Within an oven context, the components of that oven replace the process-wide ones.
+
+        :param context: The oven context to resolve dependencies from, or None for the singletons.
+        :type context: OvenContext | None
         """
         self.name: str = "Program"
+        self.key: str | None = None
         self.paused: bool = False
         self.running: bool = False
         self.finished: bool = False
+        self.task: ScheduledTask | None = None
+        self.settings: RuntimeConfig = Settings()
+
+        if context is not None:
+            self.pause_condition = threading.Condition()
+            self.sensors = context.get(SensorManager)
+            self.door = context.get(DoorController)
+            self.magnetron = context.get(MagnetronModulator)
+            self.cooling_fan = context.get(CoolingFanController)
+            self.turntable = context.get(TurntableController)
+            self.reflector = context.get(ReflectorController)
+            self.components = [self.magnetron, self.cooling_fan, self.turntable, self.reflector]
 
     @abstractmethod
     def control_components(self) -> None:
@@ -59,11 +91,42 @@ class Program(ABC):
         """
         self.logger.log(f"{self.name} control loop started", LogLevel.INFO)
 
-        while not self.paused and not self.finished:
-            self.control_components()
-            self.turntable.update()
-            self.reflector.update()
-            time.sleep(PROGRAM_UPDATE_INTERVAL_IN_SECONDS)
+        def control_step() -> bool:
+            if self.paused or self.finished:
+                return False
+
+            self.control_cycle()
+            return True
+
+        PeriodicRunner(control_step, PROGRAM_UPDATE_INTERVAL_IN_SECONDS, self.name).run()
+
+    def control_cycle(self) -> None:
+        """
+        Executes a single control cycle, commanding the components and updating the turntable and reflector.
+        """
+        self.control_components()
+        self.turntable.update()
+        self.reflector.update()
+
+    def control_tick(self) -> bool:
+        """
+        Executes one iteration of the program on a scheduler.
+
+        Runs a control cycle unless paused, and stops all components once the program is finished or stopped.
+
+        :return: True if the program keeps running, False otherwise.
+        """
+        if self.running and not self.finished and not self.paused:
+            self.control_cycle()
+
+        if self.running and not self.finished:
+            return True
+
+        self.paused = False
+        self.running = False
+
+        self.stop_components()
+        return False
 
     def get_name(self) -> str:
         """
@@ -80,6 +143,7 @@ class Program(ABC):
 
         This method sets the running state, locks the door, starts the magnetron and cooling fan,
         and enters the main control loop. If paused, it waits until resumed.
+        If a scheduler is installed, the control loop is scheduled as a task and this method returns immediately.
         """
         self.logger.log(f"{self.name} is starting", LogLevel.INFO)
 
@@ -90,13 +154,18 @@ class Program(ABC):
         self.magnetron.start()
         self.cooling_fan.start()
 
+        scheduler: SchedulerInterface | None = Scheduler()
+        if scheduler is not None:
+            self.task = scheduler.schedule(self.control_tick, PROGRAM_UPDATE_INTERVAL_IN_SECONDS, name=self.name)
+            return
+
         while self.running and not self.finished:
             self.control_loop()
 
             if not self.finished:
                 with self.pause_condition:
                     self.logger.log(f"Paused {self.name}", LogLevel.INFO)
-                    self.pause_condition.wait_for(lambda: not self.paused or not self.running)
+                    Clock().wait_for(self.pause_condition, lambda: not self.paused or not self.running)
 
         self.paused = False
         self.running = False
@@ -107,22 +176,29 @@ class Program(ABC):
         """
         Pause the program.
 
-        Sets the paused state to True and logs the action.
+        Sets the paused state to True, suspends the scheduled task if any, and logs the action.
         """
         self.logger.log(f"Pausing {self.name}", LogLevel.INFO)
         self.paused = True
 
+        if self.task is not None:
+            self.task.suspend()
+
     def resume(self) -> None:
         """
         Resume the program.
 
-        Sets the paused state to False, notifies all waiting threads, and logs the action.
+        Sets the paused state to False, notifies all waiting threads, resumes the scheduled task if any,
+        and logs the action.
         """
         self.logger.log(f"Resuming {self.name}", LogLevel.INFO)
         self.paused = False
 
+        if self.task is not None:
+            self.task.resume()
+
         with self.pause_condition:
-            self.pause_condition.notify_all()
+            Clock().notify_all(self.pause_condition)
 
     def stop(self) -> None:
         """
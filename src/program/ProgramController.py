@@ -1,8 +1,13 @@
 import threading
 
+from src.helper.Clock import Clock
 from src.helper.Logger import Logger
+from src.helper.OvenContext import OvenContext
+from src.helper.Scheduler import Scheduler
 from src.helper.logging.LogLevel import LogLevel
+from src.helper.scheduling.ScheduledTask import ScheduledTask
 from src.program.Program import Program
+from src.program.estimate.DefrostEstimator import DefrostEstimator
 
 
 class ProgramController:
@@ -13,37 +18,48 @@ class ProgramController:
 
     _instance: 'ProgramController' = None
 
-    def __new__(cls, *args, **kwargs) -> 'ProgramController':
+    def __new__(cls, context: OvenContext | None = None) -> 'ProgramController':
         """
         Ensures only one instance of ProgramController exists (Singleton pattern).
 
-        :param args: Positional arguments.
-        :param kwargs: Keyword arguments.
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of ProgramController.
         """
+        if context is not None:
+            return super(ProgramController, cls).__new__(cls)
+
         if cls._instance is None:
             cls._instance = super(ProgramController, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initializes the ProgramController with a logger and sets initial state.
+
+        :param context: The oven context to resolve dependencies from, or None for the singletons.
+        :type context: OvenContext | None
         """
         self.logger: Logger = Logger("ProgramControl")
+        self.estimator: DefrostEstimator = OvenContext.resolve(context, DefrostEstimator)
         self.program: Program | None = None
-        self.thread: threading.Thread | None = None
+        self.thread: threading.Thread | ScheduledTask | None = None
 
     def start(self, program: Program) -> None:
         """
-        Starts the given program in a new thread.
+        Starts the given program in a new thread, or as a task if a scheduler is installed.
 
         :param program: The Program instance to start.
         :return: None
         """
         self.logger.log(f"Starting program: {program.get_name()}", LogLevel.INFO)
         self.program = program
-        self.thread = threading.Thread(target=self.program.start, name="ProgramThread")
-        self.thread.start()
+
+        if Scheduler() is not None:
+            self.program.start()
+            self.thread = self.program.task
+        else:
+            self.thread = Clock().spawn(self.program.start, "ProgramThread")
 
     def pause(self) -> None:
         """
@@ -77,7 +93,7 @@ class ProgramController:
         self.program.stop()
 
         if self.thread:
-            self.thread.join()
+            Clock().join(self.thread)
 
     def emergency_stop(self) -> None:
         """
@@ -89,7 +105,7 @@ class ProgramController:
         self.program.emergency_stop()
 
         if self.thread:
-            self.thread.join()
+            Clock().join(self.thread)
 
     def is_running(self) -> bool:
         """
@@ -135,10 +151,18 @@ class ProgramController:
 
         return self.program.get_name()
 
-    def get_state_tuple(self) -> tuple[str, bool, bool, bool]:
+    def get_eta(self) -> float | None:
+        """
+        Gets the estimated remaining time of the current program.
+
+        :return: The remaining time in seconds, or None if no estimate is available for the program.
+        """
+        return self.estimator.eta(self.program)
+
+    def get_state_tuple(self) -> tuple[str, bool, bool, bool, float | None]:
         """
         Returns a tuple representing the current program state.
 
-        :return: Tuple of (program name, is running, is finished, is paused).
+        :return: Tuple of (program name, is running, is finished, is paused, estimated remaining seconds).
         """
-        return self.get_running_program(), self.is_running(), self.is_finished(), self.is_paused()
+        return self.get_running_program(), self.is_running(), self.is_finished(), self.is_paused(), self.get_eta()
@@ -0,0 +1,73 @@
+class ProgramInfo:
+    """
+    Metadata of a program, available without importing the module of the program.
+
+    :ivar key: The unique identifier the program is selected by.
+    :ivar name: The display name of the program.
+    :ivar target: The location of the program class as "module:Class".
+    :ivar parameters: The adjustable parameters of the program with their default values.
+    :ivar expected_duration_in_seconds: The typical run time of the program, or None if unknown.
+    :ivar recipe: The path of the recipe file the program executes, or None for a program class.
+    """
+
+    def __init__(self, key: str, name: str, target: str, parameters: dict[str, object] | None = None,
+                 expected_duration_in_seconds: float | None = None, recipe: str | None = None) -> None:
+        """
+        Initialize the ProgramInfo.
+
+        :param key: The unique identifier the program is selected by.
+        :type key: str
+        :param name: The display name of the program.
+        :type name: str
+        :param target: The location of the program class as "module:Class".
+        :type target: str
+        :param parameters: The adjustable parameters with their default values. Defaults to none.
+        :type parameters: dict[str, object] | None
+        :param expected_duration_in_seconds: The typical run time of the program, or None if unknown.
+            Defaults to None.
+        :type expected_duration_in_seconds: float | None
+        :param recipe: The path of the recipe file the program executes, or None for a program class.
+            Defaults to None.
+        :type recipe: str | None
+        :return: None
+        :raises ValueError: If the target is not of the form "module:Class".
+        """
+        module, _, attribute = target.partition(":")
+        if not module or not attribute:
+            raise ValueError(f"Program target must be of the form 'module:Class', got '{target}'")
+
+        self.key: str = key
+        self.name: str = name
+        self.target: str = target
+        self.parameters: dict[str, object] = dict(parameters or {})
+        self.expected_duration_in_seconds: float | None = expected_duration_in_seconds
+        self.recipe: str | None = recipe
+
+    def to_dict(self) -> dict[str, object]:
+        """
+        Convert the metadata to a JSON-compatible dict.
+
+        :return: The metadata.
+        :rtype: dict[str, object]
+        """
+        return {
+            "key": self.key,
+            "name": self.name,
+            "target": self.target,
+            "parameters": self.parameters,
+            "expected_duration_in_seconds": self.expected_duration_in_seconds,
+            "recipe": self.recipe,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, object]) -> "ProgramInfo":
+        """
+        Create the metadata from a dict written by `to_dict`.
+
+        :param data: The stored metadata.
+        :type data: dict[str, object]
+        :return: The metadata.
+        :rtype: ProgramInfo
+        """
+        return cls(str(data["key"]), str(data["name"]), str(data["target"]), dict(data.get("parameters") or {}),
+                   data.get("expected_duration_in_seconds"), data.get("recipe"))
@@ -0,0 +1,268 @@
+"""
+ProgramRegistry module providing the programs an oven can run.
+
+This module defines the ProgramRegistry class, which lists the available programs from their
+metadata alone and imports the module of a program only when it is first selected.
+"""
+
+import glob
+import importlib
+import importlib.metadata
+import json
+import os
+import threading
+from typing import TYPE_CHECKING
+
+from src.helper.Logger import Logger
+from src.helper.OvenContext import OvenContext
+from src.helper.config import PROGRAM_METADATA_CACHE_PATH, PROGRAM_RECIPE_DIRECTORY
+from src.helper.logging.LogLevel import LogLevel
+from src.program.ProgramInfo import ProgramInfo
+from src.program.recipe.Recipe import Recipe
+from src.program.recipe.StepTable import StepTable
+
+if TYPE_CHECKING:
+    from src.program.Program import Program
+
+
+class ProgramRegistry:
+    """
+    Registry of all programs in the process, by key.
+
+    Programs are known by their metadata: the built-in programs, the recipes in the built-in and the configured
+    recipe directory, and the plugins installed under the `ENTRY_POINT_GROUP` entry point group, pointing to
+    "module:Class". Recipes are compiled into step tables once, when they are discovered.
+
+    The metadata of a plugin is read from its class once and kept in a cache file, so later processes list the
+    programs without importing any of them. A program module is imported the first time the program is created,
+    and the class is kept for all ovens.
+    """
+
+    ENTRY_POINT_GROUP: str = "microwave.programs"
+    """str: The entry point group program plugins are installed under."""
+
+    BUILTIN_PROGRAMS: list[ProgramInfo] = [
+        ProgramInfo("defrosting", "Defrosting Program", "src.program.DefrostingProgram:DefrostingProgram"),
+        ProgramInfo("predictive_defrosting", "Predictive Defrosting Program",
+                    "src.program.PredictiveDefrostingProgram:PredictiveDefrostingProgram"),
+    ]
+    """list[ProgramInfo]: The programs shipped with the application."""
+
+    BUILTIN_RECIPE_DIRECTORY: str = os.path.join(os.path.dirname(__file__), "recipes")
+    """str: The directory of the recipes shipped with the application."""
+
+    RECIPE_TARGET: str = "src.program.RecipeProgram:RecipeProgram"
+    """str: The program class executing recipes."""
+
+    _programs: dict[str, ProgramInfo] = {}
+    _classes: dict[str, type["Program"]] = {}
+    _tables: dict[str, StepTable] = {}
+    _discovered: bool = False
+    _lock: threading.RLock = threading.RLock()
+    _logger: Logger = Logger("ProgramRegistry")
+
+    @classmethod
+    def register(cls, info: ProgramInfo) -> None:
+        """
+        Register a program, replacing a program registered under the same key.
+
+        :param info: The metadata of the program.
+        :type info: ProgramInfo
+        :return: None
+        """
+        with cls._lock:
+            cls._programs[info.key] = info
+            cls._classes.pop(info.key, None)
+            cls._tables.pop(info.key, None)
+
+    @classmethod
+    def register_recipe(cls, path: str) -> ProgramInfo:
+        """
+        Read, compile and register a recipe, replacing a program registered under the same key.
+
+        :param path: The path of the recipe file.
+        :type path: str
+        :return: The metadata of the recipe program.
+        :rtype: ProgramInfo
+        :raises ValueError: If the file is not a valid recipe.
+        """
+        table: StepTable = StepTable(Recipe.load(path))
+        info: ProgramInfo = ProgramInfo(table.key, table.name, cls.RECIPE_TARGET,
+                                        expected_duration_in_seconds=table.duration_in_seconds(), recipe=path)
+
+        with cls._lock:
+            cls.register(info)
+            cls._tables[info.key] = table
+
+        return info
+
+    @classmethod
+    def programs(cls) -> list[ProgramInfo]:
+        """
+        Retrieve the metadata of all programs, e.g. to show a program menu, without importing any program.
+
+        :return: The metadata of every registered program.
+        :rtype: list[ProgramInfo]
+        """
+        cls.discover()
+        return list(cls._programs.values())
+
+    @classmethod
+    def info(cls, key: str) -> ProgramInfo:
+        """
+        Retrieve the metadata of a program.
+
+        :param key: The key of the program.
+        :type key: str
+        :return: The metadata of the program.
+        :rtype: ProgramInfo
+        :raises ValueError: If no program is registered under the key.
+        """
+        cls.discover()
+        info: ProgramInfo | None = cls._programs.get(key)
+
+        if info is None:
+            raise ValueError(f"Unknown program '{key}'")
+        return info
+
+    @classmethod
+    def load(cls, key: str) -> type["Program"]:
+        """
+        Retrieve the class of a program, importing its module on first access.
+
+        :param key: The key of the program.
+        :type key: str
+        :return: The program class.
+        :rtype: type[Program]
+        :raises ValueError: If no program is registered under the key.
+        """
+        program_class: type[Program] | None = cls._classes.get(key)
+        if program_class is not None:
+            return program_class
+
+        with cls._lock:
+            info: ProgramInfo = cls.info(key)
+            program_class = cls._classes.get(key)
+
+            if program_class is None:
+                module, _, attribute = info.target.partition(":")
+                cls._logger.log(lambda: f"Loading program '{key}' from {info.target}", LogLevel.DEBUG)
+                program_class = getattr(importlib.import_module(module), attribute)
+                cls._classes[key] = program_class
+
+            return program_class
+
+    @classmethod
+    def create(cls, key: str, context: OvenContext | None = None) -> "Program":
+        """
+        Create a new instance of a program. Recipe programs are created with their compiled step table.
+
+        The program keeps the key it was created by, so it can be created again, e.g. when restoring a checkpoint.
+
+        :param key: The key of the program.
+        :type key: str
+        :param context: The oven context the program runs in, or None for the singletons.
+        :type context: OvenContext | None
+        :return: The new program.
+        :rtype: Program
+        :raises ValueError: If no program is registered under the key or its recipe is invalid.
+        """
+        info: ProgramInfo = cls.info(key)
+        if info.recipe is None:
+            program: Program = cls.load(key)(context)
+        else:
+            table: StepTable | None = cls._tables.get(key)
+            if table is None:
+                table = cls._tables.setdefault(key, StepTable(Recipe.load(info.recipe)))
+            program = cls.load(key)(context, table)
+
+        program.key = key
+        return program
+
+    @classmethod
+    def discover(cls) -> None:
+        """
+        Register the built-in programs, the recipes and the installed program plugins, once per process.
+
+        Recipes and plugins that fail to load are skipped with a warning.
+
+        :return: None
+        """
+        if cls._discovered:
+            return
+
+        with cls._lock:
+            if cls._discovered:
+                return
+
+            for info in cls.BUILTIN_PROGRAMS:
+                cls._programs.setdefault(info.key, info)
+
+            for directory in [cls.BUILTIN_RECIPE_DIRECTORY, PROGRAM_RECIPE_DIRECTORY]:
+                for path in sorted(glob.glob(os.path.join(directory, "*.json"))
+                                   + glob.glob(os.path.join(directory, "*.toml"))):
+                    try:
+                        cls.register_recipe(path)
+                    except (OSError, ValueError) as exception:
+                        cls._logger.log(f"Skipping recipe {path}: {exception}", LogLevel.WARNING)
+
+            cache: dict[str, dict[str, object]] = cls._read_cache()
+            changed: bool = False
+
+            for entry_point in importlib.metadata.entry_points(group=cls.ENTRY_POINT_GROUP):
+                version: str = entry_point.dist.version if entry_point.dist is not None else ""
+                cache_key: str = f"{entry_point.name}={entry_point.value}@{version}"
+                data: dict[str, object] | None = cache.get(cache_key)
+
+                if data is not None:
+                    cls._programs.setdefault(entry_point.name, ProgramInfo.from_dict(data))
+                    continue
+
+                try:
+                    program_class: type[Program] = entry_point.load()
+                except Exception as exception:
+                    cls._logger.log(f"Skipping program plugin {entry_point.value}: {exception}", LogLevel.WARNING)
+                    continue
+
+                info = ProgramInfo(entry_point.name, program_class.display_name, entry_point.value,
+                                   program_class.parameters, program_class.expected_duration_in_seconds)
+                cls._programs.setdefault(info.key, info)
+                cls._classes.setdefault(info.key, program_class)
+                cache[cache_key] = info.to_dict()
+                changed = True
+
+            if changed:
+                cls._write_cache(cache)
+
+            cls._discovered = True
+
+    @classmethod
+    def _read_cache(cls) -> dict[str, dict[str, object]]:
+        """
+        Read the cached metadata of the program plugins.
+
+        :return: The metadata by entry point and version, empty if there is no readable cache.
+        :rtype: dict[str, dict[str, object]]
+        """
+        try:
+            with open(PROGRAM_METADATA_CACHE_PATH, encoding="utf-8") as file:
+                cache: object = json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+        return cache if isinstance(cache, dict) else {}
+
+    @classmethod
+    def _write_cache(cls, cache: dict[str, dict[str, object]]) -> None:
+        """
+        Write the metadata of the program plugins to the cache file.
+
+        :param cache: The metadata by entry point and version.
+        :type cache: dict[str, dict[str, object]]
+        :return: None
+        """
+        try:
+            with open(PROGRAM_METADATA_CACHE_PATH, "w", encoding="utf-8") as file:
+                json.dump(cache, file, indent=2)
+        except OSError as exception:
+            cls._logger.log(f"Could not write program metadata cache: {exception}", LogLevel.WARNING)
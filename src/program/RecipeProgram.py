@@ -0,0 +1,94 @@
+from src.helper.OvenContext import OvenContext
+from src.helper.logging.LogLevel import LogLevel
+from src.program.Program import Program
+from src.program.recipe.StepTable import StepTable
+
+
+class RecipeProgram(Program):
+    """
+    Program executing a recipe compiled into a step table.
+
+    The actuator settings of a step are applied once when the step is entered. Every tick only checks the exit
+    condition of the current step, so the work per tick does not depend on the size of the recipe.
+
+    :ivar name: Name of the program, the name of the recipe.
+    :ivar table: The compiled recipe.
+    :ivar step: The index of the current step.
+    :ivar ticks: The number of ticks spent in the current step.
+    :ivar remaining: The jumps left per step.
+    """
+
+    display_name: str = "Recipe Program"
+
+    def __init__(self, context: OvenContext | None, table: StepTable) -> None:
+        """
+        Initialize the RecipeProgram.
+
+        :param context: The oven context to resolve dependencies from, or None for the singletons.
+        :type context: OvenContext | None
+        :param table: The compiled recipe to execute.
+        :type table: StepTable
+        :return: None
+        """
+        super().__init__(context)
+
+        self.name: str = table.name
+        self.table: StepTable = table
+        self.step: int = 0
+        self.ticks: int = 0
+        self.remaining: list[int] = list(table.repeats)
+
+    def enter(self, step: int) -> None:
+        """
+        Enter a step, applying its actuator settings.
+
+        :param step: The index of the step.
+        :type step: int
+        :return: None
+        """
+        self.logger.log(lambda: f"{self.name}: entering phase {self.table.names[step]}", LogLevel.INFO)
+        self.step = step
+        self.ticks = 0
+
+        self.magnetron.set_target_power_share(self.table.power_shares[step])
+        self.turntable.set_speed(self.table.turntable_speeds[step])
+        self.reflector.set_angle(self.table.reflector_angles[step])
+
+    def control_components(self) -> None:
+        """
+        Check the exit condition of the current step and move on to the following step once it is met.
+
+        :return: None
+        """
+        table: StepTable = self.table
+        step: int = self.step
+        condition: int = table.conditions[step]
+        self.ticks += 1
+
+        if condition == StepTable.DURATION:
+            done: bool = self.ticks >= table.thresholds[step]
+        else:
+            inner_temp: float = (self.sensors.inner_temp1() + self.sensors.inner_temp2()) / 2
+            done = inner_temp > table.thresholds[step] if condition == StepTable.ABOVE \
+                else inner_temp < table.thresholds[step]
+
+        if not done:
+            return
+
+        step = table.advance(step, self.remaining)
+        if step < len(table):
+            self.enter(step)
+        else:
+            self.magnetron.set_target_power_share(0.0)
+            self.logger.log(f"Finished {self.name}", LogLevel.INFO)
+            self.finished = True
+
+    def start(self) -> None:
+        """
+        Start the recipe program at its first step.
+
+        :return: None
+        """
+        self.enter(0)
+
+        super().start()
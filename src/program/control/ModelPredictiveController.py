@@ -0,0 +1,185 @@
+import numpy as np
+
+from src.components.magnetron.MagnetronRingbuffer import MagnetronRingbuffer
+from src.helper.Settings import Settings
+from src.helper.config import (AMBIENT_TEMPERATURE_IN_CELSIUS, PROGRAM_PREDICTIVE_HORIZON_IN_SECONDS,
+                               PROGRAM_PREDICTIVE_POWER_LEVELS, PROGRAM_PREDICTIVE_TEMP_MARGIN_IN_CELSIUS)
+from src.helper.configuration.RuntimeConfig import RuntimeConfig
+from src.program.control.ThermalModel import ThermalModel
+
+
+class ModelPredictiveController:
+    """
+    Plans the magnetron power share over a receding horizon using fitted thermal models.
+
+    The rate of the inner temperature is modelled from the magnetron state, the rate of the magnetron temperature
+    additionally from the cooling fan power share. On every plan, each power level is held over the horizon and
+    rejected if the predicted magnetron temperature or the predicted power share of the last minute would exceed
+    the limits of the magnetron, which are read from the runtime settings on every plan. The feasible level
+    reaching the target temperature soonest is applied until the next plan.
+
+    :ivar inner_model: The fitted model of the inner temperature rate.
+    :ivar magnetron_model: The fitted model of the magnetron temperature rate.
+    :ivar levels: The power levels considered.
+    :ivar horizon_in_seconds: The time the levels are held for when predicting.
+    :ivar temp_margin: The distance to the magnetron temperature limit kept when planning.
+    :ivar last: The last observation, or None before the first one.
+    :ivar settings: The runtime settings the limits of the magnetron are read from.
+    """
+
+    INNER_PRIOR: list[float] = [10.0, -2.0]
+    """list[float]: Inner temperature rate in °C/s with the magnetron on and off, before fitting."""
+
+    MAGNETRON_PRIOR: list[float] = [30.0, -5.0, -40.0]
+    """list[float]: Magnetron temperature rate in °C/s with the magnetron on, off and per fan power share."""
+
+    CLAMP_MARGIN_IN_CELSIUS: float = 0.5
+    """float: Temperatures this close to the ambient temperature are not fitted, since they cannot fall further."""
+
+    def __init__(self, levels: int = PROGRAM_PREDICTIVE_POWER_LEVELS,
+                 horizon_in_seconds: float = PROGRAM_PREDICTIVE_HORIZON_IN_SECONDS,
+                 temp_margin: float = PROGRAM_PREDICTIVE_TEMP_MARGIN_IN_CELSIUS) -> None:
+        """
+        Initialize the ModelPredictiveController.
+
+        :param levels: The number of steps the power share range is divided into.
+        :type levels: int
+        :param horizon_in_seconds: The time the levels are held for when predicting.
+        :type horizon_in_seconds: float
+        :param temp_margin: The distance to the magnetron temperature limit kept when planning.
+        :type temp_margin: float
+        :raises ValueError: If the number of levels or the horizon is not positive.
+        :return: None
+        """
+        if levels <= 0:
+            raise ValueError("Number of power levels must be positive")
+        if horizon_in_seconds <= 0:
+            raise ValueError("Horizon must be positive")
+
+        self.inner_model: ThermalModel = ThermalModel(self.INNER_PRIOR)
+        self.magnetron_model: ThermalModel = ThermalModel(self.MAGNETRON_PRIOR)
+        self.levels: np.ndarray = np.linspace(0.0, 1.0, levels + 1)
+        self.horizon_in_seconds: float = horizon_in_seconds
+        self.temp_margin: float = temp_margin
+        self.last: tuple[float, float, float, bool, float] | None = None
+        self.settings: RuntimeConfig = Settings()
+
+    def observe(self, time: float, inner_temp: float, magnetron_temp: float, active: bool, fan_share: float) -> None:
+        """
+        Fit the models to the change since the last observation.
+
+        The change is attributed to the magnetron state and fan power share of the last observation.
+
+        :param time: The monotonic time of the observation in seconds.
+        :type time: float
+        :param inner_temp: The mean inner temperature.
+        :type inner_temp: float
+        :param magnetron_temp: The magnetron temperature.
+        :type magnetron_temp: float
+        :param active: Whether the magnetron is active.
+        :type active: bool
+        :param fan_share: The power share of the cooling fan.
+        :type fan_share: float
+        :return: None
+        """
+        if self.last is not None:
+            last_time, last_inner, last_magnetron, last_active, last_fan = self.last
+            elapsed: float = time - last_time
+
+            if elapsed > 0:
+                on: float = float(last_active)
+                floor: float = AMBIENT_TEMPERATURE_IN_CELSIUS + self.CLAMP_MARGIN_IN_CELSIUS
+
+                if last_inner > floor and inner_temp > floor:
+                    self.inner_model.update([on, 1 - on], (inner_temp - last_inner) / elapsed)
+                if last_magnetron > floor and magnetron_temp > floor:
+                    self.magnetron_model.update([on, 1 - on, last_fan], (magnetron_temp - last_magnetron) / elapsed)
+
+        self.last = (time, inner_temp, magnetron_temp, active, fan_share)
+
+    def snapshot(self) -> dict[str, object]:
+        """
+        Capture the fitted models and the last observation, e.g. for a checkpoint.
+
+        :return: The fits of the models and the last observation.
+        :rtype: dict[str, object]
+        """
+        return {"inner_model": self.inner_model.snapshot(), "magnetron_model": self.magnetron_model.snapshot(),
+                "last": self.last}
+
+    def restore(self, state: dict[str, object]) -> None:
+        """
+        Continue from a state captured by `snapshot`.
+
+        :param state: The fits of the models and the last observation.
+        :type state: dict[str, object]
+        :return: None
+        """
+        self.inner_model.restore(state["inner_model"])
+        self.magnetron_model.restore(state["magnetron_model"])
+        self.last = tuple(state["last"]) if state["last"] is not None else None
+
+    def window_shares(self, history: MagnetronRingbuffer, cycles: int) -> np.ndarray:
+        """
+        Predict the power share of the power history after each of the next magnetron cycles for each level.
+
+        Once the history is full, the oldest recorded cycles leave the window as the planned ones enter it.
+
+        :param history: The recorded magnetron cycles.
+        :type history: MagnetronRingbuffer
+        :param cycles: The number of cycles to predict.
+        :type cycles: int
+        :return: The predicted power shares with one row per level and one column per cycle.
+        :rtype: np.ndarray
+        """
+        older, newer = history.segments()
+        recorded: np.ndarray = np.frombuffer(bytes(older) + bytes(newer), dtype=np.uint8)
+        dropped: np.ndarray = np.concatenate(([0], np.cumsum(recorded)))
+
+        steps: np.ndarray = np.arange(1, cycles + 1)
+        overflow: np.ndarray = np.clip(history.filled + steps - history.size, 0, history.filled)
+        filled: np.ndarray = np.minimum(history.filled + steps, history.size)
+
+        return (history.powered + np.outer(self.levels, steps) - dropped[overflow]) / filled
+
+    def plan(self, inner_temp: float, target_temp: float, magnetron_temp: float, fan_share: float,
+             history: MagnetronRingbuffer) -> float:
+        """
+        Choose the power share to apply until the next plan.
+
+        :param inner_temp: The mean inner temperature.
+        :type inner_temp: float
+        :param target_temp: The inner temperature to reach.
+        :type target_temp: float
+        :param magnetron_temp: The magnetron temperature.
+        :type magnetron_temp: float
+        :param fan_share: The power share of the cooling fan, assumed to be held over the horizon.
+        :type fan_share: float
+        :param history: The recorded magnetron cycles.
+        :type history: MagnetronRingbuffer
+        :return: The planned power share, 0 if the target is reached or no level is feasible.
+        :rtype: float
+        """
+        if inner_temp >= target_temp:
+            return 0.0
+
+        levels: np.ndarray = self.levels
+        inner_rates: np.ndarray = self.inner_model.predict(np.column_stack((levels, 1 - levels)))
+        magnetron_rates: np.ndarray = self.magnetron_model.predict(
+            np.column_stack((levels, 1 - levels, np.full_like(levels, fan_share))))
+
+        peak: np.ndarray = magnetron_temp + np.maximum(magnetron_rates * self.horizon_in_seconds, 0)
+        feasible: np.ndarray = ((peak <= self.settings.MAGNETRON_MAX_TEMP_IN_CELSIUS - self.temp_margin)
+                                | (magnetron_rates <= 0))
+
+        cycles: int = max(1, round(self.horizon_in_seconds / self.settings.MAGNETRON_ON_OFF_INTERVAL_IN_SECONDS))
+        feasible &= (self.window_shares(history, cycles).max(axis=1)
+                     <= self.settings.MAGNETRON_MAX_POWER_SHARE_PER_MINUTE + 1e-9)
+        feasible &= inner_rates > 0
+
+        if not feasible.any():
+            return 0.0
+
+        durations: np.ndarray = np.where(feasible, (target_temp - inner_temp) / np.where(feasible, inner_rates, 1),
+                                         np.inf)
+        return round(float(levels[int(np.argmin(durations))]), 6)
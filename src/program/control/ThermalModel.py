@@ -0,0 +1,101 @@
+import numpy as np
+
+
+class ThermalModel:
+    """
+    A linear model of a temperature rate, fitted online by exponentially weighted least squares.
+
+    The rate in degrees Celsius per second is modelled as the dot product of a feature vector and the
+    coefficients. The normal equations are accumulated per observation and solved on demand, starting from
+    prior coefficients that weigh as much as a number of observations.
+
+    :ivar gram: The weighted sum of the outer products of the observed features.
+    :ivar moment: The weighted sum of the observed features scaled by the observed rates.
+    :ivar forgetting: The factor older observations are discounted by on every new observation.
+    :ivar observations: The number of observations the model was fitted to.
+    """
+
+    def __init__(self, prior: list[float], prior_weight: float = 10.0, forgetting: float = 0.999) -> None:
+        """
+        Initialize the ThermalModel with prior coefficients.
+
+        :param prior: The coefficients assumed before any observation.
+        :type prior: list[float]
+        :param prior_weight: The number of observations the prior is worth. Defaults to 10.
+        :type prior_weight: float
+        :param forgetting: The discount factor of older observations, 1 to never forget. Defaults to 0.999.
+        :type forgetting: float
+        :raises ValueError: If the prior is empty, its weight not positive or the discount factor not in (0, 1].
+        :return: None
+        """
+        if not prior:
+            raise ValueError("Prior must contain at least one coefficient")
+        if prior_weight <= 0:
+            raise ValueError("Prior weight must be positive")
+        if not 0 < forgetting <= 1:
+            raise ValueError("Forgetting factor must be in (0, 1]")
+
+        self.gram: np.ndarray = np.eye(len(prior)) * prior_weight
+        self.moment: np.ndarray = np.asarray(prior, dtype=float) * prior_weight
+        self.forgetting: float = forgetting
+        self.observations: int = 0
+
+    def update(self, features: list[float], rate: float) -> None:
+        """
+        Add an observed rate to the fit.
+
+        :param features: The features the rate was observed with.
+        :type features: list[float]
+        :param rate: The observed rate in degrees Celsius per second.
+        :type rate: float
+        :return: None
+        """
+        vector: np.ndarray = np.asarray(features, dtype=float)
+        self.gram = self.forgetting * self.gram + np.outer(vector, vector)
+        self.moment = self.forgetting * self.moment + vector * rate
+        self.observations += 1
+
+    def snapshot(self) -> dict[str, object]:
+        """
+        Capture the fit, e.g. for a checkpoint.
+
+        :return: The accumulated normal equations and the number of observations.
+        :rtype: dict[str, object]
+        """
+        return {"gram": self.gram.copy(), "moment": self.moment.copy(), "observations": self.observations}
+
+    def restore(self, state: dict[str, object]) -> None:
+        """
+        Continue the fit from a state captured by `snapshot`.
+
+        :param state: The accumulated normal equations and the number of observations.
+        :type state: dict[str, object]
+        :raises ValueError: If the captured fit has another number of coefficients.
+        :return: None
+        """
+        if np.shape(state["gram"]) != self.gram.shape or np.shape(state["moment"]) != self.moment.shape:
+            raise ValueError(f"Captured fit has {len(state['moment'])} coefficients, expected {len(self.moment)}")
+
+        self.gram = np.array(state["gram"], dtype=float)
+        self.moment = np.array(state["moment"], dtype=float)
+        self.observations = state["observations"]
+
+    def coefficients(self) -> np.ndarray:
+        """
+        Solve the accumulated normal equations.
+
+        :return: The fitted coefficients.
+        :rtype: np.ndarray
+        """
+        return np.linalg.solve(self.gram, self.moment)
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        """
+        Predict the rates for one or more feature vectors.
+
+        :param features: A feature vector, or a matrix with one feature vector per row.
+        :type features: np.ndarray
+        :return: The predicted rates in degrees Celsius per second.
+        :rtype: np.ndarray
+        """
+        return np.asarray(features, dtype=float) @ self.coefficients()
@@ -0,0 +1,182 @@
+import json
+from bisect import bisect_right
+
+
+class DefrostEstimateTable:
+    """
+    Lookup tables of the duration and energy of a defrosting program, precomputed by simulation.
+
+    The heating tables hold the duration and energy of a complete program per measured weight and starting inner
+    temperature, the cooling table the time the load takes to cool down to the resting threshold per inner
+    temperature. Values between the grid points are interpolated linearly. Weights above the grid are
+    extrapolated, since every additional cycle adds about the same time, other values are clamped to the grid.
+
+    :ivar program: The key of the program the tables were computed for.
+    :ivar weights: The measured weights in grams, ascending.
+    :ivar temperatures: The starting inner temperatures in degrees Celsius, ascending.
+    :ivar durations: The duration in seconds per weight and temperature.
+    :ivar energies: The energy in joules per weight and temperature.
+    :ivar cooling_temperatures: The inner temperatures of the cooling table in degrees Celsius, ascending.
+    :ivar cooling_durations: The time to cool down in seconds per temperature.
+    """
+
+    def __init__(self, program: str, weights: list[float], temperatures: list[float], durations: list[list[float]],
+                 energies: list[list[float]], cooling_temperatures: list[float],
+                 cooling_durations: list[float]) -> None:
+        """
+        Initialize the DefrostEstimateTable.
+
+        :param program: The key of the program the tables were computed for.
+        :type program: str
+        :param weights: The measured weights in grams, ascending.
+        :type weights: list[float]
+        :param temperatures: The starting inner temperatures in degrees Celsius, ascending.
+        :type temperatures: list[float]
+        :param durations: The duration in seconds per weight and temperature.
+        :type durations: list[list[float]]
+        :param energies: The energy in joules per weight and temperature.
+        :type energies: list[list[float]]
+        :param cooling_temperatures: The inner temperatures of the cooling table in degrees Celsius, ascending.
+        :type cooling_temperatures: list[float]
+        :param cooling_durations: The time to cool down in seconds per temperature.
+        :type cooling_durations: list[float]
+        :raises ValueError: If an axis is not strictly ascending with at least two points or a table does not
+            match its axes.
+        :return: None
+        """
+        for axis in (weights, temperatures, cooling_temperatures):
+            if len(axis) < 2 or any(low >= high for low, high in zip(axis, axis[1:])):
+                raise ValueError("Axes must be strictly ascending with at least two points")
+        for table in (durations, energies):
+            if len(table) != len(weights) or any(len(row) != len(temperatures) for row in table):
+                raise ValueError("Tables must have one row per weight and one column per temperature")
+        if len(cooling_durations) != len(cooling_temperatures):
+            raise ValueError("Cooling table must have one duration per temperature")
+
+        self.program: str = program
+        self.weights: tuple[float, ...] = tuple(map(float, weights))
+        self.temperatures: tuple[float, ...] = tuple(map(float, temperatures))
+        self.durations: tuple[tuple[float, ...], ...] = tuple(tuple(map(float, row)) for row in durations)
+        self.energies: tuple[tuple[float, ...], ...] = tuple(tuple(map(float, row)) for row in energies)
+        self.cooling_temperatures: tuple[float, ...] = tuple(map(float, cooling_temperatures))
+        self.cooling_durations: tuple[float, ...] = tuple(map(float, cooling_durations))
+
+    @staticmethod
+    def _locate(axis: tuple[float, ...], value: float, extrapolate: bool) -> tuple[int, float]:
+        """
+        Find the grid cell of a value and its position within the cell.
+
+        :param axis: The ascending grid points.
+        :type axis: tuple[float, ...]
+        :param value: The value to locate.
+        :type value: float
+        :param extrapolate: Whether positions above the grid are kept instead of clamped to its upper edge.
+        :type extrapolate: bool
+        :return: The index of the lower grid point and the position between it and the next one.
+        :rtype: tuple[int, float]
+        """
+        index: int = min(max(bisect_right(axis, value) - 1, 0), len(axis) - 2)
+        fraction: float = (value - axis[index]) / (axis[index + 1] - axis[index])
+        return index, max(fraction, 0.0) if extrapolate else min(max(fraction, 0.0), 1.0)
+
+    def _interpolate(self, table: tuple[tuple[float, ...], ...], weight: float, temperature: float) -> float:
+        """
+        Interpolate a heating table bilinearly.
+
+        :param table: The table to interpolate.
+        :type table: tuple[tuple[float, ...], ...]
+        :param weight: The measured weight in grams.
+        :type weight: float
+        :param temperature: The starting inner temperature in degrees Celsius.
+        :type temperature: float
+        :return: The interpolated value, at least 0.
+        :rtype: float
+        """
+        row, weight_fraction = self._locate(self.weights, weight, True)
+        column, temperature_fraction = self._locate(self.temperatures, temperature, False)
+
+        lower: float = table[row][column] + temperature_fraction * (table[row][column + 1] - table[row][column])
+        upper: float = table[row + 1][column] + temperature_fraction * (
+            table[row + 1][column + 1] - table[row + 1][column])
+        return max(0.0, lower + weight_fraction * (upper - lower))
+
+    def estimate(self, weight: float, temperature: float) -> tuple[float, float]:
+        """
+        Estimate the duration and energy of a complete program.
+
+        :param weight: The measured weight in grams.
+        :type weight: float
+        :param temperature: The starting inner temperature in degrees Celsius.
+        :type temperature: float
+        :return: The duration in seconds and the energy in joules.
+        :rtype: tuple[float, float]
+        """
+        return (self._interpolate(self.durations, weight, temperature),
+                self._interpolate(self.energies, weight, temperature))
+
+    def cooling_duration(self, temperature: float) -> float:
+        """
+        Estimate the time the load takes to cool down to the resting threshold.
+
+        :param temperature: The inner temperature in degrees Celsius.
+        :type temperature: float
+        :return: The duration in seconds.
+        :rtype: float
+        """
+        index, fraction = self._locate(self.cooling_temperatures, temperature, False)
+        durations: tuple[float, ...] = self.cooling_durations
+        return max(0.0, durations[index] + fraction * (durations[index + 1] - durations[index]))
+
+    def to_dict(self) -> dict[str, object]:
+        """
+        Convert the tables into a JSON-serializable dictionary.
+
+        :return: The tables as a dictionary.
+        :rtype: dict[str, object]
+        """
+        return {
+            "program": self.program,
+            "weights": list(self.weights),
+            "temperatures": list(self.temperatures),
+            "durations": [list(row) for row in self.durations],
+            "energies": [list(row) for row in self.energies],
+            "cooling_temperatures": list(self.cooling_temperatures),
+            "cooling_durations": list(self.cooling_durations),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, object]) -> "DefrostEstimateTable":
+        """
+        Create the tables from a dictionary created by to_dict.
+
+        :param data: The tables as a dictionary.
+        :type data: dict[str, object]
+        :return: The tables.
+        :rtype: DefrostEstimateTable
+        """
+        return cls(data["program"], data["weights"], data["temperatures"], data["durations"], data["energies"],
+                   data["cooling_temperatures"], data["cooling_durations"])
+
+    def save(self, path: str) -> None:
+        """
+        Write the tables to a JSON file.
+
+        :param path: The file to write.
+        :type path: str
+        :return: None
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> "DefrostEstimateTable":
+        """
+        Read the tables from a JSON file written by save.
+
+        :param path: The file to read.
+        :type path: str
+        :return: The tables.
+        :rtype: DefrostEstimateTable
+        """
+        with open(path, encoding="utf-8") as file:
+            return cls.from_dict(json.load(file))
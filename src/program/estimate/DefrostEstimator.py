@@ -0,0 +1,169 @@
+import os
+from typing import TYPE_CHECKING
+
+from src.helper.Clock import Clock
+from src.helper.Logger import Logger
+from src.helper.OvenContext import OvenContext
+from src.helper.config import AMBIENT_TEMPERATURE_IN_CELSIUS
+from src.helper.logging.LogLevel import LogLevel
+from src.program.Program import Program
+from src.program.ProgramRegistry import ProgramRegistry
+from src.program.estimate.DefrostEstimateTable import DefrostEstimateTable
+
+if TYPE_CHECKING:
+    from src.program.DefrostingProgram import DefrostingProgram
+
+
+class DefrostEstimator:
+    """
+    Singleton service estimating the remaining time and energy of a defrosting program from lookup tables.
+
+    The tables are precomputed offline by a DefrostSweep and loaded on first use. The remaining cycles of a
+    heating program correspond to a fresh program for a weight with that many cycles, a resting program
+    additionally has to cool down first. As the tables are only interpolated when the program enters a new
+    phase, the ETA is counted down in between and costs no lookup per tick.
+    The defrosting program is loaded from the ProgramRegistry when a program is first estimated, so importing the
+    estimator does not import any program.
+
+    :ivar logger: The logger of the service.
+    :ivar table: The loaded lookup tables, or None if not loaded yet.
+    :ivar phase: The program and phase the cached ETA was estimated for, or None.
+    :ivar estimated_eta: The ETA in seconds estimated when the phase was entered.
+    :ivar estimated_at: The monotonic time the cached ETA was estimated at.
+    """
+
+    _instance: 'DefrostEstimator' = None
+
+    PROGRAM_KEY: str = "defrosting"
+    """str: The key of the program the lookup tables are computed for."""
+
+    BUILTIN_TABLE_PATH: str = os.path.join(os.path.dirname(__file__), "defrost_estimates.json")
+    """str: The lookup tables shipped with the application."""
+
+    def __new__(cls, context: OvenContext | None = None) -> 'DefrostEstimator':
+        """
+        Ensures only one instance of DefrostEstimator exists (Singleton pattern).
+
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
+        :return: The singleton instance of DefrostEstimator.
+        """
+        if context is not None:
+            return super(DefrostEstimator, cls).__new__(cls)
+
+        if cls._instance is None:
+            cls._instance = super(DefrostEstimator, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self, context: OvenContext | None = None) -> None:
+        """
+        Initializes the DefrostEstimator without loading the tables.
+
+        :param context: The oven context the instance belongs to (unused).
+        :type context: OvenContext | None
+        """
+        self.logger: Logger = Logger("DefrostEstimator")
+        self.table: DefrostEstimateTable | None = None
+        self.phase: tuple[int, int, bool, bool] | None = None
+        self.estimated_eta: float | None = None
+        self.estimated_at: float = 0.0
+
+    def program_class(self) -> type["DefrostingProgram"]:
+        """
+        Returns the class of the estimated program, loading its module on first use.
+
+        :return: The class of the defrosting program.
+        """
+        return ProgramRegistry.load(self.PROGRAM_KEY)
+
+    def load(self, path: str | None = None) -> DefrostEstimateTable | None:
+        """
+        Loads the lookup tables, unless already loaded.
+
+        :param path: The file to load, or None for the tables shipped with the application. Defaults to None.
+        :type path: str | None
+        :return: The lookup tables, or None if they cannot be read.
+        """
+        if self.table is None:
+            try:
+                self.table = DefrostEstimateTable.load(path or self.BUILTIN_TABLE_PATH)
+            except (OSError, ValueError, KeyError) as exception:
+                self.logger.log(f"Cannot load defrost estimates: {exception}", LogLevel.WARNING)
+                return None
+
+        return self.table
+
+    def estimate(self, weight: float, temperature: float) -> tuple[float, float] | None:
+        """
+        Estimates the duration and energy of a defrosting program that has not been started yet.
+
+        :param weight: The measured weight in grams.
+        :type weight: float
+        :param temperature: The inner temperature in degrees Celsius.
+        :type temperature: float
+        :return: The duration in seconds and the energy in joules, or None without lookup tables.
+        """
+        table: DefrostEstimateTable | None = self.load()
+        if table is None:
+            return None
+
+        defrosting: type["DefrostingProgram"] = self.program_class()
+        cycles: int = defrosting.cycles_for_weight(weight)
+        return table.estimate(defrosting.weight_for_cycles(cycles), temperature)
+
+    def remaining(self, program: Program) -> tuple[float, float] | None:
+        """
+        Estimates the remaining duration and energy of a program from its current state.
+
+        :param program: The program to estimate.
+        :type program: Program
+        :return: The duration in seconds and the energy in joules, or None if the program is no defrosting
+            program or there are no lookup tables.
+        """
+        defrosting: type["DefrostingProgram"] = self.program_class()
+        if type(program) is not defrosting:
+            return None
+        if program.finished:
+            return 0.0, 0.0
+
+        table: DefrostEstimateTable | None = self.load()
+        if table is None:
+            return None
+
+        weight: float = defrosting.weight_for_cycles(max(1, program.cycles))
+        temperature: float = (program.sensors.inner_temp1() + program.sensors.inner_temp2()) / 2
+
+        if not program.just_updated:
+            return table.estimate(weight, temperature)
+
+        resting: float = table.cooling_duration(temperature)
+        duration, energy = table.estimate(weight,
+                                          AMBIENT_TEMPERATURE_IN_CELSIUS + defrosting.RESTING_MARGIN_IN_CELSIUS)
+        return resting + duration, energy
+
+    def eta(self, program: Program | None) -> float | None:
+        """
+        Returns the remaining time of a program, estimating it only when the program enters a new phase.
+
+        While the program is paused, the ETA is not counted down.
+
+        :param program: The program to estimate, or None if no program is running.
+        :type program: Program | None
+        :return: The remaining time in seconds, or None if it cannot be estimated.
+        """
+        if program is None or type(program) is not self.program_class():
+            return None
+
+        phase: tuple[int, int, bool, bool] = (id(program), program.cycles, program.just_updated, program.paused)
+        now: float = Clock().monotonic()
+
+        if phase != self.phase:
+            remaining: tuple[float, float] | None = self.remaining(program)
+            self.phase = phase
+            self.estimated_eta = remaining[0] if remaining is not None else None
+            self.estimated_at = now
+
+        if self.estimated_eta is None or program.paused or program.finished:
+            return 0.0 if program.finished else self.estimated_eta
+
+        return max(0.0, self.estimated_eta - (now - self.estimated_at))
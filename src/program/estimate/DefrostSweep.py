@@ -0,0 +1,188 @@
+from src.SystemControl import SystemControl
+from src.components.magnetron.Magnetron import Magnetron
+from src.components.sensor.SensorManager import SensorManager
+from src.components.sensor.SimulationSensorTemp1 import SimulationSensorTemp1
+from src.components.sensor.SimulationSensorTemp2 import SimulationSensorTemp2
+from src.components.sensor.SimulationSensorWeight import SimulationSensorWeight
+from src.helper.Action import Action
+from src.helper.Clock import Clock
+from src.helper.OvenContext import OvenContext
+from src.helper.Scheduler import Scheduler
+from src.helper.clock.VirtualClock import VirtualClock
+from src.helper.config import MAIN_LOOP_TIMEOUT_IN_SECONDS, MAGNETRON_POWER_IN_WATTS, AMBIENT_TEMPERATURE_IN_CELSIUS
+from src.helper.noise.NoiseSource import NoiseSource
+from src.helper.scheduling.TickScheduler import TickScheduler
+from src.program.DefrostingProgram import DefrostingProgram
+from src.program.ProgramController import ProgramController
+from src.program.estimate.DefrostEstimateTable import DefrostEstimateTable
+from src.user.InputDetector import InputDetector
+from src.user.ScriptedInputDetector import ScriptedInputDetector
+from src.user.UserInteractionHandler import UserInteractionHandler
+
+
+class DefrostSweep:
+    """
+    Precomputes the lookup tables of a defrosting program by simulating it across weights and temperatures.
+
+    Every grid point runs the complete system of an oven of its own in simulated time, so a sweep takes a
+    fraction of the time the programs would take on a real oven. All ovens use a seeded noise source.
+
+    :ivar program: The key of the simulated program.
+    """
+
+    SEED: int = 0
+    """int: The seed of the noise source of every simulated oven."""
+
+    TIMEOUT_IN_SECONDS: float = 36000.0
+    """float: The simulated time after which a program is aborted."""
+
+    WEIGHTS: list[float] = [DefrostingProgram.weight_for_cycles(cycles) for cycles in range(1, 11)]
+    """list[float]: The default weights in grams, one per number of cycles."""
+
+    TEMPERATURES: list[float] = [float(temperature) for temperature in range(22, 60, 4)]
+    """list[float]: The default starting inner temperatures in degrees Celsius."""
+
+    COOLING_TEMPERATURES: list[float] = [float(temperature) for temperature in range(27, 68, 5)]
+    """list[float]: The default inner temperatures of the cooling table in degrees Celsius."""
+
+    def __init__(self, program: str = "defrosting") -> None:
+        """
+        Initialize the DefrostSweep.
+
+        :param program: The key of the program to simulate. Defaults to the defrosting program.
+        :type program: str
+        :return: None
+        """
+        self.program: str = program
+
+    def oven(self, weight: float, temperature: float) -> OvenContext:
+        """
+        Create an oven loaded with the given weight at the given inner temperature, starting the program.
+
+        :param weight: The measured weight in grams.
+        :type weight: float
+        :param temperature: The inner temperature in degrees Celsius.
+        :type temperature: float
+        :return: The context of the oven.
+        :rtype: OvenContext
+        """
+        context: OvenContext = OvenContext("Sweep")
+        context.register(InputDetector, ScriptedInputDetector({0: Action.START}))
+        context.get(NoiseSource).seed(self.SEED)
+        context.get(UserInteractionHandler).selected_program = self.program
+        context.get(SimulationSensorWeight).weight = weight
+        context.get(SimulationSensorTemp1).temperature = temperature
+        context.get(SimulationSensorTemp2).temperature = temperature
+        return context
+
+    def simulate(self, weight: float, temperature: float) -> tuple[float, float]:
+        """
+        Run the program on a loaded oven in simulated time.
+
+        The process-wide clock and scheduler are replaced while the program runs and restored afterwards.
+
+        :param weight: The measured weight in grams.
+        :type weight: float
+        :param temperature: The starting inner temperature in degrees Celsius.
+        :type temperature: float
+        :raises TimeoutError: If the program does not finish within TIMEOUT_IN_SECONDS.
+        :return: The duration in seconds from the start of the program to its end, and the energy in joules.
+        :rtype: tuple[float, float]
+        """
+        return self.simulate_oven(self.oven(weight, temperature))
+
+    def simulate_oven(self, context: OvenContext) -> tuple[float, float]:
+        """
+        Run the program on a prepared oven in simulated time.
+
+        The process-wide clock and scheduler are replaced while the program runs and restored afterwards.
+
+        :param context: The context of the oven, with the program start scripted.
+        :type context: OvenContext
+        :raises TimeoutError: If the program does not finish within TIMEOUT_IN_SECONDS.
+        :return: The duration in seconds from the start of the program to its end, and the energy in joules.
+        :rtype: tuple[float, float]
+        """
+        program_controller: ProgramController = context.get(ProgramController)
+        magnetron: Magnetron = context.get(Magnetron)
+        measured: list[float] = [0.0, 0.0]
+
+        def watch() -> bool:
+            if program_controller.program is None:
+                return True
+            if program_controller.is_finished():
+                Scheduler().stop()
+                return False
+
+            measured[0] += MAIN_LOOP_TIMEOUT_IN_SECONDS
+            measured[1] += MAIN_LOOP_TIMEOUT_IN_SECONDS * MAGNETRON_POWER_IN_WATTS * magnetron.active
+            return True
+
+        def timeout() -> bool:
+            Scheduler().stop()
+            raise TimeoutError(f"Program did not finish within {self.TIMEOUT_IN_SECONDS} s")
+
+        clock, scheduler = Clock(), Scheduler()
+        Clock.use(VirtualClock())
+        Scheduler.use(TickScheduler())
+
+        try:
+            Scheduler().schedule(watch, MAIN_LOOP_TIMEOUT_IN_SECONDS, name="SweepWatch")
+            Scheduler().schedule(timeout, self.TIMEOUT_IN_SECONDS, self.TIMEOUT_IN_SECONDS, "SweepTimeout")
+            context.get(SystemControl).start()
+            Scheduler().run()
+        finally:
+            Clock.use(clock)
+            Scheduler.use(scheduler)
+
+        return measured[0], measured[1]
+
+    def cooling(self, temperature: float) -> float:
+        """
+        Simulate the sensors of an oven with the magnetron switched off until the load has cooled down.
+
+        :param temperature: The starting inner temperature in degrees Celsius.
+        :type temperature: float
+        :return: The time in seconds until the mean inner temperature falls below the resting threshold.
+        :rtype: float
+        """
+        context: OvenContext = self.oven(0.0, temperature)
+        sensors: SensorManager = context.get(SensorManager)
+        threshold: float = AMBIENT_TEMPERATURE_IN_CELSIUS + DefrostingProgram.RESTING_MARGIN_IN_CELSIUS
+        duration: float = 0.0
+
+        while (sensors.inner_temp1() + sensors.inner_temp2()) / 2 >= threshold:
+            sensors.update_sensors()
+            duration += MAIN_LOOP_TIMEOUT_IN_SECONDS
+
+        return duration
+
+    def run(self, weights: list[float] | None = None, temperatures: list[float] | None = None,
+            cooling_temperatures: list[float] | None = None) -> DefrostEstimateTable:
+        """
+        Simulate every grid point and collect the results into lookup tables.
+
+        :param weights: The measured weights in grams, ascending, or None for WEIGHTS. Defaults to None.
+        :type weights: list[float] | None
+        :param temperatures: The starting inner temperatures in degrees Celsius, ascending, or None for
+            TEMPERATURES. Defaults to None.
+        :type temperatures: list[float] | None
+        :param cooling_temperatures: The inner temperatures of the cooling table in degrees Celsius, ascending,
+            or None for COOLING_TEMPERATURES. Defaults to None.
+        :type cooling_temperatures: list[float] | None
+        :return: The lookup tables.
+        :rtype: DefrostEstimateTable
+        """
+        weights = weights or self.WEIGHTS
+        temperatures = temperatures or self.TEMPERATURES
+        cooling_temperatures = cooling_temperatures or self.COOLING_TEMPERATURES
+        durations: list[list[float]] = []
+        energies: list[list[float]] = []
+
+        for weight in weights:
+            results: list[tuple[float, float]] = [self.simulate(weight, temperature) for temperature in temperatures]
+            durations.append([duration for duration, _ in results])
+            energies.append([energy for _, energy in results])
+
+        return DefrostEstimateTable(self.program, weights, temperatures, durations, energies, cooling_temperatures,
+                                    [self.cooling(temperature) for temperature in cooling_temperatures])
@@ -0,0 +1,102 @@
+import json
+import os
+import tomllib
+
+from src.program.recipe.RecipePhase import RecipePhase
+
+
+class Recipe:
+    """
+    Declarative description of a program as a sequence of phases.
+
+    Recipes are read from JSON or TOML files of the form::
+
+        key = "gentle_defrost"
+        name = "Gentle Defrost"
+
+        [[phases]]
+        name = "heat"
+        power_share = 0.3
+        turntable_speed = 2
+        until_temperature_above = 60
+
+    :ivar key: The unique identifier the recipe is selected by.
+    :ivar name: The display name of the recipe.
+    :ivar phases: The phases in the order they run.
+    """
+
+    def __init__(self, key: str, name: str, phases: list[RecipePhase]) -> None:
+        """
+        Initialize and validate the Recipe.
+
+        :param key: The unique identifier the recipe is selected by.
+        :type key: str
+        :param name: The display name of the recipe.
+        :type name: str
+        :param phases: The phases in the order they run.
+        :type phases: list[RecipePhase]
+        :return: None
+        :raises ValueError: If there are no phases, phase names repeat or a phase jumps to an unknown phase.
+        """
+        if not phases:
+            raise ValueError(f"Recipe {key} has no phases")
+
+        names: list[str] = [phase.name for phase in phases]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Recipe {key} has duplicate phase names")
+
+        for phase in phases:
+            if phase.next_phase is not None and phase.next_phase not in names:
+                raise ValueError(f"Recipe {key}: phase {phase.name} jumps to unknown phase {phase.next_phase}")
+
+        self.key: str = key
+        self.name: str = name
+        self.phases: list[RecipePhase] = phases
+
+    @classmethod
+    def from_dict(cls, data: dict[str, object], key: str | None = None) -> "Recipe":
+        """
+        Create a recipe from the content of a recipe file.
+
+        :param data: The content of the recipe file.
+        :type data: dict[str, object]
+        :param key: The key to use if the content has none. Defaults to None.
+        :type key: str | None
+        :return: The recipe.
+        :rtype: Recipe
+        :raises ValueError: If the content is not a valid recipe.
+        """
+        key = str(data.get("key", key or ""))
+        if not key:
+            raise ValueError("Recipe has no key")
+
+        phases: object = data.get("phases")
+        if not isinstance(phases, list):
+            raise ValueError(f"Recipe {key} has no list of phases")
+
+        return cls(key, str(data.get("name", key)), [RecipePhase.from_dict(phase) for phase in phases])
+
+    @classmethod
+    def load(cls, path: str) -> "Recipe":
+        """
+        Read a recipe from a JSON or TOML file. The key defaults to the file name without extension.
+
+        :param path: The path of the file, ending in .json or .toml.
+        :type path: str
+        :return: The recipe.
+        :rtype: Recipe
+        :raises ValueError: If the file type is not supported or the content is not a valid recipe.
+        """
+        stem, extension = os.path.splitext(os.path.basename(path))
+
+        match extension.lower():
+            case ".json":
+                with open(path, encoding="utf-8") as file:
+                    data: dict[str, object] = json.load(file)
+            case ".toml":
+                with open(path, "rb") as file:
+                    data = tomllib.load(file)
+            case _:
+                raise ValueError(f"Unsupported recipe file type: {path}")
+
+        return cls.from_dict(data, stem)
@@ -0,0 +1,93 @@
+from src.helper.Settings import Settings
+from src.helper.configuration.RuntimeConfig import RuntimeConfig
+
+
+class RecipePhase:
+    """
+    One phase of a recipe: the actuator settings held until the exit condition of the phase is met.
+
+    Every phase has exactly one exit condition: a duration, or the mean inner temperature rising above or
+    falling below a threshold. A phase may jump back to an earlier phase a number of times before the
+    recipe continues with the following phase.
+
+    :ivar name: The name of the phase, unique within the recipe.
+    :ivar power_share: The target power share of the magnetron between 0 and 1.
+    :ivar turntable_speed: The target speed of the turntable in rotations per minute.
+    :ivar reflector_angle: The target angle of the reflector in degrees.
+    :ivar duration_in_seconds: The time the phase lasts, or None.
+    :ivar until_temperature_above: The temperature in degrees Celsius the phase lasts until exceeded, or None.
+    :ivar until_temperature_below: The temperature in degrees Celsius the phase lasts until undercut, or None.
+    :ivar next_phase: The name of the phase to jump to after this phase, or None to continue with the following phase.
+    :ivar repeat: The number of jumps to the next phase before continuing with the following phase.
+    """
+
+    def __init__(self, name: str, power_share: float, turntable_speed: float = 0.0, reflector_angle: float = 0.0,
+                 duration_in_seconds: float | None = None, until_temperature_above: float | None = None,
+                 until_temperature_below: float | None = None, next_phase: str | None = None, repeat: int = 0) -> None:
+        """
+        Initialize and validate the RecipePhase.
+
+        :param name: The name of the phase, unique within the recipe.
+        :type name: str
+        :param power_share: The target power share of the magnetron between 0 and 1.
+        :type power_share: float
+        :param turntable_speed: The target speed of the turntable in rotations per minute. Defaults to 0.0.
+        :type turntable_speed: float
+        :param reflector_angle: The target angle of the reflector in degrees. Defaults to 0.0.
+        :type reflector_angle: float
+        :param duration_in_seconds: The time the phase lasts, or None. Defaults to None.
+        :type duration_in_seconds: float | None
+        :param until_temperature_above: The temperature the phase lasts until exceeded, or None. Defaults to None.
+        :type until_temperature_above: float | None
+        :param until_temperature_below: The temperature the phase lasts until undercut, or None. Defaults to None.
+        :type until_temperature_below: float | None
+        :param next_phase: The name of the phase to jump to, or None for the following phase. Defaults to None.
+        :type next_phase: str | None
+        :param repeat: The number of jumps to the next phase. Defaults to 0.
+        :type repeat: int
+        :return: None
+        :raises ValueError: If a setting is out of range or the phase has not exactly one exit condition.
+        """
+        settings: RuntimeConfig = Settings()
+        if not 0.0 <= power_share <= 1.0:
+            raise ValueError(f"Phase {name}: power share must be between 0 and 1, got {power_share}")
+        if not (settings.TURNTABLE_MIN_ROTATIONS_PER_MINUTE <= turntable_speed
+                <= settings.TURNTABLE_MAX_ROTATIONS_PER_MINUTE):
+            raise ValueError(f"Phase {name}: turntable speed {turntable_speed} is out of range")
+        if not settings.REFLECTOR_MIN_ANGLE_IN_DEGREES <= reflector_angle <= settings.REFLECTOR_MAX_ANGLE_IN_DEGREES:
+            raise ValueError(f"Phase {name}: reflector angle {reflector_angle} is out of range")
+
+        conditions: list[float | None] = [duration_in_seconds, until_temperature_above, until_temperature_below]
+        if sum(condition is not None for condition in conditions) != 1:
+            raise ValueError(f"Phase {name}: exactly one of duration_in_seconds, until_temperature_above and "
+                             f"until_temperature_below must be given")
+        if duration_in_seconds is not None and duration_in_seconds <= 0:
+            raise ValueError(f"Phase {name}: duration must be positive, got {duration_in_seconds}")
+        if repeat < 0 or (repeat > 0 and next_phase is None):
+            raise ValueError(f"Phase {name}: repeat must not be negative and needs a next phase")
+
+        self.name: str = name
+        self.power_share: float = float(power_share)
+        self.turntable_speed: float = float(turntable_speed)
+        self.reflector_angle: float = float(reflector_angle)
+        self.duration_in_seconds: float | None = duration_in_seconds
+        self.until_temperature_above: float | None = until_temperature_above
+        self.until_temperature_below: float | None = until_temperature_below
+        self.next_phase: str | None = next_phase
+        self.repeat: int = repeat
+
+    @classmethod
+    def from_dict(cls, data: dict[str, object]) -> "RecipePhase":
+        """
+        Create a phase from its entry in a recipe file.
+
+        :param data: The settings of the phase.
+        :type data: dict[str, object]
+        :return: The phase.
+        :rtype: RecipePhase
+        :raises ValueError: If the entry has unknown or missing fields or invalid settings.
+        """
+        try:
+            return cls(**data)
+        except TypeError as error:
+            raise ValueError(f"Invalid phase {data.get('name', '?')}: {error}") from error
@@ -0,0 +1,116 @@
+from src.helper.config import PROGRAM_UPDATE_INTERVAL_IN_SECONDS
+from src.program.recipe.Recipe import Recipe
+
+
+class StepTable:
+    """
+    A recipe compiled into a state machine table with one row per phase.
+
+    Every column is a tuple indexed by the step number, so executing a tick takes a fixed number of lookups
+    and a single comparison, whatever the size of the recipe. Durations are converted to program ticks and
+    phase names to step numbers when compiling.
+
+    :ivar key: The key of the compiled recipe.
+    :ivar name: The display name of the compiled recipe.
+    :ivar names: The phase name per step.
+    :ivar power_shares: The magnetron power share per step.
+    :ivar turntable_speeds: The turntable speed per step.
+    :ivar reflector_angles: The reflector angle per step.
+    :ivar conditions: The kind of exit condition per step, one of DURATION, ABOVE and BELOW.
+    :ivar thresholds: The number of ticks or the temperature of the exit condition per step.
+    :ivar next_steps: The step to jump to after the step, or -1 to continue with the following step.
+    :ivar repeats: The number of jumps per step before continuing with the following step.
+    """
+
+    DURATION: int = 0
+    """int: The step ends after a number of ticks."""
+
+    ABOVE: int = 1
+    """int: The step ends once the mean inner temperature rises above the threshold."""
+
+    BELOW: int = 2
+    """int: The step ends once the mean inner temperature falls below the threshold."""
+
+    def __init__(self, recipe: Recipe) -> None:
+        """
+        Compile a recipe.
+
+        :param recipe: The recipe to compile.
+        :type recipe: Recipe
+        :return: None
+        """
+        steps: dict[str, int] = {phase.name: step for step, phase in enumerate(recipe.phases)}
+        conditions: list[int] = []
+        thresholds: list[float] = []
+
+        for phase in recipe.phases:
+            if phase.duration_in_seconds is not None:
+                conditions.append(self.DURATION)
+                thresholds.append(max(1, round(phase.duration_in_seconds / PROGRAM_UPDATE_INTERVAL_IN_SECONDS)))
+            elif phase.until_temperature_above is not None:
+                conditions.append(self.ABOVE)
+                thresholds.append(float(phase.until_temperature_above))
+            else:
+                conditions.append(self.BELOW)
+                thresholds.append(float(phase.until_temperature_below))
+
+        self.key: str = recipe.key
+        self.name: str = recipe.name
+        self.names: tuple[str, ...] = tuple(phase.name for phase in recipe.phases)
+        self.power_shares: tuple[float, ...] = tuple(phase.power_share for phase in recipe.phases)
+        self.turntable_speeds: tuple[float, ...] = tuple(phase.turntable_speed for phase in recipe.phases)
+        self.reflector_angles: tuple[float, ...] = tuple(phase.reflector_angle for phase in recipe.phases)
+        self.conditions: tuple[int, ...] = tuple(conditions)
+        self.thresholds: tuple[float, ...] = tuple(thresholds)
+        self.next_steps: tuple[int, ...] = tuple(
+            steps[phase.next_phase] if phase.next_phase is not None else -1 for phase in recipe.phases
+        )
+        self.repeats: tuple[int, ...] = tuple(phase.repeat for phase in recipe.phases)
+
+    def __len__(self) -> int:
+        """
+        Get the number of steps.
+
+        :return: The number of steps.
+        :rtype: int
+        """
+        return len(self.names)
+
+    def advance(self, step: int, remaining: list[int]) -> int:
+        """
+        Determine the step following a finished step.
+
+        :param step: The finished step.
+        :type step: int
+        :param remaining: The jumps left per step, decremented when a jump is taken.
+        :type remaining: list[int]
+        :return: The following step, or the number of steps once the recipe is finished.
+        :rtype: int
+        """
+        next_step: int = self.next_steps[step]
+
+        if next_step >= 0 and remaining[step] > 0:
+            remaining[step] -= 1
+            return next_step
+
+        return step + 1
+
+    def duration_in_seconds(self) -> float | None:
+        """
+        Compute the run time of the recipe, if it depends on durations only.
+
+        :return: The run time in seconds, or None if a step waits for a temperature.
+        :rtype: float | None
+        """
+        if any(condition != self.DURATION for condition in self.conditions):
+            return None
+
+        ticks: float = 0
+        step: int = 0
+        remaining: list[int] = list(self.repeats)
+
+        while step < len(self):
+            ticks += self.thresholds[step]
+            step = self.advance(step, remaining)
+
+        return ticks * PROGRAM_UPDATE_INTERVAL_IN_SECONDS
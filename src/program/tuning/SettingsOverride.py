@@ -0,0 +1,122 @@
+import importlib
+import sys
+from types import ModuleType
+
+from src.helper import config
+from src.helper.Settings import Settings
+
+
+class SettingsOverride:
+    """
+    Context manager replacing settings for the duration of a block and restoring them afterwards.
+
+    Settings are named as "module:attribute" or "module:Class.attribute". Since the modules of the application
+    import configuration constants by name, a module-level setting is also replaced in every loaded module of the
+    application that imported it. A constant of the configuration module is replaced in the runtime settings too,
+    without notifying their subscribers.
+
+    :ivar settings: The values by setting.
+    :ivar replaced: The owner, attribute and previous value of every replaced attribute, in order.
+    """
+
+    PACKAGE: str = "src."
+    """str: The prefix of the modules of the application."""
+
+    def __init__(self, settings: dict[str, object]) -> None:
+        """
+        Initialize the SettingsOverride.
+
+        :param settings: The values by setting.
+        :type settings: dict[str, object]
+        :return: None
+        """
+        self.settings: dict[str, object] = dict(settings)
+        self.replaced: list[tuple[object, str, object]] = []
+
+    @staticmethod
+    def resolve(target: str) -> tuple[object, str]:
+        """
+        Find the object holding a setting.
+
+        :param target: The setting as "module:attribute" or "module:Class.attribute".
+        :type target: str
+        :raises ValueError: If the module or the attribute does not exist.
+        :return: The module or class holding the setting and the name of the attribute.
+        :rtype: tuple[object, str]
+        """
+        module_name, _, path = target.partition(":")
+        *owners, attribute = path.split(".")
+
+        try:
+            owner: object = importlib.import_module(module_name)
+            for name in owners:
+                owner = getattr(owner, name)
+        except (ImportError, AttributeError) as exception:
+            raise ValueError(f"Unknown setting {target}: {exception}") from exception
+
+        if not hasattr(owner, attribute):
+            raise ValueError(f"Unknown setting {target}")
+        return owner, attribute
+
+    def _replace(self, owner: object, attribute: str, value: object) -> None:
+        """
+        Replace an attribute, remembering its previous value.
+
+        :param owner: The module or class holding the attribute.
+        :type owner: object
+        :param attribute: The name of the attribute.
+        :type attribute: str
+        :param value: The new value.
+        :type value: object
+        :return: None
+        """
+        self.replaced.append((owner, attribute, getattr(owner, attribute)))
+        setattr(owner, attribute, value)
+
+    def __enter__(self) -> "SettingsOverride":
+        """
+        Replace the settings.
+
+        :raises ValueError: If a setting does not exist. Settings replaced before are restored.
+        :return: The override.
+        :rtype: SettingsOverride
+        """
+        try:
+            for target, value in self.settings.items():
+                owner, attribute = self.resolve(target)
+                original: object = getattr(owner, attribute)
+                self._replace(owner, attribute, value)
+
+                if isinstance(owner, ModuleType):
+                    for module in list(sys.modules.values()):
+                        if (module is not owner and getattr(module, "__name__", "").startswith(self.PACKAGE)
+                                and vars(module).get(attribute, None) is original):
+                            self._replace(module, attribute, value)
+
+                if owner is config and attribute in Settings().types:
+                    self._replace(Settings(), attribute, value)
+        except ValueError:
+            self.restore()
+            raise
+
+        return self
+
+    def __exit__(self, *exception: object) -> None:
+        """
+        Restore the settings.
+
+        :param exception: The exception raised in the block, if any.
+        :type exception: object
+        :return: None
+        """
+        self.restore()
+
+    def restore(self) -> None:
+        """
+        Restore every replaced attribute, the last replaced first.
+
+        :return: None
+        """
+        while self.replaced:
+            owner, attribute, value = self.replaced.pop()
+            setattr(owner, attribute, value)
@@ -0,0 +1,175 @@
+import itertools
+import logging
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from src.components.magnetron.MagnetronModulator import MagnetronModulator
+from src.emergency.EmergencyHandler import EmergencyHandler
+from src.helper.OvenContext import OvenContext
+from src.helper.config import AMBIENT_TEMPERATURE_IN_CELSIUS
+from src.program.DefrostingProgram import DefrostingProgram
+from src.program.estimate.DefrostSweep import DefrostSweep
+from src.program.tuning.SettingsOverride import SettingsOverride
+from src.program.tuning.TuningParameter import TuningParameter
+from src.program.tuning.TuningResult import TuningResult
+
+
+class Tuner:
+    """
+    Sweeps settings of the defrosting program across a grid or random candidates in a process pool.
+
+    Every candidate runs the complete system of an oven of its own in simulated time, in a worker process with
+    the settings of the candidate applied. The results are ranked by safety hits, defrost time and energy.
+
+    :ivar parameters: The swept parameters.
+    :ivar weight: The measured weight of the simulated load in grams.
+    :ivar temperature: The starting inner temperature of the simulated load in degrees Celsius.
+    :ivar processes: The number of worker processes, or None for one per CPU.
+    """
+
+    PARAMETERS: list[TuningParameter] = [
+        TuningParameter("target_temp", "src.helper.config:PROGRAM_DEFROSTING_TARGET_TEMP", [55, 60, 65]),
+        TuningParameter("base_power_share", "src.program.DefrostingProgram:DefrostingProgram.BASE_POWER_SHARE",
+                        [0.1, 0.2]),
+        TuningParameter("power_share_per_cycle",
+                        "src.program.DefrostingProgram:DefrostingProgram.POWER_SHARE_PER_CYCLE", [0.1, 0.2]),
+        TuningParameter("max_power_share", "src.program.DefrostingProgram:DefrostingProgram.MAX_POWER_SHARE",
+                        [0.4, 0.6, 0.8]),
+        TuningParameter("fan_start_temp",
+                        "src.components.cooling.CoolingFanController:CoolingFanController.FAN_START_TEMP_IN_CELSIUS",
+                        [40.0, 50.0]),
+        TuningParameter("fan_full_temp",
+                        "src.components.cooling.CoolingFanController:CoolingFanController.FAN_FULL_TEMP_IN_CELSIUS",
+                        [130.0, 150.0]),
+        TuningParameter("main_loop_interval", "src.helper.config:MAIN_LOOP_TIMEOUT_IN_SECONDS", [0.01, 0.02]),
+        TuningParameter("program_interval", "src.helper.config:PROGRAM_UPDATE_INTERVAL_IN_SECONDS", [0.01, 0.05]),
+        TuningParameter("magnetron_interval", "src.helper.config:MAGNETRON_ON_OFF_INTERVAL_IN_SECONDS", [0.1, 0.2]),
+        TuningParameter("cooling_fan_interval", "src.helper.config:COOLING_FAN_UPDATE_INTERVAL_IN_SECONDS",
+                        [0.1, 0.2]),
+    ]
+    """list[TuningParameter]: The parameters that can be swept, with the values tried by default."""
+
+    def __init__(self, parameters: list[TuningParameter] | None = None,
+                 weight: float = DefrostingProgram.weight_for_cycles(4),
+                 temperature: float = AMBIENT_TEMPERATURE_IN_CELSIUS, processes: int | None = None) -> None:
+        """
+        Initialize the Tuner.
+
+        :param parameters: The parameters to sweep, or None for all PARAMETERS. Defaults to None.
+        :type parameters: list[TuningParameter] | None
+        :param weight: The measured weight of the simulated load in grams. Defaults to a four cycle load.
+        :type weight: float
+        :param temperature: The starting inner temperature of the simulated load. Defaults to the ambient one.
+        :type temperature: float
+        :param processes: The number of worker processes, or None for one per CPU. Defaults to None.
+        :type processes: int | None
+        :raises ValueError: If two parameters share a name.
+        :return: None
+        """
+        self.parameters: list[TuningParameter] = list(self.PARAMETERS if parameters is None else parameters)
+        if len({parameter.name for parameter in self.parameters}) != len(self.parameters):
+            raise ValueError("Parameter names must be unique")
+
+        self.weight: float = weight
+        self.temperature: float = temperature
+        self.processes: int | None = processes
+
+    @classmethod
+    def parameter(cls, name: str) -> TuningParameter:
+        """
+        Look up a parameter that can be swept by its name.
+
+        :param name: The name of the parameter.
+        :type name: str
+        :raises ValueError: If there is no such parameter.
+        :return: The parameter.
+        :rtype: TuningParameter
+        """
+        for parameter in cls.PARAMETERS:
+            if parameter.name == name:
+                return parameter
+        raise ValueError(f"Unknown parameter {name}, choose from {', '.join(p.name for p in cls.PARAMETERS)}")
+
+    def grid(self) -> list[dict[str, object]]:
+        """
+        Create a candidate for every combination of the parameter values.
+
+        :return: The candidates, each a value per parameter name.
+        :rtype: list[dict[str, object]]
+        """
+        names: list[str] = [parameter.name for parameter in self.parameters]
+        return [dict(zip(names, values))
+                for values in itertools.product(*(parameter.values for parameter in self.parameters))]
+
+    def sample(self, count: int, seed: int | None = None) -> list[dict[str, object]]:
+        """
+        Create candidates by choosing a random value per parameter.
+
+        :param count: The number of candidates.
+        :type count: int
+        :param seed: The seed of the random choices, or None for a random seed. Defaults to None.
+        :type seed: int | None
+        :return: The candidates, each a value per parameter name.
+        :rtype: list[dict[str, object]]
+        """
+        generator: random.Random = random.Random(seed)
+        return [{parameter.name: generator.choice(parameter.values) for parameter in self.parameters}
+                for _ in range(count)]
+
+    @staticmethod
+    def quiet() -> None:
+        """
+        Silence the logging of a worker process, the results report the safety hits instead.
+
+        :return: None
+        """
+        logging.disable(logging.CRITICAL)
+
+    @staticmethod
+    def evaluate(candidate: dict[str, object], targets: dict[str, str], weight: float,
+                 temperature: float) -> TuningResult:
+        """
+        Simulate the defrosting program with the settings of a candidate applied.
+
+        :param candidate: The value per parameter name.
+        :type candidate: dict[str, object]
+        :param targets: The setting per parameter name.
+        :type targets: dict[str, str]
+        :param weight: The measured weight of the simulated load in grams.
+        :type weight: float
+        :param temperature: The starting inner temperature of the simulated load in degrees Celsius.
+        :type temperature: float
+        :return: The result, with the error set if the program did not finish or a setting does not exist.
+        :rtype: TuningResult
+        """
+        settings: dict[str, object] = {targets[name]: value for name, value in candidate.items()}
+
+        try:
+            with SettingsOverride(settings):
+                sweep: DefrostSweep = DefrostSweep()
+                context: OvenContext = sweep.oven(weight, temperature)
+                duration, energy = sweep.simulate_oven(context)
+                safety_hits: int = context.get(MagnetronModulator).safety_hits + context.get(
+                    EmergencyHandler).emergencies
+        except (TimeoutError, ValueError) as exception:
+            return TuningResult(candidate, error=str(exception))
+
+        return TuningResult(candidate, duration, energy, safety_hits)
+
+    def run(self, candidates: list[dict[str, object]]) -> list[TuningResult]:
+        """
+        Simulate every candidate in the process pool and rank the results.
+
+        :param candidates: The candidates, each a value per parameter name.
+        :type candidates: list[dict[str, object]]
+        :return: The results, the best first.
+        :rtype: list[TuningResult]
+        """
+        targets: dict[str, str] = {parameter.name: parameter.target for parameter in self.parameters}
+
+        with ProcessPoolExecutor(self.processes, initializer=self.quiet) as executor:
+            results: list[TuningResult] = list(executor.map(
+                self.evaluate, candidates, itertools.repeat(targets), itertools.repeat(self.weight),
+                itertools.repeat(self.temperature)))
+
+        return sorted(results, key=TuningResult.rank_key)
@@ -0,0 +1,45 @@
+class TuningParameter:
+    """
+    A setting swept by the tuner, with the values to try.
+
+    The target names the setting as "module:attribute" for module-level constants such as those in the
+    configuration, or as "module:Class.attribute" for class attributes.
+
+    :ivar name: The short name of the parameter.
+    :ivar target: The setting the values are applied to.
+    :ivar values: The values to try.
+    """
+
+    def __init__(self, name: str, target: str, values: list[object]) -> None:
+        """
+        Initialize the TuningParameter.
+
+        :param name: The short name of the parameter.
+        :type name: str
+        :param target: The setting the values are applied to, as "module:attribute" or "module:Class.attribute".
+        :type target: str
+        :param values: The values to try.
+        :type values: list[object]
+        :raises ValueError: If the target has no module or attribute, or there are no values.
+        :return: None
+        """
+        module, _, attribute = target.partition(":")
+        if not module or not attribute:
+            raise ValueError(f"Target {target} must have the form module:attribute")
+        if not values:
+            raise ValueError(f"Parameter {name} needs at least one value")
+
+        self.name: str = name
+        self.target: str = target
+        self.values: list[object] = list(values)
+
+    def with_values(self, values: list[object]) -> "TuningParameter":
+        """
+        Create a copy of the parameter trying other values.
+
+        :param values: The values to try.
+        :type values: list[object]
+        :return: The copy.
+        :rtype: TuningParameter
+        """
+        return TuningParameter(self.name, self.target, values)
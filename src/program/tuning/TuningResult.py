@@ -0,0 +1,59 @@
+class TuningResult:
+    """
+    The outcome of simulating the defrosting program with one candidate of settings.
+
+    :ivar candidate: The value per parameter name.
+    :ivar duration: The duration of the program in seconds, or None if the simulation failed.
+    :ivar energy: The energy the magnetron delivered in joules, or None if the simulation failed.
+    :ivar safety_hits: The magnetron cycles skipped for a safety hazard plus the emergencies declared.
+    :ivar error: The reason the simulation failed, or None.
+    """
+
+    def __init__(self, candidate: dict[str, object], duration: float | None = None, energy: float | None = None,
+                 safety_hits: int = 0, error: str | None = None) -> None:
+        """
+        Initialize the TuningResult.
+
+        :param candidate: The value per parameter name.
+        :type candidate: dict[str, object]
+        :param duration: The duration of the program in seconds, or None if the simulation failed.
+        :type duration: float | None
+        :param energy: The energy the magnetron delivered in joules, or None if the simulation failed.
+        :type energy: float | None
+        :param safety_hits: The magnetron cycles skipped for a safety hazard plus the emergencies declared.
+        :type safety_hits: int
+        :param error: The reason the simulation failed, or None.
+        :type error: str | None
+        :return: None
+        """
+        self.candidate: dict[str, object] = dict(candidate)
+        self.duration: float | None = duration
+        self.energy: float | None = energy
+        self.safety_hits: int = safety_hits
+        self.error: str | None = error
+
+    def rank_key(self) -> tuple[bool, int, float, float]:
+        """
+        Order results by failure, safety hits, duration and energy, the best first.
+
+        :return: The key to sort results by.
+        :rtype: tuple[bool, int, float, float]
+        """
+        if self.error is not None:
+            return True, self.safety_hits, float("inf"), float("inf")
+        return False, self.safety_hits, self.duration, self.energy
+
+    def to_dict(self) -> dict[str, object]:
+        """
+        Convert the result into a JSON-serializable dictionary.
+
+        :return: The result as a dictionary.
+        :rtype: dict[str, object]
+        """
+        return {
+            "candidate": self.candidate,
+            "duration": self.duration,
+            "energy": self.energy,
+            "safety_hits": self.safety_hits,
+            "error": self.error,
+        }
@@ -0,0 +1,116 @@
+import argparse
+import json
+import sys
+
+from src.program.tuning.Tuner import Tuner
+from src.program.tuning.TuningParameter import TuningParameter
+from src.program.tuning.TuningResult import TuningResult
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments of the tuner.
+
+    :param argv: The arguments without the program name, or None to use the command line.
+    :type argv: list[str] | None
+    :return: The parsed arguments.
+    :rtype: argparse.Namespace
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Sweep settings of the defrosting program in simulated time and rank the results.")
+    parser.add_argument("-p", "--parameter", action="append", default=[], metavar="NAME[=V1,V2,...]",
+                        help="sweep this parameter, optionally with other values; repeatable, defaults to all of "
+                             + ", ".join(parameter.name for parameter in Tuner.PARAMETERS))
+    parser.add_argument("-r", "--random", type=int, metavar="COUNT",
+                        help="simulate this many random candidates instead of the full grid")
+    parser.add_argument("-s", "--seed", type=int, help="seed of the random search")
+    parser.add_argument("-j", "--processes", type=int, help="number of worker processes, defaults to one per CPU")
+    parser.add_argument("-w", "--weight", type=float, help="measured weight of the load in grams")
+    parser.add_argument("-t", "--temperature", type=float, help="starting inner temperature of the load")
+    parser.add_argument("-n", "--top", type=int, default=10, help="number of ranked results to print")
+    parser.add_argument("-o", "--output", help="write all ranked results as JSON to this file")
+    return parser.parse_args(argv)
+
+
+def parse_parameter(argument: str) -> TuningParameter:
+    """
+    Parse a parameter argument of the form NAME or NAME=V1,V2,...
+
+    :param argument: The argument.
+    :type argument: str
+    :raises ValueError: If the parameter is unknown or a value is no number.
+    :return: The parameter with the given values, or its default values.
+    :rtype: TuningParameter
+    """
+    name, _, values = argument.partition("=")
+    parameter: TuningParameter = Tuner.parameter(name)
+    if not values:
+        return parameter
+    return parameter.with_values([float(value) for value in values.split(",")])
+
+
+def format_table(results: list[TuningResult], names: list[str]) -> str:
+    """
+    Format ranked results as a table.
+
+    :param results: The ranked results.
+    :type results: list[TuningResult]
+    :param names: The names of the swept parameters.
+    :type names: list[str]
+    :return: The table, one line per result below a header.
+    :rtype: str
+    """
+    width: int = max([len(name) for name in names] + [8])
+    lines: list[str] = [f"{'rank':>4} " + " ".join(f"{name:>{width}}" for name in names)
+                        + f" {'time s':>10} {'energy kJ':>10} {'hits':>6}"]
+
+    for rank, result in enumerate(results, 1):
+        values: str = " ".join(f"{result.candidate[name]!s:>{width}}" for name in names)
+        if result.error is not None:
+            lines.append(f"{rank:>4} {values} failed: {result.error}")
+        else:
+            lines.append(f"{rank:>4} {values} {result.duration:>10.1f} {result.energy / 1000:>10.1f} "
+                         f"{result.safety_hits:>6}")
+
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Entry point for the tuner. Simulates the candidates in parallel and prints the best ones.
+
+    :param argv: The arguments without the program name, or None to use the command line.
+    :type argv: list[str] | None
+    :return: The exit code, 2 for invalid parameters, 1 if every candidate failed, 0 otherwise.
+    :rtype: int
+    """
+    arguments: argparse.Namespace = parse_arguments(argv)
+
+    try:
+        parameters: list[TuningParameter] | None = [parse_parameter(argument) for argument in arguments.parameter]
+        tuner: Tuner = Tuner(parameters or None, processes=arguments.processes)
+    except ValueError as exception:
+        print(exception, file=sys.stderr)
+        return 2
+
+    if arguments.weight is not None:
+        tuner.weight = arguments.weight
+    if arguments.temperature is not None:
+        tuner.temperature = arguments.temperature
+
+    candidates: list[dict[str, object]] = (tuner.sample(arguments.random, arguments.seed)
+                                           if arguments.random is not None else tuner.grid())
+    print(f"Simulating {len(candidates)} candidates")
+    results: list[TuningResult] = tuner.run(candidates)
+
+    print(format_table(results[:arguments.top], [parameter.name for parameter in tuner.parameters]))
+
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as file:
+            json.dump([result.to_dict() for result in results], file, indent=2)
+
+    return 1 if all(result.error is not None for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
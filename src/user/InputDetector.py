@@ -3,6 +3,7 @@ from pynput.keyboard import Key
 
 from src.helper.Action import Action
 from src.helper.Logger import Logger
+from src.helper.OvenContext import OvenContext
 from src.helper.logging.LogLevel import LogLevel
 
 
@@ -11,9 +12,12 @@ class InputDetector:
     Detects and handles keyboard input events, delegating actions based on user interaction.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initializes the InputDetector, setting up the logger and keyboard listener.
+
+        :param context: The oven context the instance belongs to (unused).
+        :type context: OvenContext | None
         """
         self.logger: Logger = Logger("UserInteraction")
         self.delegating: bool = False
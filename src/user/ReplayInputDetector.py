@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.helper.Action import Action
+
+if TYPE_CHECKING:
+    from src.helper.replay.ReplayEngine import ReplayEngine
+
+
+class ReplayInputDetector:
+    """
+    Input detector returning the user actions of a recorded session instead of listening to the keyboard.
+
+    :ivar engine: The engine replaying the session.
+    :ivar delegating: Indicates if input detection is running.
+    """
+
+    def __init__(self, engine: ReplayEngine) -> None:
+        """
+        Initialize the ReplayInputDetector for a replayed session.
+
+        :param engine: The engine replaying the session.
+        :type engine: ReplayEngine
+        :return: None
+        """
+        self.engine: ReplayEngine = engine
+        self.delegating: bool = False
+
+    def start(self) -> None:
+        """
+        Start returning the recorded actions.
+
+        :return: None
+        """
+        self.delegating = True
+
+    def stop(self) -> None:
+        """
+        Stop returning the recorded actions.
+
+        :return: None
+        """
+        self.delegating = False
+
+    def get_latest_action(self) -> Action | None:
+        """
+        Get the action recorded for the current tick.
+
+        :return: The recorded Action, or None if there was none.
+        :rtype: Action or None
+        """
+        if not self.delegating:
+            return None
+        return self.engine.action()
@@ -0,0 +1,56 @@
+from src.helper.Action import Action
+
+
+class ScriptedInputDetector:
+    """
+    Input detector returning a fixed script of user actions instead of listening to the keyboard.
+
+    Every query of the latest action moves the script on by one tick, so with the system loop querying once
+    per tick, an action scheduled for tick n is seen in the n-th iteration of the loop.
+
+    :ivar actions: The scripted actions by tick.
+    :ivar tick: The number of queries answered so far.
+    :ivar delegating: Indicates if input detection is running.
+    """
+
+    def __init__(self, actions: dict[int, Action] | None = None) -> None:
+        """
+        Initialize the ScriptedInputDetector with a script of actions.
+
+        :param actions: The actions to return by tick, counted from 0. Defaults to no actions.
+        :type actions: dict[int, Action] | None
+        :return: None
+        """
+        self.actions: dict[int, Action] = dict(actions or {})
+        self.tick: int = 0
+        self.delegating: bool = False
+
+    def start(self) -> None:
+        """
+        Start returning the scripted actions.
+
+        :return: None
+        """
+        self.delegating = True
+
+    def stop(self) -> None:
+        """
+        Stop returning the scripted actions.
+
+        :return: None
+        """
+        self.delegating = False
+
+    def get_latest_action(self) -> Action | None:
+        """
+        Get the action scripted for the current tick and move on to the next tick.
+
+        :return: The scripted Action, or None if there is none or detection is stopped.
+        :rtype: Action or None
+        """
+        if not self.delegating:
+            return None
+
+        action: Action | None = self.actions.get(self.tick)
+        self.tick += 1
+        return action
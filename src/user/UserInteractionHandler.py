@@ -1,9 +1,12 @@
 from src.components.door.Door import Door
 from src.helper.Action import Action
 from src.helper.Logger import Logger
+from src.helper.OvenContext import OvenContext
+from src.helper.config import PROGRAM_DEFAULT
 from src.helper.logging.LogLevel import LogLevel
-from src.program.DefrostingProgram import DefrostingProgram
 from src.program.Program import Program
+from src.program.ProgramInfo import ProgramInfo
+from src.program.ProgramRegistry import ProgramRegistry
 from src.user.InputDetector import InputDetector
 
 
@@ -14,39 +17,53 @@ class UserInteractionHandler:
 
     _instance: "UserInteractionHandler" = None
 
-    def __new__(cls) -> "UserInteractionHandler":
+    def __new__(cls, context: OvenContext | None = None) -> "UserInteractionHandler":
         """
         Ensures only one instance of UserInteractionHandler exists.
 
+        :param context: The oven context to create an independent instance for, or None for the singleton.
+        :type context: OvenContext | None
         :return: The singleton instance of UserInteractionHandler.
         :rtype: UserInteractionHandler
         """
+        if context is not None:
+            return super(UserInteractionHandler, cls).__new__(cls)
+
         if cls._instance is None:
             cls._instance = super(UserInteractionHandler, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, context: OvenContext | None = None) -> None:
         """
         Initializes the UserInteractionHandler, setting up the logger, door, and input detector.
+
+        :param context: The oven context to resolve dependencies from, or None for the singletons.
+        :type context: OvenContext | None
         """
+        self.context: OvenContext | None = context
         self.logger: Logger = Logger("UserInteraction")
-        self.door: Door = Door()
-        self.input_detector: InputDetector = InputDetector()
+        self.door: Door = OvenContext.resolve(context, Door)
+        self.input_detector: InputDetector = OvenContext.resolve(context, InputDetector)
         self.input_detector.start()
+        self.last_action: Action | None = None
+        self.selected_program: str = PROGRAM_DEFAULT
 
     def get_interactions(self) -> tuple[Action | None, Program | None]:
         """
         Retrieves the latest user action and processes it accordingly.
 
+        The detected action is kept in `last_action`, so it can be recorded with the sensor values.
+
         :return: A tuple containing the detected Action (or None) and the corresponding Program (or None).
         :rtype: tuple[Action | None, Program | None]
         """
         action: Action | None = self.input_detector.get_latest_action()
+        self.last_action = action
 
         match action:
             case Action.START:
                 self.logger.log("User requested to start a program", LogLevel.INFO)
-                return action, DefrostingProgram()
+                return action, ProgramRegistry.create(self.selected_program, self.context)
 
             case Action.OPEN_DOOR:
                 if not self.door.opened:
@@ -64,7 +81,21 @@ class UserInteractionHandler:
                 return action, None
         return None, None
 
-    def update_display(self, program_name: str, running: bool, finished: bool, paused: bool) -> None:
+    def select_program(self, key: str) -> None:
+        """
+        Select the program started by the next start action.
+
+        :param key: The key of the program in the program registry.
+        :type key: str
+        :return: None
+        :raises ValueError: If no program is registered under the key.
+        """
+        info: ProgramInfo = ProgramRegistry.info(key)
+        self.selected_program = key
+        self.logger.log(f"User selected {info.name}", LogLevel.INFO)
+
+    def update_display(self, program_name: str, running: bool, finished: bool, paused: bool,
+                       eta: float | None = None) -> None:
         """
         Updates the display with the current program status.
 
@@ -76,6 +107,8 @@ class UserInteractionHandler:
         :type finished: bool
         :param paused: Indicates if the program is paused.
         :type paused: bool
+        :param eta: The estimated remaining time of the program in seconds, or None if unknown.
+        :type eta: float | None
         :return: None
         """
         pass
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 
 from src.SystemControl import SystemControl
 from src.helper.Action import Action
+from src.helper.config import MAIN_LOOP_TIMEOUT_IN_SECONDS
 from src.helper.logging.LogLevel import LogLevel
 
 
@@ -19,6 +20,7 @@ class TestSystemControl(unittest.TestCase):
         self.system.sensor_manager = MagicMock()
         self.system.user_interaction_handler = MagicMock()
         self.system.emergency_handler = MagicMock()
+        self.system.flight_recorder = MagicMock()
 
     def test___init__called__sets_initial_state_idle(self):
         self.assertEqual(self.system.state, self.system.State.IDLE)
@@ -78,6 +80,16 @@ class TestSystemControl(unittest.TestCase):
 
         self.system.program_controller.start.assert_called_once_with("Program1")
 
+    def test_loop_action__called__records_flight_sample_after_sensor_update(self):
+        self.system.user_interaction_handler.get_interactions.return_value = (None, None)
+        calls = MagicMock()
+        calls.attach_mock(self.system.sensor_manager.update_sensors, "update_sensors")
+        calls.attach_mock(self.system.flight_recorder.record, "record")
+
+        self.system.loop_action()
+
+        self.assertEqual([call[0] for call in calls.mock_calls], ["update_sensors", "record"])
+
     def test_loop_action__start_action_with_open_door__logs_message(self):
         self.system.user_interaction_handler.get_interactions.return_value = (Action.START, "Program1")
         self.system.program_controller.is_running.return_value = False
@@ -121,3 +133,23 @@ class TestSystemControl(unittest.TestCase):
 
         self.system.program_controller.start.assert_not_called()
         self.system.program_controller.stop.assert_not_called()
+
+    @patch("src.SystemControl.Scheduler")
+    def test_start__scheduler_installed__schedules_loop_tick(self, mock_scheduler):
+        self.system.start()
+
+        mock_scheduler.return_value.schedule.assert_called_once_with(
+            self.system.loop_tick, MAIN_LOOP_TIMEOUT_IN_SECONDS, MAIN_LOOP_TIMEOUT_IN_SECONDS, "System"
+        )
+
+    def test_loop_tick__idle_state__returns_false(self):
+        self.system.state = self.system.State.IDLE
+
+        self.assertFalse(self.system.loop_tick())
+
+    def test_loop_tick__emergency_without_error__returns_to_running(self):
+        self.system.state = self.system.State.EMERGENCY
+        self.system.emergency_handler.is_busy.return_value = False
+
+        self.assertTrue(self.system.loop_tick())
+        self.assertEqual(self.system.state, self.system.State.RUNNING)
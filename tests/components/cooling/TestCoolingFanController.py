@@ -2,12 +2,19 @@ import unittest
 from unittest.mock import MagicMock, patch
 
 from src.components.cooling.CoolingFanController import CoolingFanController
-from src.helper.config import COOLING_FAN_STEP_IN_PERCENT, AMBIENT_TEMPERATURE_IN_CELSIUS
+from src.helper.Settings import Settings
+from src.helper.config import COOLING_FAN_STEP_IN_PERCENT, AMBIENT_TEMPERATURE_IN_CELSIUS, \
+    COOLING_FAN_UPDATE_INTERVAL_IN_SECONDS
+from src.helper.configuration.RuntimeConfig import RuntimeConfig
 from src.helper.logging.LogLevel import LogLevel
 
 
 class TestCoolingFanController(unittest.TestCase):
     def setUp(self):
+        self.original_settings = Settings()
+        Settings.use(RuntimeConfig())
+        Settings().logger = MagicMock()
+        self.addCleanup(Settings.use, self.original_settings)
         CoolingFanController._instance = None
         self.cooling_fan_controller = CoolingFanController()
         self.cooling_fan_controller.cooling_fan = MagicMock()
@@ -70,6 +77,17 @@ class TestCoolingFanController(unittest.TestCase):
 
         self.assertGreater(self.cooling_fan_controller.target_power_share, 0.0)
 
+    def test_cooling_fan_cycle__called__logs_power_share_deferred_for_flight_log(self):
+        self.cooling_fan_controller.sensors.magnetron_temp1.return_value = 80.0
+        self.cooling_fan_controller.sensors.magnetron_temp2.return_value = 80.0
+        self.cooling_fan_controller.cooling_fan.power_share = 0.0
+        self.cooling_fan_controller.target_power_share = 0.5
+
+        self.cooling_fan_controller.cooling_fan_cycle()
+
+        self.cooling_fan_controller.logger.log.assert_any_call("Updating Cooling Fan - currently at %s%%",
+                                                               LogLevel.DEBUG, 0.5)
+
     def test_cooling_fan_cycle__cooldown_and_low_power__stops_running(self):
         self.cooling_fan_controller.cooldown = True
         self.cooling_fan_controller.target_power_share = COOLING_FAN_STEP_IN_PERCENT
@@ -115,3 +133,58 @@ class TestCoolingFanController(unittest.TestCase):
 
     def test_magnetron_temp_to_power_share__well_above_150__returns_one(self):
         self.assertEqual(self.cooling_fan_controller.magnetron_temp_to_power_share(200.0), 1.0)
+
+    def test_magnetron_temp_to_power_share__tuned_curve__scales_between_start_and_full_temp(self):
+        self.cooling_fan_controller.FAN_START_TEMP_IN_CELSIUS = 40.0
+        self.cooling_fan_controller.FAN_FULL_TEMP_IN_CELSIUS = 120.0
+
+        self.assertEqual(self.cooling_fan_controller.magnetron_temp_to_power_share(40.0), 0.0)
+        self.assertAlmostEqual(self.cooling_fan_controller.magnetron_temp_to_power_share(80.0), 0.25)
+        self.assertEqual(self.cooling_fan_controller.magnetron_temp_to_power_share(120.0), 1.0)
+
+    @patch("src.components.cooling.CoolingFanController.Scheduler")
+    def test_start__scheduler_installed__schedules_cooling_fan_tick(self, mock_scheduler):
+        self.cooling_fan_controller.start()
+
+        mock_scheduler.return_value.schedule.assert_called_once_with(
+            self.cooling_fan_controller.cooling_fan_tick, COOLING_FAN_UPDATE_INTERVAL_IN_SECONDS, name="CoolingFan"
+        )
+
+    def test_cooling_fan_tick__emergency__stops_and_returns_false(self):
+        self.cooling_fan_controller.running = True
+        self.cooling_fan_controller.emergency = True
+
+        self.assertFalse(self.cooling_fan_controller.cooling_fan_tick())
+        self.assertFalse(self.cooling_fan_controller.running)
+
+    @patch("src.components.cooling.CoolingFanController.Scheduler")
+    def test_apply_settings__interval_changed_while_running__updates_period_of_loop(self, mock_scheduler):
+        self.cooling_fan_controller.start()
+
+        Settings().update({"COOLING_FAN_UPDATE_INTERVAL_IN_SECONDS": 0.5})
+
+        self.assertEqual(mock_scheduler.return_value.schedule.return_value.period, 0.5)
+
+    def test_apply_settings__singleton_retrieved_again__applies_once_per_change(self):
+        controller = CoolingFanController()
+        controller.runner = MagicMock()
+        controller.logger = MagicMock()
+
+        Settings().update({"COOLING_FAN_UPDATE_INTERVAL_IN_SECONDS": 0.5})
+
+        controller.logger.log.assert_called_once_with("Cooling Fan update interval set to 0.5s", LogLevel.INFO)
+
+    def test_apply_settings__not_running__changes_nothing(self):
+        Settings().update({"COOLING_FAN_UPDATE_INTERVAL_IN_SECONDS": 0.5})
+
+        self.assertIsNone(self.cooling_fan_controller.runner)
+
+    def test_cooling_fan_cycle__step_changed_at_runtime__uses_new_step(self):
+        self.cooling_fan_controller.sensors.magnetron_temp1.return_value = 200.0
+        self.cooling_fan_controller.sensors.magnetron_temp2.return_value = 200.0
+        self.cooling_fan_controller.cooling_fan.power_share = 0.0
+
+        Settings().update({"COOLING_FAN_STEP_IN_PERCENT": 0.3})
+        self.cooling_fan_controller.cooling_fan_cycle()
+
+        self.assertAlmostEqual(self.cooling_fan_controller.cooling_fan.power_share, 0.3)
@@ -74,7 +74,7 @@ class TestDoorController(unittest.TestCase):
 
         self.controller.check()
 
-        self.mock_logger.log.assert_called_with("Door locked: True and opened: False", LogLevel.DEBUG)
+        self.mock_logger.log.assert_called_with("Door locked: %s and opened: %s", LogLevel.DEBUG, True, False)
 
     def test_check__unlocked_and_opened__no_exception(self):
         self.mock_door.opened = True
@@ -82,7 +82,7 @@ class TestDoorController(unittest.TestCase):
 
         self.controller.check()
 
-        self.mock_logger.log.assert_called_with("Door locked: False and opened: True", LogLevel.DEBUG)
+        self.mock_logger.log.assert_called_with("Door locked: %s and opened: %s", LogLevel.DEBUG, False, True)
 
     def test_check__unlocked_and_closed__no_exception(self):
         self.mock_door.opened = False
@@ -90,7 +90,15 @@ class TestDoorController(unittest.TestCase):
 
         self.controller.check()
 
-        self.mock_logger.log.assert_called_with("Door locked: False and opened: False", LogLevel.DEBUG)
+        self.mock_logger.log.assert_called_with("Door locked: %s and opened: %s", LogLevel.DEBUG, False, False)
+
+    def test_check__debug_disabled__logs_deferred_for_flight_log(self):
+        self.mock_logger.is_enabled.return_value = False
+        self.mock_door.opened = False
+
+        self.controller.check()
+
+        self.mock_logger.log.assert_called_once_with("Door locked: %s and opened: %s", LogLevel.DEBUG, False, False)
 
     def test_integration_lock_unlock_check__various_states__expected_behaviors(self):
         class DummyDoor:
@@ -5,6 +5,7 @@ from src.components.door.Door import Door
 from src.components.light.Light import Light
 from src.components.light.LightController import LightController
 from src.helper.Logger import Logger
+from src.helper.config import LIGHT_UPDATE_INTERVAL_IN_SECONDS
 from src.helper.logging.LogLevel import LogLevel
 from src.program.ProgramController import ProgramController
 
@@ -98,3 +99,20 @@ class TestLightController(unittest.TestCase):
                 self.light_controller.light_loop()
 
                 mock_light_cycle.assert_called_once()
+
+    def test_start__scheduler_installed__schedules_light_tick(self):
+        self.light_controller.running = False
+
+        with patch("src.components.light.LightController.Scheduler") as mock_scheduler:
+            self.light_controller.start()
+
+            mock_scheduler.return_value.schedule.assert_called_once_with(
+                self.light_controller.light_tick, LIGHT_UPDATE_INTERVAL_IN_SECONDS, name="Light"
+            )
+
+    def test_light_tick__not_running__returns_false(self):
+        self.light_controller.running = False
+
+        with patch.object(self.light_controller, "light_cycle") as mock_light_cycle:
+            self.assertFalse(self.light_controller.light_tick())
+            mock_light_cycle.assert_not_called()
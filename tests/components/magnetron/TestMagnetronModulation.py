@@ -0,0 +1,13 @@
+import unittest
+
+from src.components.magnetron.MagnetronModulation import MagnetronModulation
+from src.helper.config import MAGNETRON_MODULATION
+
+
+class TestMagnetronModulation(unittest.TestCase):
+    def test_magnetron_modulation__valid_enum_values__correctly_assigned(self):
+        self.assertEqual(MagnetronModulation.RANDOM.value, "RANDOM")
+        self.assertEqual(MagnetronModulation.SIGMA_DELTA.value, "SIGMA_DELTA")
+
+    def test_magnetron_modulation__configured_name__resolves_member(self):
+        self.assertIsInstance(MagnetronModulation[MAGNETRON_MODULATION], MagnetronModulation)
@@ -1,13 +1,24 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+from src.components.magnetron.MagnetronModulation import MagnetronModulation
 from src.components.magnetron.MagnetronModulator import MagnetronModulator
-from src.helper.config import MAGNETRON_MAX_POWER_SHARE_PER_MINUTE, MAGNETRON_MAX_TEMP_IN_CELSIUS
+from src.components.magnetron.MagnetronRingbuffer import MagnetronRingbuffer
+from src.helper.OvenContext import OvenContext
+from src.helper.Settings import Settings
+from src.helper.configuration.RuntimeConfig import RuntimeConfig
+from src.helper.config import MAGNETRON_MAX_POWER_SHARE_PER_MINUTE, MAGNETRON_MAX_TEMP_IN_CELSIUS, \
+    MAGNETRON_ON_OFF_INTERVAL_IN_SECONDS
 from src.helper.logging.LogLevel import LogLevel
+from src.helper.noise.NoiseSource import NoiseSource
 
 
 class TestMagnetronModulator(unittest.TestCase):
     def setUp(self):
+        self.original_settings = Settings()
+        Settings.use(RuntimeConfig())
+        Settings().logger = MagicMock()
+        self.addCleanup(Settings.use, self.original_settings)
         MagnetronModulator._instance = None
         self.modulator = MagnetronModulator()
         self.modulator.logger.log = MagicMock()
@@ -15,9 +26,17 @@ class TestMagnetronModulator(unittest.TestCase):
         self.modulator.magnetron.turn_off = MagicMock()
         self.modulator.power_history.add = MagicMock()
         self.modulator.power_history.power_share = MagicMock(return_value=0)
+        self.modulator.power_history.power_share_after = MagicMock(return_value=0)
         self.modulator.sensor_manager.magnetron_temp1 = MagicMock(return_value=25)
         self.modulator.sensor_manager.magnetron_temp2 = MagicMock(return_value=25)
 
+    def test_init__context__draws_from_noise_source_of_oven(self):
+        context = OvenContext()
+
+        modulator = MagnetronModulator(context)
+
+        self.assertIs(modulator.noise, context.get(NoiseSource).stream("MagnetronModulator"))
+
     def test_set_target_power_share__valid_value__sets_correctly(self):
         self.modulator.target_power_share = 0.1
 
@@ -34,8 +53,9 @@ class TestMagnetronModulator(unittest.TestCase):
             with self.assertRaises(ValueError):
                 self.modulator.set_target_power_share(value)
 
-    @patch("src.components.magnetron.MagnetronModulator.random.uniform", return_value=0.6)
+    @patch("src.helper.noise.NoiseStream.NoiseStream.uniform", return_value=0.6)
     def test_magnetron_cycle__within_power_limit__turns_on_magnetron(self, mock_random):
+        self.modulator.modulation = MagnetronModulation.RANDOM
         self.modulator.set_target_power_share(0.7)
         self.modulator.power_history.power_share.return_value = MAGNETRON_MAX_POWER_SHARE_PER_MINUTE - 1
         self.modulator.magnetron_cycle()
@@ -43,8 +63,9 @@ class TestMagnetronModulator(unittest.TestCase):
         self.modulator.magnetron.turn_on.assert_called_once()
         self.modulator.power_history.add.assert_called_with(True)
 
-    @patch("src.components.magnetron.MagnetronModulator.random.uniform", return_value=0.8)
+    @patch("src.helper.noise.NoiseStream.NoiseStream.uniform", return_value=0.8)
     def test_magnetron_cycle__random_above_target__turns_off_magnetron(self, mock_random):
+        self.modulator.modulation = MagnetronModulation.RANDOM
         self.modulator.set_target_power_share(0.7)
         self.modulator.power_history.power_share.return_value = 0
         self.modulator.magnetron_cycle()
@@ -52,7 +73,7 @@ class TestMagnetronModulator(unittest.TestCase):
         self.modulator.magnetron.turn_off.assert_called_once()
         self.modulator.power_history.add.assert_called_with(False)
 
-    @patch("src.components.magnetron.MagnetronModulator.random.uniform", return_value=0.6)
+    @patch("src.helper.noise.NoiseStream.NoiseStream.uniform", return_value=0.6)
     def test_magnetron_cycle__exceeds_power_limit__skips_magnetron_cycle(self, mock_random):
         self.modulator.set_target_power_share(0.7)
         self.modulator.power_history.power_share.return_value = MAGNETRON_MAX_POWER_SHARE_PER_MINUTE + 1
@@ -63,7 +84,7 @@ class TestMagnetronModulator(unittest.TestCase):
         self.modulator.logger.log.assert_called_with("Power share limit exceeded, skipping magnetron cycle",
                                                      LogLevel.WARNING)
 
-    @patch("src.components.magnetron.MagnetronModulator.random.uniform", return_value=0.6)
+    @patch("src.helper.noise.NoiseStream.NoiseStream.uniform", return_value=0.6)
     def test_magnetron_cycle__exceeds_temp_limit__skips_magnetron_cycle(self, mock_random):
         self.modulator.set_target_power_share(0.7)
         self.modulator.sensor_manager.magnetron_temp1.return_value = MAGNETRON_MAX_TEMP_IN_CELSIUS + 1
@@ -76,6 +97,70 @@ class TestMagnetronModulator(unittest.TestCase):
             LogLevel.WARNING
         )
 
+    def test_init__default_config__uses_sigma_delta_modulation(self):
+        self.assertIs(self.modulator.modulation, MagnetronModulation.SIGMA_DELTA)
+        self.assertEqual(self.modulator.owed_power, 0.0)
+
+    def test_power_cycle__sigma_delta__delivers_target_share_exactly(self):
+        for target, cycles, powered in [(0.2, 600, 120), (0.35, 600, 210), (0.5, 10, 5), (0.0, 600, 0)]:
+            self.modulator.owed_power = 0.0
+            self.modulator.target_power_share = target
+
+            self.assertEqual(sum(self.modulator.power_cycle() for _ in range(cycles)), powered)
+
+    def test_power_cycle__sigma_delta__spreads_cycles_evenly(self):
+        self.modulator.target_power_share = 0.5
+
+        self.assertEqual([self.modulator.power_cycle() for _ in range(4)], [False, True, False, True])
+
+    def test_power_cycle__sigma_delta_power_limit_reached__defers_cycle(self):
+        self.modulator.target_power_share = 0.9
+        self.modulator.owed_power = 0.9
+        self.modulator.power_history.power_share_after.return_value = MAGNETRON_MAX_POWER_SHARE_PER_MINUTE + 0.1
+
+        self.assertFalse(self.modulator.power_cycle())
+        self.assertEqual(self.modulator.owed_power, 1.0)
+
+    def test_magnetron_cycle__sigma_delta_real_history__never_exceeds_power_limit(self):
+        modulator = MagnetronModulator(OvenContext())
+        modulator.logger.log = MagicMock()
+        modulator.magnetron.turn_on = MagicMock()
+        modulator.magnetron.turn_off = MagicMock()
+        modulator.set_target_power_share(1.0)
+
+        for _ in range(1200):
+            modulator.magnetron_cycle()
+            self.assertLessEqual(modulator.power_history.power_share(), MAGNETRON_MAX_POWER_SHARE_PER_MINUTE)
+
+        self.assertAlmostEqual(modulator.power_history.powered, 480, delta=1)
+        self.assertNotIn(("Power share limit exceeded, skipping magnetron cycle", LogLevel.WARNING),
+                         [call.args for call in modulator.logger.log.call_args_list])
+
+    @patch("src.helper.noise.NoiseStream.NoiseStream.uniform", return_value=0.6)
+    def test_power_cycle__random__compares_noise_with_target(self, mock_random):
+        self.modulator.modulation = MagnetronModulation.RANDOM
+
+        self.modulator.target_power_share = 0.7
+        self.assertTrue(self.modulator.power_cycle())
+        self.modulator.target_power_share = 0.6
+        self.assertFalse(self.modulator.power_cycle())
+
+    def test_magnetron_cycle__safety_hazard__counts_safety_hit(self):
+        self.modulator.sensor_manager.magnetron_temp1.return_value = MAGNETRON_MAX_TEMP_IN_CELSIUS + 1
+
+        self.modulator.magnetron_cycle()
+        self.modulator.sensor_manager.magnetron_temp1.return_value = 25
+        self.modulator.magnetron_cycle()
+
+        self.assertEqual(self.modulator.safety_hits, 1)
+
+    def test_magnetron_cycle__called__logs_power_share_deferred_for_flight_log(self):
+        self.modulator.target_power_share = 40
+
+        self.modulator.magnetron_cycle()
+
+        self.modulator.logger.log.assert_any_call("Updating Magnetron - currently at %s%%", LogLevel.DEBUG, 40)
+
     def test_safety_hazard__power_share_exceeded__returns_true(self):
         self.modulator.power_history.power_share.return_value = MAGNETRON_MAX_POWER_SHARE_PER_MINUTE + 1
         result = self.modulator.safety_hazard()
@@ -126,7 +211,7 @@ class TestMagnetronModulator(unittest.TestCase):
 
         self.assertFalse(self.modulator.running)
 
-    @patch("src.components.magnetron.MagnetronModulator.time.sleep", return_value=None)
+    @patch("time.sleep", return_value=None)
     @patch.object(MagnetronModulator, "magnetron_cycle")
     def test_magnetron_loop__runs_until_running_false(self, mock_cycle, mock_sleep):
         call_count = [0]
@@ -142,3 +227,55 @@ class TestMagnetronModulator(unittest.TestCase):
 
         self.assertEqual(call_count[0], 3)
         self.assertFalse(self.modulator.running)
+
+    @patch("src.components.magnetron.MagnetronModulator.Scheduler")
+    def test_start__scheduler_installed__schedules_magnetron_tick(self, mock_scheduler):
+        self.modulator.start()
+
+        mock_scheduler.return_value.schedule.assert_called_once_with(
+            self.modulator.magnetron_tick, MAGNETRON_ON_OFF_INTERVAL_IN_SECONDS, name="Magnetron"
+        )
+        self.assertIs(self.modulator.thread, mock_scheduler.return_value.schedule.return_value)
+
+    @patch.object(MagnetronModulator, "magnetron_cycle")
+    def test_magnetron_tick__running__runs_cycle_and_returns_true(self, mock_cycle):
+        self.modulator.running = True
+
+        self.assertTrue(self.modulator.magnetron_tick())
+        mock_cycle.assert_called_once()
+
+    @patch.object(MagnetronModulator, "magnetron_cycle")
+    def test_magnetron_tick__not_running__returns_false(self, mock_cycle):
+        self.modulator.running = False
+
+        self.assertFalse(self.modulator.magnetron_tick())
+        mock_cycle.assert_not_called()
+
+    def test_safety_hazard__power_limit_lowered_at_runtime__returns_true(self):
+        self.modulator.power_history.power_share.return_value = 0.5
+
+        Settings().update({"MAGNETRON_MAX_POWER_SHARE_PER_MINUTE": 0.4})
+
+        self.assertTrue(self.modulator.safety_hazard())
+
+    def test_apply_settings__modulation_changed__switches_modulation_and_clears_owed_power(self):
+        self.modulator.modulation = MagnetronModulation.SIGMA_DELTA
+        self.modulator.owed_power = 0.7
+
+        Settings().update({"MAGNETRON_MODULATION": "RANDOM"})
+
+        self.assertIs(self.modulator.modulation, MagnetronModulation.RANDOM)
+        self.assertEqual(self.modulator.owed_power, 0.0)
+
+    def test_apply_settings__interval_changed__resizes_history_keeping_newest_and_sets_period(self):
+        history = MagnetronRingbuffer(600)
+        for index in range(600):
+            history.add(index >= 500)
+        self.modulator.power_history = history
+        self.modulator.runner = MagicMock()
+
+        Settings().update({"MAGNETRON_ON_OFF_INTERVAL_IN_SECONDS": 0.5})
+
+        self.assertEqual(self.modulator.power_history.size, 120)
+        self.assertEqual(self.modulator.power_history.get(), [False] * 20 + [True] * 100)
+        self.assertEqual(self.modulator.runner.period, 0.5)
@@ -98,3 +98,64 @@ class TestMagnetronRingbuffer(unittest.TestCase):
         self.ringbuffer.get = MagicMock(return_value=[True, False, True])
 
         self.assertEqual(self.ringbuffer.get(), [True, False, True])
+
+    def test_power_share__after_overwriting_items__matches_stored_items(self):
+        items = [True, False, True, True, False, False, True, True, False]
+        for item in items:
+            self.ringbuffer.add(item)
+
+        self.assertEqual(self.ringbuffer.powered, sum(self.ringbuffer.get()))
+        self.assertEqual(self.ringbuffer.power_share(), sum(items[-5:]) / 5)
+
+    def test_add__packed__stores_bits(self):
+        ringbuffer = MagnetronRingbuffer(600, packed=True)
+        ringbuffer.add(True)
+
+        self.assertEqual(len(ringbuffer.buffer), 75)
+        self.assertEqual(ringbuffer.get(), [True])
+
+    def test_get__packed_after_overwriting_items__returns_items_in_order(self):
+        ringbuffer = MagnetronRingbuffer(10, packed=True)
+        items = [index % 3 == 0 for index in range(23)]
+        for item in items:
+            ringbuffer.add(item)
+
+        self.assertEqual(ringbuffer.get(), items[-10:])
+        self.assertEqual(len(ringbuffer), 10)
+        self.assertEqual(ringbuffer.power_share(), sum(items[-10:]) / 10)
+
+    def test_add__packed_invalid_type__raises_value_error(self):
+        ringbuffer = MagnetronRingbuffer(8, packed=True)
+
+        with self.assertRaises(ValueError):
+            ringbuffer.add(1)
+
+    def test_sum__packed_window_given__counts_newest_true_values(self):
+        ringbuffer = MagnetronRingbuffer(4, packed=True)
+        for item in [True, True, False, True, False, True]:
+            ringbuffer.add(item)
+
+        self.assertEqual(ringbuffer.sum(), 2)
+        self.assertEqual(ringbuffer.sum(3), 2)
+        self.assertEqual(ringbuffer.mean(2), 0.5)
+
+    def test_power_share_after__not_full__counts_added_item(self):
+        self.ringbuffer.add(True)
+        self.ringbuffer.add(False)
+
+        self.assertEqual(self.ringbuffer.power_share_after(True), 2 / 3)
+        self.assertEqual(self.ringbuffer.power_share_after(False), 1 / 3)
+
+    def test_power_share_after__full__drops_oldest_item(self):
+        for item in [True, False, False, False, False]:
+            self.ringbuffer.add(item)
+
+        self.assertEqual(self.ringbuffer.power_share_after(True), 1 / 5)
+        self.assertEqual(self.ringbuffer.power_share_after(False), 0.0)
+
+    def test_power_share_after__packed_full__drops_oldest_item(self):
+        ringbuffer = MagnetronRingbuffer(3, packed=True)
+        for item in [False, True, True]:
+            ringbuffer.add(item)
+
+        self.assertEqual(ringbuffer.power_share_after(True), 1.0)
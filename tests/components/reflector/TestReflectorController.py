@@ -38,7 +38,7 @@ class TestReflectorController(unittest.TestCase):
         self.reflector_controller.target_angle = 30
         self.reflector_controller.set_angle(30)
 
-        self.reflector_controller.logger.info.assert_not_called()
+        self.reflector_controller.logger.log.assert_not_called()
 
     def test_update__target_angle_reached__does_not_change_angle(self):
         self.reflector_controller.reflector.angle = 30
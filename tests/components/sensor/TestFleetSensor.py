@@ -0,0 +1,27 @@
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from src.components.sensor.FleetSensor import FleetSensor
+
+
+class TestFleetSensor(unittest.TestCase):
+    def setUp(self):
+        self.engine = MagicMock()
+        self.engine.temp1 = np.array([22.0, 35.5])
+        self.sensor = FleetSensor(self.engine, "temp1", 1)
+
+    def test_get__slot_given__returns_value_of_slot(self):
+        self.assertEqual(self.sensor.get(), 35.5)
+        self.assertIsInstance(self.sensor.get(), float)
+
+    def test_update__called__leaves_value_unchanged(self):
+        self.sensor.update()
+
+        self.assertEqual(self.sensor.get(), 35.5)
+
+    def test_reset__called__resets_slot_in_engine(self):
+        self.sensor.reset()
+
+        self.engine.reset.assert_called_once_with(1, "temp1")
@@ -0,0 +1,109 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from src.components.cooling.CoolingFan import CoolingFan
+from src.components.door.Door import Door
+from src.components.magnetron.Magnetron import Magnetron
+from src.components.sensor.FleetSensor import FleetSensor
+from src.components.sensor.FleetSensorEngine import FleetSensorEngine
+from src.components.sensor.SensorManager import SensorManager
+from src.components.sensor.SimulationSensorTemp1 import SimulationSensorTemp1
+from src.helper.OvenContext import OvenContext
+from src.helper.config import AMBIENT_TEMPERATURE_IN_CELSIUS, AMBIENT_HUMIDITY_IN_PERCENT, TURNTABLE_WEIGHT_IN_GRAMS
+
+
+class TestFleetSensorEngine(unittest.TestCase):
+    def setUp(self):
+        self.engine = FleetSensorEngine(capacity=2, seed=1)
+        self.contexts = [OvenContext(f"Oven {i}") for i in range(3)]
+        self.slots = [self.engine.attach(context) for context in self.contexts]
+
+    def _step_without_noise(self):
+        self.engine.rng = MagicMock()
+        self.engine.rng.uniform.side_effect = lambda low, high, shape: np.zeros(shape)
+        self.engine.step()
+
+    def test___init__non_positive_capacity__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            FleetSensorEngine(capacity=0)
+
+    def test_attach__beyond_capacity__grows_arrays_and_assigns_slots(self):
+        self.assertEqual(self.slots, [0, 1, 2])
+        self.assertEqual(self.engine.size, 3)
+        self.assertGreaterEqual(len(self.engine.temp1), 3)
+        self.assertEqual(self.engine.weight[2], TURNTABLE_WEIGHT_IN_GRAMS)
+
+    def test_attach__context_given__registers_fleet_sensors(self):
+        sensor = self.contexts[1].get(SimulationSensorTemp1)
+
+        self.assertIsInstance(sensor, FleetSensor)
+        self.assertEqual(sensor.slot, 1)
+
+    def test_attach__sensor_manager_of_context__reads_slot(self):
+        sensor_manager = self.contexts[1].get(SensorManager)
+        self.engine.temp1[1] = 50.0
+        self.engine.magnetron_temp2[1] = 80.0
+
+        self.assertEqual(sensor_manager.inner_temp1(), 50.0)
+        self.assertEqual(sensor_manager.magnetron_temp2(), 80.0)
+        self.assertEqual(sensor_manager.inner_humidity(), AMBIENT_HUMIDITY_IN_PERCENT)
+
+    def test_step__magnetron_active__heats_only_that_oven(self):
+        self.contexts[0].get(Magnetron).turn_on()
+
+        self._step_without_noise()
+
+        self.assertAlmostEqual(self.engine.temp1[0], AMBIENT_TEMPERATURE_IN_CELSIUS + 0.1)
+        self.assertAlmostEqual(self.engine.humidity[0], AMBIENT_HUMIDITY_IN_PERCENT + 0.1)
+        self.assertAlmostEqual(self.engine.magnetron_temp1[0], AMBIENT_TEMPERATURE_IN_CELSIUS + 0.3)
+        self.assertEqual(self.engine.temp1[1], AMBIENT_TEMPERATURE_IN_CELSIUS)
+
+    def test_step__cooling_and_door_open__clamps_to_ambient(self):
+        self.engine.temp2[:3] = 30.0
+        self.engine.magnetron_temp1[:3] = 30.0
+        self.contexts[2].get(Door).open()
+        self.contexts[2].get(CoolingFan).power_share = 1.0
+
+        self._step_without_noise()
+
+        self.assertAlmostEqual(self.engine.temp2[2], 30.0 - 0.12)
+        self.assertAlmostEqual(self.engine.magnetron_temp1[2], 30.0 - 0.45)
+        self.assertEqual(self.engine.humidity[2], AMBIENT_HUMIDITY_IN_PERCENT)
+
+    def test_step__door_opened__adds_weight_once(self):
+        self.contexts[1].get(Door).open()
+
+        self._step_without_noise()
+        self._step_without_noise()
+
+        self.assertEqual(self.engine.weight[1], TURNTABLE_WEIGHT_IN_GRAMS + 530)
+        self.assertEqual(self.engine.weight[0], TURNTABLE_WEIGHT_IN_GRAMS)
+
+    def test_step__same_rules_as_simulation_sensors__matches_scalar_sensor(self):
+        context = OvenContext("Reference")
+        reference = SimulationSensorTemp1(context)
+        context.get(Magnetron).turn_on()
+        self.contexts[0].get(Magnetron).turn_on()
+
+        for _ in range(10):
+            with patch.object(reference.noise, "uniform", return_value=0.0):
+                reference.update()
+            self._step_without_noise()
+
+        self.assertAlmostEqual(self.engine.temp1[0], reference.get())
+
+    def test_step__seeded__adds_bounded_noise(self):
+        self.engine.step()
+
+        self.assertTrue(np.all(np.abs(self.engine.temp1[:3] - AMBIENT_TEMPERATURE_IN_CELSIUS) <= 0.01))
+
+    def test_reset__field_given__resets_only_that_field(self):
+        self.engine.temp1[0] = 40.0
+        self.engine.temp2[0] = 40.0
+
+        self.engine.reset(0, "temp1")
+
+        self.assertEqual(self.engine.temp1[0], AMBIENT_TEMPERATURE_IN_CELSIUS)
+        self.assertEqual(self.engine.temp2[0], 40.0)
@@ -0,0 +1,33 @@
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from src.components.sensor.ReplaySensor import ReplaySensor
+
+
+class TestReplaySensor(unittest.TestCase):
+    def setUp(self):
+        self.engine = MagicMock()
+        self.engine.trace = {"inner_temp1": np.array([20.0, 21.5, 23.0])}
+        self.engine.cursor = 1
+        self.sensor = ReplaySensor(self.engine, "inner_temp1")
+
+    def test_get__cursor_given__returns_value_of_row(self):
+        self.assertEqual(self.sensor.get(), 21.5)
+        self.assertIsInstance(self.sensor.get(), float)
+
+    def test_get__cursor_moved__returns_value_of_new_row(self):
+        self.engine.cursor = 2
+
+        self.assertEqual(self.sensor.get(), 23.0)
+
+    def test_update__called__leaves_value_unchanged(self):
+        self.sensor.update()
+
+        self.assertEqual(self.sensor.get(), 21.5)
+
+    def test_reset__called__leaves_value_unchanged(self):
+        self.sensor.reset()
+
+        self.assertEqual(self.sensor.get(), 21.5)
@@ -92,12 +92,12 @@ class TestSensorManager(unittest.TestCase):
 
         self.manager.update_sensors()
 
-        self.mock_logger.log.assert_any_call("Magnetron Temp 1: 80.0", LogLevel.DEBUG)
-        self.mock_logger.log.assert_any_call("Magnetron Temp 2: 85.0", LogLevel.DEBUG)
-        self.mock_logger.log.assert_any_call("Inner Temp 1: 25.5", LogLevel.DEBUG)
-        self.mock_logger.log.assert_any_call("Inner Temp 2: 30.0", LogLevel.DEBUG)
-        self.mock_logger.log.assert_any_call("Inner Weight: 5.0", LogLevel.DEBUG)
-        self.mock_logger.log.assert_any_call("Inner humidity: 60.0", LogLevel.DEBUG)
+        self.mock_logger.log.assert_any_call("Magnetron Temp 1: %s", LogLevel.DEBUG, 80.0)
+        self.mock_logger.log.assert_any_call("Magnetron Temp 2: %s", LogLevel.DEBUG, 85.0)
+        self.mock_logger.log.assert_any_call("Inner Temp 1: %s", LogLevel.DEBUG, 25.5)
+        self.mock_logger.log.assert_any_call("Inner Temp 2: %s", LogLevel.DEBUG, 30.0)
+        self.mock_logger.log.assert_any_call("Inner Weight: %s", LogLevel.DEBUG, 5.0)
+        self.mock_logger.log.assert_any_call("Inner humidity: %s", LogLevel.DEBUG, 60.0)
 
     def test_inner_temp1__sensor_raises_exception__raises_exception(self):
         self.manager.temp1_sensor.get = MagicMock(side_effect=Exception("Sensor error"))
@@ -106,3 +106,18 @@ class TestSensorManager(unittest.TestCase):
             self.manager.inner_temp1()
 
         self.assertEqual(str(context.exception), "Sensor error")
+
+    def test_update_sensors__debug_disabled__logs_deferred_for_flight_log(self):
+        self.mock_logger.is_enabled.return_value = False
+        self.manager.temp1_sensor.get = MagicMock(return_value=25.5)
+
+        self.manager.update_sensors()
+
+        self.mock_logger.log.assert_any_call("Inner Temp 1: %s", LogLevel.DEBUG, 25.5)
+
+    def test_update_sensors__recorder_attached__records_after_update(self):
+        self.manager.recorder = MagicMock()
+
+        self.manager.update_sensors()
+
+        self.manager.recorder.record.assert_called_once()
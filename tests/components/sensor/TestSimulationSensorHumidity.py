@@ -57,7 +57,7 @@ class TestSimulationSensorHumidity(unittest.TestCase):
 
         self.assertLess(self.sensor.get(), initial_humidity)
 
-    @patch("src.components.sensor.SimulationSensorHumidity.random.uniform", return_value=0.01)
+    @patch("src.helper.noise.NoiseStream.NoiseStream.uniform", return_value=0.01)
     def test_update__random_fluctuation__applies_fluctuation(self, mock_random):
         initial_humidity = self.sensor.get()
         self.sensor.update()
@@ -15,7 +15,7 @@ class TestSimulationSensorMagnetronTemp1(unittest.TestCase):
 
         self.assertEqual(result, AMBIENT_TEMPERATURE_IN_CELSIUS)
 
-    @patch('src.components.sensor.SimulationSensorMagnetronTemp1.random.uniform', return_value=0.01)
+    @patch('src.helper.noise.NoiseStream.NoiseStream.uniform', return_value=0.01)
     def test_update__magnetron_active__increases_temperature(self, mock_random):
         self.sensor.magnetron.active = True
         self.sensor.cooling_fan.power_share = 0
@@ -23,7 +23,7 @@ class TestSimulationSensorMagnetronTemp1(unittest.TestCase):
 
         self.assertEqual(self.sensor.temperature, AMBIENT_TEMPERATURE_IN_CELSIUS + 0.3 + 0.01)
 
-    @patch('src.components.sensor.SimulationSensorMagnetronTemp1.random.uniform', return_value=-0.01)
+    @patch('src.helper.noise.NoiseStream.NoiseStream.uniform', return_value=-0.01)
     def test_update__magnetron_inactive__decreases_temperature(self, mock_random):
         self.sensor.magnetron.active = False
         self.sensor.cooling_fan.power_share = 0
@@ -32,7 +32,7 @@ class TestSimulationSensorMagnetronTemp1(unittest.TestCase):
 
         self.assertEqual(self.sensor.temperature, (AMBIENT_TEMPERATURE_IN_CELSIUS + 10) - 0.05 - 0.01)
 
-    @patch('src.components.sensor.SimulationSensorMagnetronTemp1.random.uniform', return_value=0.01)
+    @patch('src.helper.noise.NoiseStream.NoiseStream.uniform', return_value=0.01)
     def test_update__cooling_fan_active__reduces_temperature(self, mock_random):
         self.sensor.magnetron.active = True
         self.sensor.cooling_fan.power_share = 0.5
@@ -40,7 +40,7 @@ class TestSimulationSensorMagnetronTemp1(unittest.TestCase):
 
         self.assertEqual(self.sensor.temperature, AMBIENT_TEMPERATURE_IN_CELSIUS + 0.3 - 0.4 * 0.5 + 0.01)
 
-    @patch('src.components.sensor.SimulationSensorMagnetronTemp1.random.uniform', return_value=0.0)
+    @patch('src.helper.noise.NoiseStream.NoiseStream.uniform', return_value=0.0)
     def test_update__temperature_below_ambient__clamps_to_ambient(self, mock_random):
         self.sensor.temperature = AMBIENT_TEMPERATURE_IN_CELSIUS - 10
         self.sensor.magnetron.active = False
@@ -21,7 +21,7 @@ class TestSimulationSensorTemp1(unittest.TestCase):
 
         self.assertEqual(result, AMBIENT_TEMPERATURE_IN_CELSIUS)
 
-    @patch("src.components.sensor.SimulationSensorTemp1.random.uniform", return_value=0)
+    @patch("src.helper.noise.NoiseStream.NoiseStream.uniform", return_value=0)
     def test_update__magnetron_active__increases_temperature(self, mock_random):
         self.sensor.magnetron.active = True
         initial_temperature = self.sensor.get()
@@ -29,7 +29,7 @@ class TestSimulationSensorTemp1(unittest.TestCase):
 
         self.assertGreater(self.sensor.get(), initial_temperature)
 
-    @patch("src.components.sensor.SimulationSensorTemp1.random.uniform", return_value=0)
+    @patch("src.helper.noise.NoiseStream.NoiseStream.uniform", return_value=0)
     def test_update__door_opened__decreases_temperature(self, mock_random):
         self.sensor.door.opened = True
         self.sensor.temperature = 50
@@ -38,7 +38,7 @@ class TestSimulationSensorTemp1(unittest.TestCase):
 
         self.assertLess(self.sensor.get(), initial_temperature)
 
-    @patch("src.components.sensor.SimulationSensorTemp1.random.uniform", return_value=0)
+    @patch("src.helper.noise.NoiseStream.NoiseStream.uniform", return_value=0)
     def test_update__temperature_never_below_ambient__stays_at_ambient(self, mock_random):
         self.sensor.temperature = AMBIENT_TEMPERATURE_IN_CELSIUS - 1
         self.sensor.update()
@@ -51,7 +51,7 @@ class TestSimulationSensorTemp1(unittest.TestCase):
 
         self.assertEqual(self.sensor.get(), AMBIENT_TEMPERATURE_IN_CELSIUS)
 
-    @patch("src.components.sensor.SimulationSensorTemp1.random.uniform", return_value=0)
+    @patch("src.helper.noise.NoiseStream.NoiseStream.uniform", return_value=0)
     def test_update__door_closed_and_magnetron_inactive__temperature_decreasing(self, mock_random):
         self.sensor.door.opened = False
         self.sensor.magnetron.active = False
@@ -61,7 +61,7 @@ class TestSimulationSensorTemp1(unittest.TestCase):
 
         self.assertLess(self.sensor.get(), initial_temperature)
 
-    @patch("src.components.sensor.SimulationSensorTemp1.random.uniform", return_value=0.005)
+    @patch("src.helper.noise.NoiseStream.NoiseStream.uniform", return_value=0.005)
     def test_update__random_fluctuation__temperature_adjusted(self, mock_random):
         initial_temperature = self.sensor.get()
         self.sensor.update()
@@ -74,7 +74,7 @@ class TestSimulationSensorTemp1(unittest.TestCase):
 
         self.assertEqual(self.sensor.get(), AMBIENT_TEMPERATURE_IN_CELSIUS)
 
-    @patch("src.components.sensor.SimulationSensorTemp1.random.uniform", return_value=0.0)
+    @patch("src.helper.noise.NoiseStream.NoiseStream.uniform", return_value=0.0)
     def test_update__invalid_temperature__clamped_to_ambient(self, mock_random):
         self.sensor.temperature = -100
         self.sensor.update()
@@ -27,7 +27,7 @@ class TestSimulationSensorWeight(unittest.TestCase):
         self.sensor.door.opened = False
         initial_weight = self.sensor.get()
 
-        with patch("random.uniform", return_value=0.05):
+        with patch("src.helper.noise.NoiseStream.NoiseStream.uniform", return_value=0.05):
             self.sensor.update()
 
         self.assertAlmostEqual(self.sensor.get(), initial_weight + 0.05, places=2)
@@ -63,7 +63,7 @@ class TestSimulationSensorWeight(unittest.TestCase):
         self.sensor.door.opened = False
         initial_weight = self.sensor.get()
 
-        with patch("random.uniform", return_value=-0.05):
+        with patch("src.helper.noise.NoiseStream.NoiseStream.uniform", return_value=-0.05):
             self.sensor.update()
 
         self.assertAlmostEqual(self.sensor.get(), initial_weight - 0.05, places=2)
@@ -74,7 +74,7 @@ class TestSimulationSensorWeight(unittest.TestCase):
         self.sensor.last_door_opened = False
         initial_weight = self.sensor.get()
 
-        with patch("random.uniform", return_value=0.02):
+        with patch("src.helper.noise.NoiseStream.NoiseStream.uniform", return_value=0.02):
             self.sensor.update()
 
         self.assertAlmostEqual(self.sensor.get(), initial_weight + 0.02, places=2)
@@ -88,7 +88,7 @@ class TestSimulationSensorWeight(unittest.TestCase):
         first_update_weight = self.sensor.get()
 
         self.sensor.door.opened = False
-        with patch("random.uniform", return_value=0.03):
+        with patch("src.helper.noise.NoiseStream.NoiseStream.uniform", return_value=0.03):
             self.sensor.update()
 
         second_update_weight = self.sensor.get()
@@ -108,7 +108,7 @@ class TestSimulationSensorWeight(unittest.TestCase):
 
         fluctuations = [0.1, -0.05, 0.03]
         for fluctuation in fluctuations:
-            with patch("random.uniform", return_value=fluctuation):
+            with patch("src.helper.noise.NoiseStream.NoiseStream.uniform", return_value=fluctuation):
                 self.sensor.update()
 
         expected_weight = initial_weight + sum(fluctuations)
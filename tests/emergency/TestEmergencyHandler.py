@@ -1,8 +1,11 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+from src.SystemControl import SystemControl
 from src.emergency.EmergencyHandler import EmergencyHandler
+from src.emergency.FlightRecorder import FlightRecorder
 from src.helper.Logger import LogLevel
+from src.helper.OvenContext import OvenContext
 from src.helper.exceptions import CustomException, MockException, DoorException, ProgramAlreadyRunningException
 
 
@@ -12,6 +15,7 @@ class DummySystemControl:
         self.stop_called = False
         self.emergency_stop_called = False
         self.alarm_controller = MagicMock()
+        self.flight_recorder = MagicMock()
 
     def factory_reset(self):
         self.reset_called = True
@@ -26,12 +30,10 @@ class DummySystemControl:
 class TestEmergencyHandler(unittest.TestCase):
     def setUp(self):
         EmergencyHandler._instance = None
+        EmergencyHandler._emergencies.pop(EmergencyHandler, None)
         self.handler = EmergencyHandler()
         self.system_control = DummySystemControl()
 
-    def tearDown(self):
-        EmergencyHandler.error = None
-
     def test_observe__normal_flow__returns_result_and_no_error(self):
         class Dummy:
             @EmergencyHandler.observe
@@ -41,7 +43,7 @@ class TestEmergencyHandler(unittest.TestCase):
         d = Dummy()
 
         self.assertEqual(d.foo(1), 2)
-        self.assertIsNone(EmergencyHandler.error)
+        self.assertIsNone(self.handler.error)
 
     def test_observe__custom_exception_raised__calls_declare_emergency_and_logs(self):
         class Dummy:
@@ -63,7 +65,98 @@ class TestEmergencyHandler(unittest.TestCase):
             d.declare_emergency.assert_called_once()
             log_mock.assert_called()
 
-        self.assertIsInstance(EmergencyHandler.error, CustomException)
+        self.assertIsInstance(self.handler.error, CustomException)
+
+    def test_observe__custom_exception_with_own_handler__sets_error_on_own_handler(self):
+        class Dummy:
+            def __init__(self):
+                self.emergency_handler = EmergencyHandler(OvenContext())
+
+            @EmergencyHandler.observe
+            def foo(self):
+                raise CustomException("fail")
+
+            def declare_emergency(self):
+                pass
+
+        d = Dummy()
+
+        with patch.object(EmergencyHandler.logger, "log"):
+            d.foo()
+
+        self.assertIsInstance(d.emergency_handler.error, CustomException)
+        self.assertIsNone(self.handler.error)
+
+    def test_observe__custom_exceptions_raised__counts_emergencies(self):
+        class Dummy:
+            def __init__(self):
+                self.emergency_handler = EmergencyHandler(OvenContext())
+
+            @EmergencyHandler.observe
+            def foo(self):
+                raise CustomException("fail")
+
+            def declare_emergency(self):
+                pass
+
+        d = Dummy()
+
+        with patch.object(EmergencyHandler.logger, "log"):
+            d.foo()
+            d.foo()
+
+        self.assertEqual(d.emergency_handler.emergencies, 2)
+
+    def test_emergencies__context_factory_reset__keeps_count(self):
+        context = OvenContext()
+        handler = context.get(EmergencyHandler)
+        handler.emergencies = 3
+
+        with patch.object(SystemControl, "stop"), patch.object(FlightRecorder, "dump"):
+            handler.handle_emergency(context.get(SystemControl))
+
+        self.assertIsNot(context.get(EmergencyHandler), handler)
+        self.assertEqual(context.get(EmergencyHandler).emergencies, 3)
+
+    def test_emergencies__singleton_initialized_again__keeps_count(self):
+        self.handler.emergencies = 3
+
+        EmergencyHandler()
+
+        self.assertEqual(self.handler.emergencies, 3)
+
+    def test_emergencies__other_oven__counts_separately(self):
+        EmergencyHandler(OvenContext()).emergencies = 3
+
+        self.assertEqual(EmergencyHandler(OvenContext()).emergencies, 0)
+
+    def test_observe__custom_exception_raised__flushes_logs(self):
+        class Dummy:
+            @EmergencyHandler.observe
+            def foo(self):
+                raise CustomException("fail")
+
+            def declare_emergency(self):
+                pass
+
+        with patch.object(EmergencyHandler.logger, "log"), \
+                patch("src.emergency.EmergencyHandler.Logger") as logger_mock:
+            Dummy().foo()
+
+            logger_mock.flush.assert_called_once()
+
+    def test_observe__generic_exception_raised__flushes_logs_before_reraising(self):
+        class Dummy:
+            @EmergencyHandler.observe
+            def foo(self):
+                raise ValueError("fail")
+
+        with patch.object(EmergencyHandler.logger, "log"), \
+                patch("src.emergency.EmergencyHandler.Logger") as logger_mock:
+            with self.assertRaises(ValueError):
+                Dummy().foo()
+
+            logger_mock.flush.assert_called_once()
 
     def test_observe__generic_exception_raised__reraises_and_logs(self):
         class Dummy:
@@ -80,10 +173,10 @@ class TestEmergencyHandler(unittest.TestCase):
             log_mock.assert_called()
 
     def test_is_busy__error_none_and_error_set__returns_false_and_true(self):
-        self.assertFalse(EmergencyHandler.is_busy())
-        EmergencyHandler.error = CustomException("fail")
+        self.assertFalse(self.handler.is_busy())
+        self.handler.error = CustomException("fail")
 
-        self.assertTrue(EmergencyHandler.is_busy())
+        self.assertTrue(self.handler.is_busy())
 
     def test_handle_emergency__mock_exception__logs_and_clears_error(self):
         self.handler.error = MockException()
@@ -91,7 +184,7 @@ class TestEmergencyHandler(unittest.TestCase):
             self.handler.handle_emergency(self.system_control)
 
             log_mock.assert_called()
-        self.assertIsNone(EmergencyHandler.error)
+        self.assertIsNone(self.handler.error)
 
     def test_handle_emergency__door_exception__logs_and_stops_system(self):
         self.handler.error = DoorException("door test")
@@ -109,7 +202,7 @@ class TestEmergencyHandler(unittest.TestCase):
             self.handler.handle_emergency(self.system_control)
 
             log_mock.assert_called()
-        self.assertIsNone(EmergencyHandler.error)
+        self.assertIsNone(self.handler.error)
 
     def test_handle_emergency__no_error__logs_and_resets(self):
         self.handler.error = None
@@ -120,6 +213,53 @@ class TestEmergencyHandler(unittest.TestCase):
         self.assertTrue(self.system_control.reset_called)
         self.system_control.alarm_controller.deactivate_alarm.assert_called_once()
 
+    def test_observe__custom_exception_with_flight_recorder__dumps_flight_record(self):
+        class Dummy:
+            def __init__(self):
+                self.emergency_handler = EmergencyHandler(OvenContext())
+                self.flight_recorder = MagicMock()
+
+            @EmergencyHandler.observe
+            def foo(self):
+                raise DoorException("door")
+
+            def declare_emergency(self):
+                pass
+
+        d = Dummy()
+
+        with patch.object(EmergencyHandler.logger, "log"):
+            d.foo()
+
+        d.flight_recorder.dump.assert_called_once_with("DoorException")
+
+    def test_observe__generic_exception_with_flight_recorder__dumps_before_raising(self):
+        class Dummy:
+            flight_recorder = MagicMock()
+
+            @EmergencyHandler.observe
+            def foo(self):
+                raise ValueError("boom")
+
+        with patch.object(EmergencyHandler.logger, "log"), self.assertRaises(ValueError):
+            Dummy().foo()
+
+        Dummy.flight_recorder.dump.assert_called_once_with("ValueError")
+
+    def test_handle_emergency__reset__dumps_flight_record_before_reset(self):
+        self.handler.error = CustomException("real error")
+        with patch.object(self.handler.logger, "log"):
+            self.handler.handle_emergency(self.system_control)
+
+        self.system_control.flight_recorder.dump.assert_called_once_with("FactoryReset")
+
+    def test_handle_emergency__door_exception__does_not_dump_flight_record(self):
+        self.handler.error = DoorException("door test")
+        with patch.object(self.handler.logger, "log"):
+            self.handler.handle_emergency(self.system_control)
+
+        self.system_control.flight_recorder.dump.assert_not_called()
+
     def test_handle_emergency__real_error__logs_and_resets(self):
         self.handler.error = CustomException("real error")
         with patch.object(self.handler.logger, "log") as log_mock:
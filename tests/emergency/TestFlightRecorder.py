@@ -0,0 +1,135 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from src.SystemControl import SystemControl
+from src.components.door.Door import Door
+from src.components.door.DoorController import DoorController
+from src.components.magnetron.Magnetron import Magnetron
+from src.emergency.FlightRecorder import FlightRecorder
+from src.helper.OvenContext import OvenContext
+from src.helper.Settings import Settings
+from src.helper.configuration.RuntimeConfig import RuntimeConfig
+from src.helper.logging.FlightLog import FlightLog
+from src.helper.logging.LogLevel import LogLevel
+from src.helper.logging.LoggerFacade import LoggerFacade
+from src.helper.telemetry.TelemetrySampler import TelemetrySampler
+from src.user.InputDetector import InputDetector
+from src.user.ScriptedInputDetector import ScriptedInputDetector
+
+
+class TestFlightRecorder(unittest.TestCase):
+    def setUp(self):
+        self.original_settings = Settings()
+        Settings.use(RuntimeConfig())
+        Settings().logger = MagicMock()
+        self.addCleanup(Settings.use, self.original_settings)
+        self.directory = tempfile.TemporaryDirectory()
+        self.context = OvenContext("Oven 1")
+        self.recorder = FlightRecorder(self.context)
+        self.recorder.logger = MagicMock()
+        self.recorder.directory = os.path.join(self.directory.name, "records")
+
+    def tearDown(self):
+        LoggerFacade.flight_log = None
+        self.directory.cleanup()
+
+    def test___new__no_context__returns_singleton(self):
+        FlightRecorder._instance = None
+
+        self.assertIs(FlightRecorder(), FlightRecorder())
+        self.assertIsNot(FlightRecorder(OvenContext()), FlightRecorder())
+
+    def test___init__called__preallocates_rows(self):
+        self.assertEqual(self.recorder.samples.shape, (self.recorder.rows, len(TelemetrySampler.COLUMNS)))
+        self.assertEqual(self.recorder.filled, 0)
+
+    def test___init__settings_given__covers_duration_per_main_loop_cycle(self):
+        Settings().update({"MAIN_LOOP_TIMEOUT_IN_SECONDS": 0.5})
+
+        recorder = FlightRecorder(OvenContext())
+
+        self.assertEqual(recorder.rows, round(Settings().FLIGHT_RECORDER_DURATION_IN_SECONDS / 0.5))
+
+    def test_apply_settings__main_loop_timeout_changed__resizes_rows_keeping_newest(self):
+        self.recorder.sampler = MagicMock()
+        self.recorder.sampler.sample.side_effect = [(value,) * len(TelemetrySampler.COLUMNS) for value in range(101)]
+        for _ in range(100):
+            self.recorder.record()
+
+        Settings().update({"MAIN_LOOP_TIMEOUT_IN_SECONDS": self.recorder.duration / 10})
+
+        self.assertEqual(self.recorder.rows, 10)
+        np.testing.assert_array_equal(self.recorder.window()[:, 0], range(90, 100))
+        self.recorder.record()
+        self.assertEqual(self.recorder.window()[-1][0], 100)
+
+    def test_record__called__keeps_sample(self):
+        self.context.get(Magnetron).turn_on()
+
+        self.recorder.record()
+
+        window = self.recorder.window()
+        self.assertEqual(len(window), 1)
+        self.assertEqual(window[0][7], 1.0)
+
+    def test_window__rows_wrapped__returns_oldest_first(self):
+        self.recorder.rows = 3
+        self.recorder.samples = np.zeros((3, len(TelemetrySampler.COLUMNS)))
+        self.recorder.sampler = MagicMock()
+        self.recorder.sampler.sample.side_effect = [(value,) * len(TelemetrySampler.COLUMNS) for value in range(5)]
+
+        for _ in range(5):
+            self.recorder.record()
+
+        np.testing.assert_array_equal(self.recorder.window()[:, 0], [2, 3, 4])
+
+    def test_dump__samples_and_flight_log__writes_both_files(self):
+        LoggerFacade.flight_log = FlightLog(10)
+        LoggerFacade.flight_log.add(LogLevel.DEBUG, "DoorControl", "Door opened")
+        self.recorder.record()
+        self.recorder.record()
+
+        base = self.recorder.dump("DoorException")
+
+        self.assertTrue(os.path.basename(base).endswith("-1-Oven_1-DoorException"))
+        with open(base + ".csv") as file:
+            lines = file.read().splitlines()
+        self.assertEqual(lines[0], ",".join(name for name, _ in TelemetrySampler.COLUMNS))
+        self.assertEqual(len(lines), 4)
+        with open(base + ".log") as file:
+            self.assertIn("DEBUG: DoorControl -> Door opened", file.read())
+
+    def test_dump__door_exception__records_door_state_and_checks(self):
+        LoggerFacade.flight_log = FlightLog(100)
+        self.context.register(FlightRecorder, self.recorder)
+        self.context.register(InputDetector, ScriptedInputDetector())
+        system_control = self.context.get(SystemControl)
+        self.context.get(DoorController).lock()
+        system_control.loop_action()
+
+        self.context.get(Door).opened = True
+        system_control.loop_action()
+
+        (base,) = {os.path.join(self.recorder.directory, os.path.splitext(name)[0])
+                   for name in os.listdir(self.recorder.directory)}
+        with open(base + ".csv") as file:
+            header, *rows = file.read().splitlines()
+        last = dict(zip(header.split(","), rows[-1].split(",")))
+        self.assertEqual((last["door_opened"], last["door_locked"]), ("1", "1"))
+        with open(base + ".log") as file:
+            self.assertIn("DoorControl -> Door locked: True and opened: True", file.read())
+
+    def test_dump__no_flight_log__writes_empty_log(self):
+        base = self.recorder.dump("FactoryReset")
+
+        self.assertEqual(os.path.getsize(base + ".log"), 0)
+
+    def test_dump__write_fails__logs_error_and_returns_none(self):
+        with patch("src.emergency.FlightRecorder.os.makedirs", side_effect=OSError("read-only")):
+            self.assertIsNone(self.recorder.dump("FactoryReset"))
+
+        self.assertEqual(self.recorder.logger.log.call_args.args[1], LogLevel.ERROR)
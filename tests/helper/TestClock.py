@@ -0,0 +1,19 @@
+import unittest
+
+from src.helper.Clock import Clock
+from src.helper.clock.SystemClock import SystemClock
+from src.helper.clock.VirtualClock import VirtualClock
+
+
+class TestClock(unittest.TestCase):
+    def tearDown(self):
+        Clock.use(SystemClock())
+
+    def test___new__default__returns_system_clock(self):
+        self.assertIsInstance(Clock(), SystemClock)
+
+    def test_use__clock_given__returns_installed_clock(self):
+        clock = VirtualClock()
+        Clock.use(clock)
+
+        self.assertIs(Clock(), clock)
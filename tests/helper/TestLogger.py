@@ -1,9 +1,13 @@
+import logging
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from src.helper.Logger import Logger
 from src.helper.config import DEFAULT_LOG_LEVEL
+from src.helper.logging.AsyncLogHandler import AsyncLogHandler
+from src.helper.logging.FlightLog import FlightLog
 from src.helper.logging.LogLevel import LogLevel
+from src.helper.logging.LoggerFacade import LoggerFacade
 
 
 class TestLogger(unittest.TestCase):
@@ -11,6 +15,16 @@ class TestLogger(unittest.TestCase):
         Logger._instances = {}
         self.service_name = "TestService"
         self.default_level = DEFAULT_LOG_LEVEL
+        self.root = logging.getLogger()
+        self.handlers = list(self.root.handlers)
+
+    def tearDown(self):
+        for handler in list(self.root.handlers):
+            self.root.removeHandler(handler)
+            if isinstance(handler, AsyncLogHandler):
+                handler.close()
+        for handler in self.handlers:
+            self.root.addHandler(handler)
 
     def test___new__with_same_service_name__returns_same_instance(self):
         logger1 = Logger("ServiceA")
@@ -46,3 +60,43 @@ class TestLogger(unittest.TestCase):
         logger.log("", LogLevel.INFO)
 
         mock_log.assert_not_called()
+
+    def test_use_async__stream_handler_installed__wraps_handler(self):
+        for handler in list(self.root.handlers):
+            self.root.removeHandler(handler)
+        target = logging.StreamHandler()
+        self.root.addHandler(target)
+
+        handlers = Logger.use_async()
+
+        self.assertEqual(self.root.handlers, handlers)
+        self.assertIsInstance(handlers[0], AsyncLogHandler)
+        self.assertIs(handlers[0].target, target)
+
+    def test_use_async__called_twice__keeps_existing_wrappers(self):
+        first = Logger.use_async()
+        second = Logger.use_async()
+
+        self.assertEqual(first, second)
+
+    def test_use_flight_log__flight_log_given__keeps_messages_of_all_loggers(self):
+        flight_log = FlightLog(4)
+
+        Logger.use_flight_log(flight_log)
+        try:
+            Logger("ServiceA").log("Hidden", LogLevel.DEBUG)
+        finally:
+            Logger.use_flight_log(None)
+
+        self.assertEqual(flight_log.snapshot()[0][3:5], ("ServiceA", "Hidden"))
+        self.assertIsNone(LoggerFacade.flight_log)
+
+    def test_flush__handlers_installed__flushes_every_handler(self):
+        for handler in list(self.root.handlers):
+            self.root.removeHandler(handler)
+        handler = MagicMock(level=0)
+        self.root.addHandler(handler)
+
+        Logger.flush()
+
+        handler.flush.assert_called_once()
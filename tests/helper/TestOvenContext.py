@@ -0,0 +1,110 @@
+import unittest
+
+from src.SystemControl import SystemControl
+from src.components.door.Door import Door
+from src.components.door.DoorController import DoorController
+from src.helper.OvenContext import OvenContext
+from src.program.DefrostingProgram import DefrostingProgram
+
+
+class TestOvenContext(unittest.TestCase):
+    def setUp(self):
+        self.context = OvenContext("Oven 1")
+
+    def test_get__first_access__creates_instance_for_context(self):
+        door = self.context.get(Door)
+
+        self.assertIsInstance(door, Door)
+        self.assertIsNot(door, Door())
+
+    def test_get__repeated_access__returns_same_instance(self):
+        self.assertIs(self.context.get(Door), self.context.get(Door))
+
+    def test_get__dependent_component__resolves_dependency_from_context(self):
+        door_controller = self.context.get(DoorController)
+
+        self.assertIs(door_controller.door, self.context.get(Door))
+
+    def test_register__component_given__returns_registered_component(self):
+        door = Door(self.context)
+        self.context.register(Door, door)
+
+        self.assertIs(self.context.get(Door), door)
+
+    def test_reset__kept_component__drops_all_other_components(self):
+        door = self.context.get(Door)
+        door_controller = self.context.get(DoorController)
+
+        self.context.reset(door_controller)
+
+        self.assertIsNot(self.context.get(Door), door)
+        self.assertIs(self.context.get(DoorController), door_controller)
+
+    def test_resolve__no_context__returns_singleton(self):
+        self.assertIs(OvenContext.resolve(None, Door), Door())
+
+    def test_resolve__context_given__returns_context_instance(self):
+        self.assertIs(OvenContext.resolve(self.context, Door), self.context.get(Door))
+
+    def test_components__created_and_registered__returns_all_in_order(self):
+        door = Door(self.context)
+        self.context.register(Door, door)
+        door_controller = self.context.get(DoorController)
+
+        self.assertEqual(self.context.components(), {Door: door, DoorController: door_controller})
+
+    def test_peek__not_created__returns_none_without_creating(self):
+        self.assertIsNone(OvenContext.peek(self.context, Door))
+        self.assertIsNone(OvenContext.peek(self.context, Door))
+
+    def test_peek__created__returns_context_instance(self):
+        door = self.context.get(Door)
+
+        self.assertIs(OvenContext.peek(self.context, Door), door)
+
+    def test_peek__no_context__returns_singleton_without_initializing(self):
+        door = Door()
+        door.opened = True
+
+        self.assertIs(OvenContext.peek(None, Door), door)
+        self.assertTrue(door.opened)
+
+    def test_observe__no_context__returns_singleton_without_initializing(self):
+        door = Door()
+        door.opened = True
+
+        self.assertIs(OvenContext.observe(None, Door), door)
+        self.assertTrue(door.opened)
+
+    def test_observe__not_created__creates_context_instance(self):
+        door = OvenContext.observe(self.context, Door)
+
+        self.assertIs(self.context.get(Door), door)
+
+    def test_get__two_contexts__builds_independent_systems(self):
+        other = OvenContext("Oven 2")
+
+        system1 = self.context.get(SystemControl)
+        system2 = other.get(SystemControl)
+        system1.door_controller.door.open()
+
+        self.assertIsNot(system1, system2)
+        self.assertIsNot(system1.sensor_manager, system2.sensor_manager)
+        self.assertTrue(system1.door_controller.door.opened)
+        self.assertFalse(system2.door_controller.door.opened)
+
+    def test_get__program_in_context__uses_components_of_context(self):
+        program = DefrostingProgram(self.context)
+
+        self.assertIs(program.sensors, self.context.get(SystemControl).sensor_manager)
+        self.assertIsNot(program.pause_condition, DefrostingProgram.pause_condition)
+
+    def test_factory_reset__context_given__recreates_components_of_context(self):
+        system = self.context.get(SystemControl)
+        door = system.door_controller.door
+
+        system.factory_reset()
+
+        self.assertIs(self.context.get(SystemControl), system)
+        self.assertIsNot(system.door_controller.door, door)
+        self.assertIs(system.door_controller, self.context.get(DoorController))
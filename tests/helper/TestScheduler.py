@@ -0,0 +1,18 @@
+import unittest
+
+from src.helper.Scheduler import Scheduler
+from src.helper.scheduling.TickScheduler import TickScheduler
+
+
+class TestScheduler(unittest.TestCase):
+    def tearDown(self):
+        Scheduler.use(None)
+
+    def test___new__default__returns_none(self):
+        self.assertIsNone(Scheduler())
+
+    def test_use__scheduler_given__returns_installed_scheduler(self):
+        scheduler = TickScheduler()
+        Scheduler.use(scheduler)
+
+        self.assertIs(Scheduler(), scheduler)
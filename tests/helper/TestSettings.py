@@ -0,0 +1,21 @@
+import unittest
+
+from src.helper.Settings import Settings
+from src.helper.configuration.RuntimeConfig import RuntimeConfig
+
+
+class TestSettings(unittest.TestCase):
+    def setUp(self):
+        self.original = Settings()
+
+    def tearDown(self):
+        Settings.use(self.original)
+
+    def test___new__default__returns_runtime_config(self):
+        self.assertIsInstance(Settings(), RuntimeConfig)
+
+    def test_use__settings_given__returns_installed_settings(self):
+        settings = RuntimeConfig()
+        Settings.use(settings)
+
+        self.assertIs(Settings(), settings)
@@ -0,0 +1,101 @@
+import unittest
+
+from src.helper.TypedRingbuffer import TypedRingbuffer
+
+
+class TestTypedRingbuffer(unittest.TestCase):
+    def setUp(self):
+        self.ringbuffer = TypedRingbuffer(4)
+
+    def _fill(self, *items):
+        for item in items:
+            self.ringbuffer.add(item)
+
+    def test___init__non_positive_size__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            TypedRingbuffer(0)
+
+    def test_add__partial_fill__returns_items_and_length(self):
+        self._fill(1.0, 2.0)
+
+        self.assertEqual(self.ringbuffer.get(), [1.0, 2.0])
+        self.assertEqual(len(self.ringbuffer), 2)
+
+    def test_add__overwrite_oldest__returns_newest_items(self):
+        self._fill(1.0, 2.0, 3.0, 4.0, 5.0, 6.0)
+
+        self.assertEqual(self.ringbuffer.get(), [3.0, 4.0, 5.0, 6.0])
+        self.assertEqual(len(self.ringbuffer), 4)
+
+    def test_add__zero_value__counts_as_item(self):
+        self._fill(0.0)
+
+        self.assertEqual(len(self.ringbuffer), 1)
+        self.assertEqual(self.ringbuffer.get(), [0.0])
+
+    def test_add__integer_typecode__stores_integers(self):
+        ringbuffer = TypedRingbuffer(2, "i")
+        ringbuffer.add(7)
+
+        self.assertEqual(ringbuffer.get(), [7])
+        with self.assertRaises(TypeError):
+            ringbuffer.add(1.5)
+
+    def test_segments__wrapped_around__returns_two_views_in_order(self):
+        self._fill(1.0, 2.0, 3.0, 4.0, 5.0)
+
+        older, newer = self.ringbuffer.segments()
+
+        self.assertIsInstance(older, memoryview)
+        self.assertEqual(older.tolist(), [2.0, 3.0, 4.0])
+        self.assertEqual(newer.tolist(), [5.0])
+
+    def test_segments__window_within_newest_segment__returns_single_view(self):
+        self._fill(1.0, 2.0, 3.0, 4.0, 5.0, 6.0)
+
+        older, newer = self.ringbuffer.segments(2)
+
+        self.assertEqual(older.tolist(), [5.0, 6.0])
+        self.assertEqual(len(newer), 0)
+
+    def test_segments__view__does_not_copy_buffer(self):
+        self._fill(1.0)
+
+        older, _ = self.ringbuffer.segments()
+        self.ringbuffer.buffer[0] = 9.0
+
+        self.assertEqual(older[0], 9.0)
+
+    def test_sum__window_given__sums_newest_items(self):
+        self._fill(1.0, 2.0, 3.0, 4.0, 5.0)
+
+        self.assertEqual(self.ringbuffer.sum(), 14.0)
+        self.assertEqual(self.ringbuffer.sum(3), 12.0)
+        self.assertEqual(self.ringbuffer.sum(10), 14.0)
+
+    def test_sum__empty_buffer__returns_zero(self):
+        self.assertEqual(self.ringbuffer.sum(), 0)
+
+    def test_mean__window_given__averages_newest_items(self):
+        self._fill(1.0, 2.0, 3.0, 4.0, 5.0)
+
+        self.assertEqual(self.ringbuffer.mean(), 3.5)
+        self.assertEqual(self.ringbuffer.mean(2), 4.5)
+
+    def test_mean__empty_buffer__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.ringbuffer.mean()
+
+    def test_min_max__wrapped_around__returns_extremes_of_window(self):
+        self._fill(9.0, 1.0, 7.0, 3.0, 5.0)
+
+        self.assertEqual(self.ringbuffer.min(), 1.0)
+        self.assertEqual(self.ringbuffer.max(), 7.0)
+        self.assertEqual(self.ringbuffer.min(2), 3.0)
+        self.assertEqual(self.ringbuffer.max(2), 5.0)
+
+    def test_min_max__empty_buffer__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.ringbuffer.min()
+        with self.assertRaises(ValueError):
+            self.ringbuffer.max()
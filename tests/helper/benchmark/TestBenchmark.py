@@ -0,0 +1,21 @@
+import unittest
+
+from src.helper.benchmark.Benchmark import Benchmark
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_init__valid_arguments__stores_definition(self):
+        def setup():
+            return lambda: None
+
+        benchmark = Benchmark("Test", setup, number=10, repeat=2)
+
+        self.assertEqual(benchmark.name, "Test")
+        self.assertIs(benchmark.setup, setup)
+        self.assertEqual(benchmark.number, 10)
+        self.assertEqual(benchmark.repeat, 2)
+
+    def test_init__non_positive_number_or_repeat__raises_value_error(self):
+        for number, repeat in [(0, 1), (1, 0), (-1, 5)]:
+            with self.assertRaises(ValueError):
+                Benchmark("Test", lambda: (lambda: None), number=number, repeat=repeat)
@@ -0,0 +1,25 @@
+import unittest
+
+from src.helper.benchmark.BenchmarkComparison import BenchmarkComparison
+
+
+class TestBenchmarkComparison(unittest.TestCase):
+    def test_ratio__slower_run__returns_relative_time(self):
+        self.assertAlmostEqual(BenchmarkComparison("Test", 2e-6, 3e-6).ratio(), 1.5)
+
+    def test_ratio__zero_baseline__returns_one_or_infinity(self):
+        self.assertEqual(BenchmarkComparison("Test", 0.0, 0.0).ratio(), 1.0)
+        self.assertEqual(BenchmarkComparison("Test", 0.0, 1e-6).ratio(), float("inf"))
+
+    def test_regressed__slowdown_within_threshold__returns_false(self):
+        self.assertFalse(BenchmarkComparison("Test", 1e-6, 1.05e-6).regressed(0.1))
+
+    def test_regressed__slowdown_above_threshold__returns_true(self):
+        self.assertTrue(BenchmarkComparison("Test", 1e-6, 1.2e-6).regressed(0.1))
+
+    def test_format__regression__marks_line(self):
+        line = BenchmarkComparison("Test", 1e-6, 1.2e-6).format(0.1)
+
+        self.assertTrue(line.startswith("Test"))
+        self.assertIn("+20.0%", line)
+        self.assertTrue(line.endswith("REGRESSION"))
@@ -0,0 +1,35 @@
+import os
+import tempfile
+import unittest
+
+from src.helper.benchmark.BenchmarkReport import BenchmarkReport
+from src.helper.benchmark.BenchmarkResult import BenchmarkResult
+
+
+class TestBenchmarkReport(unittest.TestCase):
+    def setUp(self):
+        self.report = BenchmarkReport([BenchmarkResult("First", 10, [2e-6]), BenchmarkResult("Second", 10, [4e-6])])
+
+    def test_init__no_environment__describes_current_environment(self):
+        for key in ["timestamp", "python", "implementation", "platform", "machine", "cpu_count", "numpy"]:
+            self.assertIn(key, self.report.environment)
+
+    def test_compare__baseline__compares_common_benchmarks_by_median(self):
+        baseline = BenchmarkReport([BenchmarkResult("Second", 10, [2e-6]), BenchmarkResult("Other", 10, [1e-6])], {})
+
+        comparisons = self.report.compare(baseline)
+
+        self.assertEqual([comparison.name for comparison in comparisons], ["Second"])
+        self.assertEqual(comparisons[0].baseline, 2e-6)
+        self.assertEqual(comparisons[0].current, 4e-6)
+
+    def test_load__written_by_save__restores_report(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.json")
+            self.report.save(path)
+
+            loaded = BenchmarkReport.load(path)
+
+        self.assertEqual(loaded.environment, self.report.environment)
+        self.assertEqual(list(loaded.results), ["First", "Second"])
+        self.assertEqual(loaded.results["Second"].times, [4e-6])
@@ -0,0 +1,28 @@
+import unittest
+
+from src.helper.benchmark.BenchmarkResult import BenchmarkResult
+
+
+class TestBenchmarkResult(unittest.TestCase):
+    def setUp(self):
+        self.result = BenchmarkResult("Test", 100, [3e-6, 1e-6, 2e-6])
+
+    def test_init__no_times__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            BenchmarkResult("Test", 100, [])
+
+    def test_best__several_repetitions__returns_fastest(self):
+        self.assertEqual(self.result.best(), 1e-6)
+
+    def test_median__several_repetitions__returns_median(self):
+        self.assertEqual(self.result.median(), 2e-6)
+
+    def test_stdev__single_repetition__returns_zero(self):
+        self.assertEqual(BenchmarkResult("Test", 1, [1.0]).stdev(), 0.0)
+
+    def test_from_dict__written_by_to_dict__restores_result(self):
+        restored = BenchmarkResult.from_dict(self.result.to_dict())
+
+        self.assertEqual(restored.name, "Test")
+        self.assertEqual(restored.number, 100)
+        self.assertEqual(restored.times, self.result.times)
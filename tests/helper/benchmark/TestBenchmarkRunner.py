@@ -0,0 +1,34 @@
+import gc
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.helper.benchmark.Benchmark import Benchmark
+from src.helper.benchmark.BenchmarkRunner import BenchmarkRunner
+
+
+class TestBenchmarkRunner(unittest.TestCase):
+    def test_run__benchmark__calls_setup_per_repetition_and_function_per_call(self):
+        function = MagicMock()
+        setup = MagicMock(return_value=function)
+
+        result = BenchmarkRunner.run(Benchmark("Test", setup, number=4, repeat=3))
+
+        self.assertEqual(setup.call_count, 3)
+        self.assertEqual(function.call_count, 12)
+        self.assertEqual(result.name, "Test")
+        self.assertEqual(len(result.times), 3)
+
+    @patch("src.helper.benchmark.BenchmarkRunner.time.perf_counter", side_effect=[1.0, 3.0])
+    def test_run__timed__returns_time_per_call(self, mock_perf_counter):
+        result = BenchmarkRunner.run(Benchmark("Test", lambda: (lambda: None), number=4, repeat=1))
+
+        self.assertEqual(result.times, [0.5])
+
+    def test_run__function_raises__enables_garbage_collector_again(self):
+        def fail():
+            raise RuntimeError("Failed")
+
+        with self.assertRaises(RuntimeError):
+            BenchmarkRunner.run(Benchmark("Test", lambda: fail, number=1, repeat=1))
+
+        self.assertTrue(gc.isenabled())
@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import patch
+
+from src.helper.Action import Action
+from src.helper.Clock import Clock
+from src.helper.Scheduler import Scheduler
+from src.helper.benchmark.BenchmarkSuite import BenchmarkSuite
+from src.helper.checkpoint.Checkpoint import Checkpoint
+from src.program.ProgramController import ProgramController
+from src.user.InputDetector import InputDetector
+from src.user.ScriptedInputDetector import ScriptedInputDetector
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_benchmarks__called__unique_names(self):
+        names = [benchmark.name for benchmark in BenchmarkSuite.benchmarks()]
+
+        self.assertEqual(len(names), len(set(names)))
+
+    def test_benchmarks__micro_benchmarks__setups_return_callable_functions(self):
+        for benchmark in BenchmarkSuite.benchmarks():
+            if benchmark.name.startswith("DefrostingProgram."):
+                continue
+
+            with self.subTest(benchmark=benchmark.name):
+                function = benchmark.setup()
+                function()
+
+    def test_oven__called__uses_scripted_input(self):
+        context = BenchmarkSuite.oven()
+
+        self.assertIsInstance(context.get(InputDetector), ScriptedInputDetector)
+
+    def test_defrosting_program__run__finishes_program_and_restores_clock_and_scheduler(self):
+        clock, scheduler = Clock(), Scheduler()
+        context = BenchmarkSuite.oven({0: Action.START})
+        with patch.object(BenchmarkSuite, "oven", return_value=context):
+            run = BenchmarkSuite.defrosting_program()
+
+        run()
+
+        program_controller = context.get(ProgramController)
+        self.assertIsNotNone(program_controller.program)
+        self.assertTrue(program_controller.is_finished())
+        self.assertIs(Clock(), clock)
+        self.assertIs(Scheduler(), scheduler)
+
+    def test_warm_checkpoint__called__captures_running_program_once(self):
+        checkpoint = BenchmarkSuite.warm_checkpoint()
+
+        self.assertIsInstance(checkpoint, Checkpoint)
+        self.assertIs(BenchmarkSuite.warm_checkpoint(), checkpoint)
+        self.assertTrue(checkpoint.program["fields"]["running"])
+        self.assertFalse(checkpoint.program["fields"]["finished"])
+        self.assertGreater(checkpoint.time, 0.0)
+
+    def test_resumed_defrosting_program__run__finishes_program_and_restores_clock_and_scheduler(self):
+        clock, scheduler = Clock(), Scheduler()
+        BenchmarkSuite.warm_checkpoint()
+        context = BenchmarkSuite.oven()
+        with patch.object(BenchmarkSuite, "oven", return_value=context):
+            run = BenchmarkSuite.resumed_defrosting_program()
+
+        run()
+
+        program_controller = context.get(ProgramController)
+        self.assertTrue(program_controller.is_finished())
+        self.assertIs(Clock(), clock)
+        self.assertIs(Scheduler(), scheduler)
+
+    @patch.object(BenchmarkSuite, "DEFROSTING_TIMEOUT_IN_SECONDS", 1.0)
+    def test_defrosting_program__not_finished_in_time__raises_timeout_error(self):
+        with self.assertRaises(TimeoutError):
+            BenchmarkSuite.defrosting_program()()
@@ -0,0 +1,244 @@
+import os
+import tempfile
+import unittest
+import zlib
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.SystemControl import SystemControl
+from src.components.door.DoorController import DoorController
+from src.components.magnetron.MagnetronModulator import MagnetronModulator
+from src.components.sensor.SensorManager import SensorManager
+from src.emergency.EmergencyHandler import EmergencyHandler
+from src.helper.Action import Action
+from src.helper.Clock import Clock
+from src.helper.OvenContext import OvenContext
+from src.helper.Scheduler import Scheduler
+from src.helper.checkpoint.Checkpoint import Checkpoint
+from src.helper.checkpoint.CheckpointCodec import CheckpointCodec
+from src.helper.clock.VirtualClock import VirtualClock
+from src.helper.exceptions import DoorException
+from src.helper.noise.NoiseSource import NoiseSource
+from src.helper.scheduling.TickScheduler import TickScheduler
+from src.program.DefrostingProgram import DefrostingProgram
+from src.program.PredictiveDefrostingProgram import PredictiveDefrostingProgram
+from src.program.ProgramController import ProgramController
+from src.program.ProgramRegistry import ProgramRegistry
+from src.program.RecipeProgram import RecipeProgram
+from src.user.InputDetector import InputDetector
+from src.user.ScriptedInputDetector import ScriptedInputDetector
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        clock, scheduler = Clock(), Scheduler()
+        self.addCleanup(Clock.use, clock)
+        self.addCleanup(Scheduler.use, scheduler)
+        Clock.use(VirtualClock())
+        Scheduler.use(TickScheduler())
+
+    @staticmethod
+    def _oven(actions=None):
+        context = OvenContext("Oven")
+        context.register(InputDetector, ScriptedInputDetector(actions))
+        context.get(NoiseSource).seed(0)
+        return context
+
+    @staticmethod
+    def _run_until(seconds):
+        Scheduler().schedule(lambda: Scheduler().stop(), seconds, seconds, "Stop")
+        Scheduler().run()
+
+    def _warm_oven(self):
+        context = self._oven({0: Action.START})
+        context.get(SystemControl).start()
+        self._run_until(20.0)
+        return context
+
+    def _running_program(self, key, seconds):
+        context = self._oven()
+        context.get(SystemControl).start()
+        context.get(ProgramController).start(ProgramRegistry.create(key, context))
+        self._run_until(seconds)
+        return context
+
+    def _restore(self, checkpoint):
+        Clock.use(VirtualClock(checkpoint.time))
+        Scheduler.use(TickScheduler())
+        context = OvenContext("Oven")
+        context.register(InputDetector, ScriptedInputDetector())
+        return checkpoint.restore(context)
+
+    def test_capture__running_program__captures_components_and_program(self):
+        context = self._warm_oven()
+
+        checkpoint = Checkpoint.capture(context)
+
+        self.assertEqual(checkpoint.name, "Oven")
+        self.assertEqual(checkpoint.time, Clock().monotonic())
+        self.assertTrue(checkpoint.components["src.components.door.DoorController:DoorController"]["fields"]["locked"])
+        self.assertEqual(checkpoint.program["key"], "defrosting")
+        self.assertEqual(checkpoint.program["fields"]["cycles"], context.get(ProgramController).program.cycles)
+
+    def test_capture__no_program__captures_no_program(self):
+        self.assertIsNone(Checkpoint.capture(self._oven()).program)
+
+    def test_from_bytes__encoded_checkpoint__returns_equal_checkpoint(self):
+        checkpoint = Checkpoint.capture(self._warm_oven())
+
+        decoded = Checkpoint.from_bytes(checkpoint.to_bytes())
+
+        self.assertEqual(decoded.time, checkpoint.time)
+        self.assertEqual(decoded.program, checkpoint.program)
+        self.assertEqual(decoded.components.keys(), checkpoint.components.keys())
+
+    def test_from_bytes__invalid_data__raises_value_error(self):
+        data = Checkpoint("Oven", 0.0, {}, None).to_bytes()
+
+        for invalid in [data[:3], b"XXXX" + data[4:], data[:4] + b"\x09\x00" + data[6:], data[:-2]]:
+            with self.subTest(invalid=invalid[:8]), self.assertRaises(ValueError):
+                Checkpoint.from_bytes(invalid)
+
+    def test_from_bytes__payload_missing_values__raises_value_error(self):
+        header = Checkpoint.HEADER.pack(Checkpoint.MAGIC, Checkpoint.VERSION)
+
+        for payload in [[], {"name": "Oven", "time": 0.0, "components": {}}]:
+            data = header + zlib.compress(CheckpointCodec.encode(payload))
+            with self.subTest(payload=payload), self.assertRaises(ValueError):
+                Checkpoint.from_bytes(data)
+
+    def test_load__saved_checkpoint__returns_equal_checkpoint(self):
+        checkpoint = Checkpoint("Oven", 12.5, {}, None)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "oven.checkpoint")
+            checkpoint.save(path)
+            loaded = Checkpoint.load(path)
+
+        self.assertEqual((loaded.name, loaded.time, loaded.components, loaded.program), ("Oven", 12.5, {}, None))
+
+    def test_restore__warm_oven__restores_sensors_buffers_and_program(self):
+        original = self._warm_oven()
+        checkpoint = Checkpoint.from_bytes(Checkpoint.capture(original).to_bytes())
+
+        context = self._restore(checkpoint)
+
+        sensors, original_sensors = context.get(SensorManager), original.get(SensorManager)
+        self.assertEqual(sensors.inner_temp1(), original_sensors.inner_temp1())
+        self.assertEqual(sensors.magnetron_temp2(), original_sensors.magnetron_temp2())
+        self.assertEqual(context.get(MagnetronModulator).power_history.get(),
+                         original.get(MagnetronModulator).power_history.get())
+        program, original_program = context.get(ProgramController).program, original.get(ProgramController).program
+        self.assertIsInstance(program, DefrostingProgram)
+        self.assertEqual(program.cycles, original_program.cycles)
+        self.assertEqual(program.just_updated, original_program.just_updated)
+        self.assertTrue(context.get(DoorController).locked)
+
+    def test_restore__warm_oven__resumes_loops_and_program(self):
+        checkpoint = Checkpoint.capture(self._warm_oven())
+
+        context = self._restore(checkpoint)
+
+        self.assertEqual(context.get(SystemControl).state, SystemControl.State.RUNNING)
+        self.assertTrue(context.get(ProgramController).is_running())
+        self.assertTrue(context.get(MagnetronModulator).running)
+        self.assertLessEqual({"System", "Defrosting Program", "Magnetron", "CoolingFan", "Light"},
+                             {task.name for _, _, task in Scheduler()._queue})
+
+    def test_restore__resumed_oven__continues_like_original(self):
+        original = self._warm_oven()
+        checkpoint = Checkpoint.capture(original)
+        self._run_until(10.0)
+
+        context = self._restore(checkpoint)
+        self._run_until(10.0)
+
+        self.assertEqual(context.get(MagnetronModulator).power_history.get(),
+                         original.get(MagnetronModulator).power_history.get())
+        self.assertAlmostEqual(context.get(SensorManager).inner_temp1(), original.get(SensorManager).inner_temp1(),
+                               delta=0.5)
+
+    def test_restore__recipe_mid_loop__restores_jumps_left(self):
+        original = self._running_program("gentle_defrost", 45.0)
+        checkpoint = Checkpoint.from_bytes(Checkpoint.capture(original).to_bytes())
+        program = original.get(ProgramController).program
+        self.assertLess(program.remaining, list(program.table.repeats))
+
+        restored = self._restore(checkpoint).get(ProgramController).program
+
+        self.assertIsInstance(restored, RecipeProgram)
+        self.assertEqual((restored.step, restored.ticks, restored.remaining),
+                         (program.step, program.ticks, program.remaining))
+        self.assertIsNot(restored.remaining, checkpoint.program["fields"]["remaining"])
+
+    def test_restore__recipe_mid_loop__continues_like_original(self):
+        original = self._running_program("gentle_defrost", 45.0)
+        checkpoint = Checkpoint.capture(original)
+        self._run_until(60.0)
+
+        context = self._restore(checkpoint)
+        self._run_until(60.0)
+
+        program, restored = original.get(ProgramController).program, context.get(ProgramController).program
+        self.assertEqual((restored.step, restored.remaining), (program.step, program.remaining))
+
+    def test_restore__predictive_program__restores_fitted_models_and_last_observation(self):
+        original = self._running_program("predictive_defrosting", 20.0)
+        checkpoint = Checkpoint.from_bytes(Checkpoint.capture(original).to_bytes())
+        controller = original.get(ProgramController).program.controller
+
+        restored = self._restore(checkpoint).get(ProgramController).program.controller
+
+        self.assertGreater(controller.inner_model.observations, 0)
+        np.testing.assert_array_equal(restored.inner_model.gram, controller.inner_model.gram)
+        np.testing.assert_array_equal(restored.magnetron_model.moment, controller.magnetron_model.moment)
+        self.assertEqual(restored.inner_model.observations, controller.inner_model.observations)
+        self.assertEqual(restored.last, controller.last)
+
+    def test_capture__predictive_program__captures_controller_snapshot(self):
+        checkpoint = Checkpoint.capture(self._running_program("predictive_defrosting", 1.0))
+
+        self.assertEqual(checkpoint.program["class"], CheckpointCodec.path(PredictiveDefrostingProgram))
+        self.assertEqual(checkpoint.program["snapshot"].keys(), {"controller"})
+
+    def test_fields__list_of_objects__is_not_captured(self):
+        fields = Checkpoint.fields(self._oven().get(SensorManager))
+
+        self.assertNotIn("sensors", fields)
+
+    def test_apply__tuple_captured_as_list__restores_tuple(self):
+        component = SimpleNamespace(pair=(0, 0))
+        section = {"fields": {"pair": [1, 2]}, "buffers": {}, "snapshot": None}
+
+        Checkpoint.apply(component, section)
+
+        self.assertEqual(component.pair, (1, 2))
+
+    def test_restore__emergency__restores_state_and_error(self):
+        context = self._oven()
+        system_control = context.get(SystemControl)
+        system_control.start()
+        context.get(EmergencyHandler).error = DoorException("Door opened while running")
+        system_control.declare_emergency()
+
+        restored = self._restore(Checkpoint.from_bytes(Checkpoint.capture(context).to_bytes()))
+
+        self.assertEqual(restored.get(SystemControl).state, SystemControl.State.EMERGENCY)
+        self.assertIsInstance(restored.get(EmergencyHandler).error, DoorException)
+        self.assertEqual(str(restored.get(EmergencyHandler).error), "Door opened while running")
+
+    def test_restore__substitute_of_other_class__keeps_substitute(self):
+        checkpoint = Checkpoint.capture(self._oven({5: Action.START}))
+        checkpoint.components["src.user.InputDetector:InputDetector"]["class"] = "other:Detector"
+
+        context = self._restore(checkpoint)
+
+        self.assertEqual(context.get(InputDetector).actions, {})
+
+    def test_apply__ring_buffer_of_other_size__raises_value_error(self):
+        section = Checkpoint.section(self._oven().get(MagnetronModulator))
+        section["buffers"]["power_history"]["data"] += b"\x00"
+
+        with self.assertRaises(ValueError):
+            Checkpoint.apply(self._oven().get(MagnetronModulator), section)
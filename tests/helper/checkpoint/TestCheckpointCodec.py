@@ -0,0 +1,71 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from src.SystemControl import SystemControl
+from src.helper.checkpoint.CheckpointCodec import CheckpointCodec
+from src.helper.exceptions import DoorException
+
+
+class TestCheckpointCodec(unittest.TestCase):
+    def test_decode__encoded_values__returns_equal_values(self):
+        value = {"none": None, "flags": [True, False], "small": -3, "large": 2 ** 127 + 5, "float": 21.5,
+                 "text": "Grüße", "bytes": b"\x00\xff", 7: {"nested": [1.0, "x"]},
+                 "state": SystemControl.State.EMERGENCY}
+
+        self.assertEqual(CheckpointCodec.decode(CheckpointCodec.encode(value)), value)
+
+    def test_decode__encoded_tuple__returns_list(self):
+        self.assertEqual(CheckpointCodec.decode(CheckpointCodec.encode((1, 2))), [1, 2])
+
+    def test_decode__encoded_exception__returns_exception_of_same_class_and_message(self):
+        error = CheckpointCodec.decode(CheckpointCodec.encode(DoorException("Door is open")))
+
+        self.assertIsInstance(error, DoorException)
+        self.assertEqual(str(error), "Door is open")
+
+    def test_decode__encoded_array__returns_equal_array(self):
+        array = np.arange(6, dtype=np.float32).reshape(2, 3)
+
+        decoded = CheckpointCodec.decode(CheckpointCodec.encode(array))
+
+        self.assertEqual(decoded.dtype, np.float32)
+        np.testing.assert_array_equal(decoded, array)
+
+    def test_encode__unsupported_type__raises_type_error(self):
+        with self.assertRaises(TypeError):
+            CheckpointCodec.encode({"value": object()})
+
+    def test_decode__truncated_data__raises_value_error(self):
+        data = CheckpointCodec.encode(["text", 1.5])
+
+        for length in range(len(data)):
+            with self.subTest(length=length), self.assertRaises(ValueError):
+                CheckpointCodec.decode(data[:length])
+
+    def test_decode__trailing_data__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            CheckpointCodec.decode(CheckpointCodec.encode(1) + b"N")
+
+    def test_decode__unknown_tag__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            CheckpointCodec.decode(b"?")
+
+    def test_load__class_not_of_base__raises_value_error(self):
+        for path in ["os:system", "builtins:dict", "missing_module:Class", "src.SystemControl:Missing"]:
+            with self.subTest(path=path), self.assertRaises(ValueError):
+                CheckpointCodec.load(path, Exception)
+
+    def test_load__module_outside_package__raises_value_error_without_import(self):
+        for path in ["plugin_module:Class", "srcfake:Class", ".relative:Class", ":Class"]:
+            with self.subTest(path=path), patch("importlib.import_module") as mock_import_module, \
+                    self.assertRaises(ValueError):
+                CheckpointCodec.load(path, Exception)
+            mock_import_module.assert_not_called()
+
+    def test_load__nested_class__returns_class(self):
+        path = CheckpointCodec.path(SystemControl.State)
+
+        self.assertEqual(path, "src.SystemControl:SystemControl.State")
+        self.assertIs(CheckpointCodec.load(path, SystemControl.State), SystemControl.State)
@@ -0,0 +1,49 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.helper.clock.SystemClock import SystemClock
+
+
+class TestSystemClock(unittest.TestCase):
+    def setUp(self):
+        self.clock = SystemClock()
+
+    def test_monotonic__called__returns_time_monotonic(self):
+        with patch("time.monotonic", return_value=42.0):
+            self.assertEqual(self.clock.monotonic(), 42.0)
+
+    def test_sleep__seconds_given__calls_time_sleep(self):
+        with patch("time.sleep") as mock_sleep:
+            self.clock.sleep(0.5)
+
+            mock_sleep.assert_called_once_with(0.5)
+
+    def test_spawn__target_given__starts_named_thread(self):
+        target = MagicMock()
+
+        thread = self.clock.spawn(target, "TestThread")
+        thread.join()
+
+        self.assertEqual(thread.name, "TestThread")
+        target.assert_called_once()
+
+    def test_join__thread_given__joins_thread(self):
+        thread = MagicMock()
+
+        self.clock.join(thread)
+
+        thread.join.assert_called_once()
+
+    def test_wait_for__predicate_true__returns_immediately(self):
+        condition = threading.Condition()
+
+        with condition:
+            self.assertTrue(self.clock.wait_for(condition, lambda: True))
+
+    def test_notify_all__condition_given__notifies_condition(self):
+        condition = MagicMock()
+
+        self.clock.notify_all(condition)
+
+        condition.notify_all.assert_called_once()
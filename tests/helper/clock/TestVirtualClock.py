@@ -0,0 +1,92 @@
+import threading
+import time
+import unittest
+
+from src.helper.clock.VirtualClock import VirtualClock
+
+
+class TestVirtualClock(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock()
+
+    def test___init__invalid_speed__raises_value_error(self):
+        for speed in [0, -1]:
+            with self.assertRaises(ValueError):
+                VirtualClock(speed=speed)
+
+    def test_monotonic__start_given__returns_start(self):
+        self.assertEqual(VirtualClock(start=10.0).monotonic(), 10.0)
+
+    def test_sleep__single_thread__advances_time_without_waiting(self):
+        started = time.monotonic()
+
+        self.clock.sleep(3600)
+
+        self.assertEqual(self.clock.monotonic(), 3600)
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_sleep__negative_seconds__does_not_go_back_in_time(self):
+        self.clock.sleep(1)
+        self.clock.sleep(-5)
+
+        self.assertEqual(self.clock.monotonic(), 1)
+
+    def test_spawn__loops_with_different_intervals__keep_relative_intervals(self):
+        ticks = []
+
+        def loop(name, interval, count):
+            for _ in range(count):
+                self.clock.sleep(interval)
+                ticks.append((round(self.clock.monotonic(), 6), name))
+
+        fast = self.clock.spawn(lambda: loop("fast", 0.1, 10), "FastThread")
+        slow = self.clock.spawn(lambda: loop("slow", 0.5, 2), "SlowThread")
+        self.clock.join(fast)
+        self.clock.join(slow)
+
+        self.assertEqual(len(ticks), 12)
+        self.assertEqual(ticks, sorted(ticks, key=lambda tick: tick[0]))
+        self.assertIn((0.5, "slow"), ticks)
+        self.assertIn((1.0, "slow"), ticks)
+        self.assertEqual(ticks[-1][0], 1.0)
+
+    def test_join__participant_sleeping__advances_time_until_finished(self):
+        thread = self.clock.spawn(lambda: self.clock.sleep(5), "SleepingThread")
+
+        self.clock.join(thread)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(self.clock.monotonic(), 5)
+
+    def test_wait_for__notified_by_participant__returns_true(self):
+        condition = threading.Condition()
+        state = {"ready": False}
+
+        def notifier():
+            self.clock.sleep(2)
+            with condition:
+                state["ready"] = True
+                self.clock.notify_all(condition)
+
+        waiter_result = []
+
+        def waiter():
+            with condition:
+                waiter_result.append(self.clock.wait_for(condition, lambda: state["ready"]))
+            waiter_result.append(self.clock.monotonic())
+
+        waiting = self.clock.spawn(waiter, "WaiterThread")
+        notifying = self.clock.spawn(notifier, "NotifierThread")
+        self.clock.join(notifying)
+        self.clock.join(waiting)
+
+        self.assertEqual(waiter_result, [True, 2])
+
+    def test_sleep__speed_given__paces_time(self):
+        clock = VirtualClock(speed=100)
+        started = time.monotonic()
+
+        clock.sleep(5)
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.04)
+        self.assertEqual(clock.monotonic(), 5)
@@ -0,0 +1,247 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.SystemControl import SystemControl
+from src.components.cooling.CoolingFanController import CoolingFanController
+from src.components.light.LightController import LightController
+from src.components.magnetron.MagnetronModulator import MagnetronModulator
+from src.components.reflector.ReflectorController import ReflectorController
+from src.components.turntable.TurntableController import TurntableController
+from src.helper import config
+from src.helper.Clock import Clock
+from src.helper.OvenContext import OvenContext
+from src.helper.Scheduler import Scheduler
+from src.helper.Settings import Settings
+from src.helper.clock.VirtualClock import VirtualClock
+from src.helper.configuration.ConfigWatcher import ConfigWatcher
+from src.helper.configuration.RuntimeConfig import RuntimeConfig
+from src.helper.logging.LogLevel import LogLevel
+from src.helper.scheduling.TickScheduler import TickScheduler
+from src.program.DefrostingProgram import DefrostingProgram
+from src.user.InputDetector import InputDetector
+from src.user.ScriptedInputDetector import ScriptedInputDetector
+
+
+class TestConfigWatcher(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "settings.json")
+        self.settings = RuntimeConfig()
+        self.settings.logger = MagicMock()
+        self.watcher = ConfigWatcher(self.path, self.settings)
+        self.watcher.logger = MagicMock()
+
+    def _write(self, values, mtime_ns):
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump(values, file)
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_check__file_missing__keeps_settings(self):
+        self.assertFalse(self.watcher.check())
+
+        self.assertEqual(self.watcher.reloads, 0)
+
+    def test_check__file_changed__applies_it(self):
+        self._write({"PROGRAM_DEFROSTING_TARGET_TEMP": 55}, 1_000_000_000)
+
+        self.assertTrue(self.watcher.check())
+        self.assertEqual(self.settings.PROGRAM_DEFROSTING_TARGET_TEMP, 55)
+
+    def test_check__file_unchanged__does_not_reload(self):
+        self._write({"PROGRAM_DEFROSTING_TARGET_TEMP": 55}, 1_000_000_000)
+        self.watcher.check()
+
+        self.assertFalse(self.watcher.check())
+        self.assertEqual(self.watcher.reloads, 1)
+
+    def test_check__file_edited__applies_new_values(self):
+        self._write({"PROGRAM_DEFROSTING_TARGET_TEMP": 55}, 1_000_000_000)
+        self.watcher.check()
+
+        self._write({"PROGRAM_DEFROSTING_TARGET_TEMP": 50}, 2_000_000_000)
+
+        self.assertTrue(self.watcher.check())
+        self.assertEqual(self.settings.PROGRAM_DEFROSTING_TARGET_TEMP, 50)
+
+    def test_check__invalid_file__logs_warning_and_keeps_settings(self):
+        self._write({"PROGRAM_DEFROSTING_TARGET_TEMP": 55}, 1_000_000_000)
+        self.watcher.check()
+
+        self._write({"PROGRAM_DEFROSTING_TARGET_TEMP": -1.5}, 2_000_000_000)
+
+        self.assertFalse(self.watcher.check())
+        self.assertEqual(self.settings.PROGRAM_DEFROSTING_TARGET_TEMP, 55)
+        self.assertEqual(self.watcher.logger.log.call_args.args[1], LogLevel.WARNING)
+
+    def test_check__file_removed__logs_warning_and_keeps_settings(self):
+        self._write({"PROGRAM_DEFROSTING_TARGET_TEMP": 55}, 1_000_000_000)
+        self.watcher.check()
+
+        os.remove(self.path)
+
+        self.assertFalse(self.watcher.check())
+        self.assertEqual(self.settings.PROGRAM_DEFROSTING_TARGET_TEMP, 55)
+        self.watcher.logger.log.assert_called_with(
+            f"Settings file {self.path} was removed, keeping the current settings", LogLevel.WARNING)
+
+    def test_start__scheduler_installed__applies_file_and_schedules_watch_task(self):
+        self._write({"PROGRAM_DEFROSTING_TARGET_TEMP": 55}, 1_000_000_000)
+        scheduler = MagicMock()
+
+        with patch("src.helper.configuration.ConfigWatcher.Scheduler", return_value=scheduler):
+            self.watcher.start()
+
+        self.assertEqual(self.settings.PROGRAM_DEFROSTING_TARGET_TEMP, 55)
+        scheduler.schedule.assert_called_once_with(self.watcher.watch_tick, config.CONFIG_WATCH_INTERVAL_IN_SECONDS,
+                                                   config.CONFIG_WATCH_INTERVAL_IN_SECONDS, "ConfigWatch")
+
+    def test_start__no_scheduler__spawns_watch_thread(self):
+        with patch("src.helper.configuration.ConfigWatcher.Scheduler", return_value=None), \
+                patch("src.helper.configuration.ConfigWatcher.Clock") as mock_clock:
+            self.watcher.start()
+
+        mock_clock.return_value.spawn.assert_called_once_with(self.watcher.watch_loop, "ConfigWatchThread")
+
+    def test_start__already_running__logs_warning(self):
+        self.watcher.running = True
+
+        self.watcher.start()
+
+        self.watcher.logger.log.assert_called_once_with("Settings file is already watched", LogLevel.WARNING)
+
+    def test_stop__running__ends_watch_tick(self):
+        self.watcher.running = True
+
+        with patch("src.helper.configuration.ConfigWatcher.Clock"):
+            self.watcher.stop()
+
+        self.assertFalse(self.watcher.watch_tick())
+
+    def test_stop__not_running__logs_warning(self):
+        self.watcher.stop()
+
+        self.watcher.logger.log.assert_called_once_with("Settings file is not watched", LogLevel.WARNING)
+
+    def test_watch_tick__running__checks_file(self):
+        self.watcher.running = True
+        self._write({"PROGRAM_DEFROSTING_TARGET_TEMP": 55}, 1_000_000_000)
+
+        self.assertTrue(self.watcher.watch_tick())
+        self.assertEqual(self.settings.PROGRAM_DEFROSTING_TARGET_TEMP, 55)
+
+    @patch("src.helper.configuration.ConfigWatcher.PeriodicRunner")
+    def test_watch_loop__called__runs_periodic_runner(self, mock_runner):
+        self.watcher.watch_loop()
+
+        mock_runner.assert_called_once_with(self.watcher.watch_tick, config.CONFIG_WATCH_INTERVAL_IN_SECONDS,
+                                            "ConfigWatch", config.CONFIG_WATCH_INTERVAL_IN_SECONDS)
+        mock_runner.return_value.run.assert_called_once()
+
+    @staticmethod
+    def _ticks(name):
+        task = next(task for _, _, task in Scheduler()._queue if task.name == name)
+        cycles = task.statistics.cycles
+        Scheduler().schedule(lambda: Scheduler().stop(), 1.0, 1.0, "Stop")
+        Scheduler().run()
+        return task.statistics.cycles - cycles
+
+    @staticmethod
+    def _accepts(setter, value):
+        try:
+            setter(value)
+        except ValueError:
+            return False
+        return True
+
+    @staticmethod
+    def _step_down(controller):
+        controller.cooling_fan.power_share = 1.0
+        controller.cooling_fan_cycle()
+        return controller.cooling_fan.power_share
+
+    @staticmethod
+    def _turn(controller):
+        controller.turntable.rotations_per_minute, controller.target_rotations_per_minute = 0.0, 5.0
+        controller.update()
+        return controller.turntable.rotations_per_minute
+
+    @staticmethod
+    def _tilt(controller):
+        controller.reflector.angle, controller.target_angle = 0.0, 45.0
+        controller.update()
+        return controller.reflector.angle
+
+    @staticmethod
+    def _finishes_cycle(program):
+        program.cycles, program.just_updated = 2, False
+        program.control_components()
+        return program.just_updated
+
+    @staticmethod
+    def _half_powered(modulator):
+        for index in range(modulator.power_history.size):
+            modulator.power_history.add(index % 2 == 0)
+        return modulator.safety_hazard()
+
+    @staticmethod
+    def _started(component, name):
+        component.start()
+        return lambda: TestConfigWatcher._ticks(name)
+
+    def test_check__reloadable_setting_changed_in_file__changes_behavior(self):
+        probes = {
+            "MAIN_LOOP_TIMEOUT_IN_SECONDS": (0.5, lambda context: self._started(context.get(SystemControl), "System")),
+            "MAGNETRON_ON_OFF_INTERVAL_IN_SECONDS": (
+                0.5, lambda context: self._started(context.get(MagnetronModulator), "Magnetron")),
+            "MAGNETRON_MAX_POWER_SHARE_PER_MINUTE": (
+                0.4, lambda context: lambda: self._half_powered(context.get(MagnetronModulator))),
+            "MAGNETRON_MAX_TEMP_IN_CELSIUS": (10.0, lambda context: context.get(MagnetronModulator).safety_hazard),
+            "MAGNETRON_MODULATION": ("RANDOM", lambda context: lambda: context.get(MagnetronModulator).modulation),
+            "COOLING_FAN_STEP_IN_PERCENT": (0.3, lambda context: lambda: self._step_down(
+                context.get(CoolingFanController))),
+            "COOLING_FAN_UPDATE_INTERVAL_IN_SECONDS": (
+                0.5, lambda context: self._started(context.get(CoolingFanController), "CoolingFan")),
+            "TURNTABLE_MIN_ROTATIONS_PER_MINUTE": (
+                0, lambda context: lambda: self._accepts(context.get(TurntableController).set_speed, -1)),
+            "TURNTABLE_MAX_ROTATIONS_PER_MINUTE": (
+                1, lambda context: lambda: self._accepts(context.get(TurntableController).set_speed, 2)),
+            "TURNTABLE_STEP_IN_ROTATIONS_PER_MINUTE": (1.0, lambda context: lambda: self._turn(
+                context.get(TurntableController))),
+            "REFLECTOR_MIN_ANGLE_IN_DEGREES": (
+                0.0, lambda context: lambda: self._accepts(context.get(ReflectorController).set_angle, -10.0)),
+            "REFLECTOR_MAX_ANGLE_IN_DEGREES": (
+                30.0, lambda context: lambda: self._accepts(context.get(ReflectorController).set_angle, 40.0)),
+            "REFLECTOR_STEP_IN_DEGREES": (5.0, lambda context: lambda: self._tilt(context.get(ReflectorController))),
+            "LIGHT_UPDATE_INTERVAL_IN_SECONDS": (
+                0.5, lambda context: self._started(context.get(LightController), "Light")),
+            "PROGRAM_DEFROSTING_TARGET_TEMP": (
+                10, lambda context: lambda: self._finishes_cycle(DefrostingProgram(context))),
+            "CONFIG_WATCH_INTERVAL_IN_SECONDS": (
+                0.25, lambda context: self._started(ConfigWatcher(self.path + ".other"), "ConfigWatch")),
+        }
+        self.assertEqual(probes.keys(), RuntimeConfig.RELOADABLE)
+        self.addCleanup(Settings.use, Settings())
+        self.addCleanup(Clock.use, Clock())
+        self.addCleanup(Scheduler.use, Scheduler())
+
+        for mtime, (name, (value, probe)) in enumerate(probes.items(), start=1):
+            with self.subTest(name=name):
+                settings = RuntimeConfig()
+                settings.logger = MagicMock()
+                Settings.use(settings)
+                Clock.use(VirtualClock())
+                Scheduler.use(TickScheduler())
+                context = OvenContext("Oven")
+                context.register(InputDetector, ScriptedInputDetector())
+                watcher = ConfigWatcher(self.path, settings)
+                measure = probe(context)
+                before = measure()
+
+                self._write({name: value}, mtime * 1_000_000_000)
+                watcher.check()
+
+                self.assertNotEqual(measure(), before)
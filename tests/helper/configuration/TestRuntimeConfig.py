@@ -0,0 +1,251 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from src.helper import config
+from src.helper.configuration.RuntimeConfig import RuntimeConfig
+from src.helper.logging.LogLevel import LogLevel
+
+
+class Subscriber:
+    def __init__(self):
+        self.changes = []
+
+    def notify(self, changes):
+        self.changes.append(changes)
+
+
+class TestRuntimeConfig(unittest.TestCase):
+    def setUp(self):
+        self.settings = RuntimeConfig()
+        self.settings.logger = MagicMock()
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def _write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+        return path
+
+    def test_init__defaults__exposes_every_config_constant_as_attribute(self):
+        for name in config.__annotations__:
+            self.assertEqual(getattr(self.settings, name), getattr(config, name))
+
+    def test_convert__text__parses_to_type_of_setting(self):
+        self.assertEqual(self.settings.convert("METRICS_PORT", "8080"), 8080)
+        self.assertEqual(self.settings.convert("MAGNETRON_MAX_TEMP_IN_CELSIUS", "180.5"), 180.5)
+        self.assertIs(self.settings.convert("METRICS_ENABLED", "yes"), True)
+        self.assertIs(self.settings.convert("METRICS_ENABLED", "off"), False)
+        self.assertIsNone(self.settings.convert("NOISE_SEED", "none"))
+        self.assertEqual(self.settings.convert("NOISE_SEED", "7"), 7)
+
+    def test_convert__int_for_float_setting__returns_float(self):
+        value = self.settings.convert("MAGNETRON_MAX_TEMP_IN_CELSIUS", 180)
+
+        self.assertIsInstance(value, float)
+        self.assertEqual(value, 180.0)
+
+    def test_convert__wrong_type__raises_value_error(self):
+        for name, value in [("METRICS_PORT", 1.5), ("METRICS_PORT", True), ("METRICS_ENABLED", "maybe"),
+                            ("PROGRAM_DEFAULT", 3), ("MAGNETRON_MAX_TEMP_IN_CELSIUS", "hot"),
+                            ("TURNTABLE_WEIGHT_IN_GRAMS", None)]:
+            with self.subTest(name=name, value=value), self.assertRaises(ValueError):
+                self.settings.convert(name, value)
+
+    def test_convert__violates_constraint__raises_value_error(self):
+        for name, value in [("MAIN_LOOP_TIMEOUT_IN_SECONDS", 0.0), ("MAGNETRON_MAX_POWER_SHARE_PER_MINUTE", 1.5),
+                            ("MAGNETRON_MODULATION", "PWM"), ("DEFAULT_LOG_LEVEL", "LOUD")]:
+            with self.subTest(name=name), self.assertRaises(ValueError):
+                self.settings.convert(name, value)
+
+    def test_convert__unknown_setting__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.settings.convert("MISSING", 1)
+
+    def test_validate__minimum_above_maximum__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.settings.validate({"TURNTABLE_MIN_ROTATIONS_PER_MINUTE": 10})
+
+    def test_update__valid_values__applies_and_returns_changes(self):
+        changes = self.settings.update({"PROGRAM_DEFROSTING_TARGET_TEMP": 55,
+                                        "LIGHT_UPDATE_INTERVAL_IN_SECONDS": config.LIGHT_UPDATE_INTERVAL_IN_SECONDS})
+
+        self.assertEqual(self.settings.PROGRAM_DEFROSTING_TARGET_TEMP, 55)
+        self.assertEqual(changes, {"PROGRAM_DEFROSTING_TARGET_TEMP": (config.PROGRAM_DEFROSTING_TARGET_TEMP, 55)})
+
+    def test_update__one_value_invalid__changes_nothing(self):
+        with self.assertRaises(ValueError):
+            self.settings.update({"PROGRAM_DEFROSTING_TARGET_TEMP": 55, "MAIN_LOOP_TIMEOUT_IN_SECONDS": -1.0})
+
+        self.assertEqual(self.settings.PROGRAM_DEFROSTING_TARGET_TEMP, config.PROGRAM_DEFROSTING_TARGET_TEMP)
+
+    def test_update__setting_read_at_startup__raises_value_error_and_changes_nothing(self):
+        with self.assertRaises(ValueError):
+            self.settings.update({"PROGRAM_DEFROSTING_TARGET_TEMP": 55, "METRICS_PORT": 9000})
+
+        self.assertEqual(self.settings.PROGRAM_DEFROSTING_TARGET_TEMP, config.PROGRAM_DEFROSTING_TARGET_TEMP)
+        self.assertEqual(self.settings.METRICS_PORT, config.METRICS_PORT)
+
+    def test_reloadable__every_reloadable_setting__is_a_setting(self):
+        self.assertLessEqual(RuntimeConfig.RELOADABLE, self.settings.types.keys())
+
+    def test_subscribe__named_setting_changed__notifies_with_its_changes_only(self):
+        callback = MagicMock()
+        self.settings.subscribe(callback, "PROGRAM_DEFROSTING_TARGET_TEMP")
+
+        self.settings.update({"PROGRAM_DEFROSTING_TARGET_TEMP": 55, "LIGHT_UPDATE_INTERVAL_IN_SECONDS": 0.5})
+
+        callback.assert_called_once_with(
+            {"PROGRAM_DEFROSTING_TARGET_TEMP": (config.PROGRAM_DEFROSTING_TARGET_TEMP, 55)})
+
+    def test_subscribe__other_setting_changed__does_not_notify(self):
+        callback = MagicMock()
+        self.settings.subscribe(callback, "PROGRAM_DEFROSTING_TARGET_TEMP")
+
+        self.settings.update({"LIGHT_UPDATE_INTERVAL_IN_SECONDS": 0.5})
+
+        callback.assert_not_called()
+
+    def test_subscribe__no_names__notifies_of_every_change(self):
+        callback = MagicMock()
+        self.settings.subscribe(callback)
+
+        self.settings.update({"LIGHT_UPDATE_INTERVAL_IN_SECONDS": 0.5})
+
+        callback.assert_called_once_with(
+            {"LIGHT_UPDATE_INTERVAL_IN_SECONDS": (config.LIGHT_UPDATE_INTERVAL_IN_SECONDS, 0.5)})
+
+    def test_subscribe__unknown_setting__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.settings.subscribe(MagicMock(), "MISSING")
+
+    def test_subscribe__setting_read_at_startup__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.settings.subscribe(MagicMock(), "METRICS_PORT")
+
+    def test_subscribe__bound_method_of_dropped_object__is_released(self):
+        subscriber = Subscriber()
+        self.settings.subscribe(subscriber.notify)
+        del subscriber
+
+        self.settings.update({"LIGHT_UPDATE_INTERVAL_IN_SECONDS": 0.5})
+
+        self.assertEqual(self.settings._subscribers, [])
+
+    def test_subscribe__same_callback_twice__notifies_once_per_change(self):
+        subscriber = Subscriber()
+        self.settings.subscribe(subscriber.notify, "LIGHT_UPDATE_INTERVAL_IN_SECONDS")
+        self.settings.subscribe(subscriber.notify, "LIGHT_UPDATE_INTERVAL_IN_SECONDS")
+
+        self.settings.update({"LIGHT_UPDATE_INTERVAL_IN_SECONDS": 0.5})
+
+        self.assertEqual(len(subscriber.changes), 1)
+        self.assertEqual(len(self.settings._subscribers), 1)
+
+    def test_subscribe__same_callback_for_other_settings__notifies_for_both(self):
+        subscriber = Subscriber()
+        self.settings.subscribe(subscriber.notify, "LIGHT_UPDATE_INTERVAL_IN_SECONDS")
+        self.settings.subscribe(subscriber.notify, "PROGRAM_DEFROSTING_TARGET_TEMP")
+
+        self.assertEqual(len(self.settings._subscribers), 2)
+
+    def test_subscribe__bound_method__notifies_while_object_is_alive(self):
+        subscriber = Subscriber()
+        self.settings.subscribe(subscriber.notify, "LIGHT_UPDATE_INTERVAL_IN_SECONDS")
+
+        self.settings.update({"LIGHT_UPDATE_INTERVAL_IN_SECONDS": 0.5})
+
+        self.assertEqual(subscriber.changes,
+                         [{"LIGHT_UPDATE_INTERVAL_IN_SECONDS": (config.LIGHT_UPDATE_INTERVAL_IN_SECONDS, 0.5)}])
+
+    def test_unsubscribe__subscribed_callback__stops_notifications(self):
+        subscriber = Subscriber()
+        self.settings.subscribe(subscriber.notify)
+
+        self.settings.unsubscribe(subscriber.notify)
+        self.settings.update({"LIGHT_UPDATE_INTERVAL_IN_SECONDS": 0.5})
+
+        self.assertEqual(subscriber.changes, [])
+
+    def test_notify__subscriber_fails__logs_error_and_notifies_others(self):
+        failing = MagicMock(side_effect=RuntimeError("boom"))
+        callback = MagicMock()
+        self.settings.subscribe(failing)
+        self.settings.subscribe(callback)
+
+        self.settings.update({"LIGHT_UPDATE_INTERVAL_IN_SECONDS": 0.5})
+
+        callback.assert_called_once()
+        self.assertEqual(self.settings.logger.log.call_args.args[1], LogLevel.ERROR)
+
+    def test_load__toml_file__applies_settings(self):
+        path = self._write("settings.toml",
+                           "program_defrosting_target_temp = 55\nLIGHT_UPDATE_INTERVAL_IN_SECONDS = 1\n")
+
+        self.settings.load(path)
+
+        self.assertEqual(self.settings.PROGRAM_DEFROSTING_TARGET_TEMP, 55)
+        self.assertEqual(self.settings.LIGHT_UPDATE_INTERVAL_IN_SECONDS, 1.0)
+
+    def test_load__setting_read_at_startup__logs_warning_and_applies_others(self):
+        path = self._write("settings.json", json.dumps({"PROGRAM_DEFROSTING_TARGET_TEMP": 55, "METRICS_ENABLED": True}))
+
+        changes = self.settings.load(path)
+
+        self.assertEqual(changes, {"PROGRAM_DEFROSTING_TARGET_TEMP": (config.PROGRAM_DEFROSTING_TARGET_TEMP, 55)})
+        self.assertIs(self.settings.METRICS_ENABLED, config.METRICS_ENABLED)
+        self.settings.logger.log.assert_any_call(f"Ignoring METRICS_ENABLED from {path}: only read at startup",
+                                                 LogLevel.WARNING)
+
+    def test_load__setting_removed_from_file__reverts_to_default(self):
+        self.settings.load(self._write("settings.json", json.dumps({"PROGRAM_DEFROSTING_TARGET_TEMP": 55})))
+
+        changes = self.settings.load(self._write("settings.json", json.dumps({})))
+
+        self.assertEqual(self.settings.PROGRAM_DEFROSTING_TARGET_TEMP, config.PROGRAM_DEFROSTING_TARGET_TEMP)
+        self.assertEqual(changes, {"PROGRAM_DEFROSTING_TARGET_TEMP": (55, config.PROGRAM_DEFROSTING_TARGET_TEMP)})
+
+    def test_load__invalid_file__keeps_previous_settings(self):
+        self.settings.load(self._write("settings.json", json.dumps({"PROGRAM_DEFROSTING_TARGET_TEMP": 55})))
+
+        with self.assertRaises(ValueError):
+            self.settings.load(self._write("settings.json", json.dumps({"PROGRAM_DEFROSTING_TARGET_TEMP": "warm"})))
+
+        self.assertEqual(self.settings.PROGRAM_DEFROSTING_TARGET_TEMP, 55)
+        self.assertEqual(self.settings.file_values, {"PROGRAM_DEFROSTING_TARGET_TEMP": 55})
+
+    def test_load__not_a_table__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.settings.load(self._write("settings.json", "[1, 2]"))
+
+    def test_load__unsupported_file_type__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.settings.load(self._write("settings.yaml", "METRICS_PORT: 1"))
+
+    def test_load_environment__prefixed_variables__override_file(self):
+        self.settings.load(self._write("settings.json", json.dumps({"PROGRAM_DEFROSTING_TARGET_TEMP": 55,
+                                                                    "LIGHT_UPDATE_INTERVAL_IN_SECONDS": 0.5})))
+
+        self.settings.load_environment({"MICROWAVE_PROGRAM_DEFROSTING_TARGET_TEMP": "65", "PROGRAM_DEFAULT": "x"})
+
+        self.assertEqual(self.settings.PROGRAM_DEFROSTING_TARGET_TEMP, 65)
+        self.assertEqual(self.settings.LIGHT_UPDATE_INTERVAL_IN_SECONDS, 0.5)
+        self.assertEqual(self.settings.PROGRAM_DEFAULT, config.PROGRAM_DEFAULT)
+
+    def test_load_environment__setting_read_at_startup__logs_warning_and_keeps_default(self):
+        self.settings.load_environment({"MICROWAVE_PROGRAM_UPDATE_INTERVAL_IN_SECONDS": "0.05"})
+
+        self.assertEqual(self.settings.PROGRAM_UPDATE_INTERVAL_IN_SECONDS, config.PROGRAM_UPDATE_INTERVAL_IN_SECONDS)
+        self.settings.logger.log.assert_called_once_with(
+            "Ignoring PROGRAM_UPDATE_INTERVAL_IN_SECONDS from the environment: only read at startup", LogLevel.WARNING)
+
+    def test_reload__value_updated_directly__restores_file_value(self):
+        self.settings.load(self._write("settings.json", json.dumps({"PROGRAM_DEFROSTING_TARGET_TEMP": 55})))
+        self.settings.update({"PROGRAM_DEFROSTING_TARGET_TEMP": 50})
+
+        self.settings.reload()
+
+        self.assertEqual(self.settings.PROGRAM_DEFROSTING_TARGET_TEMP, 55)
@@ -0,0 +1,167 @@
+import io
+import logging
+import threading
+import unittest
+from collections import deque
+from unittest.mock import MagicMock, patch
+
+from src.helper.logging.AsyncLogHandler import AsyncLogHandler
+from src.helper.logging.LogLevel import LogLevel
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.flushes = 0
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def flush(self):
+        self.flushes += 1
+
+
+class RacingDeque(deque):
+    def popleft(self):
+        entry = super().popleft()
+        if self:
+            # A producer making room pops the next record while the queue is drained
+            super().popleft()
+        return entry
+
+
+class TestAsyncLogHandler(unittest.TestCase):
+    def setUp(self):
+        self.target = RecordingHandler()
+        self.handler = AsyncLogHandler(self.target, capacity=3, flush_interval=60)
+
+    def tearDown(self):
+        self.handler.close()
+
+    @staticmethod
+    def _record(level, message):
+        return logging.makeLogRecord({"levelno": level, "levelname": LogLevel(level).name, "msg": message})
+
+    def _messages(self):
+        return [record.getMessage() for record in self.target.records]
+
+    def test___init__invalid_arguments__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            AsyncLogHandler(self.target, capacity=0)
+        with self.assertRaises(ValueError):
+            AsyncLogHandler(self.target, droppable=(LogLevel.DEBUG, LogLevel.CRITICAL))
+
+    def test_emit__records_queued__does_not_write_until_flush(self):
+        self.handler.emit(self._record(LogLevel.INFO, "a"))
+
+        self.assertEqual(self.target.records, [])
+        self.assertEqual(len(self.handler), 1)
+
+    def test_flush__mixed_levels__writes_records_in_original_order(self):
+        for level, message in ((LogLevel.INFO, "a"), (LogLevel.DEBUG, "b"), (LogLevel.WARNING, "c")):
+            self.handler.emit(self._record(level, message))
+
+        self.handler.flush()
+
+        self.assertEqual(self._messages(), ["a", "b", "c"])
+        self.assertEqual(self.target.flushes, 1)
+        self.assertEqual(len(self.handler), 0)
+
+    def test_emit__queue_full__drops_oldest_debug_record_first(self):
+        for level, message in ((LogLevel.DEBUG, "a"), (LogLevel.INFO, "b"), (LogLevel.DEBUG, "c")):
+            self.handler.emit(self._record(level, message))
+
+        self.handler.emit(self._record(LogLevel.INFO, "d"))
+        self.handler.flush()
+
+        self.assertIn("dropped 1 DEBUG records", self._messages()[0])
+        self.assertEqual(self._messages()[1:], ["b", "c", "d"])
+
+    def test_emit__queue_full_without_lower_records__drops_incoming_record(self):
+        for message in ("a", "b", "c"):
+            self.handler.emit(self._record(LogLevel.WARNING, message))
+
+        self.handler.emit(self._record(LogLevel.DEBUG, "d"))
+        self.handler.flush()
+
+        self.assertEqual(self._messages()[1:], ["a", "b", "c"])
+        self.assertEqual(self.handler.dropped[LogLevel.DEBUG], 0)
+
+    def test_emit__queue_full_of_critical_records__never_drops_critical(self):
+        for message in ("a", "b", "c", "d"):
+            self.handler.emit(self._record(LogLevel.CRITICAL, message))
+
+        self.handler.flush()
+
+        self.assertEqual(self._messages(), ["a", "b", "c", "d"])
+
+    def test_emit__custom_droppable_levels__keeps_non_droppable_records(self):
+        handler = AsyncLogHandler(self.target, capacity=1, droppable=(LogLevel.DEBUG,), flush_interval=60)
+        handler.emit(self._record(LogLevel.INFO, "a"))
+        handler.emit(self._record(LogLevel.INFO, "b"))
+        handler.emit(self._record(LogLevel.DEBUG, "c"))
+
+        handler.close()
+
+        self.assertEqual(self._messages()[1:], ["a", "b"])
+
+    def test_emit__error_record__wakes_writer_thread(self):
+        written = threading.Event()
+        self.target.flush = MagicMock(side_effect=written.set)
+
+        self.handler.emit(self._record(LogLevel.ERROR, "a"))
+
+        self.assertTrue(written.wait(5))
+        self.assertEqual(self._messages(), ["a"])
+
+    def test_flush__producer_pops_while_draining__writes_remaining_records(self):
+        self.handler._queues[LogLevel.DEBUG] = RacingDeque()
+        for message in ("a", "b", "c"):
+            self.handler.emit(self._record(LogLevel.DEBUG, message))
+
+        self.handler.flush()
+
+        self.assertEqual(self._messages(), ["a", "c"])
+        self.assertEqual(len(self.handler), 0)
+
+    def test_emit__target_flush_fails__writer_thread_keeps_writing(self):
+        failed = threading.Event()
+        written = threading.Event()
+
+        def flush():
+            if not failed.is_set():
+                failed.set()
+                raise OSError("disk full")
+            written.set()
+
+        self.target.flush = flush
+
+        with patch("sys.stderr", new_callable=io.StringIO) as stderr:
+            self.handler.emit(self._record(LogLevel.ERROR, "a"))
+            self.assertTrue(failed.wait(5))
+            self.handler.emit(self._record(LogLevel.ERROR, "b"))
+            self.assertTrue(written.wait(5))
+
+        self.assertIn("disk full", stderr.getvalue())
+        self.assertTrue(self.handler._thread.is_alive())
+        self.assertEqual(self._messages(), ["a", "b"])
+
+    def test_close__records_queued__writes_records_and_stops_writer_thread(self):
+        self.handler.emit(self._record(LogLevel.INFO, "a"))
+
+        self.handler.close()
+
+        self.assertEqual(self._messages(), ["a"])
+        self.assertFalse(self.handler._thread.is_alive())
+
+    def test_emit__via_logger__formats_with_target_formatter(self):
+        logger = logging.getLogger("TestAsyncLogHandler")
+        logger.propagate = False
+        logger.addHandler(self.handler)
+        self.addCleanup(logger.removeHandler, self.handler)
+
+        logger.warning("Value: %s", 42)
+        self.handler.flush()
+
+        self.assertEqual(self._messages(), ["Value: 42"])
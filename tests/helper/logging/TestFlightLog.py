@@ -0,0 +1,51 @@
+import unittest
+
+from src.helper.Clock import Clock
+from src.helper.clock.SystemClock import SystemClock
+from src.helper.clock.VirtualClock import VirtualClock
+from src.helper.logging.FlightLog import FlightLog
+from src.helper.logging.LogLevel import LogLevel
+
+
+class TestFlightLog(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock()
+        Clock.use(self.clock)
+        self.flight_log = FlightLog(3)
+
+    def tearDown(self):
+        Clock.use(SystemClock())
+
+    def test___init__non_positive_capacity__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            FlightLog(0)
+
+    def test___init__called__preallocates_entries(self):
+        self.assertEqual(self.flight_log.entries, [None, None, None])
+
+    def test_add__capacity_exceeded__overwrites_oldest(self):
+        for message in ["a", "b", "c", "d"]:
+            self.flight_log.add(LogLevel.DEBUG, "Test", message)
+
+        self.assertEqual([entry[4] for entry in self.flight_log.snapshot()], ["b", "c", "d"])
+
+    def test_snapshot__since_given__returns_only_newer_messages(self):
+        self.flight_log.add(LogLevel.INFO, "Test", "old")
+        self.clock.sleep(5)
+        self.flight_log.add(LogLevel.INFO, "Test", "new")
+
+        self.assertEqual([entry[4] for entry in self.flight_log.snapshot(since=1.0)], ["new"])
+
+    def test_format__arguments_given__merges_arguments(self):
+        self.flight_log.add(LogLevel.WARNING, "Sensors", "Temp: %.1f", (21.55,))
+
+        line = FlightLog.format(self.flight_log.snapshot()[0])
+
+        self.assertEqual(line, "[0.000] WARNING: Sensors -> Temp: 21.6")
+
+    def test_format__arguments_not_matching__appends_arguments(self):
+        self.flight_log.add(LogLevel.DEBUG, "Sensors", "No placeholder", (1,))
+
+        line = FlightLog.format(self.flight_log.snapshot()[0])
+
+        self.assertEqual(line, "[0.000] DEBUG: Sensors -> No placeholder (1,)")
@@ -1,7 +1,8 @@
 import logging
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+from src.helper.logging.FlightLog import FlightLog
 from src.helper.logging.LogLevel import LogLevel
 from src.helper.logging.LoggerFacade import LoggerFacade
 
@@ -11,6 +12,7 @@ class TestLoggerFacade(unittest.TestCase):
         self.facade = LoggerFacade(LogLevel.INFO, service="TestService")
 
     def tearDown(self):
+        LoggerFacade.flight_log = None
         for handler in list(self.facade._logger.handlers):
             self.facade._logger.removeHandler(handler)
 
@@ -100,3 +102,65 @@ class TestLoggerFacade(unittest.TestCase):
     def test_log__non_string_message__raises_type_error(self, mock_log):
         with self.assertRaises(TypeError):
             self.facade.log(None, LogLevel.INFO)
+
+    def test_is_enabled__info_level__filters_lower_levels(self):
+        self.assertFalse(self.facade.is_enabled(LogLevel.DEBUG))
+        self.assertTrue(self.facade.is_enabled(LogLevel.INFO))
+        self.assertTrue(self.facade.is_enabled(LogLevel.CRITICAL))
+
+    @patch("logging.Logger.log")
+    def test_log__arguments_given__defers_formatting_to_logging(self, mock_log):
+        self.facade.log("Value: %s", LogLevel.INFO, 42)
+
+        mock_log.assert_called_with(LogLevel.INFO, "TestService -> Value: %s", 42)
+
+    @patch("logging.Logger.log")
+    def test_log__arguments_and_disabled_level__does_not_log(self, mock_log):
+        self.facade.log("Value: %s", LogLevel.DEBUG, 42)
+
+        mock_log.assert_not_called()
+
+    @patch("logging.Logger.log")
+    def test_log__callable_and_enabled_level__logs_built_message(self, mock_log):
+        self.facade.log(lambda: "Built message", LogLevel.WARNING)
+
+        mock_log.assert_called_with(LogLevel.WARNING, "TestService -> Built message")
+
+    @patch("logging.Logger.log")
+    def test_log__callable_and_disabled_level__does_not_build_message(self, mock_log):
+        build = MagicMock(return_value="Built message")
+
+        self.facade.log(build, LogLevel.DEBUG)
+
+        build.assert_not_called()
+        mock_log.assert_not_called()
+
+    @patch("logging.Logger.log")
+    def test_log__flight_log_and_disabled_level__keeps_message(self, mock_log):
+        LoggerFacade.flight_log = FlightLog(4)
+
+        self.facade.log("Debug details", LogLevel.DEBUG)
+        self.facade.log("Value: %s", LogLevel.DEBUG, 42)
+
+        entries = LoggerFacade.flight_log.snapshot()
+        self.assertEqual([(entry[3], entry[4], entry[5]) for entry in entries],
+                         [("TestService", "Debug details", ()), ("TestService", "Value: %s", (42,))])
+
+    @patch("logging.Logger.log")
+    def test_log__flight_log_and_disabled_callable__does_not_build_message(self, mock_log):
+        LoggerFacade.flight_log = FlightLog(4)
+        build = MagicMock(return_value="Built message")
+
+        self.facade.log(build, LogLevel.DEBUG)
+
+        build.assert_not_called()
+        self.assertEqual(LoggerFacade.flight_log.snapshot(), [])
+
+    @patch("logging.Logger.log")
+    def test_log__flight_log_and_enabled_level__keeps_and_emits_message(self, mock_log):
+        LoggerFacade.flight_log = FlightLog(4)
+
+        self.facade.log(lambda: "Built message", LogLevel.WARNING)
+
+        mock_log.assert_called_once()
+        self.assertEqual(LoggerFacade.flight_log.snapshot()[0][4], "Built message")
@@ -49,6 +49,16 @@ class TestLoggerInterface(unittest.TestCase):
 
         self.assertEqual(logger.level, LogLevel.DEBUG)
 
+    def test_is_enabled__not_overridden_in_subclass__returns_true(self):
+        class DummyLogger(LoggerInterface):
+            def log(self, message: str, level: LogLevel = LogLevel.INFO) -> None:
+                pass
+
+            def set_level(self, level: LogLevel) -> None:
+                pass
+
+        self.assertTrue(DummyLogger().is_enabled(LogLevel.DEBUG))
+
     def test_log__mocked_logger__calls_with_correct_arguments(self):
         self.mock_logger.log("test message", LogLevel.WARNING)
 
@@ -0,0 +1,82 @@
+import unittest
+
+from src.helper.metrics.LatencyHistogram import LatencyHistogram
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def setUp(self):
+        self.histogram = LatencyHistogram()
+
+    def test___init__invalid_bits__raises_value_error(self):
+        for significant_bits, highest_bits in [(0, 32), (8, 4)]:
+            with self.assertRaises(ValueError):
+                LatencyHistogram(significant_bits, highest_bits)
+
+    def test_record__values_recorded__tracks_count_minimum_and_maximum(self):
+        for seconds in [0.002, 0.0005, 0.01]:
+            self.histogram.record(seconds)
+
+        self.assertEqual(self.histogram.count, 3)
+        self.assertEqual(self.histogram.minimum, 500)
+        self.assertEqual(self.histogram.maximum, 10000)
+
+    def test_record__negative_duration__recorded_as_zero(self):
+        self.histogram.record(-0.001)
+
+        self.assertEqual(self.histogram.counts[0], 1)
+
+    def test_record__value_beyond_range__counted_in_last_bucket(self):
+        histogram = LatencyHistogram(highest_bits=10)
+
+        histogram.record(1.0)
+
+        self.assertEqual(histogram.counts[-1], 1)
+
+    def test_percentile__many_values__within_relative_precision(self):
+        for microseconds in range(1, 10001):
+            self.histogram.record(microseconds * 1e-6)
+
+        for percentile in [50, 90, 99]:
+            expected = percentile * 100 * 1e-6
+            self.assertAlmostEqual(self.histogram.percentile(percentile), expected, delta=expected * 0.07)
+
+    def test_percentile__hundred__returns_maximum(self):
+        for seconds in [0.001, 0.0123]:
+            self.histogram.record(seconds)
+
+        self.assertAlmostEqual(self.histogram.percentile(100), 0.0123)
+
+    def test_percentile__empty__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.histogram.percentile(50)
+
+    def test_percentile__out_of_range__raises_value_error(self):
+        self.histogram.record(0.001)
+
+        with self.assertRaises(ValueError):
+            self.histogram.percentile(101)
+
+    def test_mean__values_recorded__returns_average(self):
+        for seconds in [0.001, 0.003]:
+            self.histogram.record(seconds)
+
+        self.assertAlmostEqual(self.histogram.mean(), 0.002)
+
+    def test_summary__empty__returns_only_count(self):
+        self.assertEqual(self.histogram.summary(), {"count": 0})
+
+    def test_summary__values_recorded__returns_percentiles(self):
+        self.histogram.record(0.001)
+
+        summary = self.histogram.summary()
+
+        self.assertEqual(set(summary), {"count", "min", "mean", "p50", "p90", "p99", "p999", "max"})
+        self.assertAlmostEqual(summary["p99"], 0.001)
+
+    def test_reset__values_recorded__empties_histogram(self):
+        self.histogram.record(0.001)
+
+        self.histogram.reset()
+
+        self.assertEqual(self.histogram.count, 0)
+        self.assertEqual(sum(self.histogram.counts), 0)
@@ -0,0 +1,34 @@
+import unittest
+
+from src.helper.metrics.LoopMonitor import LoopMonitor
+from src.helper.metrics.LoopStatistics import LoopStatistics
+
+
+class TestLoopMonitor(unittest.TestCase):
+    def setUp(self):
+        LoopMonitor._loops.clear()
+
+    def test___new__same_name__returns_same_statistics(self):
+        statistics = LoopMonitor("System", 0.01)
+
+        self.assertIsInstance(statistics, LoopStatistics)
+        self.assertIs(LoopMonitor("System", 0.01), statistics)
+
+    def test___new__different_names__returns_separate_statistics(self):
+        self.assertIsNot(LoopMonitor("System", 0.01), LoopMonitor("Light", 0.1))
+
+    def test_snapshot__loops_recorded__returns_summary_per_loop(self):
+        LoopMonitor("System", 0.01).record(1.0, 1.002, 1.01)
+        LoopMonitor("Light", 0.1)
+
+        snapshot = LoopMonitor.snapshot()
+
+        self.assertEqual(set(snapshot), {"System", "Light"})
+        self.assertEqual(snapshot["System"]["cycles"], 1)
+
+    def test_reset__loops_recorded__keeps_loops_without_cycles(self):
+        LoopMonitor("System", 0.01).record(1.0, 1.002, 1.01)
+
+        LoopMonitor.reset()
+
+        self.assertEqual(LoopMonitor.snapshot()["System"]["cycles"], 0)
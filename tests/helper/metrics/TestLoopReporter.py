@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.helper.logging.LogLevel import LogLevel
+from src.helper.metrics.LoopMonitor import LoopMonitor
+from src.helper.metrics.LoopReporter import LoopReporter
+from src.helper.metrics.LoopStatistics import LoopStatistics
+
+
+class TestLoopReporter(unittest.TestCase):
+    def setUp(self):
+        LoopReporter._instance = None
+        LoopMonitor._loops.clear()
+        self.reporter = LoopReporter()
+        self.reporter.logger = MagicMock()
+
+    def test_start__no_scheduler__spawns_report_thread(self):
+        with patch('src.helper.metrics.LoopReporter.Scheduler', return_value=None), \
+                patch('src.helper.metrics.LoopReporter.Clock') as mock_clock:
+            self.reporter.start()
+
+        self.assertTrue(self.reporter.running)
+        mock_clock.return_value.spawn.assert_called_once_with(self.reporter.report_loop, "LoopReportThread")
+
+    def test_start__scheduler_installed__schedules_report_task(self):
+        scheduler = MagicMock()
+        with patch('src.helper.metrics.LoopReporter.Scheduler', return_value=scheduler):
+            self.reporter.start()
+
+        self.assertIs(self.reporter.thread, scheduler.schedule.return_value)
+
+    def test_start__already_running__logs_warning(self):
+        self.reporter.running = True
+
+        self.reporter.start()
+
+        self.reporter.logger.log.assert_called_once_with("Loop reports are already running", LogLevel.WARNING)
+
+    def test_stop__running__ends_report_tick(self):
+        self.reporter.running = True
+
+        with patch('src.helper.metrics.LoopReporter.Clock'):
+            self.reporter.stop()
+
+        self.assertFalse(self.reporter.report_tick())
+
+    def test_report__loops_recorded__logs_one_line_per_loop(self):
+        LoopMonitor("System", 0.01).record(1.0, 1.002, 1.01)
+        LoopMonitor("Light", 0.1)
+
+        self.reporter.report()
+
+        self.assertEqual(self.reporter.logger.log.call_count, 2)
+
+    def test_report__info_disabled__logs_nothing(self):
+        LoopMonitor("System", 0.01)
+        self.reporter.logger.is_enabled.return_value = False
+
+        self.reporter.report()
+
+        self.reporter.logger.log.assert_not_called()
+
+    def test_format__cycles_recorded__contains_counts_and_percentiles(self):
+        statistics = LoopStatistics("System", 0.01)
+        statistics.record(1.0, 1.002, 1.01)
+        statistics.record(1.01, 1.025, 1.02, previous_start=1.0)
+
+        line = LoopReporter.format(statistics)
+
+        self.assertIn("System (period 10.0ms): 2 cycles, 1 deadline misses", line)
+        self.assertIn("period p50 10.00ms", line)
+
+    def test_format__no_cycles__marks_percentiles_unavailable(self):
+        self.assertIn("execution n/a", LoopReporter.format(LoopStatistics("Light", 0.1)))
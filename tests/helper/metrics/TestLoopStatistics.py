@@ -0,0 +1,45 @@
+import unittest
+
+from src.helper.metrics.LoopStatistics import LoopStatistics
+
+
+class TestLoopStatistics(unittest.TestCase):
+    def setUp(self):
+        self.statistics = LoopStatistics("System", 0.01)
+
+    def test_record__first_cycle__records_execution_only(self):
+        self.statistics.record(1.0, 1.002, 1.01)
+
+        self.assertEqual(self.statistics.execution.count, 1)
+        self.assertEqual(self.statistics.interval.count, 0)
+
+    def test_record__previous_start_given__records_interval(self):
+        self.statistics.record(1.011, 1.012, 1.02, previous_start=1.0)
+
+        self.assertEqual(self.statistics.interval.maximum, 11000)
+
+    def test_record__finished_after_deadline__counts_deadline_miss(self):
+        self.statistics.record(1.0, 1.002, 1.01)
+        self.statistics.record(1.01, 1.025, 1.02)
+
+        self.assertEqual(self.statistics.cycles, 2)
+        self.assertEqual(self.statistics.deadline_misses, 1)
+
+    def test_snapshot__cycles_recorded__returns_counts_and_summaries(self):
+        self.statistics.record(1.0, 1.002, 1.01)
+
+        snapshot = self.statistics.snapshot()
+
+        self.assertEqual(snapshot["period"], 0.01)
+        self.assertEqual(snapshot["cycles"], 1)
+        self.assertEqual(snapshot["deadline_misses"], 0)
+        self.assertEqual(snapshot["execution"]["count"], 1)
+        self.assertEqual(snapshot["interval"], {"count": 0})
+
+    def test_reset__cycles_recorded__removes_them(self):
+        self.statistics.record(1.0, 1.025, 1.01)
+
+        self.statistics.reset()
+
+        self.assertEqual((self.statistics.cycles, self.statistics.deadline_misses), (0, 0))
+        self.assertEqual(self.statistics.execution.count, 0)
@@ -0,0 +1,94 @@
+import unittest
+
+from src.components.magnetron.Magnetron import Magnetron
+from src.components.magnetron.MagnetronModulator import MagnetronModulator
+from src.components.sensor.SensorManager import SensorManager
+from src.emergency.EmergencyHandler import EmergencyHandler
+from src.helper.OvenContext import OvenContext
+from src.helper.metrics.LoopMonitor import LoopMonitor
+from src.helper.metrics.MetricsCollector import MetricsCollector
+from src.program.ProgramController import ProgramController
+
+
+class TestMetricsCollector(unittest.TestCase):
+    def setUp(self):
+        LoopMonitor._loops.clear()
+        self.context = OvenContext("Oven 1")
+        self.collector = MetricsCollector([self.context])
+
+    def _lines(self):
+        return self.collector.collect().splitlines()
+
+    def test_collect__loop_recorded__exports_counters_and_summary(self):
+        LoopMonitor("System", 0.01).record(1.0, 1.002, 1.01)
+        LoopMonitor("System", 0.01).record(1.01, 1.025, 1.02, previous_start=1.0)
+
+        lines = self._lines()
+
+        self.assertIn('microwave_loop_cycles_total{loop="System"} 2.0', lines)
+        self.assertIn('microwave_loop_deadline_misses_total{loop="System"} 1.0', lines)
+        self.assertIn('microwave_loop_period_target_seconds{loop="System"} 0.01', lines)
+        self.assertIn('microwave_loop_interval_seconds_count{loop="System"} 1.0', lines)
+        self.assertTrue(any(line.startswith('microwave_loop_execution_seconds{loop="System",quantile="0.99"}')
+                            for line in lines))
+
+    def test_collect__every_metric__has_help_and_type(self):
+        lines = self._lines()
+
+        for name, kind, _ in MetricsCollector.OVEN_METRICS:
+            self.assertIn(f"# TYPE {name} {kind}", lines)
+
+    def test_collect__components_not_created__leaves_them_out_without_creating(self):
+        lines = self._lines()
+
+        self.assertFalse(any(line.startswith("microwave_inner_temperature_celsius{") for line in lines))
+        self.assertIsNone(OvenContext.peek(self.context, SensorManager))
+
+    def test_collect__sensors_created__exports_readings(self):
+        sensors = self.context.get(SensorManager)
+
+        lines = self._lines()
+
+        self.assertIn(f'microwave_inner_weight_grams{{oven="Oven 1"}} {float(sensors.inner_weight())!r}', lines)
+        self.assertIn(f'microwave_magnetron_temperature_celsius{{oven="Oven 1",sensor="2"}} '
+                      f'{float(sensors.magnetron_temp2())!r}', lines)
+
+    def test_collect__magnetron_powered__exports_state_and_power_share(self):
+        self.context.get(Magnetron).turn_on()
+        modulator = self.context.get(MagnetronModulator)
+        modulator.power_history.add(True)
+        modulator.power_history.add(False)
+
+        lines = self._lines()
+
+        self.assertIn('microwave_magnetron_active{oven="Oven 1"} 1.0', lines)
+        self.assertIn('microwave_magnetron_power_share{oven="Oven 1"} 0.5', lines)
+
+    def test_collect__emergencies_declared__exports_count(self):
+        self.context.get(EmergencyHandler).emergencies = 3
+
+        self.assertIn('microwave_emergencies_total{oven="Oven 1"} 3.0', self._lines())
+
+    def test_collect__program_controller_created__exports_program_state(self):
+        self.context.get(ProgramController)
+
+        self.assertIn('microwave_program_running{oven="Oven 1",program="No program running"} 0.0', self._lines())
+
+    def test_collect__program_estimated__exports_eta(self):
+        self.context.get(ProgramController).get_eta = lambda: 12.5
+
+        self.assertIn('microwave_program_eta_seconds{oven="Oven 1",program="No program running"} 12.5', self._lines())
+
+    def test_collect__program_not_estimated__omits_eta(self):
+        self.context.get(ProgramController)
+
+        self.assertFalse(any(line.startswith("microwave_program_eta_seconds{") for line in self._lines()))
+
+    def test_collect__no_contexts_given__observes_singletons(self):
+        self.assertEqual(MetricsCollector().contexts, [None])
+
+    def test_collect__label_with_special_characters__escapes_label(self):
+        self.context.name = 'Oven "A"\\1'
+        self.context.get(EmergencyHandler)
+
+        self.assertIn('microwave_emergencies_total{oven="Oven \\"A\\"\\\\1"} 0.0', self._lines())
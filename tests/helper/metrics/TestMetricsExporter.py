@@ -0,0 +1,63 @@
+import unittest
+import urllib.error
+import urllib.request
+from unittest.mock import ANY, MagicMock
+
+from src.helper.OvenContext import OvenContext
+from src.helper.metrics.MetricsExporter import MetricsExporter
+
+
+class TestMetricsExporter(unittest.TestCase):
+    def setUp(self):
+        self.exporter = MetricsExporter([OvenContext()], port=0)
+        self.exporter.logger = MagicMock()
+        self.exporter.collector = MagicMock()
+        self.exporter.collector.collect.return_value = "microwave_test 1.0\n"
+
+    def tearDown(self):
+        if self.exporter.server is not None:
+            self.exporter.stop()
+
+    def _get(self, path):
+        return urllib.request.urlopen(f"http://{self.exporter.host}:{self.exporter.port}{path}", timeout=5)
+
+    def test_start__scraped__returns_collected_metrics(self):
+        self.exporter.start()
+
+        with self._get("/metrics") as response:
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.headers["Content-Type"], MetricsExporter.CONTENT_TYPE)
+            self.assertEqual(response.read(), b"microwave_test 1.0\n")
+
+    def test_start__other_path__returns_not_found(self):
+        self.exporter.start()
+
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            self._get("/other")
+
+        self.assertEqual(context.exception.code, 404)
+
+    def test_start__port_zero__binds_free_port(self):
+        self.exporter.start()
+
+        self.assertNotEqual(self.exporter.port, 0)
+
+    def test_start__already_running__logs_warning(self):
+        self.exporter.start()
+
+        self.exporter.start()
+
+        self.exporter.logger.log.assert_called_with("Metrics server is already running", ANY)
+
+    def test_stop__running__closes_server(self):
+        self.exporter.start()
+
+        self.exporter.stop()
+
+        self.assertIsNone(self.exporter.server)
+        self.assertIsNone(self.exporter.thread)
+
+    def test_stop__not_running__logs_warning(self):
+        self.exporter.stop()
+
+        self.exporter.logger.log.assert_called_once_with("Metrics server is not running", ANY)
@@ -0,0 +1,97 @@
+import unittest
+from unittest.mock import patch
+
+from src.helper.OvenContext import OvenContext
+from src.helper.noise.NoiseSource import NoiseSource
+
+
+class TestNoiseSource(unittest.TestCase):
+    def setUp(self):
+        NoiseSource._instance = None
+
+    @staticmethod
+    def _draw(stream, count=5):
+        return [stream.uniform(0, 1) for _ in range(count)]
+
+    def test_new__no_context__returns_singleton(self):
+        self.assertIs(NoiseSource(), NoiseSource())
+
+    def test_init__singleton_retrieved_again__keeps_seed_and_streams(self):
+        NoiseSource().seed(1)
+        stream = NoiseSource().stream("Test")
+        expected = self._draw(stream)
+
+        NoiseSource().seed(1)
+        NoiseSource()
+
+        self.assertIs(NoiseSource().stream("Test"), stream)
+        self.assertEqual(self._draw(NoiseSource().stream("Test")), expected)
+
+    def test_stream__seeded_singleton__reproducible_across_runs(self):
+        runs = []
+        for _ in range(2):
+            NoiseSource._instance = None
+            NoiseSource().seed(1)
+            runs.append(self._draw(NoiseSource().stream("SimulationSensorTemp1")))
+
+        self.assertEqual(runs[0], runs[1])
+
+    def test_new__context__returns_independent_instance(self):
+        self.assertIsNot(NoiseSource(OvenContext()), NoiseSource())
+
+    def test_stream__same_name__returns_same_stream(self):
+        source = NoiseSource()
+
+        self.assertIs(source.stream("Test"), source.stream("Test"))
+
+    @patch("src.helper.noise.NoiseSource.NOISE_SEED", 7)
+    def test_stream__configured_seed__reproducible_across_instances(self):
+        first = NoiseSource(OvenContext("Oven"))
+        second = NoiseSource(OvenContext("Oven"))
+
+        self.assertEqual(self._draw(first.stream("Test")), self._draw(second.stream("Test")))
+
+    @patch("src.helper.noise.NoiseSource.NOISE_SEED", 7)
+    def test_stream__different_names__different_values(self):
+        source = NoiseSource(OvenContext("Oven"))
+
+        self.assertNotEqual(self._draw(source.stream("First")), self._draw(source.stream("Second")))
+
+    @patch("src.helper.noise.NoiseSource.NOISE_SEED", 7)
+    def test_stream__different_ovens__different_values(self):
+        first = NoiseSource(OvenContext("First"))
+        second = NoiseSource(OvenContext("Second"))
+
+        self.assertNotEqual(self._draw(first.stream("Test")), self._draw(second.stream("Test")))
+
+    def test_stream__creation_order__does_not_change_values(self):
+        first = NoiseSource(OvenContext("Oven"))
+        first.seed(3)
+        first.stream("Other").uniform(0, 1)
+        second = NoiseSource(OvenContext("Oven"))
+        second.seed(3)
+
+        self.assertEqual(self._draw(first.stream("Test")), self._draw(second.stream("Test")))
+
+    def test_seed__existing_stream__restarts_stream(self):
+        source = NoiseSource(OvenContext("Oven"))
+        stream = source.stream("Test")
+        source.seed(3)
+        expected = self._draw(stream)
+
+        source.seed(3)
+
+        self.assertEqual(self._draw(stream), expected)
+
+    def test_snapshot__restored_into_other_source__continues_every_stream(self):
+        source = NoiseSource(OvenContext("Oven"))
+        source.seed(3)
+        self._draw(source.stream("First"), 3)
+        self._draw(source.stream("Second"), 7)
+        snapshot = source.snapshot()
+        expected = [self._draw(source.stream("First")), self._draw(source.stream("Second"))]
+
+        other = NoiseSource(OvenContext("Oven"))
+        other.restore(snapshot)
+
+        self.assertEqual([self._draw(other.stream("First")), self._draw(other.stream("Second"))], expected)
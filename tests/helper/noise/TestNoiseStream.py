@@ -0,0 +1,54 @@
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from src.helper.noise.NoiseStream import NoiseStream
+
+
+class TestNoiseStream(unittest.TestCase):
+    def setUp(self):
+        self.stream = NoiseStream("Test", np.random.default_rng(1), 4)
+
+    def test_init__non_positive_block_size__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            NoiseStream("Test", np.random.default_rng(1), 0)
+
+    def test_uniform__called__values_within_bounds(self):
+        values = [self.stream.uniform(-0.5, 0.5) for _ in range(100)]
+
+        self.assertTrue(all(-0.5 <= value < 0.5 for value in values))
+
+    def test_uniform__called__returns_generator_values_in_order(self):
+        expected = np.random.default_rng(1).random(8).tolist()
+
+        values = [self.stream.uniform(0, 1) for _ in range(8)]
+
+        self.assertEqual(values, expected)
+
+    def test_uniform__block_exhausted__generates_one_block_at_once(self):
+        self.stream.generator = MagicMock(wraps=self.stream.generator)
+
+        for _ in range(5):
+            self.stream.uniform(0, 1)
+
+        self.assertEqual(self.stream.generator.random.call_count, 2)
+        self.stream.generator.random.assert_called_with(4)
+
+    def test_restart__buffered_values__continues_with_new_generator(self):
+        self.stream.uniform(0, 1)
+
+        self.stream.restart(np.random.default_rng(2))
+
+        self.assertEqual(self.stream.uniform(0, 1), np.random.default_rng(2).random())
+
+    def test_snapshot__buffered_values__continues_with_same_values_after_restore(self):
+        stream = NoiseStream("Test", np.random.default_rng(1), 4)
+        stream.uniform(0, 1)
+        state = stream.snapshot()
+        expected = [stream.uniform(0, 1) for _ in range(6)]
+
+        stream.uniform(0, 1)
+        stream.restore(state)
+
+        self.assertEqual([stream.uniform(0, 1) for _ in range(6)], expected)
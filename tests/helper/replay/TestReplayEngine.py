@@ -0,0 +1,103 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from src.helper.Action import Action
+from src.helper.Clock import Clock
+from src.helper.OvenContext import OvenContext
+from src.helper.Scheduler import Scheduler
+from src.helper.noise.NoiseSource import NoiseSource
+from src.helper.replay.ReplayEngine import ReplayEngine
+from src.helper.telemetry.TelemetryFormat import TelemetryFormat
+from src.helper.telemetry.TelemetryRecorder import TelemetryRecorder
+
+
+class TestReplayEngine(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "trace.bin")
+        self.logger_patch = patch('src.helper.replay.ReplayEngine.Logger', return_value=MagicMock())
+        self.logger_patch.start()
+
+    def tearDown(self):
+        self.logger_patch.stop()
+        self.directory.cleanup()
+
+    def _record(self, rows, actions=None, magnetron_active=()):
+        recorder = TelemetryRecorder(self.path, OvenContext(), chunk_rows=16)
+        for row in range(rows):
+            action = TelemetryFormat.encode_action((actions or {}).get(row))
+            recorder.append((0.01 * (row + 1), 20.0, 20.0, 0.5, 500.0, 25.0, 25.0, row in magnetron_active,
+                             0.0, 0.0, 0.0, action))
+        recorder.close()
+        return ReplayEngine(self.path)
+
+    def test_run__idle_session__matches_recording(self):
+        result = self._record(20).run()
+
+        self.assertEqual(result.replayed, 20)
+        self.assertTrue(result.matches())
+
+    def test_run__differing_actuator__reports_mismatching_rows(self):
+        result = self._record(20, magnetron_active=(3, 7)).run()
+
+        np.testing.assert_array_equal(result.mismatches["magnetron_active"], [3, 7])
+        self.assertEqual(result.first_mismatch(), 3)
+
+    def test_run__recorded_start__drives_program(self):
+        result = self._record(30, actions={0: Action.START}).run()
+
+        self.assertGreater(result.outputs["turntable_rotations_per_minute"].max(), 0.0)
+
+    def test_run__same_seed__replays_identically(self):
+        engine = self._record(30, actions={0: Action.START})
+
+        first = engine.run()
+        second = engine.run()
+
+        for column, values in first.outputs.items():
+            np.testing.assert_array_equal(values, second.outputs[column])
+
+    def test_run__recorded_off__stops_before_end_of_recording(self):
+        result = self._record(20, actions={5: Action.OFF}).run()
+
+        self.assertEqual(result.replayed, 6)
+        self.assertFalse(result.matches())
+
+    def test_run__empty_recording__replays_nothing(self):
+        result = self._record(0).run()
+
+        self.assertEqual(result.replayed, 0)
+        self.assertTrue(result.matches())
+
+    def test_run__called__restores_clock_and_scheduler(self):
+        engine = self._record(5)
+        clock, scheduler = Clock(), Scheduler()
+
+        engine.run()
+
+        self.assertIs(Clock(), clock)
+        self.assertIs(Scheduler(), scheduler)
+
+    def test_create_context__same_seed__same_noise(self):
+        engine = self._record(1)
+
+        first = engine.create_context().get(NoiseSource).stream("Test")
+        second = engine.create_context().get(NoiseSource).stream("Test")
+
+        self.assertEqual([first.uniform(0, 1) for _ in range(3)], [second.uniform(0, 1) for _ in range(3)])
+
+    def test_action__recorded_row__returns_decoded_action(self):
+        engine = self._record(3, actions={1: Action.PAUSE})
+        engine.tick = 1
+
+        self.assertEqual(engine.action(), Action.PAUSE)
+
+    def test_action__after_last_row__returns_none(self):
+        engine = self._record(3)
+        engine.tick = 3
+
+        self.assertIsNone(engine.action())
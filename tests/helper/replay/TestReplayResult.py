@@ -0,0 +1,27 @@
+import unittest
+
+import numpy as np
+
+from src.helper.replay.ReplayResult import ReplayResult
+
+
+class TestReplayResult(unittest.TestCase):
+    def _result(self, replayed=4, mismatches=()):
+        return ReplayResult(4, replayed, {"magnetron_active": np.zeros(replayed, dtype=bool)},
+                            {"magnetron_active": np.array(mismatches, dtype=np.intp),
+                             "reflector_angle": np.array([], dtype=np.intp)})
+
+    def test_matches__all_rows_equal__returns_true(self):
+        self.assertTrue(self._result().matches())
+
+    def test_matches__mismatching_row__returns_false(self):
+        self.assertFalse(self._result(mismatches=[2]).matches())
+
+    def test_matches__replay_ended_early__returns_false(self):
+        self.assertFalse(self._result(replayed=2).matches())
+
+    def test_first_mismatch__mismatching_rows__returns_earliest(self):
+        self.assertEqual(self._result(mismatches=[1, 3]).first_mismatch(), 1)
+
+    def test_first_mismatch__all_rows_equal__returns_none(self):
+        self.assertIsNone(self._result().first_mismatch())
@@ -0,0 +1,75 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from src.helper.scheduling.AsyncioScheduler import AsyncioScheduler
+
+
+class TestAsyncioScheduler(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.scheduler = AsyncioScheduler()
+        self.scheduler.logger = MagicMock()
+
+    def test_schedule__no_running_loop__raises_runtime_error(self):
+        with self.assertRaises(RuntimeError):
+            AsyncioScheduler().schedule(MagicMock(), 0.1)
+
+    async def test_schedule__invalid_period__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.scheduler.schedule(MagicMock(), 0)
+
+    async def test_schedule__callbacks_end__runs_each_as_coroutine_until_done(self):
+        threads_before = threading.active_count()
+        fast = MagicMock(side_effect=[True, True, False])
+        slow = MagicMock(side_effect=[False])
+
+        self.scheduler.schedule(fast, 0.001, name="Fast")
+        self.scheduler.schedule(slow, 0.005, 0.002, "Slow")
+        await self.scheduler.join()
+
+        self.assertEqual(fast.call_count, 3)
+        self.assertEqual(slow.call_count, 1)
+        self.assertEqual(threading.active_count(), threads_before)
+
+    async def test_suspend__task_suspended__awaits_resume_event(self):
+        calls = []
+        task = self.scheduler.schedule(lambda: calls.append(1) or len(calls) < 2, 0.001)
+        task.suspend()
+
+        await asyncio.sleep(0.01)
+        self.assertEqual(calls, [])
+
+        task.resume()
+        await self.scheduler.join()
+
+        self.assertEqual(calls, [1, 1])
+
+    async def test_join__suspended_task_stopped__ends_coroutine(self):
+        running = {"value": True}
+        task = self.scheduler.schedule(lambda: running["value"], 0.001)
+        task.suspend()
+        await asyncio.sleep(0.005)
+
+        running["value"] = False
+        task.join()
+        await asyncio.wait_for(self.scheduler.join(), 1)
+
+        self.assertFalse(task.is_alive())
+
+    async def test_schedule__called_from_other_thread__runs_on_event_loop(self):
+        loop_thread = threading.current_thread()
+        executed_on = []
+
+        def callback():
+            executed_on.append(threading.current_thread())
+            return False
+
+        self.scheduler.loop = asyncio.get_running_loop()
+        thread = threading.Thread(target=lambda: self.scheduler.schedule(callback, 0.001))
+        thread.start()
+        thread.join()
+        await asyncio.sleep(0.01)
+        await self.scheduler.join()
+
+        self.assertEqual(executed_on, [loop_thread])
@@ -0,0 +1,99 @@
+import unittest
+from unittest.mock import MagicMock
+
+from src.helper.Clock import Clock
+from src.helper.clock.SystemClock import SystemClock
+from src.helper.clock.VirtualClock import VirtualClock
+from src.helper.logging.LogLevel import LogLevel
+from src.helper.metrics.LoopMonitor import LoopMonitor
+from src.helper.scheduling.OverrunPolicy import OverrunPolicy
+from src.helper.scheduling.PeriodicRunner import PeriodicRunner
+
+
+class TestPeriodicRunner(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock()
+        Clock.use(self.clock)
+        LoopMonitor._loops.clear()
+        self.starts = []
+
+    def tearDown(self):
+        Clock.use(SystemClock())
+
+    def _runner(self, durations, period=0.1, phase=0.0, policy=OverrunPolicy.SKIP):
+        def callback():
+            self.starts.append(round(self.clock.monotonic(), 6))
+            self.clock.sleep(durations[len(self.starts) - 1])
+            return len(self.starts) < len(durations)
+
+        runner = PeriodicRunner(callback, period, "Test", phase, policy)
+        runner.logger = MagicMock()
+        return runner
+
+    def test___init__invalid_period_or_phase__raises_value_error(self):
+        for period, phase in [(0, 0.0), (-0.1, 0.0), (0.1, -1.0)]:
+            with self.assertRaises(ValueError):
+                PeriodicRunner(MagicMock(), period, phase=phase)
+
+    def test_run__work_within_period__keeps_absolute_deadlines(self):
+        runner = self._runner([0.03, 0.05, 0.07, 0.01])
+
+        runner.run()
+
+        self.assertEqual(self.starts, [0.0, 0.1, 0.2, 0.3])
+        self.assertEqual(runner.overruns, 0)
+
+    def test_run__phase_given__delays_first_execution(self):
+        self._runner([0.0, 0.0], phase=0.05).run()
+
+        self.assertEqual(self.starts, [0.05, 0.15])
+
+    def test_run__callback_returns_false__stops_after_first_execution(self):
+        callback = MagicMock(return_value=False)
+
+        PeriodicRunner(callback, 0.1).run()
+
+        callback.assert_called_once()
+
+    def test_run__overrun_with_skip_policy__skips_missed_deadlines_and_reports(self):
+        runner = self._runner([0.0, 0.25, 0.0, 0.0])
+
+        runner.run()
+
+        self.assertEqual(self.starts, [0.0, 0.1, 0.4, 0.5])
+        self.assertEqual(runner.overruns, 1)
+        self.assertEqual(runner.missed, 2)
+        self.assertAlmostEqual(runner.max_lateness, 0.15)
+        self.assertEqual(runner.logger.log.call_args.args[1], LogLevel.WARNING)
+
+    def test_run__overrun_with_catch_up_policy__runs_missed_deadlines_back_to_back(self):
+        runner = self._runner([0.0, 0.25, 0.0, 0.0, 0.0], policy=OverrunPolicy.CATCH_UP)
+
+        runner.run()
+
+        self.assertEqual(self.starts, [0.0, 0.1, 0.35, 0.35, 0.4])
+        self.assertEqual(runner.overruns, 1)
+        self.assertEqual(runner.missed, 0)
+
+    def test_run__executions__records_loop_statistics(self):
+        runner = self._runner([0.03, 0.25, 0.0, 0.0])
+
+        runner.run()
+
+        self.assertIs(runner.statistics, LoopMonitor("Test", 0.1))
+        self.assertEqual(runner.statistics.cycles, 4)
+        self.assertEqual(runner.statistics.deadline_misses, 1)
+        self.assertEqual(runner.statistics.interval.count, 3)
+        self.assertAlmostEqual(runner.statistics.execution.maximum, 250000, delta=1)
+
+    def test_next_deadline__on_time__returns_following_deadline(self):
+        self.assertEqual(PeriodicRunner.next_deadline(1.0, 1.05, 0.1), (1.1, 0))
+
+    def test_next_deadline__late_with_skip__returns_next_deadline_on_grid(self):
+        deadline, missed = PeriodicRunner.next_deadline(1.0, 1.32, 0.1)
+
+        self.assertAlmostEqual(deadline, 1.4)
+        self.assertEqual(missed, 3)
+
+    def test_next_deadline__late_with_catch_up__returns_following_deadline(self):
+        self.assertEqual(PeriodicRunner.next_deadline(1.0, 1.32, 0.1, OverrunPolicy.CATCH_UP), (1.1, 0))
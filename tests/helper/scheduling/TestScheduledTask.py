@@ -0,0 +1,48 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from src.helper.scheduling.ScheduledTask import ScheduledTask
+
+
+class TestScheduledTask(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = MagicMock()
+        self.callback = MagicMock(return_value=True)
+        self.task = ScheduledTask(self.scheduler, self.callback, 0.1, "TestTask", threading.RLock())
+
+    def test_run__callback_returns_true__keeps_task_alive(self):
+        self.assertTrue(self.task.run())
+        self.assertTrue(self.task.is_alive())
+
+    def test_run__callback_returns_false__ends_task(self):
+        self.callback.return_value = False
+
+        self.assertFalse(self.task.run())
+        self.assertFalse(self.task.is_alive())
+
+    def test_run__task_done__does_not_call_callback(self):
+        self.task.cancel()
+
+        self.assertFalse(self.task.run())
+        self.callback.assert_not_called()
+
+    def test_join__callback_ends_after_two_runs__runs_inline_until_done(self):
+        self.callback.side_effect = [True, False]
+
+        self.task.join()
+
+        self.assertEqual(self.callback.call_count, 2)
+        self.assertFalse(self.task.is_alive())
+
+    def test_resume__suspended_task__reschedules_task(self):
+        self.task.suspend()
+        self.task.resume()
+
+        self.assertFalse(self.task.suspended)
+        self.scheduler.reschedule.assert_called_once_with(self.task)
+
+    def test_resume__not_suspended__does_nothing(self):
+        self.task.resume()
+
+        self.scheduler.reschedule.assert_not_called()
@@ -0,0 +1,106 @@
+import unittest
+from unittest.mock import MagicMock
+
+from src.helper.Clock import Clock
+from src.helper.clock.SystemClock import SystemClock
+from src.helper.clock.VirtualClock import VirtualClock
+from src.helper.metrics.LoopMonitor import LoopMonitor
+from src.helper.scheduling.TickScheduler import TickScheduler
+
+
+class TestTickScheduler(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock()
+        Clock.use(self.clock)
+        LoopMonitor._loops.clear()
+        self.scheduler = TickScheduler()
+        self.scheduler.logger = MagicMock()
+
+    def tearDown(self):
+        Clock.use(SystemClock())
+
+    def test_schedule__invalid_period__raises_value_error(self):
+        for period in [0, -0.1]:
+            with self.assertRaises(ValueError):
+                self.scheduler.schedule(MagicMock(), period)
+
+    def test_schedule__negative_phase__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.scheduler.schedule(MagicMock(), 0.1, -1)
+
+    def test_run__tasks_with_periods_and_phases__executes_in_time_order(self):
+        ticks = []
+
+        def task(name, count):
+            def callback():
+                ticks.append((round(self.clock.monotonic(), 6), name))
+                return len([tick for tick in ticks if tick[1] == name]) < count
+
+            return callback
+
+        self.scheduler.schedule(task("fast", 5), 0.1, name="Fast")
+        self.scheduler.schedule(task("slow", 2), 0.25, 0.02, "Slow")
+        self.scheduler.run()
+
+        self.assertEqual(ticks, [
+            (0.0, "fast"), (0.02, "slow"), (0.1, "fast"), (0.2, "fast"),
+            (0.27, "slow"), (0.3, "fast"), (0.4, "fast"),
+        ])
+        self.assertFalse(self.scheduler.running)
+
+    def test_tick__task_overran__skips_missed_executions_and_keeps_phase(self):
+        def slow_callback():
+            self.clock.sleep(0.35)
+            return True
+
+        task = self.scheduler.schedule(slow_callback, 0.1, 0.05)
+        self.clock.sleep(0.05)
+        self.scheduler.tick()
+
+        self.assertAlmostEqual(task.next_run, 0.45)
+
+    def test_tick__task_executed__records_loop_statistics(self):
+        durations = [0.02, 0.15, 0.0]
+        self.scheduler.schedule(lambda: self.clock.sleep(durations.pop(0)) or bool(durations), 0.1, name="Measured")
+
+        self.scheduler.run()
+
+        statistics = LoopMonitor("Measured", 0.1)
+        self.assertEqual(statistics.cycles, 3)
+        self.assertEqual(statistics.deadline_misses, 1)
+        self.assertEqual(statistics.interval.count, 2)
+
+    def test_tick__suspended_task__is_not_executed_until_resumed(self):
+        callback = MagicMock(return_value=True)
+        task = self.scheduler.schedule(callback, 0.1)
+        task.suspend()
+
+        self.assertIsNone(self.scheduler.tick())
+        callback.assert_not_called()
+
+        task.resume()
+        self.scheduler.tick()
+
+        callback.assert_called_once()
+
+    def test_tick__cancelled_task__is_removed(self):
+        callback = MagicMock(return_value=True)
+        task = self.scheduler.schedule(callback, 0.1)
+        task.cancel()
+
+        self.assertIsNone(self.scheduler.tick())
+        callback.assert_not_called()
+
+    def test_start__not_running__runs_in_separate_thread(self):
+        self.scheduler.schedule(MagicMock(side_effect=[True, False]), 0.1)
+
+        self.scheduler.start()
+        Clock().join(self.scheduler.thread)
+
+        self.assertEqual(self.scheduler.thread.name, "SchedulerThread")
+        self.assertFalse(self.scheduler.running)
+
+    def test_stop__not_running__logs_warning(self):
+        self.scheduler.stop()
+
+        self.scheduler.logger.log.assert_called_once()
@@ -0,0 +1,28 @@
+import unittest
+
+from src.helper.Action import Action
+from src.helper.telemetry.TelemetryFormat import TelemetryFormat
+
+
+class TestTelemetryFormat(unittest.TestCase):
+    def test_header_size__columns_given__aligns_to_chunk_alignment(self):
+        size = TelemetryFormat.header_size(3)
+
+        self.assertEqual(size % TelemetryFormat.ALIGNMENT, 0)
+        self.assertGreaterEqual(size, TelemetryFormat.HEADER.size + 3 * TelemetryFormat.COLUMN.size)
+
+    def test_chunk_layout__formats_given__aligns_every_column(self):
+        offsets, size = TelemetryFormat.chunk_layout(["d", "?"], 10)
+
+        self.assertEqual(offsets, [0, 128])
+        self.assertEqual(size, 192)
+
+    def test_encode_action__no_action__returns_zero(self):
+        self.assertEqual(TelemetryFormat.encode_action(None), 0)
+
+    def test_decode_action__encoded_action__returns_same_action(self):
+        for action in Action:
+            self.assertEqual(TelemetryFormat.decode_action(TelemetryFormat.encode_action(action)), action)
+
+    def test_decode_action__zero__returns_none(self):
+        self.assertIsNone(TelemetryFormat.decode_action(0))
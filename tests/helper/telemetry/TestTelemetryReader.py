@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.helper.OvenContext import OvenContext
+from src.helper.telemetry.TelemetryReader import TelemetryReader
+from src.helper.telemetry.TelemetryRecorder import TelemetryRecorder
+
+
+class TestTelemetryReader(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "trace.bin")
+        self.recorder = TelemetryRecorder(self.path, OvenContext(), chunk_rows=4)
+
+    def tearDown(self):
+        self.recorder.close()
+        self.directory.cleanup()
+
+    def _record(self, count):
+        for value in range(count):
+            self.recorder.append((float(value), value + 0.5, 0.0, 0.0, 0.0, 0.0, 0.0, value % 2 == 0, 0.1 * value,
+                                  -1.0, 45.0, value % 3))
+
+    def test___init__not_a_telemetry_file__raises_value_error(self):
+        path = os.path.join(self.directory.name, "other.bin")
+        with open(path, "wb") as file:
+            file.write(b"\0" * 256)
+
+        with self.assertRaises(ValueError):
+            TelemetryReader(path)
+
+    def test___init__recorded_file__reads_header(self):
+        self._record(3)
+
+        reader = TelemetryReader(self.path)
+
+        self.assertEqual(reader.rows, 3)
+        self.assertEqual(reader.chunk_rows, 4)
+        self.assertEqual(reader.columns, [name for name, _ in TelemetryRecorder.COLUMNS])
+
+    def test_read__multiple_chunks__returns_values_in_order(self):
+        self._record(10)
+
+        reader = TelemetryReader(self.path)
+
+        np.testing.assert_array_equal(reader.read("time"), np.arange(10.0))
+        np.testing.assert_array_equal(reader.read("inner_temp1"), np.arange(10.0) + 0.5)
+        np.testing.assert_array_equal(reader.read("magnetron_active"), np.arange(10) % 2 == 0)
+
+    def test_read__single_chunk__returns_view_without_copy(self):
+        self._record(2)
+
+        values = TelemetryReader(self.path).read("reflector_angle")
+
+        self.assertEqual(values.dtype, np.float64)
+        self.assertFalse(values.flags.owndata)
+        np.testing.assert_array_equal(values, [45.0, 45.0])
+
+    def test_read__unknown_column__raises_key_error(self):
+        with self.assertRaises(KeyError):
+            TelemetryReader(self.path).read("unknown")
+
+    def test_read_all__recorded_file__returns_every_column(self):
+        self._record(5)
+
+        columns = TelemetryReader(self.path).read_all()
+
+        self.assertEqual(len(columns), len(TelemetryRecorder.COLUMNS))
+        self.assertTrue(all(len(values) == 5 for values in columns.values()))
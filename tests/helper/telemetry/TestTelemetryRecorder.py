@@ -0,0 +1,125 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from src.components.door.Door import Door
+from src.components.magnetron.Magnetron import Magnetron
+from src.components.sensor.SensorManager import SensorManager
+from src.components.sensor.SimulationSensorTemp1 import SimulationSensorTemp1
+from src.helper.Action import Action
+from src.helper.OvenContext import OvenContext
+from src.helper.telemetry.TelemetryFormat import TelemetryFormat
+from src.helper.telemetry.TelemetryRecorder import TelemetryRecorder
+from src.user.UserInteractionHandler import UserInteractionHandler
+
+
+class TestTelemetryRecorder(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "trace.bin")
+        self.context = OvenContext()
+        self.recorder = TelemetryRecorder(self.path, self.context, chunk_rows=4)
+
+    def tearDown(self):
+        self.recorder.close()
+        self.directory.cleanup()
+
+    def _row(self, value):
+        return (value,) * 7 + (value > 1,) + (value,) * 3 + (0,)
+
+    def test___init__non_positive_chunk_rows__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            TelemetryRecorder(self.path, self.context, chunk_rows=0)
+
+    def test___init__called__preallocates_header_and_first_chunk(self):
+        self.assertEqual(os.path.getsize(self.path), self.recorder.header_size + self.recorder.chunk_size)
+        self.assertEqual(self.recorder.chunks, 1)
+
+    def test___init__called__writes_header(self):
+        with open(self.path, "rb") as file:
+            magic, version, columns, chunk_rows, rows = TelemetryFormat.HEADER.unpack(
+                file.read(TelemetryFormat.HEADER.size)
+            )
+
+        self.assertEqual((magic, version, columns, chunk_rows, rows),
+                         (TelemetryFormat.MAGIC, TelemetryFormat.VERSION, len(TelemetryRecorder.COLUMNS), 4, 0))
+
+    def test_append__chunk_full__grows_file_by_one_chunk(self):
+        for value in range(5):
+            self.recorder.append(self._row(float(value)))
+
+        self.assertEqual(self.recorder.rows, 5)
+        self.assertEqual(self.recorder.chunks, 2)
+        self.assertEqual(os.path.getsize(self.path), self.recorder.header_size + 2 * self.recorder.chunk_size)
+
+    def test_append__row_written__updates_row_count_in_header(self):
+        self.recorder.append(self._row(1.0))
+
+        self.assertEqual(TelemetryFormat.ROWS.unpack_from(self.recorder._map, TelemetryFormat.ROWS_OFFSET), (1,))
+
+    def test_record__attached_context__samples_sensors_and_actuators(self):
+        self.recorder.append = MagicMock()
+        self.context.get(Magnetron).turn_on()
+
+        self.recorder.record()
+
+        row = self.recorder.append.call_args.args[0]
+        self.assertEqual(len(row), len(TelemetryRecorder.COLUMNS))
+        self.assertEqual(row[1], self.context.get(SensorManager).inner_temp1())
+        self.assertTrue(row[7])
+
+    def test_record__user_action__records_action_code(self):
+        self.recorder.append = MagicMock()
+        self.context.get(UserInteractionHandler).last_action = Action.PAUSE
+
+        self.recorder.record()
+
+        row = self.recorder.append.call_args.args[0]
+        action = [name for name, _ in TelemetryRecorder.COLUMNS].index("action")
+        self.assertEqual(TelemetryFormat.decode_action(row[action]), Action.PAUSE)
+
+    def test_attach__sensor_update__records_row(self):
+        self.recorder.attach()
+
+        self.context.get(SensorManager).update_sensors()
+
+        self.assertEqual(self.recorder.rows, 1)
+
+    def test_close__attached__detaches_from_sensor_manager(self):
+        self.recorder.attach()
+
+        self.recorder.close()
+
+        self.assertIsNone(self.context.get(SensorManager).recorder)
+
+    def test___init__singletons_running__keeps_their_state(self):
+        for singleton in (SensorManager, SimulationSensorTemp1, Magnetron, Door, UserInteractionHandler):
+            self.addCleanup(setattr, singleton, "_instance", None)
+        user_interaction_handler = UserInteractionHandler()
+        sensor_manager = SensorManager()
+        magnetron = Magnetron()
+        door = Door()
+        sensor_manager.temp1_sensor.temperature = 42.0
+        magnetron.active = True
+        door.opened = True
+        user_interaction_handler.selected_program = "defrosting"
+
+        recorder = TelemetryRecorder(os.path.join(self.directory.name, "singletons.bin"))
+        self.addCleanup(recorder.close)
+
+        self.assertIs(recorder.sensor_manager, sensor_manager)
+        self.assertEqual(sensor_manager.inner_temp1(), 42.0)
+        self.assertTrue(magnetron.active)
+        self.assertTrue(door.opened)
+        self.assertEqual(user_interaction_handler.selected_program, "defrosting")
+
+    def test_attach__singleton_retrieved_again__stays_attached(self):
+        self.addCleanup(setattr, SensorManager, "_instance", None)
+        recorder = TelemetryRecorder(os.path.join(self.directory.name, "singletons.bin"))
+        self.addCleanup(recorder.close)
+        recorder.attach()
+
+        SensorManager()
+
+        self.assertIs(recorder.sensor_manager.recorder, recorder)
@@ -0,0 +1,39 @@
+import unittest
+
+from src.components.cooling.CoolingFan import CoolingFan
+from src.components.door.Door import Door
+from src.components.door.DoorController import DoorController
+from src.components.sensor.SensorManager import SensorManager
+from src.helper.Action import Action
+from src.helper.OvenContext import OvenContext
+from src.helper.telemetry.TelemetryFormat import TelemetryFormat
+from src.helper.telemetry.TelemetrySampler import TelemetrySampler
+from src.user.UserInteractionHandler import UserInteractionHandler
+
+
+class TestTelemetrySampler(unittest.TestCase):
+    def setUp(self):
+        self.context = OvenContext()
+        self.sampler = TelemetrySampler(self.context)
+
+    def test_sample__called__returns_value_per_column(self):
+        self.assertEqual(len(self.sampler.sample()), len(TelemetrySampler.COLUMNS))
+
+    def test_sample__context_given__samples_components_of_context(self):
+        self.context.get(CoolingFan).power_share = 0.3
+        self.context.get(UserInteractionHandler).last_action = Action.STOP
+
+        row = self.sampler.sample()
+
+        self.assertEqual(row[4], self.context.get(SensorManager).inner_weight())
+        self.assertEqual(row[8], 0.3)
+        self.assertEqual(TelemetryFormat.decode_action(row[11]), Action.STOP)
+
+    def test_sample__door_opened_while_locked__samples_door_state(self):
+        self.context.get(Door).opened = True
+        self.context.get(DoorController).locked = True
+
+        row = dict(zip((name for name, _ in TelemetrySampler.COLUMNS), self.sampler.sample()))
+
+        self.assertIs(row["door_opened"], True)
+        self.assertIs(row["door_locked"], True)
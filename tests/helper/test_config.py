@@ -8,6 +8,54 @@ class TestConfig(unittest.TestCase):
         self.assertTrue(hasattr(config, "DEFAULT_LOG_LEVEL"))
         self.assertIsInstance(config.DEFAULT_LOG_LEVEL, str)
 
+    def test_LOG_QUEUE_CAPACITY__exists_and_is_int(self):
+        self.assertTrue(hasattr(config, "LOG_QUEUE_CAPACITY"))
+        self.assertIsInstance(config.LOG_QUEUE_CAPACITY, int)
+
+    def test_LOG_FLUSH_INTERVAL_IN_SECONDS__exists_and_is_float(self):
+        self.assertTrue(hasattr(config, "LOG_FLUSH_INTERVAL_IN_SECONDS"))
+        self.assertIsInstance(config.LOG_FLUSH_INTERVAL_IN_SECONDS, float)
+
+    def test_FLIGHT_RECORDER_DURATION_IN_SECONDS__exists_and_is_float(self):
+        self.assertTrue(hasattr(config, "FLIGHT_RECORDER_DURATION_IN_SECONDS"))
+        self.assertIsInstance(config.FLIGHT_RECORDER_DURATION_IN_SECONDS, float)
+
+    def test_FLIGHT_RECORDER_LOG_CAPACITY__exists_and_is_int(self):
+        self.assertTrue(hasattr(config, "FLIGHT_RECORDER_LOG_CAPACITY"))
+        self.assertIsInstance(config.FLIGHT_RECORDER_LOG_CAPACITY, int)
+
+    def test_FLIGHT_RECORDER_DIRECTORY__exists_and_is_str(self):
+        self.assertTrue(hasattr(config, "FLIGHT_RECORDER_DIRECTORY"))
+        self.assertIsInstance(config.FLIGHT_RECORDER_DIRECTORY, str)
+
+    def test_LOOP_REPORT_INTERVAL_IN_SECONDS__exists_and_is_float(self):
+        self.assertTrue(hasattr(config, "LOOP_REPORT_INTERVAL_IN_SECONDS"))
+        self.assertIsInstance(config.LOOP_REPORT_INTERVAL_IN_SECONDS, float)
+
+    def test_METRICS_ENABLED__exists_and_is_bool(self):
+        self.assertTrue(hasattr(config, "METRICS_ENABLED"))
+        self.assertIsInstance(config.METRICS_ENABLED, bool)
+
+    def test_METRICS_HOST__exists_and_is_str(self):
+        self.assertTrue(hasattr(config, "METRICS_HOST"))
+        self.assertIsInstance(config.METRICS_HOST, str)
+
+    def test_METRICS_PORT__exists_and_is_int(self):
+        self.assertTrue(hasattr(config, "METRICS_PORT"))
+        self.assertIsInstance(config.METRICS_PORT, int)
+
+    def test_BENCHMARK_REGRESSION_THRESHOLD__exists_and_is_float(self):
+        self.assertTrue(hasattr(config, "BENCHMARK_REGRESSION_THRESHOLD"))
+        self.assertIsInstance(config.BENCHMARK_REGRESSION_THRESHOLD, float)
+
+    def test_NOISE_SEED__exists_and_is_int_or_none(self):
+        self.assertTrue(hasattr(config, "NOISE_SEED"))
+        self.assertIsInstance(config.NOISE_SEED, (int, type(None)))
+
+    def test_NOISE_BLOCK_SIZE__exists_and_is_int(self):
+        self.assertTrue(hasattr(config, "NOISE_BLOCK_SIZE"))
+        self.assertIsInstance(config.NOISE_BLOCK_SIZE, int)
+
     def test_AMBIENT_TEMPERATURE_IN_CELSIUS__exists_and_is_float(self):
         self.assertTrue(hasattr(config, "AMBIENT_TEMPERATURE_IN_CELSIUS"))
         self.assertIsInstance(config.AMBIENT_TEMPERATURE_IN_CELSIUS, float)
@@ -32,6 +80,14 @@ class TestConfig(unittest.TestCase):
         self.assertTrue(hasattr(config, "MAGNETRON_MAX_TEMP_IN_CELSIUS"))
         self.assertIsInstance(config.MAGNETRON_MAX_TEMP_IN_CELSIUS, float)
 
+    def test_MAGNETRON_MODULATION__exists_and_is_str(self):
+        self.assertTrue(hasattr(config, "MAGNETRON_MODULATION"))
+        self.assertIsInstance(config.MAGNETRON_MODULATION, str)
+
+    def test_MAGNETRON_POWER_IN_WATTS__exists_and_is_float(self):
+        self.assertTrue(hasattr(config, "MAGNETRON_POWER_IN_WATTS"))
+        self.assertIsInstance(config.MAGNETRON_POWER_IN_WATTS, float)
+
     def test_COOLING_FAN_STEP_IN_PERCENT__exists_and_is_float(self):
         self.assertTrue(hasattr(config, "COOLING_FAN_STEP_IN_PERCENT"))
         self.assertIsInstance(config.COOLING_FAN_STEP_IN_PERCENT, float)
@@ -79,3 +135,35 @@ class TestConfig(unittest.TestCase):
     def test_PROGRAM_DEFROSTING_TARGET_TEMP__exists_and_is_int(self):
         self.assertTrue(hasattr(config, "PROGRAM_DEFROSTING_TARGET_TEMP"))
         self.assertIsInstance(config.PROGRAM_DEFROSTING_TARGET_TEMP, int)
+
+    def test_PROGRAM_DEFAULT__exists_and_is_str(self):
+        self.assertTrue(hasattr(config, "PROGRAM_DEFAULT"))
+        self.assertIsInstance(config.PROGRAM_DEFAULT, str)
+
+    def test_PROGRAM_RECIPE_DIRECTORY__exists_and_is_str(self):
+        self.assertTrue(hasattr(config, "PROGRAM_RECIPE_DIRECTORY"))
+        self.assertIsInstance(config.PROGRAM_RECIPE_DIRECTORY, str)
+
+    def test_PROGRAM_METADATA_CACHE_PATH__exists_and_is_str(self):
+        self.assertTrue(hasattr(config, "PROGRAM_METADATA_CACHE_PATH"))
+        self.assertIsInstance(config.PROGRAM_METADATA_CACHE_PATH, str)
+
+    def test_PROGRAM_PREDICTIVE_HORIZON_IN_SECONDS__exists_and_is_float(self):
+        self.assertTrue(hasattr(config, "PROGRAM_PREDICTIVE_HORIZON_IN_SECONDS"))
+        self.assertIsInstance(config.PROGRAM_PREDICTIVE_HORIZON_IN_SECONDS, float)
+
+    def test_PROGRAM_PREDICTIVE_POWER_LEVELS__exists_and_is_int(self):
+        self.assertTrue(hasattr(config, "PROGRAM_PREDICTIVE_POWER_LEVELS"))
+        self.assertIsInstance(config.PROGRAM_PREDICTIVE_POWER_LEVELS, int)
+
+    def test_PROGRAM_PREDICTIVE_TEMP_MARGIN_IN_CELSIUS__exists_and_is_float(self):
+        self.assertTrue(hasattr(config, "PROGRAM_PREDICTIVE_TEMP_MARGIN_IN_CELSIUS"))
+        self.assertIsInstance(config.PROGRAM_PREDICTIVE_TEMP_MARGIN_IN_CELSIUS, float)
+
+    def test_CONFIG_PATH__exists_and_is_str(self):
+        self.assertTrue(hasattr(config, "CONFIG_PATH"))
+        self.assertIsInstance(config.CONFIG_PATH, str)
+
+    def test_CONFIG_WATCH_INTERVAL_IN_SECONDS__exists_and_is_float(self):
+        self.assertTrue(hasattr(config, "CONFIG_WATCH_INTERVAL_IN_SECONDS"))
+        self.assertIsInstance(config.CONFIG_WATCH_INTERVAL_IN_SECONDS, float)
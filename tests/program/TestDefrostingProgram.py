@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import MagicMock
 
 from src.helper.config import TURNTABLE_WEIGHT_IN_GRAMS, AMBIENT_TEMPERATURE_IN_CELSIUS, PROGRAM_DEFROSTING_TARGET_TEMP
+from src.helper.configuration.RuntimeConfig import RuntimeConfig
 from src.program.DefrostingProgram import DefrostingProgram
 
 
@@ -41,6 +42,18 @@ class TestDefrostingProgram(unittest.TestCase):
 
         self.assertEqual(self.program.cycles, 2)
 
+    def test_control_components__target_temp_changed_at_runtime__uses_new_target(self):
+        self.program.settings = RuntimeConfig()
+        self.program.settings.logger = MagicMock()
+        self.mock_sensors.inner_temp1.return_value = PROGRAM_DEFROSTING_TARGET_TEMP - 1
+        self.mock_sensors.inner_temp2.return_value = PROGRAM_DEFROSTING_TARGET_TEMP - 1
+        self.program.cycles = 3
+
+        self.program.settings.update({"PROGRAM_DEFROSTING_TARGET_TEMP": PROGRAM_DEFROSTING_TARGET_TEMP - 2})
+        self.program.control_components()
+
+        self.assertEqual(self.program.cycles, 2)
+
     def test_control_components__inner_temp_below_ambient_plus_5_and_just_updated__resets_just_updated(self):
         self.program.just_updated = True
 
@@ -74,3 +87,25 @@ class TestDefrostingProgram(unittest.TestCase):
         self.program.control_components()
 
         self.mock_magnetron.set_target_power_share.assert_called_with(0.2)
+
+    def test_heating_power_share__remaining_cycles__decreases_with_cycles(self):
+        self.program.cycles = 2
+
+        self.assertAlmostEqual(self.program.heating_power_share(AMBIENT_TEMPERATURE_IN_CELSIUS), 0.3)
+
+    def test_cycles_for_weight__weights__one_cycle_per_100_grams_at_least_one(self):
+        self.assertEqual(DefrostingProgram.cycles_for_weight(TURNTABLE_WEIGHT_IN_GRAMS), 1)
+        self.assertEqual(DefrostingProgram.cycles_for_weight(TURNTABLE_WEIGHT_IN_GRAMS + 299.9), 2)
+        self.assertEqual(DefrostingProgram.cycles_for_weight(TURNTABLE_WEIGHT_IN_GRAMS + 500), 5)
+
+    def test_weight_for_cycles__cycles__returns_weight_with_these_cycles(self):
+        for cycles in range(1, 10):
+            self.assertEqual(DefrostingProgram.cycles_for_weight(DefrostingProgram.weight_for_cycles(cycles)), cycles)
+
+    def test_heating_power_share__tuned_formula__uses_class_attributes(self):
+        self.program.cycles = 3
+        self.program.BASE_POWER_SHARE = 0.2
+        self.program.POWER_SHARE_PER_CYCLE = 0.05
+        self.program.MAX_POWER_SHARE = 0.6
+
+        self.assertAlmostEqual(self.program.heating_power_share(AMBIENT_TEMPERATURE_IN_CELSIUS), 0.35)
@@ -0,0 +1,77 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.components.magnetron.MagnetronRingbuffer import MagnetronRingbuffer
+from src.helper.config import TURNTABLE_WEIGHT_IN_GRAMS, AMBIENT_TEMPERATURE_IN_CELSIUS, \
+    PROGRAM_DEFROSTING_TARGET_TEMP, MAGNETRON_MAX_POWER_SHARE_PER_MINUTE
+from src.program.PredictiveDefrostingProgram import PredictiveDefrostingProgram
+
+
+class TestPredictiveDefrostingProgram(unittest.TestCase):
+    def setUp(self):
+        self.program = PredictiveDefrostingProgram()
+        self.program.sensors = MagicMock()
+        self.program.logger = MagicMock()
+        self.program.magnetron = MagicMock()
+        self.program.cooling_fan = MagicMock()
+
+        self.program.sensors.inner_weight.return_value = TURNTABLE_WEIGHT_IN_GRAMS
+        self.program.sensors.magnetron_temp1.return_value = AMBIENT_TEMPERATURE_IN_CELSIUS
+        self.program.sensors.magnetron_temp2.return_value = AMBIENT_TEMPERATURE_IN_CELSIUS
+        self.program.magnetron.magnetron.active = False
+        self.program.magnetron.power_history = MagnetronRingbuffer(600)
+        self.program.cooling_fan.cooling_fan.power_share = 0.0
+        self._temperature(30.0)
+
+        self.time = 100.0
+        patcher = patch("src.program.PredictiveDefrostingProgram.Clock")
+        patcher.start().return_value.monotonic.side_effect = lambda: self.time
+        self.addCleanup(patcher.stop)
+
+    def _temperature(self, value):
+        self.program.sensors.inner_temp1.return_value = value
+        self.program.sensors.inner_temp2.return_value = value
+
+    def test_magnetron_temp__two_sensors__returns_higher_reading(self):
+        self.program.sensors.magnetron_temp2.return_value = 80.0
+
+        self.assertEqual(self.program.magnetron_temp(), 80.0)
+
+    def test_control_components__heating__sets_planned_power_share(self):
+        self.program.control_components()
+
+        self.program.magnetron.set_target_power_share.assert_called_with(MAGNETRON_MAX_POWER_SHARE_PER_MINUTE)
+        self.assertEqual(self.program.planned_at, 100.0)
+
+    def test_control_components__consecutive_ticks__observes_every_tick(self):
+        self.program.control_components()
+        self.time += 0.01
+        self._temperature(30.1)
+        self.program.control_components()
+
+        self.assertEqual(self.program.controller.inner_model.observations, 1)
+
+    def test_control_components__target_exceeded__finishes_cycle(self):
+        self._temperature(PROGRAM_DEFROSTING_TARGET_TEMP + 1)
+
+        self.program.control_components()
+
+        self.program.magnetron.set_target_power_share.assert_called_with(0.0)
+        self.assertTrue(self.program.finished)
+
+    def test_heating_power_share__within_magnetron_cycle__keeps_plan(self):
+        self.program.heating_power_share(30.0)
+        self.program.magnetron.power_history = MagnetronRingbuffer(600)
+        for _ in range(600):
+            self.program.magnetron.power_history.add(True)
+        self.time += 0.05
+
+        self.assertEqual(self.program.heating_power_share(30.0), MAGNETRON_MAX_POWER_SHARE_PER_MINUTE)
+
+    def test_heating_power_share__after_magnetron_cycle__replans(self):
+        self.program.heating_power_share(30.0)
+        for _ in range(600):
+            self.program.magnetron.power_history.add(True)
+        self.time += 0.2
+
+        self.assertEqual(self.program.heating_power_share(30.0), 0.0)
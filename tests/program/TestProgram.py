@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+from src.helper.config import PROGRAM_UPDATE_INTERVAL_IN_SECONDS
 from src.helper.logging.LogLevel import LogLevel
 from src.program.Program import Program
 
@@ -100,3 +101,50 @@ class TestProgram(unittest.TestCase):
 
         self.program.turntable.update.assert_called_once()
         self.program.reflector.update.assert_called_once()
+
+    def test_start__scheduler_installed__schedules_control_tick_and_returns(self):
+        self.program.control_loop = MagicMock()
+
+        with patch("src.program.Program.Scheduler") as mock_scheduler:
+            self.program.start()
+
+            mock_scheduler.return_value.schedule.assert_called_once_with(
+                self.program.control_tick, PROGRAM_UPDATE_INTERVAL_IN_SECONDS, name="Program"
+            )
+            self.assertIs(self.program.task, mock_scheduler.return_value.schedule.return_value)
+            self.program.control_loop.assert_not_called()
+            self.assertTrue(self.program.running)
+
+    def test_control_tick__running__runs_cycle_and_returns_true(self):
+        self.program.running = True
+        self.program.control_components = MagicMock()
+
+        self.assertTrue(self.program.control_tick())
+        self.program.control_components.assert_called_once()
+        self.program.turntable.update.assert_called_once()
+        self.program.reflector.update.assert_called_once()
+
+    def test_control_tick__paused__skips_cycle_and_returns_true(self):
+        self.program.running = True
+        self.program.paused = True
+        self.program.control_components = MagicMock()
+
+        self.assertTrue(self.program.control_tick())
+        self.program.control_components.assert_not_called()
+
+    def test_control_tick__stopped__stops_components_and_returns_false(self):
+        self.program.running = False
+
+        self.assertFalse(self.program.control_tick())
+        for component in self.program.components:
+            component.stop.assert_called_once()
+        self.program.door.unlock.assert_called_once()
+
+    def test_pause_and_resume__scheduled_task__suspends_and_resumes_task(self):
+        self.program.task = MagicMock()
+
+        self.program.pause()
+        self.program.task.suspend.assert_called_once()
+
+        self.program.resume()
+        self.program.task.resume.assert_called_once()
@@ -1,5 +1,8 @@
+import os
+import subprocess
+import sys
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from src.helper.Logger import Logger
 from src.helper.logging.LogLevel import LogLevel
@@ -122,10 +125,43 @@ class TestProgramController(unittest.TestCase):
         self.mock_program.paused = False
         result = self.program_controller.get_state_tuple()
 
-        self.assertEqual(result, ("TestProgram", True, False, False))
+        self.assertEqual(result, ("TestProgram", True, False, False, None))
 
     def test_get_state_tuple__no_program__returns_default_tuple(self):
         self.program_controller.program = None
         result = self.program_controller.get_state_tuple()
 
-        self.assertEqual(result, ("No program running", False, True, False))
+        self.assertEqual(result, ("No program running", False, True, False, None))
+
+    def test_get_state_tuple__estimated_program__returns_eta_of_estimator(self):
+        self.program_controller.program = self.mock_program
+        self.mock_program.running = True
+        self.mock_program.finished = False
+        self.mock_program.paused = False
+        self.program_controller.estimator = MagicMock()
+        self.program_controller.estimator.eta.return_value = 42.0
+
+        result = self.program_controller.get_state_tuple()
+
+        self.assertEqual(result[-1], 42.0)
+        self.program_controller.estimator.eta.assert_called_once_with(self.mock_program)
+
+    def test_start__scheduler_installed__starts_program_inline(self):
+        self.mock_program.get_name.return_value = "TestProgram"
+        self.mock_program.task = MagicMock()
+
+        with patch("src.program.ProgramController.Scheduler"):
+            self.program_controller.start(self.mock_program)
+
+        self.mock_program.start.assert_called_once()
+        self.assertIs(self.program_controller.thread, self.mock_program.task)
+
+    def test_import__module_imported__does_not_import_programs(self):
+        script = ("import sys; import src.program.ProgramController; "
+                  "print('src.program.DefrostingProgram' in sys.modules)")
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+        result = subprocess.run([sys.executable, "-c", script], cwd=root, capture_output=True, text=True,
+                                check=True)
+
+        self.assertEqual(result.stdout.strip(), "False")
@@ -0,0 +1,23 @@
+import unittest
+
+from src.program.ProgramInfo import ProgramInfo
+
+
+class TestProgramInfo(unittest.TestCase):
+    def test_init__invalid_target__raises_value_error(self):
+        for target in ["module", "module:", ":Class"]:
+            with self.assertRaises(ValueError):
+                ProgramInfo("test", "Test", target)
+
+    def test_init__no_parameters__empty_parameters(self):
+        info = ProgramInfo("test", "Test", "module:Class")
+
+        self.assertEqual(info.parameters, {})
+        self.assertIsNone(info.expected_duration_in_seconds)
+
+    def test_from_dict__written_by_to_dict__restores_metadata(self):
+        info = ProgramInfo("test", "Test", "module:Class", {"power": 0.5}, 120.0)
+
+        restored = ProgramInfo.from_dict(info.to_dict())
+
+        self.assertEqual(restored.to_dict(), info.to_dict())
@@ -0,0 +1,186 @@
+import json
+import os
+import sys
+import tempfile
+import types
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.helper.OvenContext import OvenContext
+from src.program.DefrostingProgram import DefrostingProgram
+from src.program.ProgramInfo import ProgramInfo
+from src.program.ProgramRegistry import ProgramRegistry
+
+
+class PluginProgram:
+    display_name = "Plugin Program"
+    parameters = {"power": 0.5}
+    expected_duration_in_seconds = 90.0
+
+    def __init__(self, context=None):
+        self.context = context
+
+
+class TestProgramRegistry(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.directory.name, "programs.json")
+        self.recipe_directory = os.path.join(self.directory.name, "recipes")
+        os.mkdir(self.recipe_directory)
+        self.patches = [
+            patch.object(ProgramRegistry, "_programs", {}),
+            patch.object(ProgramRegistry, "_classes", {}),
+            patch.object(ProgramRegistry, "_tables", {}),
+            patch.object(ProgramRegistry, "BUILTIN_RECIPE_DIRECTORY", self.directory.name),
+            patch("src.program.ProgramRegistry.PROGRAM_RECIPE_DIRECTORY", self.recipe_directory),
+            patch.object(ProgramRegistry, "_discovered", False),
+            patch.object(ProgramRegistry, "_logger", MagicMock()),
+            patch("src.program.ProgramRegistry.PROGRAM_METADATA_CACHE_PATH", self.cache_path),
+            patch("src.program.ProgramRegistry.importlib.metadata.entry_points", return_value=[]),
+        ]
+        started = [active.start() for active in self.patches]
+        self.mock_entry_points = started[-1]
+
+    def tearDown(self):
+        for active in reversed(self.patches):
+            active.stop()
+        self.directory.cleanup()
+
+    @staticmethod
+    def _entry_point(name="plugin", value="plugin_module:PluginProgram", version="1.0"):
+        entry_point = MagicMock()
+        entry_point.name = name
+        entry_point.value = value
+        entry_point.dist.version = version
+        entry_point.load.return_value = PluginProgram
+        return entry_point
+
+    def test_programs__no_plugins__lists_builtin_programs(self):
+        keys = [info.key for info in ProgramRegistry.programs()]
+
+        self.assertEqual(keys, ["defrosting", "predictive_defrosting"])
+
+    def test_info__unknown_key__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            ProgramRegistry.info("unknown")
+
+    def test_load__registered_program__imports_module_once(self):
+        module = types.ModuleType("lazy_program_module")
+        module.PluginProgram = PluginProgram
+        ProgramRegistry.register(ProgramInfo("lazy", "Lazy", "lazy_program_module:PluginProgram"))
+
+        with patch("src.program.ProgramRegistry.importlib.import_module", return_value=module) as mock_import:
+            first = ProgramRegistry.load("lazy")
+            second = ProgramRegistry.load("lazy")
+
+        mock_import.assert_called_once_with("lazy_program_module")
+        self.assertIs(first, PluginProgram)
+        self.assertIs(second, PluginProgram)
+
+    def test_create__builtin_program__returns_new_instance_for_context(self):
+        context = OvenContext()
+
+        with patch.object(DefrostingProgram, "__init__", return_value=None) as mock_init:
+            program = ProgramRegistry.create("defrosting", context)
+
+        self.assertIsInstance(program, DefrostingProgram)
+        mock_init.assert_called_once_with(context)
+
+    def test_create__builtin_program__keeps_key(self):
+        with patch.object(DefrostingProgram, "__init__", return_value=None):
+            program = ProgramRegistry.create("defrosting", OvenContext())
+
+        self.assertEqual(program.key, "defrosting")
+
+    def test_programs__plugin_not_cached__loads_plugin_and_caches_metadata(self):
+        entry_point = self._entry_point()
+        self.mock_entry_points.return_value = [entry_point]
+
+        info = {info.key: info for info in ProgramRegistry.programs()}["plugin"]
+
+        entry_point.load.assert_called_once()
+        self.assertEqual(info.name, "Plugin Program")
+        self.assertEqual(info.parameters, {"power": 0.5})
+        self.assertEqual(info.expected_duration_in_seconds, 90.0)
+        with open(self.cache_path, encoding="utf-8") as file:
+            self.assertIn("plugin=plugin_module:PluginProgram@1.0", json.load(file))
+
+    def test_programs__plugin_cached__lists_plugin_without_import(self):
+        entry_point = self._entry_point()
+        cached = ProgramInfo("plugin", "Cached Plugin", "plugin_module:PluginProgram")
+        with open(self.cache_path, "w", encoding="utf-8") as file:
+            json.dump({"plugin=plugin_module:PluginProgram@1.0": cached.to_dict()}, file)
+        self.mock_entry_points.return_value = [entry_point]
+
+        names = [info.name for info in ProgramRegistry.programs()]
+
+        entry_point.load.assert_not_called()
+        self.assertIn("Cached Plugin", names)
+        self.assertNotIn("plugin_module", sys.modules)
+
+    def test_programs__plugin_version_changed__reloads_metadata(self):
+        cached = ProgramInfo("plugin", "Old Plugin", "plugin_module:PluginProgram")
+        with open(self.cache_path, "w", encoding="utf-8") as file:
+            json.dump({"plugin=plugin_module:PluginProgram@1.0": cached.to_dict()}, file)
+        entry_point = self._entry_point(version="2.0")
+        self.mock_entry_points.return_value = [entry_point]
+
+        names = [info.name for info in ProgramRegistry.programs()]
+
+        entry_point.load.assert_called_once()
+        self.assertIn("Plugin Program", names)
+
+    def test_programs__plugin_fails_to_load__skips_plugin_with_warning(self):
+        entry_point = self._entry_point()
+        entry_point.load.side_effect = ImportError("missing dependency")
+        self.mock_entry_points.return_value = [entry_point]
+
+        keys = [info.key for info in ProgramRegistry.programs()]
+
+        self.assertEqual(keys, ["defrosting", "predictive_defrosting"])
+        ProgramRegistry._logger.log.assert_called_once()
+
+    def _write_recipe(self, name, content):
+        path = os.path.join(self.recipe_directory, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+        return path
+
+    def test_programs__recipe_files__lists_recipes_with_duration(self):
+        self._write_recipe("quick.json", json.dumps({"name": "Quick", "phases": [
+            {"name": "heat", "power_share": 0.5, "duration_in_seconds": 10}
+        ]}))
+
+        info = ProgramRegistry.info("quick")
+
+        self.assertEqual(info.name, "Quick")
+        self.assertEqual(info.target, ProgramRegistry.RECIPE_TARGET)
+        self.assertAlmostEqual(info.expected_duration_in_seconds, 10.0)
+
+    def test_programs__invalid_recipe__skips_recipe_with_warning(self):
+        self._write_recipe("broken.toml", "name = 'Broken'\n")
+
+        keys = [info.key for info in ProgramRegistry.programs()]
+
+        self.assertEqual(keys, ["defrosting", "predictive_defrosting"])
+        ProgramRegistry._logger.log.assert_called_once()
+
+    def test_create__recipe__creates_recipe_program_with_compiled_table(self):
+        self._write_recipe("quick.json", json.dumps({"phases": [
+            {"name": "heat", "power_share": 0.5, "until_temperature_above": 60}
+        ]}))
+        program_class = MagicMock()
+
+        with patch.object(ProgramRegistry, "load", return_value=program_class):
+            ProgramRegistry.create("quick")
+            ProgramRegistry.create("quick")
+
+        first_table = program_class.call_args_list[0].args[1]
+        self.assertEqual(first_table.names, ("heat",))
+        self.assertIs(program_class.call_args_list[1].args[1], first_table)
+
+    def test_programs__called_twice__discovers_once(self):
+        ProgramRegistry.programs()
+        ProgramRegistry.programs()
+
+        self.mock_entry_points.assert_called_once()
@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import MagicMock
+
+from src.helper.config import AMBIENT_TEMPERATURE_IN_CELSIUS
+from src.program.RecipeProgram import RecipeProgram
+from src.program.recipe.Recipe import Recipe
+from src.program.recipe.RecipePhase import RecipePhase
+from src.program.recipe.StepTable import StepTable
+
+
+class TestRecipeProgram(unittest.TestCase):
+    def setUp(self):
+        self.table = StepTable(Recipe("test", "Test", [
+            RecipePhase("heat", 0.4, 2, 10, until_temperature_above=60),
+            RecipePhase("rest", 0.0, 1, until_temperature_below=27, next_phase="heat", repeat=1),
+            RecipePhase("settle", 0.1, duration_in_seconds=0.02),
+        ]))
+        self.program = RecipeProgram(None, self.table)
+        self.program.sensors = MagicMock()
+        self.program.logger = MagicMock()
+        self.program.magnetron = MagicMock()
+        self.program.turntable = MagicMock()
+        self.program.reflector = MagicMock()
+        self._temperature(AMBIENT_TEMPERATURE_IN_CELSIUS)
+
+    def _temperature(self, value):
+        self.program.sensors.inner_temp1.return_value = value
+        self.program.sensors.inner_temp2.return_value = value
+
+    def test_init__table__uses_recipe_name(self):
+        self.assertEqual(self.program.name, "Test")
+        self.assertEqual(self.program.remaining, [0, 1, 0])
+
+    def test_enter__step__applies_actuator_settings(self):
+        self.program.enter(0)
+
+        self.program.magnetron.set_target_power_share.assert_called_once_with(0.4)
+        self.program.turntable.set_speed.assert_called_once_with(2.0)
+        self.program.reflector.set_angle.assert_called_once_with(10.0)
+
+    def test_control_components__condition_not_met__stays_in_step_without_commands(self):
+        self.program.enter(0)
+        self.program.magnetron.reset_mock()
+
+        self.program.control_components()
+
+        self.assertEqual(self.program.step, 0)
+        self.assertEqual(self.program.ticks, 1)
+        self.program.magnetron.set_target_power_share.assert_not_called()
+
+    def test_control_components__temperature_above_threshold__enters_next_step(self):
+        self.program.enter(0)
+        self._temperature(61)
+
+        self.program.control_components()
+
+        self.assertEqual(self.program.step, 1)
+        self.program.magnetron.set_target_power_share.assert_called_with(0.0)
+
+    def test_control_components__temperature_below_threshold_with_repeat__jumps_back(self):
+        self.program.enter(1)
+
+        self.program.control_components()
+
+        self.assertEqual(self.program.step, 0)
+        self.assertEqual(self.program.remaining[1], 0)
+
+    def test_control_components__duration_over_in_last_step__finishes_program(self):
+        self.program.enter(2)
+
+        self.program.control_components()
+        self.assertFalse(self.program.finished)
+        self.program.control_components()
+
+        self.assertTrue(self.program.finished)
+        self.program.magnetron.set_target_power_share.assert_called_with(0.0)
@@ -0,0 +1,99 @@
+import unittest
+
+import numpy as np
+
+from src.components.magnetron.MagnetronRingbuffer import MagnetronRingbuffer
+from src.helper.config import AMBIENT_TEMPERATURE_IN_CELSIUS, MAGNETRON_MAX_POWER_SHARE_PER_MINUTE, \
+    MAGNETRON_MAX_TEMP_IN_CELSIUS
+from src.program.control.ModelPredictiveController import ModelPredictiveController
+
+
+class TestModelPredictiveController(unittest.TestCase):
+    def setUp(self):
+        self.controller = ModelPredictiveController(levels=20, horizon_in_seconds=5.0, temp_margin=10.0)
+        self.history = MagnetronRingbuffer(600)
+
+    def test_init__invalid_arguments__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            ModelPredictiveController(levels=0)
+        with self.assertRaises(ValueError):
+            ModelPredictiveController(horizon_in_seconds=0)
+
+    def test_observe__temperatures_above_ambient__fits_rates_of_last_state(self):
+        self.controller.observe(0.0, 30.0, 100.0, True, 0.5)
+        self.controller.observe(1.0, 31.0, 110.0, False, 0.5)
+
+        self.assertEqual(self.controller.inner_model.observations, 1)
+        self.assertEqual(self.controller.magnetron_model.observations, 1)
+        self.assertEqual(self.controller.last, (1.0, 31.0, 110.0, False, 0.5))
+
+    def test_observe__temperatures_at_ambient__skips_fit(self):
+        self.controller.observe(0.0, AMBIENT_TEMPERATURE_IN_CELSIUS, AMBIENT_TEMPERATURE_IN_CELSIUS, False, 0.0)
+        self.controller.observe(1.0, AMBIENT_TEMPERATURE_IN_CELSIUS, AMBIENT_TEMPERATURE_IN_CELSIUS, False, 0.0)
+
+        self.assertEqual(self.controller.inner_model.observations, 0)
+        self.assertEqual(self.controller.magnetron_model.observations, 0)
+
+    def test_observe__no_time_elapsed__skips_fit(self):
+        self.controller.observe(1.0, 30.0, 100.0, True, 0.0)
+        self.controller.observe(1.0, 31.0, 110.0, True, 0.0)
+
+        self.assertEqual(self.controller.inner_model.observations, 0)
+
+    def test_window_shares__empty_history__predicts_level(self):
+        shares = self.controller.window_shares(self.history, 3)
+
+        np.testing.assert_allclose(shares[:, 0], self.controller.levels)
+        np.testing.assert_allclose(shares[:, 2], self.controller.levels)
+
+    def test_window_shares__full_history__drops_oldest_cycles(self):
+        history = MagnetronRingbuffer(4)
+        for item in [True, True, False, False]:
+            history.add(item)
+
+        shares = self.controller.window_shares(history, 2)
+
+        np.testing.assert_allclose(shares[0], [1 / 4, 0.0])
+        np.testing.assert_allclose(shares[-1], [2 / 4, 2 / 4])
+
+    def test_plan__target_reached__returns_zero(self):
+        self.assertEqual(self.controller.plan(60.0, 60.0, 50.0, 0.0, self.history), 0.0)
+
+    def test_plan__cold_magnetron__returns_highest_feasible_share(self):
+        power_share = self.controller.plan(30.0, 60.0, AMBIENT_TEMPERATURE_IN_CELSIUS, 0.0, self.history)
+
+        self.assertEqual(power_share, MAGNETRON_MAX_POWER_SHARE_PER_MINUTE)
+
+    def test_plan__exhausted_power_history__returns_lower_share(self):
+        for _ in range(600):
+            self.history.add(True)
+
+        power_share = self.controller.plan(30.0, 60.0, AMBIENT_TEMPERATURE_IN_CELSIUS, 0.0, self.history)
+
+        self.assertEqual(power_share, 0.0)
+
+    def test_plan__hot_magnetron__returns_share_keeping_temperature_margin(self):
+        power_share = self.controller.plan(30.0, 60.0, MAGNETRON_MAX_TEMP_IN_CELSIUS - 25, 0.0, self.history)
+
+        self.assertAlmostEqual(power_share, 0.2)
+
+    def test_plan__magnetron_too_hot_to_heat__returns_zero(self):
+        power_share = self.controller.plan(30.0, 60.0, MAGNETRON_MAX_TEMP_IN_CELSIUS - 15, 0.0, self.history)
+
+        self.assertEqual(power_share, 0.0)
+
+    def test_plan__full_cooling__allows_highest_share_when_hot(self):
+        power_share = self.controller.plan(30.0, 60.0, MAGNETRON_MAX_TEMP_IN_CELSIUS - 15, 1.0, self.history)
+
+        self.assertEqual(power_share, MAGNETRON_MAX_POWER_SHARE_PER_MINUTE)
+
+    def test_restore__snapshot__restores_models_and_last_observation(self):
+        self.controller.observe(0.0, 30.0, 100.0, True, 0.5)
+        self.controller.observe(1.0, 31.0, 110.0, False, 0.5)
+
+        restored = ModelPredictiveController(levels=20, horizon_in_seconds=5.0, temp_margin=10.0)
+        restored.restore(self.controller.snapshot())
+
+        np.testing.assert_array_equal(restored.inner_model.coefficients(), self.controller.inner_model.coefficients())
+        np.testing.assert_array_equal(restored.magnetron_model.gram, self.controller.magnetron_model.gram)
+        self.assertEqual(restored.last, (1.0, 31.0, 110.0, False, 0.5))
@@ -0,0 +1,61 @@
+import unittest
+
+import numpy as np
+
+from src.program.control.ThermalModel import ThermalModel
+
+
+class TestThermalModel(unittest.TestCase):
+    def test_init__invalid_arguments__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            ThermalModel([])
+        with self.assertRaises(ValueError):
+            ThermalModel([1.0], prior_weight=0)
+        with self.assertRaises(ValueError):
+            ThermalModel([1.0], forgetting=0)
+
+    def test_coefficients__no_observations__returns_prior(self):
+        model = ThermalModel([10.0, -2.0])
+
+        np.testing.assert_allclose(model.coefficients(), [10.0, -2.0])
+        self.assertEqual(model.observations, 0)
+
+    def test_coefficients__many_observations__converges_to_observed_rates(self):
+        model = ThermalModel([10.0, -2.0], forgetting=1.0)
+
+        for _ in range(10000):
+            model.update([1.0, 0.0], 4.0)
+            model.update([0.0, 1.0], -1.0)
+
+        np.testing.assert_allclose(model.coefficients(), [4.0, -1.0], atol=0.01)
+        self.assertEqual(model.observations, 20000)
+
+    def test_update__forgetting__discounts_older_observations(self):
+        model = ThermalModel([0.0], prior_weight=1.0, forgetting=0.5)
+
+        model.update([1.0], 10.0)
+        model.update([1.0], 20.0)
+
+        self.assertAlmostEqual(model.coefficients()[0], (0.5 * 10.0 + 20.0) / (0.25 + 0.5 + 1.0))
+
+    def test_predict__feature_matrix__returns_rate_per_row(self):
+        model = ThermalModel([10.0, -2.0])
+
+        np.testing.assert_allclose(model.predict(np.array([[1.0, 0.0], [0.5, 0.5], [0.0, 1.0]])), [10.0, 4.0, -2.0])
+
+    def test_restore__snapshot__continues_fit_of_captured_model(self):
+        model = ThermalModel([10.0, -2.0])
+        model.update([1.0, 0.0], 4.0)
+        snapshot = model.snapshot()
+        model.update([0.0, 1.0], -1.0)
+
+        restored = ThermalModel([10.0, -2.0])
+        restored.restore(snapshot)
+        restored.update([0.0, 1.0], -1.0)
+
+        np.testing.assert_array_equal(restored.coefficients(), model.coefficients())
+        self.assertEqual(restored.observations, model.observations)
+
+    def test_restore__other_number_of_coefficients__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            ThermalModel([1.0]).restore(ThermalModel([1.0, 2.0]).snapshot())
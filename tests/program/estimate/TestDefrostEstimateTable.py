@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+
+from src.program.estimate.DefrostEstimateTable import DefrostEstimateTable
+
+
+class TestDefrostEstimateTable(unittest.TestCase):
+    def setUp(self):
+        self.table = DefrostEstimateTable("defrosting", [500, 600], [20, 40], [[100, 60], [200, 160]],
+                                          [[1000, 600], [2000, 1600]], [30, 60], [5, 35])
+
+    def test_init__axis_not_ascending__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            DefrostEstimateTable("defrosting", [600, 500], [20, 40], [[1, 1], [1, 1]], [[1, 1], [1, 1]], [30, 60],
+                                 [5, 35])
+
+    def test_init__axis_with_single_point__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            DefrostEstimateTable("defrosting", [500], [20, 40], [[1, 1]], [[1, 1]], [30, 60], [5, 35])
+
+    def test_init__table_not_matching_axes__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            DefrostEstimateTable("defrosting", [500, 600], [20, 40], [[1, 1]], [[1, 1], [1, 1]], [30, 60], [5, 35])
+        with self.assertRaises(ValueError):
+            DefrostEstimateTable("defrosting", [500, 600], [20, 40], [[1, 1], [1, 1]], [[1, 1], [1, 1]], [30, 60],
+                                 [5])
+
+    def test_estimate__grid_point__returns_table_values(self):
+        self.assertEqual(self.table.estimate(600, 20), (200.0, 2000.0))
+
+    def test_estimate__between_grid_points__interpolates_bilinearly(self):
+        self.assertEqual(self.table.estimate(550, 30), (130.0, 1300.0))
+
+    def test_estimate__weight_above_grid__extrapolates(self):
+        self.assertEqual(self.table.estimate(700, 20), (300.0, 3000.0))
+
+    def test_estimate__outside_grid_otherwise__clamps_to_edges(self):
+        self.assertEqual(self.table.estimate(400, 10), (100.0, 1000.0))
+        self.assertEqual(self.table.estimate(500, 90), (60.0, 600.0))
+
+    def test_cooling_duration__temperatures__interpolates_and_clamps(self):
+        self.assertEqual(self.table.cooling_duration(45), 20.0)
+        self.assertEqual(self.table.cooling_duration(20), 5.0)
+        self.assertEqual(self.table.cooling_duration(70), 35.0)
+
+    def test_save__load__restores_tables(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "estimates.json")
+
+            self.table.save(path)
+            loaded = DefrostEstimateTable.load(path)
+
+        self.assertEqual(loaded.to_dict(), self.table.to_dict())
+        self.assertEqual(loaded.program, "defrosting")
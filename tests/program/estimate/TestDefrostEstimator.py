@@ -0,0 +1,117 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.helper.config import AMBIENT_TEMPERATURE_IN_CELSIUS, TURNTABLE_WEIGHT_IN_GRAMS
+from src.helper.OvenContext import OvenContext
+from src.helper.logging.LogLevel import LogLevel
+from src.program.DefrostingProgram import DefrostingProgram
+from src.program.PredictiveDefrostingProgram import PredictiveDefrostingProgram
+from src.program.estimate.DefrostEstimateTable import DefrostEstimateTable
+from src.program.estimate.DefrostEstimator import DefrostEstimator
+
+
+class TestDefrostEstimator(unittest.TestCase):
+    def setUp(self):
+        self.estimator = DefrostEstimator(OvenContext())
+        self.estimator.table = DefrostEstimateTable(
+            "defrosting", [570, 670], [22, 62], [[100, 60], [200, 160]], [[1000, 600], [2000, 1600]], [27, 67],
+            [0, 40])
+
+        self.program = DefrostingProgram(OvenContext())
+        self.program.sensors = MagicMock()
+        self.program.cycles = 2
+        self._temperature(42.0)
+
+        self.time = 10.0
+        patcher = patch("src.program.estimate.DefrostEstimator.Clock")
+        patcher.start().return_value.monotonic.side_effect = lambda: self.time
+        self.addCleanup(patcher.stop)
+
+    def _temperature(self, value):
+        self.program.sensors.inner_temp1.return_value = value
+        self.program.sensors.inner_temp2.return_value = value
+
+    def test_init__context__creates_instance_per_oven(self):
+        self.assertIsNot(DefrostEstimator(OvenContext()), self.estimator)
+
+    def test_load__shipped_tables__loads_defrosting_tables(self):
+        estimator = DefrostEstimator(OvenContext())
+
+        self.assertEqual(estimator.load().program, "defrosting")
+        self.assertIs(estimator.load(), estimator.table)
+
+    def test_load__missing_file__logs_warning_and_returns_none(self):
+        estimator = DefrostEstimator(OvenContext())
+        estimator.logger = MagicMock()
+
+        self.assertIsNone(estimator.load("missing.json"))
+        self.assertEqual(estimator.logger.log.call_args.args[1], LogLevel.WARNING)
+
+    def test_estimate__weight__looks_up_weight_of_its_cycles(self):
+        self.assertEqual(self.estimator.estimate(TURNTABLE_WEIGHT_IN_GRAMS + 210, 42), (180.0, 1800.0))
+
+    def test_estimate__no_tables__returns_none(self):
+        with patch.object(self.estimator, "load", return_value=None):
+            self.assertIsNone(self.estimator.estimate(600, 22))
+
+    def test_remaining__heating__looks_up_remaining_cycles(self):
+        self.assertEqual(self.estimator.remaining(self.program), (180.0, 1800.0))
+
+    def test_remaining__resting__adds_cooling_time(self):
+        self.program.just_updated = True
+        self._temperature(47.0)
+
+        duration, energy = self.estimator.remaining(self.program)
+
+        self.assertAlmostEqual(duration, 20.0 + 200.0 - 40.0 * (AMBIENT_TEMPERATURE_IN_CELSIUS + 5 - 22) / 40)
+        self.assertAlmostEqual(energy, 2000.0 - 400.0 * (AMBIENT_TEMPERATURE_IN_CELSIUS + 5 - 22) / 40)
+
+    def test_remaining__finished__returns_zero(self):
+        self.program.finished = True
+
+        self.assertEqual(self.estimator.remaining(self.program), (0.0, 0.0))
+
+    def test_remaining__other_program__returns_none(self):
+        self.assertIsNone(self.estimator.remaining(PredictiveDefrostingProgram(OvenContext())))
+
+    def test_eta__no_program__returns_none(self):
+        self.assertIsNone(self.estimator.eta(None))
+
+    def test_eta__same_phase__counts_down_without_lookup(self):
+        self.assertEqual(self.estimator.eta(self.program), 180.0)
+
+        self.time += 30.0
+        with patch.object(self.estimator, "remaining") as mock_remaining:
+            self.assertEqual(self.estimator.eta(self.program), 150.0)
+        mock_remaining.assert_not_called()
+
+    def test_eta__new_phase__estimates_again(self):
+        self.estimator.eta(self.program)
+        self.time += 30.0
+        self.program.cycles = 1
+        self._temperature(22.0)
+
+        self.assertEqual(self.estimator.eta(self.program), 100.0)
+
+    def test_eta__paused__stops_counting_down(self):
+        self.program.paused = True
+        self.estimator.eta(self.program)
+        self.time += 30.0
+
+        self.assertEqual(self.estimator.eta(self.program), 180.0)
+
+    def test_eta__overdue__returns_zero(self):
+        self.estimator.eta(self.program)
+        self.time += 1000.0
+
+        self.assertEqual(self.estimator.eta(self.program), 0.0)
+
+    def test_eta__finished__returns_zero(self):
+        self.program.cycles = 0
+        self.program.finished = True
+
+        self.assertEqual(self.estimator.eta(self.program), 0.0)
+
+    def test_eta__no_tables__returns_none(self):
+        with patch.object(self.estimator, "load", return_value=None):
+            self.assertIsNone(self.estimator.eta(self.program))
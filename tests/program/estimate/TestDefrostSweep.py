@@ -0,0 +1,60 @@
+import unittest
+from unittest.mock import patch
+
+from src.components.sensor.SensorManager import SensorManager
+from src.helper.Clock import Clock
+from src.helper.Scheduler import Scheduler
+from src.helper.config import AMBIENT_TEMPERATURE_IN_CELSIUS, PROGRAM_DEFROSTING_TARGET_TEMP
+from src.program.estimate.DefrostSweep import DefrostSweep
+from src.user.UserInteractionHandler import UserInteractionHandler
+
+
+class TestDefrostSweep(unittest.TestCase):
+    def setUp(self):
+        self.sweep = DefrostSweep()
+
+    def test_oven__weight_and_temperature__loads_sensors_and_selects_program(self):
+        context = self.sweep.oven(900.0, 40.0)
+        sensors = context.get(SensorManager)
+
+        self.assertEqual(sensors.inner_weight(), 900.0)
+        self.assertEqual(sensors.inner_temp1(), 40.0)
+        self.assertEqual(sensors.inner_temp2(), 40.0)
+        self.assertEqual(context.get(UserInteractionHandler).selected_program, "defrosting")
+
+    def test_simulate__warm_load__runs_program_in_simulated_time(self):
+        clock, scheduler = Clock(), Scheduler()
+
+        duration, energy = self.sweep.simulate(570.0, PROGRAM_DEFROSTING_TARGET_TEMP - 2)
+
+        self.assertGreater(duration, 0.0)
+        self.assertLess(duration, 60.0)
+        self.assertGreater(energy, 0.0)
+        self.assertIs(Clock(), clock)
+        self.assertIs(Scheduler(), scheduler)
+
+    def test_simulate__program_not_finishing__raises_timeout_error(self):
+        with patch.object(DefrostSweep, "TIMEOUT_IN_SECONDS", 1.0), self.assertRaises(TimeoutError):
+            self.sweep.simulate(570.0, AMBIENT_TEMPERATURE_IN_CELSIUS)
+
+    def test_cooling__warm_load__returns_time_to_resting_threshold(self):
+        self.assertAlmostEqual(self.sweep.cooling(AMBIENT_TEMPERATURE_IN_CELSIUS + 7), 1.0, delta=0.1)
+        self.assertEqual(self.sweep.cooling(AMBIENT_TEMPERATURE_IN_CELSIUS), 0.0)
+
+    def test_run__grid__collects_simulations_into_tables(self):
+        with patch.object(DefrostSweep, "simulate", side_effect=lambda weight, temperature: (weight, temperature)), \
+                patch.object(DefrostSweep, "cooling", side_effect=lambda temperature: temperature / 10):
+            table = self.sweep.run([500.0, 600.0], [20.0, 40.0], [30.0, 60.0])
+
+        self.assertEqual(table.durations, ((500.0, 500.0), (600.0, 600.0)))
+        self.assertEqual(table.energies, ((20.0, 40.0), (20.0, 40.0)))
+        self.assertEqual(table.cooling_durations, (3.0, 6.0))
+
+    def test_run__no_grid__uses_default_grid(self):
+        with patch.object(DefrostSweep, "simulate", return_value=(1.0, 1.0)), \
+                patch.object(DefrostSweep, "cooling", return_value=1.0):
+            table = self.sweep.run()
+
+        self.assertEqual(list(table.weights), DefrostSweep.WEIGHTS)
+        self.assertEqual(list(table.temperatures), DefrostSweep.TEMPERATURES)
+        self.assertEqual(list(table.cooling_temperatures), DefrostSweep.COOLING_TEMPERATURES)
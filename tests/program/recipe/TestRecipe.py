@@ -0,0 +1,69 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.program.ProgramRegistry import ProgramRegistry
+from src.program.recipe.Recipe import Recipe
+from src.program.recipe.RecipePhase import RecipePhase
+
+
+class TestRecipe(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+        return path
+
+    def test_init__no_phases__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            Recipe("empty", "Empty", [])
+
+    def test_init__duplicate_phase_names__raises_value_error(self):
+        phase = RecipePhase("heat", 0.5, duration_in_seconds=1)
+
+        with self.assertRaises(ValueError):
+            Recipe("twice", "Twice", [phase, phase])
+
+    def test_init__jump_to_unknown_phase__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            Recipe("jump", "Jump", [RecipePhase("heat", 0.5, duration_in_seconds=1, next_phase="rest", repeat=1)])
+
+    def test_from_dict__no_phases_list__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            Recipe.from_dict({"key": "broken", "phases": "heat"})
+
+    def test_load__json_without_key__uses_file_name(self):
+        path = self._write("quick.json", json.dumps({"phases": [
+            {"name": "heat", "power_share": 0.5, "duration_in_seconds": 10}
+        ]}))
+
+        recipe = Recipe.load(path)
+
+        self.assertEqual(recipe.key, "quick")
+        self.assertEqual(recipe.name, "quick")
+        self.assertEqual(recipe.phases[0].duration_in_seconds, 10)
+
+    def test_load__toml__reads_phases(self):
+        path = self._write("quick.toml", 'key = "toml_quick"\nname = "Quick"\n\n[[phases]]\nname = "heat"\n'
+                                         'power_share = 0.5\nuntil_temperature_above = 60\n')
+
+        recipe = Recipe.load(path)
+
+        self.assertEqual(recipe.key, "toml_quick")
+        self.assertEqual(recipe.phases[0].until_temperature_above, 60)
+
+    def test_load__unsupported_extension__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            Recipe.load(self._write("quick.yaml", "phases: []"))
+
+    def test_load__builtin_recipes__are_valid(self):
+        for name in os.listdir(ProgramRegistry.BUILTIN_RECIPE_DIRECTORY):
+            with self.subTest(recipe=name):
+                Recipe.load(os.path.join(ProgramRegistry.BUILTIN_RECIPE_DIRECTORY, name))
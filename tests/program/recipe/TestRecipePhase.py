@@ -0,0 +1,37 @@
+import unittest
+
+from src.program.recipe.RecipePhase import RecipePhase
+
+
+class TestRecipePhase(unittest.TestCase):
+    def test_init__valid_settings__stores_settings(self):
+        phase = RecipePhase("heat", 0.5, 2, -10, until_temperature_above=60, next_phase="heat", repeat=1)
+
+        self.assertEqual(phase.power_share, 0.5)
+        self.assertEqual(phase.turntable_speed, 2.0)
+        self.assertEqual(phase.reflector_angle, -10.0)
+        self.assertEqual(phase.until_temperature_above, 60)
+        self.assertEqual(phase.next_phase, "heat")
+
+    def test_init__settings_out_of_range__raises_value_error(self):
+        for settings in [{"power_share": 1.5}, {"turntable_speed": 100}, {"reflector_angle": 180}]:
+            with self.subTest(settings=settings), self.assertRaises(ValueError):
+                RecipePhase(**{"name": "heat", "power_share": 0.5, "duration_in_seconds": 1, **settings})
+
+    def test_init__not_exactly_one_exit_condition__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            RecipePhase("heat", 0.5)
+        with self.assertRaises(ValueError):
+            RecipePhase("heat", 0.5, duration_in_seconds=1, until_temperature_above=60)
+
+    def test_init__non_positive_duration__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            RecipePhase("heat", 0.5, duration_in_seconds=0)
+
+    def test_init__repeat_without_next_phase__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            RecipePhase("heat", 0.5, duration_in_seconds=1, repeat=2)
+
+    def test_from_dict__unknown_field__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            RecipePhase.from_dict({"name": "heat", "power_share": 0.5, "duration_in_seconds": 1, "colour": "red"})
@@ -0,0 +1,44 @@
+import unittest
+
+from src.helper.config import PROGRAM_UPDATE_INTERVAL_IN_SECONDS
+from src.program.recipe.Recipe import Recipe
+from src.program.recipe.RecipePhase import RecipePhase
+from src.program.recipe.StepTable import StepTable
+
+
+class TestStepTable(unittest.TestCase):
+    def setUp(self):
+        self.table = StepTable(Recipe("test", "Test", [
+            RecipePhase("heat", 0.4, 2, 10, until_temperature_above=60),
+            RecipePhase("rest", 0.0, 2, until_temperature_below=27, next_phase="heat", repeat=2),
+            RecipePhase("settle", 0.1, duration_in_seconds=1.0),
+        ]))
+
+    def test_init__recipe__compiles_one_row_per_phase(self):
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(self.table.names, ("heat", "rest", "settle"))
+        self.assertEqual(self.table.power_shares, (0.4, 0.0, 0.1))
+        self.assertEqual(self.table.reflector_angles, (10.0, 0.0, 0.0))
+        self.assertEqual(self.table.conditions, (StepTable.ABOVE, StepTable.BELOW, StepTable.DURATION))
+        self.assertEqual(self.table.thresholds, (60.0, 27.0, round(1.0 / PROGRAM_UPDATE_INTERVAL_IN_SECONDS)))
+        self.assertEqual(self.table.next_steps, (-1, 0, -1))
+        self.assertEqual(self.table.repeats, (0, 2, 0))
+
+    def test_advance__jumps_left__jumps_and_counts_down(self):
+        remaining = list(self.table.repeats)
+
+        steps = [self.table.advance(1, remaining) for _ in range(3)]
+
+        self.assertEqual(steps, [0, 0, 2])
+        self.assertEqual(remaining[1], 0)
+
+    def test_duration_in_seconds__temperature_condition__returns_none(self):
+        self.assertIsNone(self.table.duration_in_seconds())
+
+    def test_duration_in_seconds__durations_with_repeat__sums_all_steps(self):
+        table = StepTable(Recipe("pulse", "Pulse", [
+            RecipePhase("on", 1.0, duration_in_seconds=2.0),
+            RecipePhase("off", 0.0, duration_in_seconds=1.0, next_phase="on", repeat=2),
+        ]))
+
+        self.assertAlmostEqual(table.duration_in_seconds(), 9.0)
@@ -0,0 +1,61 @@
+import unittest
+
+from src.helper import config
+from src.helper.Settings import Settings
+from src.program import DefrostingProgram as defrosting_module
+from src.program.DefrostingProgram import DefrostingProgram
+from src.program.tuning.SettingsOverride import SettingsOverride
+
+
+class TestSettingsOverride(unittest.TestCase):
+    def test_resolve__class_attribute__returns_class_and_attribute(self):
+        owner, attribute = SettingsOverride.resolve("src.program.DefrostingProgram:DefrostingProgram.MAX_POWER_SHARE")
+
+        self.assertIs(owner, DefrostingProgram)
+        self.assertEqual(attribute, "MAX_POWER_SHARE")
+
+    def test_resolve__unknown_setting__raises_value_error(self):
+        for target in ["src.missing:VALUE", "src.helper.config:MISSING", "src.helper.config:Missing.VALUE"]:
+            with self.assertRaises(ValueError):
+                SettingsOverride.resolve(target)
+
+    def test_enter__config_constant__replaces_it_in_importing_modules_and_restores(self):
+        original = config.TURNTABLE_WEIGHT_IN_GRAMS
+
+        with SettingsOverride({"src.helper.config:TURNTABLE_WEIGHT_IN_GRAMS": 42}):
+            self.assertEqual(config.TURNTABLE_WEIGHT_IN_GRAMS, 42)
+            self.assertEqual(defrosting_module.TURNTABLE_WEIGHT_IN_GRAMS, 42)
+
+        self.assertEqual(config.TURNTABLE_WEIGHT_IN_GRAMS, original)
+        self.assertEqual(defrosting_module.TURNTABLE_WEIGHT_IN_GRAMS, original)
+
+    def test_enter__config_constant__replaces_it_in_runtime_settings_and_restores(self):
+        original = Settings().PROGRAM_DEFROSTING_TARGET_TEMP
+
+        with SettingsOverride({"src.helper.config:PROGRAM_DEFROSTING_TARGET_TEMP": 42}):
+            self.assertEqual(Settings().PROGRAM_DEFROSTING_TARGET_TEMP, 42)
+
+        self.assertEqual(Settings().PROGRAM_DEFROSTING_TARGET_TEMP, original)
+
+    def test_enter__class_attribute__replaces_and_restores(self):
+        with SettingsOverride({"src.program.DefrostingProgram:DefrostingProgram.MAX_POWER_SHARE": 0.9}):
+            self.assertEqual(DefrostingProgram.MAX_POWER_SHARE, 0.9)
+
+        self.assertEqual(DefrostingProgram.MAX_POWER_SHARE, 0.4)
+
+    def test_enter__unknown_setting__restores_replaced_settings(self):
+        override = SettingsOverride({"src.program.DefrostingProgram:DefrostingProgram.MAX_POWER_SHARE": 0.9,
+                                     "src.helper.config:MISSING": 1})
+
+        with self.assertRaises(ValueError):
+            override.__enter__()
+
+        self.assertEqual(DefrostingProgram.MAX_POWER_SHARE, 0.4)
+        self.assertEqual(override.replaced, [])
+
+    def test_exit__exception_in_block__restores_settings(self):
+        with self.assertRaises(RuntimeError):
+            with SettingsOverride({"src.program.DefrostingProgram:DefrostingProgram.MAX_POWER_SHARE": 0.9}):
+                raise RuntimeError("failure")
+
+        self.assertEqual(DefrostingProgram.MAX_POWER_SHARE, 0.4)
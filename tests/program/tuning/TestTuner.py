@@ -0,0 +1,83 @@
+import logging
+import unittest
+from unittest.mock import patch
+
+from src.helper.config import PROGRAM_DEFROSTING_TARGET_TEMP
+from src.program.DefrostingProgram import DefrostingProgram
+from src.program.tuning.SettingsOverride import SettingsOverride
+from src.program.tuning.Tuner import Tuner
+from src.program.tuning.TuningParameter import TuningParameter
+
+
+class TestTuner(unittest.TestCase):
+    def setUp(self):
+        self.tuner = Tuner([TuningParameter("a", "src.helper.config:NOISE_SEED", [1, 2]),
+                            TuningParameter("b", "src.helper.config:NOISE_BLOCK_SIZE", [3, 4, 5])])
+
+    def test_init__no_parameters__sweeps_all_parameters(self):
+        self.assertEqual(len(Tuner().parameters), len(Tuner.PARAMETERS))
+
+    def test_init__duplicate_names__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            Tuner([Tuner.parameter("target_temp"), Tuner.parameter("target_temp")])
+
+    def test_parameter__unknown_name__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            Tuner.parameter("missing")
+
+    def test_parameters__targets__all_exist(self):
+        for parameter in Tuner.PARAMETERS:
+            SettingsOverride.resolve(parameter.target)
+
+    def test_grid__parameters__returns_every_combination(self):
+        grid = self.tuner.grid()
+
+        self.assertEqual(len(grid), 6)
+        self.assertIn({"a": 2, "b": 4}, grid)
+
+    def test_sample__seed__returns_reproducible_candidates_of_parameter_values(self):
+        candidates = self.tuner.sample(20, seed=3)
+
+        self.assertEqual(candidates, self.tuner.sample(20, seed=3))
+        self.assertTrue(all(candidate["a"] in [1, 2] and candidate["b"] in [3, 4, 5] for candidate in candidates))
+
+    def test_quiet__worker__disables_logging(self):
+        try:
+            Tuner.quiet()
+
+            self.assertEqual(logging.root.manager.disable, logging.CRITICAL)
+        finally:
+            logging.disable(logging.NOTSET)
+
+    def test_evaluate__candidate__simulates_with_settings_applied(self):
+        targets = {"target_temp": Tuner.parameter("target_temp").target}
+        weight = DefrostingProgram.weight_for_cycles(1)
+
+        result = Tuner.evaluate({"target_temp": PROGRAM_DEFROSTING_TARGET_TEMP + 1}, targets, weight,
+                                PROGRAM_DEFROSTING_TARGET_TEMP - 2)
+        reference = Tuner.evaluate({}, targets, weight, PROGRAM_DEFROSTING_TARGET_TEMP - 2)
+
+        self.assertIsNone(result.error)
+        self.assertGreater(result.duration, reference.duration)
+        self.assertEqual(result.safety_hits, 0)
+
+    def test_evaluate__unknown_setting__returns_failed_result(self):
+        result = Tuner.evaluate({"a": 1}, {"a": "src.helper.config:MISSING"}, 570.0, 22.0)
+
+        self.assertIsNotNone(result.error)
+        self.assertEqual(result.candidate, {"a": 1})
+
+    @patch("src.program.estimate.DefrostSweep.DefrostSweep.TIMEOUT_IN_SECONDS", 1.0)
+    def test_evaluate__program_not_finishing__returns_failed_result(self):
+        result = Tuner.evaluate({}, {}, 570.0, 22.0)
+
+        self.assertIn("did not finish", result.error)
+
+    def test_run__candidates__returns_ranked_results_from_process_pool(self):
+        tuner = Tuner([Tuner.parameter("target_temp").with_values([58, 59])], DefrostingProgram.weight_for_cycles(1),
+                      50.0, processes=1)
+
+        results = tuner.run(tuner.grid())
+
+        self.assertEqual([result.candidate for result in results], [{"target_temp": 58}, {"target_temp": 59}])
+        self.assertLess(results[0].duration, results[1].duration)
@@ -0,0 +1,22 @@
+import unittest
+
+from src.program.tuning.TuningParameter import TuningParameter
+
+
+class TestTuningParameter(unittest.TestCase):
+    def test_init__target_without_attribute__raises_value_error(self):
+        for target in ["src.helper.config", "src.helper.config:", ":ATTRIBUTE"]:
+            with self.assertRaises(ValueError):
+                TuningParameter("name", target, [1])
+
+    def test_init__no_values__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            TuningParameter("name", "src.helper.config:NOISE_SEED", [])
+
+    def test_with_values__values__returns_copy_with_values(self):
+        parameter = TuningParameter("name", "src.helper.config:NOISE_SEED", [1, 2])
+
+        copy = parameter.with_values([3])
+
+        self.assertEqual((copy.name, copy.target, copy.values), ("name", "src.helper.config:NOISE_SEED", [3]))
+        self.assertEqual(parameter.values, [1, 2])
@@ -0,0 +1,22 @@
+import unittest
+
+from src.program.tuning.TuningResult import TuningResult
+
+
+class TestTuningResult(unittest.TestCase):
+    def test_rank_key__results__orders_by_failure_hits_duration_and_energy(self):
+        failed = TuningResult({"a": 1}, error="timeout")
+        unsafe = TuningResult({"a": 2}, 10.0, 100.0, safety_hits=1)
+        slow = TuningResult({"a": 3}, 20.0, 100.0)
+        costly = TuningResult({"a": 4}, 10.0, 200.0)
+        best = TuningResult({"a": 5}, 10.0, 100.0)
+
+        ranked = sorted([failed, unsafe, slow, costly, best], key=TuningResult.rank_key)
+
+        self.assertEqual(ranked, [best, costly, slow, unsafe, failed])
+
+    def test_to_dict__result__contains_all_fields(self):
+        result = TuningResult({"a": 1}, 10.0, 100.0, 2)
+
+        self.assertEqual(result.to_dict(), {"candidate": {"a": 1}, "duration": 10.0, "energy": 100.0,
+                                            "safety_hits": 2, "error": None})
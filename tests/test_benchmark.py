@@ -0,0 +1,65 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from src.benchmark import main, parse_arguments
+from src.helper.benchmark.Benchmark import Benchmark
+from src.helper.benchmark.BenchmarkReport import BenchmarkReport
+from src.helper.benchmark.BenchmarkResult import BenchmarkResult
+from src.helper.config import BENCHMARK_REGRESSION_THRESHOLD
+
+
+@patch("src.benchmark.BenchmarkSuite.benchmarks", return_value=[
+    Benchmark("First", lambda: (lambda: None), number=10, repeat=2),
+    Benchmark("Second", lambda: (lambda: None), number=10, repeat=2),
+])
+class TestBenchmarkMain(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.directory.name, "results.json")
+        self.baseline = os.path.join(self.directory.name, "baseline.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _main(self, *argv):
+        with redirect_stdout(io.StringIO()) as output:
+            code = main(list(argv))
+        return code, output.getvalue()
+
+    def test_parse_arguments__no_arguments__uses_configured_threshold(self, mock_benchmarks):
+        arguments = parse_arguments([])
+
+        self.assertEqual(arguments.threshold, BENCHMARK_REGRESSION_THRESHOLD)
+        self.assertEqual(arguments.filter, "")
+        self.assertIsNone(arguments.baseline)
+
+    def test_main__output__writes_report_of_all_benchmarks(self, mock_benchmarks):
+        code, _ = self._main("--output", self.output)
+
+        self.assertEqual(code, 0)
+        self.assertEqual(list(BenchmarkReport.load(self.output).results), ["First", "Second"])
+
+    def test_main__filter__runs_matching_benchmarks_only(self, mock_benchmarks):
+        self._main("-k", "Sec", "-o", self.output)
+
+        self.assertEqual(list(BenchmarkReport.load(self.output).results), ["Second"])
+
+    def test_main__baseline_much_faster__returns_one(self, mock_benchmarks):
+        BenchmarkReport([BenchmarkResult("First", 10, [1e-12])], {}).save(self.baseline)
+
+        code, output = self._main("--baseline", self.baseline)
+
+        self.assertEqual(code, 1)
+        self.assertIn("REGRESSION", output)
+
+    def test_main__baseline_much_slower__returns_zero(self, mock_benchmarks):
+        BenchmarkReport([BenchmarkResult("First", 10, [1.0])], {}).save(self.baseline)
+
+        code, output = self._main("--baseline", self.baseline, "--threshold", "0.5")
+
+        self.assertEqual(code, 0)
+        self.assertNotIn("REGRESSION", output)
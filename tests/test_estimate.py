@@ -0,0 +1,39 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from src.estimate import main, parse_arguments
+from src.program.estimate.DefrostEstimateTable import DefrostEstimateTable
+from src.program.estimate.DefrostEstimator import DefrostEstimator
+
+
+class TestEstimateMain(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.directory.name, "estimates.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_parse_arguments__no_arguments__writes_shipped_tables(self):
+        arguments = parse_arguments([])
+
+        self.assertEqual(arguments.output, DefrostEstimator.BUILTIN_TABLE_PATH)
+        self.assertIsNone(arguments.weights)
+        self.assertIsNone(arguments.temperatures)
+
+    @patch("src.estimate.DefrostSweep.cooling", return_value=1.0)
+    @patch("src.estimate.DefrostSweep.simulate", return_value=(10.0, 100.0))
+    def test_main__grid__writes_tables(self, mock_simulate, mock_cooling):
+        with redirect_stdout(io.StringIO()) as output:
+            code = main(["-o", self.output, "-w", "570", "670", "-t", "22", "40"])
+
+        table = DefrostEstimateTable.load(self.output)
+        self.assertEqual(code, 0)
+        self.assertEqual(table.weights, (570.0, 670.0))
+        self.assertEqual(table.durations, ((10.0, 10.0), (10.0, 10.0)))
+        self.assertEqual(mock_simulate.call_count, 4)
+        self.assertIn("Wrote 2 x 2 estimates", output.getvalue())
@@ -1,13 +1,22 @@
 import unittest
 from unittest.mock import patch, MagicMock
 
+from src.helper.config import CONFIG_PATH
 from src.main import main
 
 
 class TestMain(unittest.TestCase):
-    @patch("src.main.time.sleep", return_value=None)
+    def setUp(self):
+        self.mock_settings = patch("src.main.Settings").start()
+        self.mock_config_watcher = patch("src.main.ConfigWatcher").start()
+        self.addCleanup(patch.stopall)
+
+    @patch("src.main.LoopReporter")
+    @patch("src.main.Logger")
+    @patch("time.sleep", return_value=None)
     @patch("src.main.SystemControl")
-    def test_main__system_control_start_called__success(self, mock_system_control, mock_sleep):
+    def test_main__system_control_start_called__success(self, mock_system_control, mock_sleep, mock_logger,
+                                                        mock_loop_reporter):
         mock_system_instance = MagicMock()
         mock_system_control.return_value = mock_system_instance
 
@@ -16,9 +25,69 @@ class TestMain(unittest.TestCase):
         mock_system_control.assert_called_once()
         mock_system_instance.start.assert_called_once()
 
-    @patch("src.main.time.sleep", return_value=None)
+    @patch("src.main.LoopReporter")
+    @patch("src.main.Logger")
+    @patch("time.sleep", return_value=None)
     @patch("src.main.SystemControl")
-    def test_main__time_sleep_called_with_1__success(self, mock_system_control, mock_sleep):
+    def test_main__time_sleep_called_with_1__success(self, mock_system_control, mock_sleep, mock_logger,
+                                                     mock_loop_reporter):
         main()
 
         mock_sleep.assert_any_call(1)
+
+    @patch("src.main.LoopReporter")
+    @patch("src.main.Logger")
+    @patch("time.sleep", return_value=None)
+    @patch("src.main.SystemControl")
+    def test_main__called__enables_async_logging(self, mock_system_control, mock_sleep, mock_logger,
+                                                 mock_loop_reporter):
+        main()
+
+        mock_logger.use_async.assert_called_once()
+        mock_logger.use_flight_log.assert_called_once()
+
+    @patch("src.main.LoopReporter")
+    @patch("src.main.Logger")
+    @patch("time.sleep", return_value=None)
+    @patch("src.main.SystemControl")
+    def test_main__called__starts_loop_reports(self, mock_system_control, mock_sleep, mock_logger,
+                                               mock_loop_reporter):
+        main()
+
+        mock_loop_reporter.return_value.start.assert_called_once()
+
+    @patch("src.main.MetricsExporter")
+    @patch("src.main.METRICS_ENABLED", True)
+    @patch("src.main.LoopReporter")
+    @patch("src.main.Logger")
+    @patch("time.sleep", return_value=None)
+    @patch("src.main.SystemControl")
+    def test_main__metrics_enabled__starts_metrics_exporter(self, mock_system_control, mock_sleep, mock_logger,
+                                                            mock_loop_reporter, mock_metrics_exporter):
+        main()
+
+        mock_metrics_exporter.return_value.start.assert_called_once()
+
+    @patch("src.main.MetricsExporter")
+    @patch("src.main.LoopReporter")
+    @patch("src.main.Logger")
+    @patch("time.sleep", return_value=None)
+    @patch("src.main.SystemControl")
+    def test_main__metrics_disabled__does_not_start_metrics_exporter(self, mock_system_control, mock_sleep,
+                                                                     mock_logger, mock_loop_reporter,
+                                                                     mock_metrics_exporter):
+        main()
+
+        mock_metrics_exporter.assert_not_called()
+
+    @patch("src.main.LoopReporter")
+    @patch("src.main.Logger")
+    @patch("time.sleep", return_value=None)
+    @patch("src.main.SystemControl")
+    def test_main__called__loads_environment_and_watches_settings_file(self, mock_system_control, mock_sleep,
+                                                                       mock_logger, mock_loop_reporter):
+        main()
+
+        self.mock_settings.return_value.load_environment.assert_called_once_with()
+        self.mock_config_watcher.assert_called_once_with(CONFIG_PATH)
+        self.mock_config_watcher.return_value.start.assert_called_once()
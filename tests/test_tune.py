@@ -0,0 +1,81 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout, redirect_stderr
+from unittest.mock import patch
+
+from src.program.tuning.Tuner import Tuner
+from src.program.tuning.TuningResult import TuningResult
+from src.tune import format_table, main, parse_arguments, parse_parameter
+
+
+def fake_run(tuner, candidates):
+    return [TuningResult(candidate, 10.0 * index, 1000.0) for index, candidate in enumerate(candidates)]
+
+
+@patch("src.tune.Tuner.run", autospec=True, side_effect=fake_run)
+class TestTuneMain(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.directory.name, "results.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _main(self, *argv):
+        with redirect_stdout(io.StringIO()) as output, redirect_stderr(io.StringIO()) as error:
+            code = main(list(argv))
+        return code, output.getvalue() + error.getvalue()
+
+    def test_parse_arguments__no_arguments__sweeps_all_parameters_on_grid(self, mock_run):
+        arguments = parse_arguments([])
+
+        self.assertEqual(arguments.parameter, [])
+        self.assertIsNone(arguments.random)
+        self.assertEqual(arguments.top, 10)
+
+    def test_parse_parameter__values__overrides_default_values(self, mock_run):
+        self.assertEqual(parse_parameter("target_temp=50,52.5").values, [50.0, 52.5])
+        self.assertEqual(parse_parameter("target_temp").values, Tuner.parameter("target_temp").values)
+
+    def test_main__grid__prints_ranked_table_and_writes_results(self, mock_run):
+        code, output = self._main("-p", "target_temp", "-p", "max_power_share=0.4", "-w", "900", "-t", "30",
+                                  "-o", self.output)
+
+        tuner = mock_run.call_args.args[0]
+        with open(self.output, encoding="utf-8") as file:
+            results = json.load(file)
+        self.assertEqual(code, 0)
+        self.assertEqual((tuner.weight, tuner.temperature), (900.0, 30.0))
+        self.assertIn("Simulating 3 candidates", output)
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0]["candidate"], {"target_temp": 55, "max_power_share": 0.4})
+
+    def test_main__random__simulates_sampled_candidates(self, mock_run):
+        code, output = self._main("-p", "target_temp", "-r", "5", "-s", "1")
+
+        self.assertEqual(code, 0)
+        self.assertEqual(len(mock_run.call_args.args[1]), 5)
+
+    def test_main__unknown_parameter__returns_two(self, mock_run):
+        code, output = self._main("-p", "missing")
+
+        self.assertEqual(code, 2)
+        self.assertIn("Unknown parameter missing", output)
+        mock_run.assert_not_called()
+
+    def test_main__all_candidates_failed__returns_one(self, mock_run):
+        mock_run.side_effect = lambda tuner, candidates: [TuningResult(candidate, error="timeout")
+                                                          for candidate in candidates]
+
+        code, output = self._main("-p", "target_temp=60")
+
+        self.assertEqual(code, 1)
+        self.assertIn("failed: timeout", output)
+
+    def test_format_table__results__prints_one_row_per_result(self, mock_run):
+        table = format_table([TuningResult({"a": 1}, 12.34, 5600.0, 2)], ["a"])
+
+        self.assertEqual(table.splitlines()[1].split(), ["1", "1", "12.3", "5.6", "2"])
@@ -0,0 +1,26 @@
+import unittest
+from unittest.mock import MagicMock
+
+from src.helper.Action import Action
+from src.user.ReplayInputDetector import ReplayInputDetector
+
+
+class TestReplayInputDetector(unittest.TestCase):
+    def setUp(self):
+        self.engine = MagicMock()
+        self.engine.action.return_value = Action.START
+        self.input_detector = ReplayInputDetector(self.engine)
+
+    def test_get_latest_action__not_started__returns_none(self):
+        self.assertIsNone(self.input_detector.get_latest_action())
+
+    def test_get_latest_action__started__returns_recorded_action(self):
+        self.input_detector.start()
+
+        self.assertEqual(self.input_detector.get_latest_action(), Action.START)
+
+    def test_get_latest_action__stopped__returns_none(self):
+        self.input_detector.start()
+        self.input_detector.stop()
+
+        self.assertIsNone(self.input_detector.get_latest_action())
@@ -0,0 +1,26 @@
+import unittest
+
+from src.helper.Action import Action
+from src.user.ScriptedInputDetector import ScriptedInputDetector
+
+
+class TestScriptedInputDetector(unittest.TestCase):
+    def setUp(self):
+        self.input_detector = ScriptedInputDetector({1: Action.START, 3: Action.OFF})
+
+    def test_get_latest_action__not_started__returns_none(self):
+        self.assertIsNone(self.input_detector.get_latest_action())
+        self.assertEqual(self.input_detector.tick, 0)
+
+    def test_get_latest_action__started__returns_script_tick_by_tick(self):
+        self.input_detector.start()
+
+        actions = [self.input_detector.get_latest_action() for _ in range(5)]
+
+        self.assertEqual(actions, [None, Action.START, None, Action.OFF, None])
+
+    def test_get_latest_action__stopped__returns_none(self):
+        self.input_detector.start()
+        self.input_detector.stop()
+
+        self.assertIsNone(self.input_detector.get_latest_action())
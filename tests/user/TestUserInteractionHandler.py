@@ -34,6 +34,13 @@ class TestUserInteractionHandler(unittest.TestCase):
         self.assertIsNone(result_action)
         self.assertIsNone(result_program)
 
+    def test_get_interactions__open_door_action__keeps_last_action(self):
+        self.mock_input_detector.get_latest_action.return_value = Action.OPEN_DOOR
+        self.mock_door.opened = False
+        self.handler.get_interactions()
+
+        self.assertEqual(self.handler.last_action, Action.OPEN_DOOR)
+
     def test_get_interactions__close_door_action__closes_door_and_returns_none(self):
         self.mock_input_detector.get_latest_action.return_value = Action.CLOSE_DOOR
         self.mock_door.opened = True
@@ -57,8 +64,32 @@ class TestUserInteractionHandler(unittest.TestCase):
         self.assertIsNone(result_action)
         self.assertIsNone(result_program)
 
+    @patch("src.user.UserInteractionHandler.ProgramRegistry.create")
+    def test_get_interactions__start_action__creates_selected_program(self, mock_create):
+        self.handler.selected_program = "defrosting"
+        self.mock_input_detector.get_latest_action.return_value = Action.START
+
+        _, result_program = self.handler.get_interactions()
+
+        mock_create.assert_called_once_with("defrosting", None)
+        self.assertIs(result_program, mock_create.return_value)
+
+    def test_select_program__registered_program__selects_program(self):
+        self.handler.selected_program = None
+
+        self.handler.select_program("defrosting")
+
+        self.assertEqual(self.handler.selected_program, "defrosting")
+
+    def test_select_program__unknown_program__raises_value_error_and_keeps_selection(self):
+        with self.assertRaises(ValueError):
+            self.handler.select_program("unknown")
+
+        self.assertEqual(self.handler.selected_program, "defrosting")
+
     def test_update_display__valid_inputs__does_not_raise_exception(self):
         try:
             self.handler.update_display("ProgramName", running=True, finished=False, paused=False)
+            self.handler.update_display("ProgramName", running=True, finished=False, paused=False, eta=12.5)
         except Exception as e:
             self.fail(f"update_display raised an exception: {e}")